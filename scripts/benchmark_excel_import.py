@@ -3,11 +3,20 @@ Benchmark Excel import performance for GanttBuddy.
 
 Cold benchmark only:
 - No Streamlit
-- No caching
+- No caching: the parse cache is cleared before every run
+  (pass --warm-cache to measure repeat uploads of the same bytes instead)
 - Re-runs the actual loader functions repeatedly
 - Separates:
     - analyze vs load
     - infer_predecessors on vs off
+- Reports peak traced memory (tracemalloc) from one extra, untimed run
+- Reports median seconds per stage: the parse stages the loader records,
+  then `build` (the workflow on a warm parse cache, i.e. after the parse),
+  and the peak traced memory of each stage from one more run
+- Can generate deterministic synthetic workbooks (see synthetic_workbook.py)
+  instead of, or next to, --files
+- Can save the results as a baseline and fail (exit code 1) when a later run
+  regresses past --max-regression on any case, total or stage
 
 Usage examples:
 
@@ -23,6 +32,17 @@ Usage examples:
         --repeats 10 \
         --profile
 
+    python scripts/benchmark_excel_import.py \
+        --synthetic 1k 10k 100k \
+        --mode load \
+        --save-baseline bench_baseline.json
+
+    python scripts/benchmark_excel_import.py \
+        --synthetic 1k 10k 100k \
+        --mode load \
+        --baseline bench_baseline.json \
+        --max-regression 0.25
+
 """
 
 from __future__ import annotations
@@ -35,6 +55,7 @@ import pstats
 import statistics
 import sys
 import time
+import tracemalloc
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Callable, Iterable, Literal
@@ -43,8 +64,13 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 SRC_ROOT = REPO_ROOT / "src"
 
 sys.path.insert(0, str(SRC_ROOT))
+sys.path.insert(0, str(REPO_ROOT))
 
+from logic.excel_parse_cache import get_excel_parse_cache
 from logic.load_project import ExcelProjectLoader, ExcelParameters, DataColumn
+from scripts.synthetic_workbook import ensure_workbook, parse_size
+
+DEFAULT_DATA_DIR = REPO_ROOT / "tests" / "data"
 
 
 @dataclass
@@ -60,6 +86,25 @@ class BenchmarkResult:
     median_seconds: float
     mean_seconds: float
     max_seconds: float
+    peak_memory_mb: float
+    stage_seconds: dict[str, float]
+    stage_peak_mb: dict[str, float]
+
+    @property
+    def case(self) -> str:
+        return f"{Path(self.file).name}|{self.mode}|infer={'on' if self.infer_predecessors else 'off'}"
+
+
+@dataclass
+class Regression:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else float("inf")
 
 
 def default_excel_parameters(start_row: int = 8) -> ExcelParameters:
@@ -102,6 +147,71 @@ def bench_function(
     return runs
 
 
+def measure_peak_memory(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> float:
+    """
+    Peak Python allocation during one run, in MB. Kept out of the timed runs
+    because tracing slows allocation-heavy code down considerably.
+    """
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024.0 * 1024.0)
+
+
+def measure_stages(
+    fn: Callable[..., Any],
+    file_bytes: bytes,
+    params: ExcelParameters,
+    infer_predecessors: bool,
+    repeats: int,
+) -> dict[str, float]:
+    """
+    Median seconds per stage over `repeats` parses, plus `build`: `fn` with the
+    parse already cached.
+    """
+    per_stage: dict[str, list[float]] = {}
+    for _ in range(repeats):
+        parsed = ExcelProjectLoader._parse_excel_import(file_bytes, params, infer_predecessors)
+        for stage, seconds in parsed.stage_seconds.items():
+            per_stage.setdefault(stage, []).append(seconds)
+    per_stage["build"] = bench_function(
+        fn,
+        file_bytes,
+        params,
+        infer_predecessors,
+        True,
+        repeats=repeats,
+        warmups=1,
+    )
+    return {stage: statistics.median(runs) for stage, runs in per_stage.items()}
+
+
+def measure_stage_memory(
+    fn: Callable[..., Any],
+    file_bytes: bytes,
+    params: ExcelParameters,
+    infer_predecessors: bool,
+) -> dict[str, float]:
+    """
+    Peak traced MB per stage from one parse, plus `build` (`fn` with the parse
+    already cached), in the order of `measure_stages`.
+    """
+    tracemalloc.start()
+    try:
+        parsed = ExcelProjectLoader._parse_excel_import(file_bytes, params, infer_predecessors)
+        stage_peak_mb = dict(parsed.stage_peak_mb)
+        del parsed
+    finally:
+        tracemalloc.stop()
+    get_excel_parse_cache().clear()
+    fn(file_bytes, params, infer_predecessors, False)
+    stage_peak_mb["build"] = measure_peak_memory(fn, file_bytes, params, infer_predecessors, True)
+    return stage_peak_mb
+
+
 def summarize_runs(
     file_path: Path,
     mode: str,
@@ -109,6 +219,9 @@ def summarize_runs(
     runs: list[float],
     repeats: int,
     warmups: int,
+    peak_memory_mb: float,
+    stage_seconds: dict[str, float],
+    stage_peak_mb: dict[str, float],
 ) -> BenchmarkResult:
     return BenchmarkResult(
         file=str(file_path),
@@ -122,6 +235,9 @@ def summarize_runs(
         median_seconds=statistics.median(runs),
         mean_seconds=statistics.mean(runs),
         max_seconds=max(runs),
+        peak_memory_mb=peak_memory_mb,
+        stage_seconds=stage_seconds,
+        stage_peak_mb=stage_peak_mb,
     )
 
 
@@ -129,7 +245,10 @@ def run_analyze(
     file_bytes: bytes,
     params: ExcelParameters,
     infer_predecessors: bool,
+    warm_cache: bool = False,
 ) -> Any:
+    if not warm_cache:
+        get_excel_parse_cache().clear()
     return ExcelProjectLoader.analyze_excel_project(
         file=file_bytes,
         params=params,
@@ -141,7 +260,10 @@ def run_load(
     file_bytes: bytes,
     params: ExcelParameters,
     infer_predecessors: bool,
+    warm_cache: bool = False,
 ) -> Any:
+    if not warm_cache:
+        get_excel_parse_cache().clear()
     return ExcelProjectLoader.load_excel_project(
         file=file_bytes,
         params=params,
@@ -187,6 +309,7 @@ def print_result_table(results: Iterable[BenchmarkResult]) -> None:
         "Median",
         "Mean",
         "Max",
+        "Peak MB",
     ]
 
     rows: list[list[str]] = []
@@ -201,6 +324,7 @@ def print_result_table(results: Iterable[BenchmarkResult]) -> None:
                 format_seconds(r.median_seconds),
                 format_seconds(r.mean_seconds),
                 format_seconds(r.max_seconds),
+                f"{r.peak_memory_mb:.1f}",
             ]
         )
 
@@ -220,12 +344,108 @@ def print_result_table(results: Iterable[BenchmarkResult]) -> None:
         print(fmt_row(row))
 
 
+def print_stage_table(
+    results: Iterable[BenchmarkResult],
+    field: Literal["stage_seconds", "stage_peak_mb"] = "stage_seconds",
+) -> None:
+    results = list(results)
+    if not results:
+        return
+
+    stages = list(getattr(results[0], field))
+    fmt = format_seconds if field == "stage_seconds" else (lambda x: f"{x:.1f}")
+    headers = ["File", "Mode", "Infer", *stages]
+    rows = [
+        [
+            Path(r.file).name,
+            r.mode,
+            "on" if r.infer_predecessors else "off",
+            *(fmt(getattr(r, field).get(stage, 0.0)) for stage in stages),
+        ]
+        for r in results
+    ]
+    widths = [max(len(headers[i]), *(len(row[i]) for row in rows)) for i in range(len(headers))]
+
+    def fmt_row(row: list[str]) -> str:
+        return " | ".join(cell.ljust(widths[i]) for i, cell in enumerate(row))
+
+    print("\nStage timings (median)" if field == "stage_seconds" else "\nStage peak memory (MB)")
+    print("-" * 80)
+    print(fmt_row(headers))
+    print("-+-".join("-" * w for w in widths))
+    for row in rows:
+        print(fmt_row(row))
+
+
 def save_results_json(results: list[BenchmarkResult], out_path: Path) -> None:
     payload = [asdict(r) for r in results]
     out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
     print(f"\nSaved results to {out_path}")
 
 
+def baseline_metrics(result: BenchmarkResult) -> dict[str, float]:
+    """The gated numbers of one case: totals and every stage, in seconds and MB."""
+    return {
+        "median_seconds": result.median_seconds,
+        "peak_memory_mb": result.peak_memory_mb,
+        **{f"stage_seconds.{stage}": seconds for stage, seconds in result.stage_seconds.items()},
+        **{f"stage_peak_mb.{stage}": mb for stage, mb in result.stage_peak_mb.items()},
+    }
+
+
+def save_baseline(results: list[BenchmarkResult], out_path: Path) -> None:
+    payload = {"cases": {r.case: baseline_metrics(r) for r in results}}
+    out_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    print(f"\nSaved baseline to {out_path}")
+
+
+def compare_to_baseline(
+    results: list[BenchmarkResult],
+    baseline: dict[str, dict[str, float]],
+    *,
+    max_regression: float,
+    min_seconds: float,
+    min_mb: float,
+) -> list[Regression]:
+    """
+    Metrics that grew by more than `max_regression` (a fraction) over the
+    baseline. Changes under `min_seconds` / `min_mb` are noise and never fail.
+    """
+    regressions: list[Regression] = []
+    for result in results:
+        expected = baseline.get(result.case)
+        if expected is None:
+            print(f"No baseline for {result.case}; not gated.")
+            continue
+        for metric, current in baseline_metrics(result).items():
+            if metric not in expected:
+                continue
+            floor = min_mb if "_mb" in metric else min_seconds
+            before = expected[metric]
+            if current - before > floor and current > before * (1.0 + max_regression):
+                regressions.append(Regression(case=result.case, metric=metric, baseline=before, current=current))
+    return regressions
+
+
+def print_regressions(regressions: list[Regression], max_regression: float) -> None:
+    headers = ["Case", "Metric", "Baseline", "Current", "Change"]
+    rows = [
+        [r.case, r.metric, f"{r.baseline:.3f}", f"{r.current:.3f}", f"{r.change:+.1%}"]
+        for r in regressions
+    ]
+    widths = [max(len(headers[i]), *(len(row[i]) for row in rows)) for i in range(len(headers))]
+
+    def fmt_row(row: list[str]) -> str:
+        return " | ".join(cell.ljust(widths[i]) for i, cell in enumerate(row))
+
+    print(f"\nRegressions beyond {max_regression:.0%} of the baseline")
+    print("-" * 80)
+    print(fmt_row(headers))
+    print("-+-".join("-" * w for w in widths))
+    for row in rows:
+        print(fmt_row(row))
+
+
 def parse_mode(value: str) -> list[str]:
     value = value.lower().strip()
     if value == "analyze":
@@ -261,9 +481,20 @@ def main() -> int:
     parser.add_argument(
         "--files",
         nargs="+",
-        required=True,
+        default=[],
         help="One or more Excel files to benchmark.",
     )
+    parser.add_argument(
+        "--synthetic",
+        nargs="+",
+        default=[],
+        help="Also benchmark generated workbooks of these sizes (1k, 10k, 100k or row counts).",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=str(DEFAULT_DATA_DIR),
+        help="Where generated workbooks are kept between runs.",
+    )
     parser.add_argument(
         "--mode",
         choices=["analyze", "load", "both"],
@@ -288,6 +519,11 @@ def main() -> int:
         default=1,
         help="Number of warmup runs before measured runs.",
     )
+    parser.add_argument(
+        "--warm-cache",
+        action="store_true",
+        help="Keep the content-addressed parse cache between runs (repeat uploads).",
+    )
     parser.add_argument(
         "--profile",
         action="store_true",
@@ -311,11 +547,45 @@ def main() -> int:
         default="",
         help="Optional path to save raw benchmark results as JSON.",
     )
+    parser.add_argument(
+        "--save-baseline",
+        type=str,
+        default="",
+        help="Save the gated metrics of this run as a baseline JSON.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default="",
+        help="Baseline JSON to compare against; exits with 1 on a regression.",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed growth over the baseline per metric, as a fraction.",
+    )
+    parser.add_argument(
+        "--min-seconds",
+        type=float,
+        default=0.02,
+        help="Timing changes smaller than this never count as regressions.",
+    )
+    parser.add_argument(
+        "--min-mb",
+        type=float,
+        default=1.0,
+        help="Memory changes smaller than this never count as regressions.",
+    )
 
     args = parser.parse_args()
 
     try:
         files = validate_files(args.files)
+        files += [ensure_workbook(Path(args.data_dir), parse_size(size)) for size in args.synthetic]
+        if not files:
+            raise ValueError("Pass --files and/or --synthetic.")
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["cases"] if args.baseline else None
         params = default_excel_parameters()
     except Exception as exc:
         print(f"Setup error: {exc}", file=sys.stderr)
@@ -350,10 +620,15 @@ def main() -> int:
                     file_bytes,
                     params,
                     infer_predecessors,
+                    args.warm_cache,
                     repeats=args.repeats,
                     warmups=args.warmups,
                 )
 
+                peak_memory_mb = measure_peak_memory(fn, file_bytes, params, infer_predecessors, args.warm_cache)
+                stage_seconds = measure_stages(fn, file_bytes, params, infer_predecessors, args.repeats)
+                stage_peak_mb = measure_stage_memory(fn, file_bytes, params, infer_predecessors)
+
                 result = summarize_runs(
                     file_path=file_path,
                     mode=mode,
@@ -361,6 +636,9 @@ def main() -> int:
                     runs=runs,
                     repeats=args.repeats,
                     warmups=args.warmups,
+                    peak_memory_mb=peak_memory_mb,
+                    stage_seconds=stage_seconds,
+                    stage_peak_mb=stage_peak_mb,
                 )
                 results.append(result)
 
@@ -370,15 +648,34 @@ def main() -> int:
                         file_bytes,
                         params,
                         infer_predecessors,
+                        args.warm_cache,
                         sort_by=args.profile_sort,
                         top_n=args.profile_top,
                     )
                     did_profile = True
 
     print_result_table(results)
+    print_stage_table(results)
+    print_stage_table(results, "stage_peak_mb")
 
     if args.json_out:
         save_results_json(results, Path(args.json_out).resolve())
+    if args.save_baseline:
+        save_baseline(results, Path(args.save_baseline).resolve())
+
+    if baseline is not None:
+        regressions = compare_to_baseline(
+            results,
+            baseline,
+            max_regression=args.max_regression,
+            min_seconds=args.min_seconds,
+            min_mb=args.min_mb,
+        )
+        if regressions:
+            print_regressions(regressions, args.max_regression)
+            print(f"\nFAILED: {len(regressions)} metric(s) regressed against {args.baseline}", file=sys.stderr)
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
 
     return 0
 
@@ -0,0 +1,174 @@
+"""
+Benchmark parsing backend list responses into pydantic models in rows/sec.
+
+Every mode starts from the raw response body. Compares, per model:
+- `json.loads` + per-item `Model.model_validate` (the old per-row loops),
+- `json.loads` + a `TypeAdapter(list[Model])` built on every call,
+- `json.loads` + the cached adapter in `models/parsing.py`,
+- the cached adapter validating the body directly (`parse_model_list_json`),
+- `json.loads` + `Model.model_construct`, i.e. skipping validation entirely.
+  With pydantic v2 this is slower than validating, which is why the client
+  has no "trusted payload" mode.
+
+Usage examples:
+
+    python scripts/benchmark_model_parsing.py --rows 50000
+
+    python scripts/benchmark_model_parsing.py --rows 200000 --repeat 5 --json-out parse_results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+
+sys.path.insert(0, str(SRC_ROOT))
+
+from pydantic import TypeAdapter
+
+from models.delay import Delay
+from models.event import EventIn
+from models.parsing import parse_model_list, parse_model_list_json
+from models.signals import SignalObservation
+
+
+@dataclass
+class ParseResult:
+    model: str
+    mode: str
+    rows: int
+    seconds: float
+    rows_per_second: float
+    speedup: float = 1.0
+
+
+def observation_payload(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"obs-{i}",
+            "signal_id": "bench-signal",
+            "timestamp_utc": f"2026-01-{1 + i // 86400 % 28:02d}T{i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}Z",
+            "numeric_value": 100.0 + (i % 997) / 10,
+            "quality_code": "GOOD",
+            "source_record_key": f"bench-{i}",
+            "ingestion_run_id": None,
+            "created_at": "2026-02-01T00:00:00Z",
+        }
+        for i in range(rows)
+    ]
+
+
+def delay_payload(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"delay-{i}",
+            "project_id": "bench-project",
+            "delay_type": "EQUIPMENT",
+            "duration_minutes": 30 + i % 90,
+            "description": "Crane down",
+            "start_dt": "2026-01-05T08:00:00Z",
+            "end_dt": "2026-01-05T08:30:00Z",
+            "shift_assignment_id": None,
+            "created_by": "bench-user",
+            "created_at": "2026-01-05T09:00:00Z",
+            "updated_at": None,
+            "updated_by": None,
+        }
+        for i in range(rows)
+    ]
+
+
+def event_payload(rows: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"event-{i}",
+            "project_name": "Bench",
+            "ts": "2026-01-05T08:00:00Z",
+            "project_id": "bench-project",
+            "phase_id": None,
+            "task_id": f"task-{i % 400}",
+            "user_id": "bench-user",
+            "user_name": "Bench User",
+            "event_type": "TASK_UPDATED",
+            "payload": {"name": "Tear out", "status": "IN_PROGRESS"},
+        }
+        for i in range(rows)
+    ]
+
+
+def _parsers(model: type) -> dict[str, Callable[[bytes], list]]:
+    return {
+        "model_validate per item": lambda raw: [model.model_validate(item) for item in json.loads(raw)],
+        "TypeAdapter per call": lambda raw: TypeAdapter(list[model]).validate_python(json.loads(raw)),
+        "cached TypeAdapter": lambda raw: parse_model_list(model, json.loads(raw)),
+        "cached TypeAdapter, JSON": lambda raw: parse_model_list_json(model, raw),
+        "model_construct": lambda raw: [model.model_construct(**item) for item in json.loads(raw)],
+    }
+
+
+def run_benchmark(rows: int, repeat: int) -> list[ParseResult]:
+    results: list[ParseResult] = []
+    for model, payload in (
+        (SignalObservation, observation_payload(rows)),
+        (Delay, delay_payload(rows)),
+        (EventIn, event_payload(rows)),
+    ):
+        raw = json.dumps(payload).encode("utf-8")
+        baseline = 0.0
+        for mode, parse in _parsers(model).items():
+            best = float("inf")
+            for _ in range(repeat):
+                started = time.perf_counter()
+                parse(raw)
+                best = min(best, time.perf_counter() - started)
+            baseline = baseline or best
+            results.append(
+                ParseResult(
+                    model=model.__name__,
+                    mode=mode,
+                    rows=rows,
+                    seconds=best,
+                    rows_per_second=rows / best if best else 0.0,
+                    speedup=baseline / best if best else 0.0,
+                )
+            )
+    return results
+
+
+def print_results(results: list[ParseResult]) -> None:
+    print("\nModel parsing benchmark (best of repeats)")
+    print("=" * 84)
+    print(f"{'model':<20} {'mode':<26} {'rows':>9} {'seconds':>9} {'rows/sec':>12} {'speedup':>8}")
+    print("-" * 84)
+    for item in results:
+        print(
+            f"{item.model:<20} {item.mode:<26} {item.rows:>9} {item.seconds:>9.3f} "
+            f"{item.rows_per_second:>12,.0f} {item.speedup:>7.1f}x"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pydantic parsing of backend list responses.")
+    parser.add_argument("--rows", type=int, default=20_000, help="Items per synthetic response.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode; the fastest is reported.")
+    parser.add_argument("--json-out", type=str, default="", help="Optional path to save results as JSON.")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, max(args.repeat, 1))
+    print_results(results)
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps([asdict(item) for item in results], indent=2), encoding="utf-8")
+        print(f"\nSaved JSON results to: {args.json_out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
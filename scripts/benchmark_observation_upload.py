@@ -0,0 +1,196 @@
+"""
+Benchmark bulk signal observation uploads in rows/sec.
+
+Compares one uncompressed JSON POST of every row (`create_signal_observations`)
+with the bulk path in `logic/backend/observation_upload.py` (size-bounded gzip
+chunks uploaded concurrently). Both share the vectorized preparation step. By default an
+in-process stub backend is started; pass `--base-url` to target a real API.
+
+Usage examples:
+
+    python scripts/benchmark_observation_upload.py --rows 200000
+
+    python scripts/benchmark_observation_upload.py \
+        --rows 500000 --chunk-kb 512 --workers 8 --latency-ms 40 \
+        --json-out upload_results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(SRC_ROOT))
+
+from scripts.load_test import point_client_at
+from scripts.stub_backend import StubServer, add_fixture_arguments, backend_from_args
+
+
+@dataclass
+class PhaseResult:
+    name: str
+    rows: int
+    seconds: float
+    rows_per_second: float
+    chunks: int = 0
+    raw_bytes: int = 0
+    sent_bytes: int = 0
+    retries: int = 0
+
+
+def synthetic_frame(rows: int, *, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    stamps = pd.date_range("2025-01-01", periods=rows, freq="s")
+    return pd.DataFrame(
+        {
+            "timestamp_local": stamps,
+            "numeric_value": np.round(100 + rng.normal(size=rows).cumsum(), 3),
+            "quality_code": "GOOD",
+            "source_record_key": [f"bench-{i}" for i in range(rows)],
+        }
+    )
+
+
+def _timed(name: str, rows: int, fn) -> tuple[PhaseResult, object]:
+    started = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - started
+    return PhaseResult(name=name, rows=rows, seconds=seconds, rows_per_second=rows / seconds if seconds else 0.0), result
+
+
+def run_benchmark(
+    base_url: str,
+    *,
+    rows: int,
+    chunk_bytes: int,
+    workers: int,
+    token: str | None,
+    project_id: str,
+    signal_id: str,
+    single_post: bool,
+) -> list[PhaseResult]:
+    point_client_at(base_url)
+    from logic.backend.observation_upload import (
+        iter_gzip_chunks,
+        observation_records,
+        prepare_observations,
+        upload_observations,
+    )
+    from logic.backend.signals import create_signal_observations
+    from models.signals import SignalDataType
+
+    headers = {"Authorization": f"Bearer {token or 'benchmark'}"}
+    timezone = ZoneInfo("America/Vancouver")
+    frame = synthetic_frame(rows)
+    results: list[PhaseResult] = []
+
+    phase, prepared = _timed(
+        "prepare", rows, lambda: prepare_observations(frame, SignalDataType.NUMERIC, timezone=timezone)
+    )
+    results.append(phase)
+
+    if single_post:
+        phase, _ = _timed(
+            "single POST",
+            rows,
+            lambda: create_signal_observations(headers, project_id, signal_id, observation_records(prepared)),
+        )
+        results.append(phase)
+
+    phase, chunks = _timed("bulk: chunk + gzip", rows, lambda: list(iter_gzip_chunks(prepared, max_bytes=chunk_bytes)))
+    phase.chunks = len(chunks)
+    phase.raw_bytes = sum(chunk.raw_bytes for chunk in chunks)
+    phase.sent_bytes = sum(len(chunk.body) for chunk in chunks)
+    results.append(phase)
+
+    phase, report = _timed(
+        "bulk: chunked upload",
+        rows,
+        lambda: upload_observations(
+            headers, project_id, signal_id, prepared, max_bytes=chunk_bytes, max_workers=workers
+        ),
+    )
+    phase.chunks, phase.raw_bytes, phase.sent_bytes, phase.retries = (
+        report.chunks,
+        report.raw_bytes,
+        report.sent_bytes,
+        report.retries,
+    )
+    results.append(phase)
+    return results
+
+
+def print_results(results: list[PhaseResult]) -> None:
+    print("\nObservation upload benchmark")
+    print("=" * 92)
+    print(f"{'phase':<28} {'rows':>9} {'seconds':>9} {'rows/sec':>12} {'chunks':>7} {'raw MB':>8} {'sent MB':>8}")
+    print("-" * 92)
+    for item in results:
+        raw_mb = f"{item.raw_bytes / 1e6:.2f}" if item.raw_bytes else ""
+        sent_mb = f"{item.sent_bytes / 1e6:.2f}" if item.sent_bytes else ""
+        print(
+            f"{item.name:<28} {item.rows:>9} {item.seconds:>9.3f} {item.rows_per_second:>12,.0f} "
+            f"{item.chunks or '':>7} {raw_mb:>8} {sent_mb:>8}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark bulk signal observation uploads.")
+    parser.add_argument("--base-url", default="", help="Existing backend to target; omit to start the stub.")
+    parser.add_argument("--token", default="", help="Bearer token for --base-url.")
+    parser.add_argument("--project-id", default="bench-project")
+    parser.add_argument("--signal-id", default="bench-signal")
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic observations to upload.")
+    parser.add_argument("--chunk-kb", type=int, default=1024, help="Uncompressed chunk size bound.")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent chunk uploads.")
+    parser.add_argument("--skip-single-post", action="store_true", help="Only run the bulk path.")
+    parser.add_argument("--json-out", type=str, default="", help="Optional path to save results as JSON.")
+    add_fixture_arguments(parser)
+    args = parser.parse_args()
+
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    server: StubServer | None = None
+    base_url = args.base_url
+    if not base_url:
+        server = StubServer(backend_from_args(args)).start()
+        base_url = server.base_url
+        print(f"Started stub backend on {base_url}")
+
+    try:
+        results = run_benchmark(
+            base_url,
+            rows=args.rows,
+            chunk_bytes=args.chunk_kb * 1024,
+            workers=args.workers,
+            token=args.token or None,
+            project_id=args.project_id,
+            signal_id=args.signal_id,
+            single_post=not args.skip_single_post,
+        )
+    finally:
+        if server is not None:
+            server.stop()
+
+    print_results(results)
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps([asdict(item) for item in results], indent=2), encoding="utf-8")
+        print(f"\nSaved JSON results to: {args.json_out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
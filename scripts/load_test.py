@@ -0,0 +1,385 @@
+"""
+Replay realistic GanttBuddy page flows against a backend and report latency per flow.
+
+Each simulated user runs the flow sequence (default home -> projects -> plan ->
+analytics) through the real client code in `logic/backend`, so the numbers
+include client-side caching, revalidation, request coalescing and parsing, not
+just the HTTP round trip.
+
+By default an in-process stub backend (`scripts/stub_backend.py`) is started;
+pass `--base-url` to point at a running API instead.
+
+Usage examples:
+
+    python scripts/load_test.py --users 10 --iterations 5 --latency-ms 40 --jitter-ms 30
+
+    python scripts/load_test.py \
+        --users 25 --iterations 3 \
+        --flows home projects plan analytics \
+        --fresh-sessions \
+        --json-out load_results.json
+
+    python scripts/load_test.py --base-url http://127.0.0.1:8000 --token "$TOKEN" --users 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+from zoneinfo import ZoneInfo
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(SRC_ROOT))
+
+from scripts.stub_backend import StubServer, add_fixture_arguments, backend_from_args
+
+DEFAULT_FLOWS = ("home", "projects", "plan", "analytics")
+
+
+@dataclass
+class FlowContext:
+    headers: dict
+    user_index: int
+    timezone: ZoneInfo = ZoneInfo("America/Vancouver")
+    project_id: str | None = None
+
+
+@dataclass
+class FlowSummary:
+    flow: str
+    count: int
+    errors: int
+    mean_seconds: float | None
+    p50_seconds: float | None
+    p95_seconds: float | None
+    p99_seconds: float | None
+    max_seconds: float | None
+    sample_errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class LoadTestReport:
+    base_url: str
+    users: int
+    iterations: int
+    flows: list[str]
+    wall_seconds: float
+    flow_summaries: list[FlowSummary]
+    endpoints: list[dict[str, Any]]
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def point_client_at(base_url: str) -> None:
+    """
+    Point the backend client modules at `base_url`.
+
+    `API_BASE` is resolved at import time, so modules that are already
+    imported are patched in place.
+    """
+    from logic.backend import api_client, login, observation_upload, signals
+
+    for module in (api_client, login, signals, observation_upload):
+        module.API_BASE = base_url.rstrip("/")
+
+
+def _pick_project(ctx: FlowContext) -> str:
+    from logic.backend.project_list import get_projects
+
+    if ctx.project_id is None:
+        projects = list(get_projects(ctx.headers))
+        if not projects:
+            raise RuntimeError("Backend returned no projects.")
+        ctx.project_id = projects[ctx.user_index % len(projects)]
+    return ctx.project_id
+
+
+def flow_home(ctx: FlowContext) -> None:
+    from logic.backend.attention import get_attention_tasks
+    from logic.backend.events import get_events
+    from logic.backend.project_list import get_projects
+    from logic.backend.todo import get_todos
+
+    get_projects(ctx.headers)
+    get_events(ctx.headers, n_events=5, timezone=ctx.timezone)
+    get_attention_tasks(ctx.headers)
+    get_todos(headers=ctx.headers, timezone=ctx.timezone)
+
+
+def flow_projects(ctx: FlowContext) -> None:
+    from logic.backend.api_client import fetch_project_members, fetch_project_snapshot
+    from logic.backend.import_project import snapshot_to_project
+    from logic.backend.project_list import get_projects
+
+    get_projects(ctx.headers, include_closed=True)
+    project_id = _pick_project(ctx)
+    snapshot_to_project(fetch_project_snapshot(project_id, ctx.headers))
+    fetch_project_members(headers=ctx.headers, project_id=project_id)
+
+
+def flow_plan(ctx: FlowContext) -> None:
+    from logic.backend.api_client import fetch_project_snapshot
+    from logic.backend.delays import get_delays
+    from logic.backend.events import get_events
+    from logic.backend.import_project import snapshot_to_project
+    from logic.backend.todo import get_todos
+
+    project_id = _pick_project(ctx)
+    project, _ = snapshot_to_project(fetch_project_snapshot(project_id, ctx.headers))
+    get_delays(ctx.headers, project_id, project.timezone)
+    get_todos(headers=ctx.headers, timezone=project.timezone, project_id=project_id)
+    get_events(ctx.headers, project_id=project_id, n_events=50, timezone=project.timezone)
+
+
+def flow_analytics(ctx: FlowContext) -> None:
+    from logic.backend.api_client import fetch_analytics, fetch_inching_performance, fetch_project_forecast
+    from logic.backend.signals import fetch_data_sources, fetch_signal_definitions
+
+    project_id = _pick_project(ctx)
+    fetch_analytics(ctx.headers, project_id, None, None)
+    fetch_project_forecast(ctx.headers, project_id)
+    fetch_inching_performance(headers=ctx.headers, project_id=project_id)
+    fetch_signal_definitions(ctx.headers, project_id)
+    fetch_data_sources(ctx.headers, project_id)
+
+
+FLOWS: dict[str, Callable[[FlowContext], None]] = {
+    "home": flow_home,
+    "projects": flow_projects,
+    "plan": flow_plan,
+    "analytics": flow_analytics,
+}
+
+
+def _headers_for(user_index: int, token: str | None, fresh: bool) -> dict:
+    if token:
+        return {"Authorization": f"Bearer {token}"}
+    suffix = uuid.uuid4().hex[:8] if fresh else "session"
+    return {"Authorization": f"Bearer load-user-{user_index}-{suffix}"}
+
+
+def run_load(
+    base_url: str,
+    *,
+    users: int = 4,
+    iterations: int = 3,
+    flows: Iterable[str] = DEFAULT_FLOWS,
+    think_seconds: float = 0.0,
+    fresh_sessions: bool = False,
+    token: str | None = None,
+) -> LoadTestReport:
+    """
+    Run `users` concurrent simulated users, each replaying `flows` in order
+    `iterations` times, and summarise per-flow latency.
+
+    With `fresh_sessions` every iteration uses a new bearer token, so per-user
+    caches start cold while shared reference data stays warm.
+    """
+    from logic.backend.instrumentation import get_backend_metrics
+
+    flows = list(flows)
+    unknown = [name for name in flows if name not in FLOWS]
+    if unknown:
+        raise ValueError(f"Unknown flows: {', '.join(unknown)}")
+
+    point_client_at(base_url)
+    metrics = get_backend_metrics()
+    metrics.reset()
+
+    timings: dict[str, list[float]] = {name: [] for name in flows}
+    errors: dict[str, list[str]] = {name: [] for name in flows}
+    lock = threading.Lock()
+
+    def simulate(user_index: int) -> None:
+        ctx = FlowContext(headers=_headers_for(user_index, token, fresh_sessions), user_index=user_index)
+        for _ in range(iterations):
+            if fresh_sessions:
+                ctx = FlowContext(headers=_headers_for(user_index, token, True), user_index=user_index)
+            for name in flows:
+                started = time.perf_counter()
+                try:
+                    FLOWS[name](ctx)
+                except Exception as exc:
+                    with lock:
+                        errors[name].append(f"{type(exc).__name__}: {exc}")
+                else:
+                    with lock:
+                        timings[name].append(time.perf_counter() - started)
+                if think_seconds:
+                    time.sleep(think_seconds)
+
+    threads = [threading.Thread(target=simulate, args=(i,), name=f"load-user-{i}") for i in range(users)]
+    wall_started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_seconds = time.perf_counter() - wall_started
+
+    summaries = [
+        FlowSummary(
+            flow=name,
+            count=len(timings[name]),
+            errors=len(errors[name]),
+            mean_seconds=statistics.mean(timings[name]) if timings[name] else None,
+            p50_seconds=percentile(timings[name], 0.50),
+            p95_seconds=percentile(timings[name], 0.95),
+            p99_seconds=percentile(timings[name], 0.99),
+            max_seconds=max(timings[name]) if timings[name] else None,
+            sample_errors=errors[name][:3],
+        )
+        for name in flows
+    ]
+    return LoadTestReport(
+        base_url=base_url,
+        users=users,
+        iterations=iterations,
+        flows=flows,
+        wall_seconds=wall_seconds,
+        flow_summaries=summaries,
+        endpoints=metrics.snapshot(),
+    )
+
+
+def format_ms(x: float | None) -> str:
+    return "-" if x is None else f"{x * 1000:.1f}ms"
+
+
+def _print_table(title: str, headers: list[str], rows: list[list[str]]) -> None:
+    widths = [len(h) for h in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            widths[i] = max(widths[i], len(cell))
+
+    def fmt_row(row: list[str]) -> str:
+        return " | ".join(cell.ljust(widths[i]) for i, cell in enumerate(row))
+
+    print(f"\n{title}")
+    print("-" * 80)
+    print(fmt_row(headers))
+    print("-+-".join("-" * w for w in widths))
+    for row in rows:
+        print(fmt_row(row))
+
+
+def print_report(report: LoadTestReport) -> None:
+    _print_table(
+        f"Flow latency ({report.users} users x {report.iterations} iterations, {report.wall_seconds:.2f}s wall)",
+        ["Flow", "Runs", "Errors", "Mean", "p50", "p95", "p99", "Max"],
+        [
+            [
+                s.flow,
+                str(s.count),
+                str(s.errors),
+                format_ms(s.mean_seconds),
+                format_ms(s.p50_seconds),
+                format_ms(s.p95_seconds),
+                format_ms(s.p99_seconds),
+                format_ms(s.max_seconds),
+            ]
+            for s in report.flow_summaries
+        ],
+    )
+    _print_table(
+        "Backend calls",
+        ["Method", "Endpoint", "Calls", "p50", "p95", "Cache hits", "Cache misses"],
+        [
+            [
+                row["method"],
+                row["endpoint"],
+                str(row["count"]),
+                format_ms(row["latency_p50_s"]),
+                format_ms(row["latency_p95_s"]),
+                str(row["cache_hits"]),
+                str(row["cache_misses"]),
+            ]
+            for row in report.endpoints
+        ],
+    )
+    for summary in report.flow_summaries:
+        for message in summary.sample_errors:
+            print(f"[{summary.flow}] {message}", file=sys.stderr)
+
+
+def save_report_json(report: LoadTestReport, out_path: Path) -> None:
+    out_path.write_text(json.dumps(asdict(report), indent=2, default=str), encoding="utf-8")
+    print(f"\nSaved results to {out_path}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test GanttBuddy client flows.")
+    parser.add_argument("--base-url", default="", help="Existing backend to target; omit to start the stub.")
+    parser.add_argument("--token", default="", help="Bearer token for --base-url; all users share it.")
+    parser.add_argument("--users", type=int, default=4, help="Concurrent simulated users.")
+    parser.add_argument("--iterations", type=int, default=3, help="Flow sequences per user.")
+    parser.add_argument(
+        "--flows",
+        nargs="+",
+        default=list(DEFAULT_FLOWS),
+        choices=sorted(FLOWS),
+        help="Flows each user replays, in order.",
+    )
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Pause between flows.")
+    parser.add_argument(
+        "--fresh-sessions",
+        action="store_true",
+        help="Use a new token per iteration so per-user caches start cold.",
+    )
+    parser.add_argument("--json-out", type=str, default="", help="Optional path to save the report as JSON.")
+    add_fixture_arguments(parser)
+    args = parser.parse_args()
+
+    # The client runs outside `streamlit run`; its bare-mode warnings are expected.
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+
+    server: StubServer | None = None
+    base_url = args.base_url
+    if not base_url:
+        try:
+            server = StubServer(backend_from_args(args)).start()
+        except ValueError as exc:
+            print(f"Setup error: {exc}", file=sys.stderr)
+            return 1
+        base_url = server.base_url
+        print(f"Started stub backend on {base_url}")
+
+    try:
+        report = run_load(
+            base_url,
+            users=args.users,
+            iterations=args.iterations,
+            flows=args.flows,
+            think_seconds=args.think_ms / 1000.0,
+            fresh_sessions=args.fresh_sessions,
+            token=args.token or None,
+        )
+    finally:
+        if server is not None:
+            server.stop()
+
+    print_report(report)
+    if args.json_out:
+        save_report_json(report, Path(args.json_out).resolve())
+    return 1 if any(s.errors for s in report.flow_summaries) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
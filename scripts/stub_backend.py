@@ -0,0 +1,908 @@
+"""
+Local stand-in for the GanttBuddy API, for performance work without the real backend.
+
+Serves the endpoints used by `logic/backend/api_client.py`, `signals.py` and
+`login.py` from synthetic, seeded fixtures:
+- auth (me, oidc exchange)
+- projects list, snapshot, import, members, attention, closeout
+- analytics dashboard, forecast, inching performance
+- sites, mills, crews
+- delays, events, todos
+- signals, data sources, observations, intervals
+- organization dashboard / summaries / activity
+
+GET responses carry an ETag and honour If-None-Match, so the client's
+conditional-GET path is exercised too. Latency is configurable globally and
+per endpoint template.
+
+Usage examples:
+
+    python scripts/stub_backend.py --port 8000 --latency-ms 40 --jitter-ms 20
+
+    python scripts/stub_backend.py \
+        --projects 20 --tasks-per-project 400 \
+        --route-latency "/projects/{id}/snapshot=250" \
+        --route-latency "/projects/{id}/analytics/dashboard=400"
+
+Then run the app with GANTTBUDDY_API_BASE_URL=http://127.0.0.1:8000.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gzip
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlparse
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+
+sys.path.insert(0, str(SRC_ROOT))
+
+from logic.backend.instrumentation import endpoint_template
+
+STUB_ORGANIZATION_ID = "00000000-0000-4000-8000-000000000001"
+STUB_SITE_ID = "00000000-0000-4000-8000-0000000000a1"
+TASK_STATUSES = ("NOT_STARTED", "IN_PROGRESS", "COMPLETE", "BLOCKED")
+TASK_TYPES = ("GENERIC", "STRIP", "INSTALL", "INCH")
+EVENT_TYPES = ("TASK_UPDATED", "TASK_CREATED", "PROJECT_UPDATED", "PHASE_CREATED")
+DELAY_TYPES = ("PERFORMANCE", "EQUIPMENT", "SAFETY", "FOUND_WORK", "PREPARATION", "MANPOWER_SHORTAGE", "OTHER")
+
+
+def _iso(value: dt.datetime) -> str:
+    return value.astimezone(dt.UTC).isoformat().replace("+00:00", "Z")
+
+
+def _parse_iso(value: str | None) -> dt.datetime | None:
+    if not value:
+        return None
+    return dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _stable_uuid(*parts: Any) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, "ganttbuddy-stub/" + "/".join(map(str, parts))))
+
+
+@dataclass
+class LatencyProfile:
+    base_ms: float = 0.0
+    jitter_ms: float = 0.0
+    per_route_ms: dict[str, float] = field(default_factory=dict)
+
+    def delay_seconds(self, template: str, rng: random.Random) -> float:
+        base = self.per_route_ms.get(template, self.base_ms)
+        jitter = rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(base + jitter, 0.0) / 1000.0
+
+
+@dataclass
+class StubFixtures:
+    projects: list[dict[str, Any]]
+    snapshots: dict[str, dict[str, Any]]
+    events: list[dict[str, Any]]
+    delays: dict[str, list[dict[str, Any]]]
+    todos: list[dict[str, Any]]
+    signals: dict[str, list[dict[str, Any]]]
+    data_sources: dict[str, list[dict[str, Any]]]
+    sites: list[dict[str, Any]]
+    mills: list[dict[str, Any]]
+    crews: list[dict[str, Any]]
+
+
+def build_fixtures(
+    *,
+    n_projects: int = 5,
+    tasks_per_project: int = 120,
+    events_per_project: int = 200,
+    delays_per_project: int = 60,
+    signals_per_project: int = 4,
+    seed: int = 7,
+    now: dt.datetime | None = None,
+) -> StubFixtures:
+    rng = random.Random(seed)
+    now = now or dt.datetime.now(dt.UTC).replace(microsecond=0)
+    tasks_per_phase = 20
+
+    projects: list[dict[str, Any]] = []
+    snapshots: dict[str, dict[str, Any]] = {}
+    events: list[dict[str, Any]] = []
+    delays: dict[str, list[dict[str, Any]]] = {}
+    todos: list[dict[str, Any]] = []
+    signals: dict[str, list[dict[str, Any]]] = {}
+    data_sources: dict[str, list[dict[str, Any]]] = {}
+
+    for p in range(n_projects):
+        project_id = _stable_uuid("project", seed, p)
+        start = now - dt.timedelta(days=rng.randint(1, 10))
+        cursor = start
+        phases: list[dict[str, Any]] = []
+        tasks: list[dict[str, Any]] = []
+        for t in range(tasks_per_project):
+            if t % tasks_per_phase == 0:
+                phases.append(
+                    {
+                        "id": _stable_uuid("phase", seed, p, len(phases)),
+                        "project_id": project_id,
+                        "name": f"Phase {len(phases) + 1}",
+                        "sort_mode": "manual",
+                        "position": len(phases),
+                        "planned": True,
+                        "constraints": [],
+                    }
+                )
+            duration = dt.timedelta(minutes=rng.choice((30, 60, 90, 120, 240)))
+            planned_end = cursor + duration
+            started = planned_end < now
+            actual_start = cursor + dt.timedelta(minutes=rng.randint(-10, 30)) if started else None
+            actual_end = actual_start + duration * rng.uniform(0.8, 1.4) if started and rng.random() < 0.9 else None
+            tasks.append(
+                {
+                    "id": _stable_uuid("task", seed, p, t),
+                    "project_id": project_id,
+                    "phase_id": phases[-1]["id"],
+                    "name": f"Task {t + 1}",
+                    "position": t % tasks_per_phase,
+                    "planned_start": _iso(cursor),
+                    "planned_end": _iso(planned_end),
+                    "actual_start": _iso(actual_start) if actual_start else None,
+                    "actual_end": _iso(actual_end) if actual_end else None,
+                    "note": "",
+                    "status": "COMPLETE" if actual_end else ("IN_PROGRESS" if actual_start else "NOT_STARTED"),
+                    "planned": True,
+                    "task_type": rng.choice(TASK_TYPES),
+                    "constraints": [],
+                }
+            )
+            cursor = planned_end
+
+        project = {
+            "id": project_id,
+            "name": f"Stub project {p + 1}",
+            "description": "Synthetic project served by the stub backend.",
+            "project_type": "GENERIC",
+            "closed": False,
+            "site_id": STUB_SITE_ID,
+            "timezone_name": "America/Vancouver",
+            "created_at": _iso(start - dt.timedelta(days=3)),
+            "updated_at": _iso(now),
+            "planned_start": _iso(start),
+            "planned_finish": _iso(cursor),
+            "created_by_user_id": _stable_uuid("user", 0),
+            "can_view": True,
+            "can_edit": True,
+            "can_manage_members": p == 0,
+        }
+        projects.append(project)
+        snapshots[project_id] = {
+            "project": dict(project),
+            "settings": {
+                "work_all_day": True,
+                "work_start_time": "07:00:00",
+                "work_end_time": "19:00:00",
+                "working_days_mask": 127,
+                "observe_state_holidays": False,
+                "province": None,
+                "duration_resolution": "hours",
+            },
+            "shift_definition": None,
+            "shift_assignments": [],
+            "phases": phases,
+            "tasks": tasks,
+            "metadata": None,
+        }
+
+        for e in range(events_per_project):
+            task = rng.choice(tasks)
+            event_type = rng.choice(EVENT_TYPES)
+            payload: dict[str, Any] = {"name": task["name"], "status": task["status"], "position": 0}
+            if event_type == "PROJECT_UPDATED":
+                payload = {"field_changes": {"description": ["old", "new"]}}
+            events.append(
+                {
+                    "id": _stable_uuid("event", seed, p, e),
+                    "project_name": project["name"],
+                    "ts": _iso(now - dt.timedelta(minutes=rng.randint(1, 60 * 24 * 10))),
+                    "project_id": project_id,
+                    "phase_id": task["phase_id"],
+                    "task_id": task["id"],
+                    "user_id": _stable_uuid("user", e % 3),
+                    "user_name": f"User {e % 3}",
+                    "event_type": event_type,
+                    "payload": payload,
+                }
+            )
+
+        project_delays = []
+        for d in range(delays_per_project):
+            delay_start = start + dt.timedelta(minutes=rng.randint(0, int((now - start).total_seconds() // 60)))
+            minutes = rng.randint(5, 120)
+            project_delays.append(
+                {
+                    "id": _stable_uuid("delay", seed, p, d),
+                    "project_id": project_id,
+                    "delay_type": rng.choice(DELAY_TYPES),
+                    "duration_minutes": minutes,
+                    "description": f"Delay {d + 1}",
+                    "start_dt": _iso(delay_start),
+                    "end_dt": _iso(delay_start + dt.timedelta(minutes=minutes)),
+                    "shift_assignment_id": None,
+                    "created_by": _stable_uuid("user", 0),
+                    "created_at": _iso(delay_start),
+                    "updated_at": None,
+                    "updated_by": None,
+                }
+            )
+        delays[project_id] = sorted(project_delays, key=lambda item: item["start_dt"])
+
+        for n in range(5):
+            todos.append(
+                {
+                    "id": _stable_uuid("todo", seed, p, n),
+                    "owner_id": _stable_uuid("user", 0),
+                    "project_id": project_id,
+                    "task_id": tasks[n]["id"] if tasks else None,
+                    "name": f"Follow up {n + 1}",
+                    "description": "",
+                    "status": rng.choice(TASK_STATUSES),
+                    "priority": rng.randint(0, 5),
+                    "created_at": _iso(start),
+                    "updated_at": _iso(now),
+                    "start_date": None,
+                    "due_date": _iso(now + dt.timedelta(days=n)),
+                    "completed_at": None,
+                }
+            )
+
+        data_source_id = _stable_uuid("data-source", seed, p)
+        data_sources[project_id] = [
+            {
+                "id": data_source_id,
+                "project_id": project_id,
+                "name": "Stub historian",
+                "source_type": "API",
+                "config_json": {},
+                "is_active": True,
+                "last_synced_at": _iso(now),
+                "created_at": _iso(start),
+                "updated_at": _iso(now),
+            }
+        ]
+        signals[project_id] = [
+            {
+                "id": _stable_uuid("signal", seed, p, s),
+                "project_id": project_id,
+                "key": f"signal_{s}",
+                "name": f"Signal {s}",
+                "description": None,
+                "data_type": "BOOLEAN" if s % 2 else "NUMERIC",
+                "value_mode": "STATE_CHANGE" if s % 2 else "SAMPLE",
+                "unit": None if s % 2 else "kW",
+                "data_source_id": data_source_id,
+                "is_builtin": False,
+                "metadata_json": None,
+                "created_at": _iso(start),
+                "updated_at": _iso(now),
+            }
+            for s in range(signals_per_project)
+        ]
+
+    events.sort(key=lambda item: item["ts"], reverse=True)
+    sites = [{"id": STUB_SITE_ID, "name": "Stub site", "organization_id": STUB_ORGANIZATION_ID}]
+    mills = [
+        {"id": _stable_uuid("mill", m), "site_id": STUB_SITE_ID, "name": f"Mill {m + 1}", "active": True}
+        for m in range(3)
+    ]
+    crews = [{"id": _stable_uuid("crew", c), "site_id": STUB_SITE_ID, "name": f"Crew {c + 1}"} for c in range(4)]
+    return StubFixtures(
+        projects=projects,
+        snapshots=snapshots,
+        events=events,
+        delays=delays,
+        todos=todos,
+        signals=signals,
+        data_sources=data_sources,
+        sites=sites,
+        mills=mills,
+        crews=crews,
+    )
+
+
+Route = tuple[str, re.Pattern[str], Callable[..., Any]]
+
+
+class StubBackend:
+    """
+    Thread-safe, in-memory backend state plus a router.
+
+    Handlers receive `(query, body, *path_groups)` and return a JSON-able
+    payload, or `(status, payload)` for non-200 responses.
+    """
+
+    def __init__(
+        self,
+        fixtures: StubFixtures | None = None,
+        *,
+        latency: LatencyProfile | None = None,
+        seed: int = 7,
+    ):
+        self.fixtures = fixtures or build_fixtures(seed=seed)
+        self.latency = latency or LatencyProfile()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.request_counts: dict[str, int] = {}
+        self.routes: list[Route] = []
+        self._register_routes()
+
+    def _route(self, method: str, pattern: str, handler: Callable[..., Any]) -> None:
+        regex = re.compile("^" + re.sub(r"\{[a-z_]+\}", r"([^/]+)", pattern) + "$")
+        self.routes.append((method, regex, handler))
+
+    def _register_routes(self) -> None:
+        r = self._route
+        r("GET", "/auth/me", self._me)
+        r("POST", "/auth/oidc/exchange", lambda q, b: {"access_token": f"stub-{uuid.uuid4().hex}"})
+        r("GET", "/projects", self._projects)
+        r("GET", "/projects/attention", self._attention)
+        r("POST", "/projects/import", self._import_project)
+        r("PATCH", "/projects/closeout/{project_id}", self._closeout)
+        r("GET", "/projects/{project_id}/snapshot", self._snapshot)
+        r("GET", "/projects/{project_id}/members", self._members)
+        r("GET", "/projects/{project_id}/analytics/dashboard", self._dashboard)
+        r("GET", "/projects/{project_id}/analytics/forecast", self._forecast)
+        r("GET", "/projects/{project_id}/analytics/inching-performance", self._inching)
+        r("GET", "/projects/{project_id}/signals", lambda q, b, pid: self.fixtures.signals.get(pid, []))
+        r("GET", "/projects/{project_id}/signals/{signal_id}", self._signal)
+        r("GET", "/projects/{project_id}/signals/{signal_id}/observations", self._observations)
+        r("POST", "/projects/{project_id}/signals/{signal_id}/observations", self._create_observations)
+        r("GET", "/projects/{project_id}/signals/{signal_id}/intervals", self._intervals)
+        r("GET", "/projects/{project_id}/data-sources", lambda q, b, pid: self.fixtures.data_sources.get(pid, []))
+        r("GET", "/sites", lambda q, b: self.fixtures.sites)
+        r("GET", "/sites/{site_id}", self._site)
+        r("GET", "/mills", lambda q, b: self.fixtures.mills)
+        r("GET", "/crews", lambda q, b: self.fixtures.crews)
+        r("POST", "/crews", lambda q, b: {"id": str(uuid.uuid4()), **(b or {})})
+        r("GET", "/delays", self._delays)
+        r("PUT", "/delays/{project_id}/delays", self._save_delays)
+        r("GET", "/events", self._events)
+        r("GET", "/todos", self._todos)
+        r("PUT", "/todos", self._save_todos)
+        r("DELETE", "/todos/{todo_id}", self._delete_todo)
+        r("GET", "/organizations/{organization_id}/dashboard", self._org_dashboard)
+        r("GET", "/organizations/{organization_id}/projects/summary", self._org_projects)
+        r("GET", "/organizations/{organization_id}/users/summary", self._org_users)
+        r("GET", "/organizations/{organization_id}/activity", self._org_activity)
+
+    def dispatch(self, method: str, path: str, query: dict[str, str], body: Any) -> tuple[int, Any]:
+        template = endpoint_template(path)
+        with self._lock:
+            self.request_counts[f"{method} {template}"] = self.request_counts.get(f"{method} {template}", 0) + 1
+            delay = self.latency.delay_seconds(template, self._rng)
+        if delay:
+            time.sleep(delay)
+
+        for route_method, regex, handler in self.routes:
+            if route_method != method:
+                continue
+            match = regex.match(path)
+            if match is None:
+                continue
+            result = handler(query, body, *match.groups())
+            if isinstance(result, tuple):
+                return result
+            return 200, result
+        return 404, {"detail": f"No stub route for {method} {path}"}
+
+    def add_event(self, project_id: str, *, event_type: str = "TASK_UPDATED", ts: dt.datetime | None = None) -> dict:
+        snapshot = self.fixtures.snapshots[project_id]
+        task = snapshot["tasks"][0]
+        event = {
+            "id": str(uuid.uuid4()),
+            "project_name": snapshot["project"]["name"],
+            "ts": _iso(ts or dt.datetime.now(dt.UTC)),
+            "project_id": project_id,
+            "phase_id": task["phase_id"],
+            "task_id": task["id"],
+            "user_id": _stable_uuid("user", 0),
+            "user_name": "User 0",
+            "event_type": event_type,
+            "payload": {"name": task["name"], "status": task["status"], "position": 0},
+        }
+        with self._lock:
+            self.fixtures.events.insert(0, event)
+            self.fixtures.events.sort(key=lambda item: item["ts"], reverse=True)
+        return event
+
+    # ---- handlers
+
+    def _me(self, query, body):
+        return {
+            "id": _stable_uuid("user", 0),
+            "email": "stub.user@example.com",
+            "display_name": "Stub User",
+            "organizations": [
+                {"organization_id": STUB_ORGANIZATION_ID, "role": "member", "is_active": True},
+            ],
+            "roles": [],
+        }
+
+    def _projects(self, query, body):
+        include_closed = query.get("include_closed", "false").lower() == "true"
+        return [p for p in self.fixtures.projects if include_closed or not p["closed"]]
+
+    def _attention(self, query, body):
+        now = _iso(dt.datetime.now(dt.UTC))
+        late, upcoming, awaiting = [], [], []
+        for project in self.fixtures.projects:
+            for task in self.fixtures.snapshots[project["id"]]["tasks"]:
+                record = {**task, "project_name": project["name"]}
+                if task["actual_start"] and not task["actual_end"]:
+                    awaiting.append(record)
+                elif not task["actual_start"] and task["planned_start"] < now:
+                    late.append(record)
+                elif not task["actual_start"] and len(upcoming) < 20:
+                    upcoming.append(record)
+        return {"late_tasks": late[:50], "upcoming_tasks": upcoming, "awaiting_actuals": awaiting[:50]}
+
+    def _snapshot(self, query, body, project_id):
+        snapshot = self.fixtures.snapshots.get(project_id)
+        if snapshot is None:
+            return 404, {"detail": "Project not found"}
+        return snapshot
+
+    def _import_project(self, query, body):
+        project = (body or {}).get("project") or {}
+        project_id = project.get("id") or str(uuid.uuid4())
+        with self._lock:
+            self.fixtures.snapshots[project_id] = body
+        return {"project_id": project_id}
+
+    def _closeout(self, query, body, project_id):
+        snapshot = self.fixtures.snapshots.get(project_id)
+        if snapshot is None:
+            return 404, {"detail": "Project not found"}
+        snapshot["project"]["closed"] = True
+        return {"project_id": project_id, "closed": True}
+
+    def _members(self, query, body, project_id):
+        return {
+            "project_id": project_id,
+            "members": [
+                {"user_id": _stable_uuid("user", u), "display_name": f"User {u}", "role": "editor" if u else "owner"}
+                for u in range(3)
+            ],
+        }
+
+    def _dashboard(self, query, body, project_id):
+        snapshot = self.fixtures.snapshots.get(project_id)
+        if snapshot is None:
+            return 404, {"detail": "Project not found"}
+        tasks = snapshot["tasks"]
+        counts: dict[str, int] = {}
+        for task in tasks:
+            counts[task["status"]] = counts.get(task["status"], 0) + 1
+        planned_hours = sum(
+            (_parse_iso(t["planned_end"]) - _parse_iso(t["planned_start"])).total_seconds() / 3600 for t in tasks
+        )
+        actual_hours = sum(
+            (_parse_iso(t["actual_end"]) - _parse_iso(t["actual_start"])).total_seconds() / 3600
+            for t in tasks
+            if t["actual_start"] and t["actual_end"]
+        )
+        completed = counts.get("COMPLETE", 0)
+        return {
+            "as_of": _iso(dt.datetime.now(dt.UTC)),
+            "metadata": {},
+            "overview": {
+                "kpis": [
+                    {"key": "task_count", "value": len(tasks), "unit": None},
+                    {"key": "planned_hours", "value": round(planned_hours, 2), "unit": "h"},
+                    {"key": "actual_hours", "value": round(actual_hours, 2), "unit": "h"},
+                    {"key": "delta_hours", "value": round(actual_hours - planned_hours, 2), "unit": "h"},
+                    {"key": "pct_complete", "value": round(100 * completed / max(len(tasks), 1), 1), "unit": "%"},
+                ],
+                "task_counts": counts,
+            },
+            "series": [
+                {
+                    "name": "Completed tasks",
+                    "points": [
+                        {"x": t["actual_end"], "y": i + 1}
+                        for i, t in enumerate(sorted((t for t in tasks if t["actual_end"]), key=lambda t: t["actual_end"]))
+                    ],
+                }
+            ],
+        }
+
+    def _forecast(self, query, body, project_id):
+        snapshot = self.fixtures.snapshots.get(project_id)
+        if snapshot is None:
+            return 404, {"detail": "Project not found"}
+        phases = {phase["id"]: phase for phase in snapshot["phases"]}
+        rows, planned_points = [], []
+        cumulative = 0.0
+        for task in snapshot["tasks"]:
+            planned_hours = (_parse_iso(task["planned_end"]) - _parse_iso(task["planned_start"])).total_seconds() / 3600
+            cumulative += planned_hours
+            planned_points.append({"x": task["planned_end"], "y": round(cumulative, 3)})
+            phase = phases[task["phase_id"]]
+            rows.append(
+                {
+                    "task_id": task["id"],
+                    "phase_id": task["phase_id"],
+                    "phase_name": phase["name"],
+                    "phase_position": phase["position"],
+                    "task_name": task["name"],
+                    "task_position": task["position"],
+                    "planned": task["planned"],
+                    "status": task["status"],
+                    "planned_start": task["planned_start"],
+                    "planned_end": task["planned_end"],
+                    "planned_duration_hours": round(planned_hours, 3),
+                    "actual_start": task["actual_start"],
+                    "actual_end": task["actual_end"],
+                    "effective_start": task["actual_start"] or task["planned_start"],
+                    "effective_end": task["actual_end"] or task["planned_end"],
+                    "effective_duration_hours": round(planned_hours, 3),
+                    "is_completed": task["status"] == "COMPLETE",
+                    "is_in_progress": task["status"] == "IN_PROGRESS",
+                }
+            )
+        project = snapshot["project"]
+        return {
+            "project_id": project_id,
+            "as_of": _iso(dt.datetime.now(dt.UTC)),
+            "timezone_name": project.get("timezone_name", "America/Vancouver"),
+            "has_actuals": any(task["actual_start"] for task in snapshot["tasks"]),
+            "planned_end": project.get("planned_finish"),
+            "forecast_end": project.get("planned_finish"),
+            "forecast_start": project.get("planned_start"),
+            "total_planned_hours": round(cumulative, 3),
+            "planned_cumulative_hours": planned_points,
+            "actual_forecast_cumulative_hours": planned_points,
+            "tasks": rows,
+        }
+
+    def _inching(self, query, body, project_id):
+        return {"kpis": [], "shift_inch_performance": []}
+
+    def _signal(self, query, body, project_id, signal_id):
+        for signal in self.fixtures.signals.get(project_id, []):
+            if signal["id"] == signal_id:
+                return signal
+        return 404, {"detail": "Signal not found"}
+
+    def _signal_window(self, query) -> tuple[dt.datetime, dt.datetime]:
+        end = _parse_iso(query.get("end")) or dt.datetime.now(dt.UTC).replace(second=0, microsecond=0)
+        start = _parse_iso(query.get("start")) or end - dt.timedelta(days=1)
+        return start, end
+
+    def _observations(self, query, body, project_id, signal_id):
+        # Deterministic one-minute samples derived from the timestamp, so any
+        # window / page of the same signal is consistent across requests.
+        start, end = self._signal_window(query)
+        limit = int(query.get("limit", 500))
+        offset = int(query.get("offset", 0))
+        boolean = signal_id.endswith(tuple("13579bdf"))
+        first = start.replace(second=0, microsecond=0)
+        if first < start:
+            first += dt.timedelta(minutes=1)
+        total = int((end - first).total_seconds() // 60) + 1 if end >= first else 0
+        rows = []
+        for i in range(offset, min(offset + limit, total)):
+            ts = first + dt.timedelta(minutes=i)
+            minute = int(ts.timestamp() // 60)
+            row = {"signal_id": signal_id, "timestamp_utc": _iso(ts)}
+            if boolean:
+                row["boolean_value"] = (minute // 37) % 2 == 0
+            else:
+                row["numeric_value"] = round(100 + 25 * ((minute * 7919) % 97) / 97, 3)
+            rows.append(row)
+        return rows
+
+    def _create_observations(self, query, body, project_id, signal_id):
+        observations = (body or {}).get("observations", [])
+        return [{"signal_id": signal_id, **item} for item in observations]
+
+    def _intervals(self, query, body, project_id, signal_id):
+        start, end = self._signal_window(query)
+        intervals, cursor, state = [], start, True
+        while cursor < end:
+            stop = min(cursor + dt.timedelta(minutes=37), end)
+            intervals.append(
+                {
+                    "start_utc": _iso(cursor),
+                    "end_utc": _iso(stop),
+                    "value": state,
+                    "duration_seconds": (stop - cursor).total_seconds(),
+                }
+            )
+            cursor, state = stop, not state
+        return intervals
+
+    def _site(self, query, body, site_id):
+        for site in self.fixtures.sites:
+            if site["id"] == site_id:
+                return site
+        return 404, {"detail": "Site not found"}
+
+    def _delays(self, query, body):
+        project_delays = self.fixtures.delays.get(query.get("project_id", ""), [])
+        time_min = _parse_iso(query.get("time_min"))
+        time_max = _parse_iso(query.get("time_max"))
+        rows = [
+            d
+            for d in project_delays
+            if (time_min is None or _parse_iso(d["end_dt"]) >= time_min)
+            and (time_max is None or _parse_iso(d["start_dt"]) <= time_max)
+            and (not query.get("delay_type") or d["delay_type"] == query["delay_type"])
+        ]
+        if query.get("order") == "start_dt":
+            rows.sort(key=lambda d: (d["start_dt"], d["id"]))
+        offset = int(query.get("offset", 0) or 0)
+        limit = int(query.get("limit", 0) or 0)
+        return rows[offset : offset + limit] if limit else rows[offset:]
+
+    def _save_delays(self, query, body, project_id):
+        saved = []
+        for item in body or []:
+            saved.append(
+                {
+                    **item,
+                    "id": item.get("id") or str(uuid.uuid4()),
+                    "project_id": project_id,
+                    "created_by": _stable_uuid("user", 0),
+                    "created_at": _iso(dt.datetime.now(dt.UTC)),
+                    "updated_at": None,
+                    "updated_by": None,
+                }
+            )
+        with self._lock:
+            if query.get("replace") == "true":
+                self.fixtures.delays[project_id] = saved
+            else:
+                by_id = {d["id"]: d for d in self.fixtures.delays.get(project_id, [])}
+                by_id.update({d["id"]: d for d in saved})
+                self.fixtures.delays[project_id] = sorted(by_id.values(), key=lambda item: item["start_dt"] or "")
+        return saved
+
+    def _events(self, query, body):
+        project_id = query.get("project_id")
+        from_dt = query.get("from_dt")
+        n_events = int(query.get("n_events", 0) or 0)
+        with self._lock:
+            events = list(self.fixtures.events)
+        rows = [
+            e
+            for e in events
+            if (not project_id or e["project_id"] == project_id) and (not from_dt or e["ts"] > from_dt)
+        ]
+        return rows[:n_events] if n_events else rows
+
+    def _todos(self, query, body):
+        return [
+            t
+            for t in self.fixtures.todos
+            if (not query.get("project_id") or t["project_id"] == query["project_id"])
+            and (not query.get("task_id") or t["task_id"] == query["task_id"])
+            and (not query.get("status") or t["status"] == query["status"])
+        ]
+
+    def _save_todos(self, query, body):
+        now = _iso(dt.datetime.now(dt.UTC))
+        saved = [
+            {
+                **item,
+                "id": item.get("id") or str(uuid.uuid4()),
+                "owner_id": _stable_uuid("user", 0),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for item in body or []
+        ]
+        with self._lock:
+            by_id = {t["id"]: t for t in self.fixtures.todos}
+            by_id.update({t["id"]: t for t in saved})
+            self.fixtures.todos = list(by_id.values())
+        return saved
+
+    def _delete_todo(self, query, body, todo_id):
+        with self._lock:
+            self.fixtures.todos = [t for t in self.fixtures.todos if t["id"] != todo_id]
+        return 204, None
+
+    def _org_dashboard(self, query, body, organization_id):
+        return {
+            "organization_id": organization_id,
+            "project_count": len(self.fixtures.projects),
+            "active_project_count": sum(not p["closed"] for p in self.fixtures.projects),
+            "user_count": 3,
+        }
+
+    def _paged(self, items: list[Any], query) -> dict[str, Any]:
+        page = int(query.get("page", 1))
+        page_size = int(query.get("page_size", 100))
+        start = (page - 1) * page_size
+        return {"items": items[start : start + page_size], "page": page, "page_size": page_size, "total": len(items)}
+
+    def _org_projects(self, query, body, organization_id):
+        return self._paged(self.fixtures.projects, query)
+
+    def _org_users(self, query, body, organization_id):
+        users = [{"id": _stable_uuid("user", u), "display_name": f"User {u}", "role": "member"} for u in range(3)]
+        return self._paged(users, query)
+
+    def _org_activity(self, query, body, organization_id):
+        limit = int(query.get("limit", 25))
+        return {"items": self.fixtures.events[:limit]}
+
+
+def _make_handler(backend: StubBackend) -> type[BaseHTTPRequestHandler]:
+    class StubRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; without this, delayed
+        # ACKs add ~40ms to every keep-alive response.
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _handle(self) -> None:
+            parsed = urlparse(self.path)
+            query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+            length = int(self.headers.get("Content-Length") or 0)
+            body = None
+            if length:
+                raw = self.rfile.read(length)
+                if self.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+                try:
+                    body = json.loads(raw)
+                except ValueError:
+                    body = None
+
+            if not self.headers.get("Authorization") and not parsed.path.startswith("/auth/oidc"):
+                status, payload = 401, {"detail": "Not authenticated"}
+            else:
+                try:
+                    status, payload = backend.dispatch(self.command, parsed.path, query, body)
+                except Exception as exc:  # surface handler bugs as 500s, like the real API
+                    status, payload = 500, {"detail": f"{type(exc).__name__}: {exc}"}
+
+            data = b"" if payload is None else json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            etag = None
+            if self.command == "GET" and status == 200:
+                etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    status, data = 304, b""
+
+            self.send_response(status)
+            if etag:
+                self.send_header("ETag", etag)
+            if data:
+                self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if data:
+                self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    return StubRequestHandler
+
+
+class StubServer:
+    """Runs a `StubBackend` on a background `ThreadingHTTPServer`."""
+
+    def __init__(self, backend: StubBackend | None = None, *, host: str = "127.0.0.1", port: int = 0):
+        self.backend = backend or StubBackend()
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self.backend))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-backend", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def parse_route_latency(values: list[str]) -> dict[str, float]:
+    per_route: dict[str, float] = {}
+    for value in values:
+        template, sep, ms = value.rpartition("=")
+        if not sep or not template:
+            raise ValueError(f"Invalid --route-latency {value!r}; expected TEMPLATE=MS")
+        per_route[template] = float(ms)
+    return per_route
+
+
+def add_fixture_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--projects", type=int, default=5, help="Number of synthetic projects.")
+    parser.add_argument("--tasks-per-project", type=int, default=120, help="Tasks in each project snapshot.")
+    parser.add_argument("--events-per-project", type=int, default=200, help="Feed events per project.")
+    parser.add_argument("--delays-per-project", type=int, default=60, help="Delays per project.")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the synthetic fixtures.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Base latency added to every request.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform random jitter on top of the base.")
+    parser.add_argument(
+        "--route-latency",
+        action="append",
+        default=[],
+        help="Per-endpoint base latency, e.g. '/projects/{id}/snapshot=250'. Repeatable.",
+    )
+
+
+def backend_from_args(args: argparse.Namespace) -> StubBackend:
+    fixtures = build_fixtures(
+        n_projects=args.projects,
+        tasks_per_project=args.tasks_per_project,
+        events_per_project=args.events_per_project,
+        delays_per_project=args.delays_per_project,
+        seed=args.seed,
+    )
+    latency = LatencyProfile(
+        base_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        per_route_ms=parse_route_latency(args.route_latency),
+    )
+    return StubBackend(fixtures, latency=latency, seed=args.seed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run a local stub of the GanttBuddy API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    add_fixture_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        backend = backend_from_args(args)
+    except ValueError as exc:
+        print(f"Setup error: {exc}", file=sys.stderr)
+        return 1
+
+    server = StubServer(backend, host=args.host, port=args.port)
+    print(f"Stub backend listening on {server.base_url} ({len(backend.fixtures.projects)} projects)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,367 @@
+"""
+Deterministic GanttBuddy-format workbooks for the Excel import benchmark.
+
+The workbooks follow the Daily Schedule layout the loader reads with
+`default_excel_parameters()`: phases with duration formulas, tasks whose
+start/end cells are formulas on the row above (shared formulas for the ends,
+with cached values like Excel writes), predecessor and UUID columns, partial
+actuals, plus the Project Inputs, metadata and shift sheets. The same
+(rows, seed) always produces the same bytes.
+
+Sheet XML is written straight into the zip, one row at a time, so 100k-row
+workbooks generate in seconds with flat memory.
+
+Usage:
+
+    python scripts/synthetic_workbook.py --sizes 1k 10k 100k --out-dir tests/data
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import random
+import uuid
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable
+from xml.sax.saxutils import escape
+
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import to_excel
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+PROJECT_ID = "synthetic-project"
+PROJECT_START = dt.datetime(2026, 2, 17, 7)
+TASKS_PER_PHASE = 40
+FIRST_PHASE_ROW = 9
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_SHEET_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+
+# cellXfs indexes in `_STYLES`
+_GENERAL, _DATETIME, _DATE, _TIME = 0, 1, 2, 3
+_STYLES = (
+    f'<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="22" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="21" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+_TASK_NAMES = (
+    "Install shell liner",
+    "Install feed head liner",
+    "Remove discharge grate",
+    "Strip worn lifters",
+    "Inch mill",
+    "Torque bolts",
+    "Clean trunnion",
+    "Crane setup",
+)
+_NOTES = ("", "", "", "Waiting on crane", "Bolt seized", "Shift change")
+_HEADERS = (
+    "NO.",
+    "ACTIVITY",
+    "PLANNED DURATION (HOURS)",
+    "PLANNED START",
+    "PLANNED END",
+    "ID",
+    "ACTUAL DURATION",
+    "ACTUAL START",
+    "ACTUAL END",
+    "NOTES",
+    "PREDECESSOR",
+    "UUID",
+    "PLANNED",
+)
+
+
+def parse_size(value: str) -> int:
+    """`1k`, `10k`, `100k` or a plain row count."""
+    return SIZES.get(value.lower().strip()) or int(value)
+
+
+class _SharedStrings:
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+
+    def __call__(self, text: str) -> int:
+        if text not in self.index:
+            self.index[text] = len(self.index)
+        return self.index[text]
+
+    def xml(self) -> bytes:
+        items = "".join(f"<si><t>{escape(text)}</t></si>" for text in self.index)
+        count = len(self.index)
+        return f'<sst xmlns="{_MAIN_NS}" count="{count}" uniqueCount="{count}">{items}</sst>'.encode("utf-8")
+
+
+class _SheetWriter:
+    """Cells of one worksheet; values are written like Excel does, formulas with their cached value."""
+
+    def __init__(self, out: BinaryIO, strings: _SharedStrings):
+        self.out = out
+        self.strings = strings
+        out.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{_MAIN_NS}"><sheetData>'.encode("utf-8"))
+
+    def cell(self, ref: str, value: Any, formula: str | None = None, *, shared: str | None = None) -> str:
+        f = ""
+        if shared is not None:
+            f = f'<f t="shared" si="{shared}"/>' if formula is None else f'<f t="shared" ref="{formula[0]}" si="{shared}">{escape(formula[1])}</f>'
+        elif formula is not None:
+            f = f"<f>{escape(formula)}</f>"
+
+        if value is None:
+            return f'<c r="{ref}">{f}</c>' if f else ""
+        if isinstance(value, bool):
+            return f'<c r="{ref}" t="b">{f}<v>{int(value)}</v></c>'
+        if isinstance(value, dt.datetime):
+            return f'<c r="{ref}" s="{_DATETIME}">{f}<v>{to_excel(value)!r}</v></c>'
+        if isinstance(value, dt.date):
+            return f'<c r="{ref}" s="{_DATE}">{f}<v>{to_excel(value)!r}</v></c>'
+        if isinstance(value, dt.time):
+            return f'<c r="{ref}" s="{_TIME}">{f}<v>{to_excel(value)!r}</v></c>'
+        if isinstance(value, (int, float)):
+            return f'<c r="{ref}">{f}<v>{value!r}</v></c>'
+        if f:
+            return f'<c r="{ref}" t="str">{f}<v>{escape(value)}</v></c>'
+        return f'<c r="{ref}" t="s"><v>{self.strings(value)}</v></c>'
+
+    def row(self, row: int, cells: Iterable[str]) -> None:
+        self.out.write(f'<row r="{row}">{"".join(cells)}</row>'.encode("utf-8"))
+
+    def values(self, row: int, values: Iterable[Any]) -> None:
+        self.row(row, (self.cell(f"{get_column_letter(col)}{row}", value) for col, value in enumerate(values, start=1)))
+
+    def close(self) -> None:
+        self.out.write(b"</sheetData></worksheet>")
+
+
+def _duration_text(row: int, start: str, end: str, days: float) -> tuple[str, str]:
+    formula = f'ROUND({end}{row}-{start}{row},1)&" Days ("&ROUND(({end}{row}-{start}{row})*24,1)&" Hours)"'
+    return formula, f"{round(days, 1)} Days ({round(days * 24, 1)} Hours)"
+
+
+def _write_schedule(sheet: _SheetWriter, rows: int, rng: random.Random) -> dt.datetime:
+    sheet.values(7, _HEADERS)
+    # Row 8 is the template's project summary row; the loader drops it.
+    spacer_row = 8
+    sheet.row(spacer_row, [sheet.cell(f"B{spacer_row}", "Synthetic Project")])
+
+    row = FIRST_PHASE_ROW
+    cursor = PROJECT_START
+    completed_until = rows * 2 // 5  # first 40% of the schedule has actuals
+    task_uuids: list[str] = []
+    phase_no = task_no = 0
+    last_row = FIRST_PHASE_ROW + rows - 1
+    while row <= last_row:
+        phase_no += 1
+        tasks = min(TASKS_PER_PHASE, last_row - row)
+        hours = [rng.choice((0.5, 1.0, 1.5, 2.0, 3.0, 4.0)) for _ in range(tasks)]
+        # The first task starts with its phase; later ones sometimes wait an hour.
+        lags = [1 / 24 if i and rng.random() < 0.1 else 0.0 for i in range(tasks)]
+        phase_end = cursor + dt.timedelta(hours=sum(hours)) + dt.timedelta(days=sum(lags))
+        phase_row = row
+        duration = _duration_text(phase_row, "D", "E", (phase_end - cursor) / dt.timedelta(days=1))
+        done = row + tasks < completed_until
+        actual_duration = _duration_text(phase_row, "H", "I", (phase_end - cursor) / dt.timedelta(days=1))
+        sheet.row(phase_row, [
+            sheet.cell(f"A{phase_row}", phase_no),
+            sheet.cell(f"B{phase_row}", f"Phase {phase_no}"),
+            sheet.cell(f"C{phase_row}", duration[1], duration[0]),
+            sheet.cell(f"D{phase_row}", cursor, f"D{phase_row + 1}" if tasks else None),
+            sheet.cell(f"E{phase_row}", phase_end, f"E{phase_row + tasks}" if tasks else None),
+            sheet.cell(f"F{phase_row}", phase_no),
+            sheet.cell(f"G{phase_row}", actual_duration[1] if done else "", actual_duration[0]),
+            sheet.cell(f"H{phase_row}", cursor if done else None),
+            sheet.cell(f"I{phase_row}", phase_end if done else None),
+            sheet.cell(f"M{phase_row}", True),
+        ])
+        row += 1
+
+        shared = str(phase_no - 1)
+        for i, (task_hours, lag) in enumerate(zip(hours, lags)):
+            task_no += 1
+            start = cursor + dt.timedelta(days=lag)
+            end = start + dt.timedelta(hours=task_hours)
+            task_uuid = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            if i == 0:
+                start_formula = f"D{phase_row}"
+            else:
+                start_formula = f"E{row - 1}+1/24" if lag else f"E{row - 1}"
+            predecessor = rng.choice(task_uuids[-50:]) if task_uuids and rng.random() < 0.05 else ""
+            cells = [
+                sheet.cell(f"A{row}", task_no),
+                sheet.cell(f"B{row}", rng.choice(_TASK_NAMES)),
+                sheet.cell(f"C{row}", task_hours),
+                sheet.cell(f"D{row}", start, start_formula),
+                sheet.cell(
+                    f"E{row}",
+                    end,
+                    (f"E{row}:E{phase_row + tasks}", f"D{row}+C{row}/24") if i == 0 else None,
+                    shared=shared,
+                ),
+                sheet.cell(f"F{row}", task_no),
+            ]
+            if row < completed_until:
+                overrun = dt.timedelta(minutes=rng.choice((0, 0, 0, 15, 30, 90, -15)))
+                cells += [
+                    sheet.cell(f"G{row}", task_hours + overrun / dt.timedelta(hours=1)),
+                    sheet.cell(f"H{row}", start),
+                    sheet.cell(f"I{row}", end + overrun),
+                ]
+            cells += [
+                sheet.cell(f"J{row}", rng.choice(_NOTES) or None),
+                sheet.cell(f"K{row}", predecessor or None),
+                sheet.cell(f"L{row}", task_uuid),
+                sheet.cell(f"M{row}", rng.random() > 0.05),
+            ]
+            sheet.row(row, cells)
+            task_uuids.append(task_uuid)
+            cursor = end
+            row += 1
+    return cursor
+
+
+def _write_project_inputs(sheet: _SheetWriter) -> None:
+    sheet.row(13, [sheet.cell("D13", "MILL_RELINE")])
+    sheet.row(14, [sheet.cell("D14", PROJECT_ID)])
+
+
+def _write_metadata(sheet: _SheetWriter) -> None:
+    sheet.values(1, ("site_id", "site_name", "mill_id", "mill_name", "vendor", "liner_system", "campaign_id", "scope", "liner_type", "supervisor", "notes"))
+    sheet.values(2, ("site-1", "Synthetic Site", "mill-1", "SAG Mill", "Vendor", "Megaliner", "campaign-1", "Full", "Shell", "Supervisor", "Generated"))
+
+
+def _write_shift_definition(sheet: _SheetWriter) -> None:
+    sheet.values(1, ("id", "project_id", "day_start_time", "night_start_time", "shift_length_hours", "timezone"))
+    sheet.values(2, ("shift-def-1", PROJECT_ID, dt.time(7), dt.time(19), 12, "America/Vancouver"))
+
+
+def _write_shift_assignments(sheet: _SheetWriter, end: dt.datetime) -> None:
+    sheet.values(1, ("id", "project_id", "shift_type", "crew_id", "start_date", "end_date"))
+    # Four on, four off: crews A/B on days and C/D on nights, swapping every rotation.
+    row = 2
+    start = PROJECT_START.date()
+    rotation = 0
+    while start <= end.date():
+        stop = start + dt.timedelta(days=3)
+        for shift_type, crews in (("day", "AB"), ("night", "CD")):
+            crew = crews[rotation % 2]
+            sheet.values(row, (f"assign-{row - 1}", PROJECT_ID, shift_type, f"crew-{crew.lower()}", start, stop))
+            row += 1
+        start += dt.timedelta(days=4)
+        rotation += 1
+
+
+def write_workbook(out: BinaryIO, rows: int, *, seed: int = 0) -> None:
+    """Write a synthetic workbook whose Daily Schedule has `rows` phase and task rows."""
+    rng = random.Random(seed)
+    strings = _SharedStrings()
+    sheets = ("Project Inputs", "metadata", "Daily Schedule", "shift_definition", "shift_assignments")
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        project_end = PROJECT_START
+        for number, name in enumerate(sheets, start=1):
+            # A fixed timestamp keeps the archive bytes deterministic.
+            info = zipfile.ZipInfo(f"xl/worksheets/sheet{number}.xml", date_time=(2026, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, "w") as part:
+                sheet = _SheetWriter(part, strings)
+                if name == "Daily Schedule":
+                    project_end = _write_schedule(sheet, rows, rng)
+                elif name == "Project Inputs":
+                    _write_project_inputs(sheet)
+                elif name == "metadata":
+                    _write_metadata(sheet)
+                elif name == "shift_definition":
+                    _write_shift_definition(sheet)
+                else:
+                    _write_shift_assignments(sheet, project_end)
+                sheet.close()
+
+        overrides = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{number}.xml" ContentType="{_SHEET_TYPE}"/>'
+            for number in range(1, len(sheets) + 1)
+        )
+        parts = {
+            "[Content_Types].xml": (
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                '<Default Extension="xml" ContentType="application/xml"/>'
+                '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+                '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+                f"{overrides}</Types>"
+            ),
+            "_rels/.rels": (
+                f'<Relationships xmlns="{_PKG_REL_NS}">'
+                f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+                "</Relationships>"
+            ),
+            "xl/workbook.xml": (
+                f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>'
+                + "".join(f'<sheet name="{escape(name)}" sheetId="{n}" r:id="rId{n}"/>' for n, name in enumerate(sheets, start=1))
+                + "</sheets></workbook>"
+            ),
+            "xl/_rels/workbook.xml.rels": (
+                f'<Relationships xmlns="{_PKG_REL_NS}">'
+                + "".join(
+                    f'<Relationship Id="rId{n}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{n}.xml"/>'
+                    for n in range(1, len(sheets) + 1)
+                )
+                + f'<Relationship Id="rId{len(sheets) + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+                + f'<Relationship Id="rId{len(sheets) + 2}" Type="{_REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+                + "</Relationships>"
+            ),
+            "xl/styles.xml": _STYLES,
+            "xl/sharedStrings.xml": strings.xml(),
+        }
+        for name, data in parts.items():
+            info = zipfile.ZipInfo(name, date_time=(2026, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, data)
+
+
+def build_workbook(rows: int, *, seed: int = 0) -> bytes:
+    buffer = BytesIO()
+    write_workbook(buffer, rows, seed=seed)
+    return buffer.getvalue()
+
+
+def ensure_workbook(out_dir: Path, rows: int, *, seed: int = 0) -> Path:
+    """Path of the synthetic workbook for `rows`, generating it if it is not on disk yet."""
+    path = out_dir / f"synthetic_{rows}_rows_seed{seed}.xlsx"
+    if not path.exists():
+        out_dir.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as out:
+            write_workbook(out, rows, seed=seed)
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic GanttBuddy workbooks.")
+    parser.add_argument("--sizes", nargs="+", default=list(SIZES), help="Row counts: 1k, 10k, 100k or integers.")
+    parser.add_argument("--out-dir", default="tests/data", help="Directory to write the workbooks to.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        path = ensure_workbook(Path(args.out_dir).resolve(), parse_size(size), seed=args.seed)
+        print(f"{path} ({path.stat().st_size / 1024.0:.1f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
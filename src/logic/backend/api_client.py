@@ -1,3 +1,5 @@
+import hashlib
+import json
 import requests
 import streamlit as st
 import pydantic
@@ -13,43 +15,160 @@ from typing import Optional
 
 from logic.backend.config import get_backend_environment_config
 from logic.backend.export_project import project_to_import_payload
+from logic.backend.http_cache import conditional_get_json
+from logic.backend.instrumentation import backend_session, record_cache_lookup
+from logic.backend.reference_cache import get_reference_cache
+from logic.backend.single_flight import get_single_flight
+from logic.cache_registry import REFERENCE_TAG, invalidate_tags, tagged_cache_data
 
 from models.project import Project
 from models.crew import CrewOut
 from models.delay import DelayType
+from models.parsing import parse_model_list_json
 from models.todo import TodoIn, TodoUpsertRow
 
 
 API_BASE = get_backend_environment_config().api_base_url
 
+# Cached reads below are revalidated with the backend's ETag / Last-Modified once
+# the short Streamlit TTL lapses, so a refresh costs a 304 instead of a full body.
+REVALIDATE_TTL_SECONDS = 30
+
 
 @st.cache_data
 def get_current_user(auth_headers: dict) -> dict:
-    response = requests.get(f"{API_BASE}/auth/me", headers=auth_headers, timeout=10)
+    response = backend_session.get(f"{API_BASE}/auth/me", headers=auth_headers, timeout=10)
     if response.status_code != 200:
         raise RuntimeError(f"Failed to get current user: {response.text}")
     return response.json()
 
-@st.cache_data
+
+def reference_scope(headers: dict | None, *, per_user: bool = False) -> str:
+    """
+    Stable cache scope for the caller's permissions, independent of the bearer token.
+
+    Org-level reference data is shared between users with the same memberships
+    and roles. `per_user` adds the user id for project-scoped data, where access
+    is granted per project member.
+    """
+    headers = headers or {}
+    try:
+        user = get_current_user(auth_headers=headers)
+    except Exception:
+        # Without a resolvable user, fall back to a scope nobody else can share.
+        raw = json.dumps({"auth": headers.get("Authorization")})
+    else:
+        memberships = sorted(
+            (str(membership.get("organization_id")), str(membership.get("role")))
+            for membership in user.get("organizations", [])
+            if membership.get("is_active")
+        )
+        scope: dict[str, Any] = {
+            "org": headers.get("X-Organization-Id"),
+            "memberships": memberships,
+            "roles": sorted(str(role.get("name")) for role in user.get("roles", [])),
+        }
+        if per_user:
+            scope["user"] = user.get("id")
+        raw = json.dumps(scope, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def shared_reference_get(
+    namespace: str,
+    *,
+    url: str,
+    headers: dict | None,
+    loader,
+    params: dict[str, Any] | None = None,
+    tags: tuple[str, ...] = (REFERENCE_TAG,),
+    per_user: bool = False,
+) -> Any:
+    key = (
+        namespace,
+        reference_scope(headers, per_user=per_user),
+        tuple(sorted((str(name), str(value)) for name, value in (params or {}).items())),
+    )
+    cache = get_reference_cache()
+    cached = cache.get(key)
+    record_cache_lookup(url, hit=cached is not None)
+    if cached is not None:
+        return cached
+    payload = loader()
+    cache.put(key, payload, namespace=namespace, tags=tags)
+    return payload
+
+def _credential_scope(headers: dict | None) -> str:
+    headers = headers or {}
+    raw = json.dumps({"auth": headers.get("Authorization"), "org": headers.get("X-Organization-Id")})
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def _can_view_project(headers: dict | None, project_id: str | UUID) -> bool:
+    try:
+        projects = fetch_projects(headers, include_closed=True)
+    except Exception:
+        return False
+    record = next((item for item in projects or [] if str(item.get("id")) == str(project_id)), None)
+    return bool(record and record.get("can_view"))
+
+
+def project_access_scope(headers: dict | None, project_id: str | UUID) -> str:
+    """
+    Scope for sharing reads of `project_id`. Every caller whose own project
+    list (the cached `/projects` permissions) grants view access shares one
+    scope per project, whatever their token, so concurrent viewers share
+    in-flight requests and cached data. Anyone else is scoped to their exact
+    credentials and gets their own request and the backend's auth check. A
+    revoked grant stops sharing once the caller's project list is
+    revalidated (`REVALIDATE_TTL_SECONDS`).
+    """
+    if _can_view_project(headers, project_id):
+        raw = json.dumps(["viewers", str(project_id)])
+    else:
+        raw = json.dumps([_credential_scope(headers), str(project_id)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def _coalesced_project_get(
+    endpoint: str,
+    *,
+    url: str,
+    headers: dict | None,
+    project_id: str | UUID,
+    params: dict[str, Any] | None,
+    loader,
+) -> Any:
+    key = (
+        "GET",
+        url,
+        tuple(sorted((str(name), str(value)) for name, value in (params or {}).items())),
+        project_access_scope(headers, project_id),
+    )
+    return get_single_flight().do(key, loader, label=endpoint)
+
+
+@tagged_cache_data("project:{project_id}", ttl=REVALIDATE_TTL_SECONDS, show_spinner=False)
 def fetch_project_snapshot(project_id: str, headers) -> dict:
     url = f"{API_BASE}/projects/{project_id}/snapshot"
+    return _coalesced_project_get(
+        "/projects/{project_id}/snapshot",
+        url=url,
+        headers=headers,
+        project_id=project_id,
+        params=None,
+        loader=lambda: conditional_get_json(url, headers=headers, timeout=30, record_lookup=False),
+    )
 
-    r = requests.get(url, headers=headers, timeout=30)
-    r.raise_for_status()
-    return r.json()
-
-@st.cache_data
+@tagged_cache_data("projects", ttl=REVALIDATE_TTL_SECONDS, show_spinner=False)
 def fetch_projects(headers, include_closed: bool = False) -> dict:
     url = f"{API_BASE}/projects"
     
     params = {"include_closed": include_closed}
-    
-    r = requests.get(url, params=params, headers=headers, timeout=30)
-    r.raise_for_status()
-    return r.json()
+    return conditional_get_json(url, headers=headers, params=params, timeout=30)
 
 
-@st.cache_data(ttl=30, show_spinner=False)
+@tagged_cache_data("project:{project_id}", "project-members:{project_id}", ttl=30, show_spinner=False)
 def fetch_project_members(*, headers: dict, project_id: str | UUID) -> Any:
     url = f"{API_BASE}/projects/{project_id}/members"
     return _request_json(method="GET", url=url, headers=headers)
@@ -63,7 +182,7 @@ def upsert_project_member(
     role: str,
 ) -> dict:
     url = f"{API_BASE}/projects/{project_id}/members/{user_id}"
-    response = requests.put(url, headers=headers, json={"role": role}, timeout=30)
+    response = backend_session.put(url, headers=headers, json={"role": role}, timeout=30)
     try:
         response.raise_for_status()
     except Exception as e:
@@ -73,7 +192,7 @@ def upsert_project_member(
         except Exception:
             pass
         raise ValueError(f"Failed to update project member: {e} {body}")
-    fetch_project_members.clear()
+    invalidate_tags(f"project-members:{project_id}")
     return response.json()
 
 
@@ -84,7 +203,7 @@ def delete_project_member(
     user_id: str | UUID,
 ) -> None:
     url = f"{API_BASE}/projects/{project_id}/members/{user_id}"
-    response = requests.delete(url, headers=headers, timeout=30)
+    response = backend_session.delete(url, headers=headers, timeout=30)
     try:
         response.raise_for_status()
     except Exception as e:
@@ -94,14 +213,14 @@ def delete_project_member(
         except Exception:
             pass
         raise ValueError(f"Failed to delete project member: {e} {body}")
-    fetch_project_members.clear()
+    invalidate_tags(f"project-members:{project_id}")
 
 def save_project(project: Project, headers) -> str:
     metadata = st.session_state.get("reline_metadata", None)
     payload = project_to_import_payload(project, metadata=metadata)
 
     try:
-        response = requests.post(f"{API_BASE}/projects/import", json=payload, headers=headers)
+        response = backend_session.post(f"{API_BASE}/projects/import", json=payload, headers=headers)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -117,25 +236,31 @@ def save_project(project: Project, headers) -> str:
 def fetch_attention_tasks(headers: dict) -> dict:
     url = f"{API_BASE}/projects/attention"
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = backend_session.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         return response.json()
     except Exception as e:
         raise ValueError(f"Failed to fetch attention tasks: {e} {response.text}")
 
 
-@st.cache_data
 def fetch_sites(headers: dict) -> dict:
     url = f"{API_BASE}/sites"
     try:
-        response = requests.get(url, headers=headers,timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return shared_reference_get(
+            "sites",
+            url=url,
+            headers=headers,
+            loader=lambda: conditional_get_json(url, headers=headers, timeout=30, record_lookup=False),
+        )
     except Exception as e:
-        raise ValueError(f"Failed to fetch sites: {e} {response.text}")
+        body = ""
+        try:
+            body = e.response.text
+        except Exception:
+            pass
+        raise ValueError(f"Failed to fetch sites: {e} {body}")
     
 
-@st.cache_data
 def fetch_mills(headers: dict, site_id: str | None = None, active: bool | None = True) -> dict:
     """
     Fetch mills for dropdown hydration.
@@ -159,49 +284,58 @@ def fetch_mills(headers: dict, site_id: str | None = None, active: bool | None =
         params["active"] = str(active).lower()  # "true"/"false" is safest
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return shared_reference_get(
+            "mills",
+            url=url,
+            headers=headers,
+            params=params,
+            loader=lambda: conditional_get_json(url, headers=headers, params=params, timeout=30, record_lookup=False),
+        )
     except Exception as e:
-        # keep your existing error style
         body = ""
         try:
-            body = response.text
+            body = e.response.text
         except Exception:
             pass
         raise ValueError(f"Failed to fetch mills: {e} {body}")
 
-@st.cache_data
 def fetch_site(headers: dict, site_id: str) -> dict:
     url = f"{API_BASE}/sites/{site_id}"
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return shared_reference_get(
+            "site",
+            url=url,
+            headers=headers,
+            params={"site_id": site_id},
+            loader=lambda: conditional_get_json(url, headers=headers, timeout=30, record_lookup=False),
+        )
     except Exception as e:
-        # keep your existing error style
         body = ""
         try:
-            body = response.text
+            body = e.response.text
         except Exception:
             pass
         raise ValueError(f"Failed to fetch site: {e} {body}")
     
 
-@st.cache_data
 def fetch_crews(headers: dict, site_id: str) -> dict:
     url = f"{API_BASE}/crews"
     params = {}
     params["site_id"] = site_id
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return shared_reference_get(
+            "crews",
+            url=url,
+            headers=headers,
+            params=params,
+            tags=(REFERENCE_TAG, f"crews:{site_id}"),
+            loader=lambda: conditional_get_json(url, headers=headers, params=params, timeout=30, record_lookup=False),
+        )
     except Exception as e:
         body = ""
         try:
-            body = response.text
+            body = e.response.text
         except Exception:
             pass
         raise ValueError(f"Failed to fetch crews: {e} {body}")
@@ -210,8 +344,9 @@ def post_new_crew(headers: dict, crew: CrewOut) -> dict:
     url = f"{API_BASE}/crews"
 
     try:
-        response = requests.post(url, json=crew.model_dump(mode="json"), headers=headers, timeout=30)
+        response = backend_session.post(url, json=crew.model_dump(mode="json"), headers=headers, timeout=30)
         response.raise_for_status()
+        invalidate_tags(f"crews:{crew.site_id}")
         return response.json()
     except Exception as e:
         body = ""
@@ -222,7 +357,7 @@ def post_new_crew(headers: dict, crew: CrewOut) -> dict:
         raise ValueError(f"Failed to post new crew: {e} {body}")
     
 
-@st.cache_data
+@tagged_cache_data("project:{project_id}")
 def fetch_analytics(headers: dict, project_id: str, date_from: Optional[dt.date], date_to: Optional[dt.date]):
     url = f"{API_BASE}/projects/{project_id}/analytics/dashboard"
     params = {}
@@ -232,16 +367,16 @@ def fetch_analytics(headers: dict, project_id: str, date_from: Optional[dt.date]
         params["date_to"] = date_to.isoformat()
     
     try:
-        response = requests.get(url=url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
+        return _coalesced_project_get(
+            "/projects/{project_id}/analytics/dashboard",
+            url=url,
+            headers=headers,
+            project_id=project_id,
+            params=params,
+            loader=lambda: _request_json(method="GET", url=url, headers=headers, params=params),
+        )
     except Exception as e:
-        body = ""
-        try:
-            body = response.text
-        except Exception:
-            pass
-        raise ValueError(f"Failed to fetch analytics for {project_id}: {e} {body}")
+        raise ValueError(f"Failed to fetch analytics for {project_id}: {e}")
     
 def fetch_inching_performance(
     *,
@@ -259,7 +394,7 @@ def fetch_inching_performance(
     url = f"{API_BASE}/projects/{project_id}/analytics/inching-performance"
 
     try:
-        response = requests.get(url=url, headers=headers, params=params, timeout=30)
+        response = backend_session.get(url=url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -286,7 +421,7 @@ def _request_json(
     params: dict[str, Any] | None = None,
     timeout: int = 30,
 ) -> Any:
-    response = requests.request(
+    response = backend_session.request(
         method=method,
         url=url,
         headers=headers,
@@ -305,7 +440,7 @@ def _request_json(
     return response.json()
 
 
-@st.cache_data(ttl=30, show_spinner=False)
+@tagged_cache_data("org:{organization_id}", ttl=30, show_spinner=False)
 def fetch_organization_dashboard(
     *,
     headers: dict,
@@ -315,7 +450,7 @@ def fetch_organization_dashboard(
     return _request_json(method="GET", url=url, headers=headers)
 
 
-@st.cache_data(ttl=30, show_spinner=False)
+@tagged_cache_data("org:{organization_id}", ttl=30, show_spinner=False)
 def fetch_organization_projects_summary(
     *,
     headers: dict,
@@ -335,7 +470,7 @@ def fetch_organization_projects_summary(
     return _request_json(method="GET", url=url, headers=headers, params=params)
 
 
-@st.cache_data(ttl=30, show_spinner=False)
+@tagged_cache_data("org:{organization_id}", ttl=30, show_spinner=False)
 def fetch_organization_users_summary(
     *,
     headers: dict,
@@ -358,7 +493,7 @@ def fetch_organization_users_summary(
     return _request_json(method="GET", url=url, headers=headers, params=params)
 
 
-@st.cache_data(ttl=30, show_spinner=False)
+@tagged_cache_data("org:{organization_id}", ttl=30, show_spinner=False)
 def fetch_organization_user_detail(
     *,
     headers: dict,
@@ -369,7 +504,7 @@ def fetch_organization_user_detail(
     return _request_json(method="GET", url=url, headers=headers)
 
 
-@st.cache_data(ttl=30, show_spinner=False)
+@tagged_cache_data("org:{organization_id}", ttl=30, show_spinner=False)
 def fetch_organization_activity(
     *,
     headers: dict,
@@ -398,7 +533,7 @@ def update_organization_user_role(
     role: str,
 ) -> dict:
     url = f"{API_BASE}/organizations/{organization_id}/users/{user_id}/role"
-    response = requests.patch(url, headers=headers, json={"role": role}, timeout=30)
+    response = backend_session.patch(url, headers=headers, json={"role": role}, timeout=30)
     try:
         response.raise_for_status()
     except Exception as e:
@@ -411,21 +546,22 @@ def update_organization_user_role(
     return response.json()
 
 
-@st.cache_data
+@tagged_cache_data("project:{project_id}")
 def fetch_project_forecast(headers: dict, project_id: str) -> ForecastResponse:
     url = f"{API_BASE}/projects/{project_id}/analytics/forecast"
 
     try:
-        response = requests.get(url=url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return parse_forecast_response(response.json())
+        payload = _coalesced_project_get(
+            "/projects/{project_id}/analytics/forecast",
+            url=url,
+            headers=headers,
+            project_id=project_id,
+            params=None,
+            loader=lambda: _request_json(method="GET", url=url, headers=headers),
+        )
+        return parse_forecast_response(payload)
     except Exception as e:
-        body = ""
-        try:
-            body = response.text
-        except Exception:
-            pass
-        raise ValueError(f"Failed to fetch forecast for {project_id}: {e} {body}")
+        raise ValueError(f"Failed to fetch forecast for {project_id}: {e}")
     
 
 def fetch_delays(
@@ -436,6 +572,8 @@ def fetch_delays(
         time_min: Optional[dt.datetime] = None,
         time_max: Optional[dt.datetime] = None,
         limit: Optional[int] = 200,
+        offset: Optional[int] = None,
+        order: Optional[str] = None,
 ):
     params = {"project_id": project_id}
     if time_min:
@@ -448,11 +586,14 @@ def fetch_delays(
         params["shift_assignment_id"] = shift_assignment_id
     if limit:
         params["limit"] = limit
-
+    if offset:
+        params["offset"] = offset
+    if order:
+        params["order"] = order
 
     url = f"{API_BASE}/delays"
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = backend_session.get(url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         return response.json()
     except Exception as e:
@@ -513,10 +654,11 @@ def save_delays(
 
     url = f"{API_BASE}/delays/{pid}/delays"
     params = {"replace": "true"} if replace else None
-    resp = requests.put(url, headers=headers, json=payload, params=params, timeout=30)
+    resp = backend_session.put(url, headers=headers, json=payload, params=params, timeout=30)
     resp.raise_for_status()
+    invalidate_tags(f"delays:{pid}")
 
-    return [Delay.model_validate(x) for x in resp.json()]
+    return parse_model_list_json(Delay, resp.content)
 
 
 def fetch_events(
@@ -537,7 +679,7 @@ def fetch_events(
     url = f"{API_BASE}/events"
 
     try:
-        resp = requests.get(url=url, params=params, headers=headers, timeout=30)
+        resp = backend_session.get(url=url, params=params, headers=headers, timeout=30)
         resp.raise_for_status()
         return resp.json()
     except Exception as e:
@@ -557,7 +699,7 @@ def closeout_project(
     url = f"{API_BASE}/projects/closeout/{project_id}"
 
     try:
-        response = requests.patch(url=url, headers=headers, timeout=30)
+        response = backend_session.patch(url=url, headers=headers, timeout=30)
         response.raise_for_status()
         return response.json()    
     except Exception as e:
@@ -593,7 +735,7 @@ def fetch_todos(
     url = f"{API_BASE}/todos"
 
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = backend_session.get(url, headers=headers, params=params, timeout=30)
         resp.raise_for_status()
         return resp.json()
     except Exception as e:
@@ -642,9 +784,9 @@ def save_todos(
         payload.append(item)
 
     url = f"{API_BASE}/todos"
-    resp = requests.put(url, headers=headers, json=payload, params=params or None, timeout=30)
+    resp = backend_session.put(url, headers=headers, json=payload, params=params or None, timeout=30)
     resp.raise_for_status()
-    return [TodoIn.model_validate(item) for item in resp.json()]
+    return parse_model_list_json(TodoIn, resp.content)
 
 
 def delete_todo(
@@ -653,5 +795,5 @@ def delete_todo(
     todo_id: str | UUID,
 ) -> None:
     url = f"{API_BASE}/todos/{todo_id}"
-    resp = requests.delete(url, headers=headers, timeout=30)
+    resp = backend_session.delete(url, headers=headers, timeout=30)
     resp.raise_for_status()
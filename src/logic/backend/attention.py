@@ -1,5 +1,6 @@
 from logic.backend.api_client import fetch_attention_tasks
 from models.input.task import TaskIn, AttentionIn
+from models.parsing import parse_model_list
 
 
 def get_attention_tasks(headers: dict) -> AttentionIn:
@@ -16,9 +17,9 @@ def get_attention_tasks(headers: dict) -> AttentionIn:
     upcoming = json.get("upcoming_tasks", [])
     awaiting = json.get("awaiting_actuals", [])
 
-    late = [TaskIn.model_validate(task) for task in late]
-    upcoming = [TaskIn.model_validate(task) for task in upcoming]
-    awaiting = [TaskIn.model_validate(task) for task in awaiting]
+    late = parse_model_list(TaskIn, late)
+    upcoming = parse_model_list(TaskIn, upcoming)
+    awaiting = parse_model_list(TaskIn, awaiting)
 
     return AttentionIn(
         late=late,
@@ -1,12 +1,280 @@
+from __future__ import annotations
 
 from typing import Optional
+from uuid import UUID
+import bisect
 import datetime as dt
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from zoneinfo import ZoneInfo
 
-from logic.backend.api_client import fetch_delays
+from logic.backend.api_client import fetch_delays, project_access_scope
+from logic.backend.pagination import merge_range, missing_ranges, with_script_ctx
 from logic.backend.utils.parse_datetime import parse_backend_utc, _from_utc_to_project_tz
+from logic.cache_registry import get_cache_registry, project_tag
 
 from models.delay import DelayType, Delay
+from models.parsing import parse_model_list
+
+DELAY_PAGE_SIZE = 200
+DELAY_MAX_WORKERS = 4
+DELAY_SLICE = dt.timedelta(days=7)
+DELAY_CACHE_TTL_SECONDS = 60
+DELAY_MAX_PROJECTS = 64
+DELAY_ORDER = "start_dt"
+
+_MIN_DT = dt.datetime.min.replace(tzinfo=dt.UTC)
+_MAX_DT = dt.datetime.max.replace(tzinfo=dt.UTC)
+_MAX_ID = "\U0010ffff"
+
+logger = logging.getLogger(__name__)
+
+
+def delays_tag(project_id: str | UUID) -> str:
+    return f"delays:{project_id}"
+
+
+def _as_utc(value: dt.datetime | None, default: dt.datetime) -> dt.datetime:
+    if value is None:
+        return default
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt.UTC)
+    return value.astimezone(dt.UTC)
+
+
+def _sort_key(delay: Delay) -> tuple[dt.datetime, str]:
+    return (_as_utc(delay.start_dt, _MIN_DT), delay.id)
+
+
+@dataclass
+class _ProjectDelays:
+    """Delays of one project, sorted by start, plus the time ranges already fetched."""
+
+    loaded_at: float
+    keys: list[tuple[dt.datetime, str]] = field(default_factory=list)
+    delays: list[Delay] = field(default_factory=list)
+    ids: set[str] = field(default_factory=set)
+    covered: list[tuple[dt.datetime, dt.datetime]] = field(default_factory=list)
+    max_span: dt.timedelta = dt.timedelta(0)
+
+    def gaps(self, lo: dt.datetime, hi: dt.datetime) -> list[tuple[dt.datetime, dt.datetime]]:
+        return missing_ranges(self.covered, lo, hi)
+
+    def cover(self, lo: dt.datetime, hi: dt.datetime) -> None:
+        self.covered = merge_range(self.covered, lo, hi)
+
+    def add(self, delays: list[Delay]) -> None:
+        for delay in delays:
+            if delay.id in self.ids:
+                continue
+            key = _sort_key(delay)
+            index = bisect.bisect(self.keys, key)
+            self.keys.insert(index, key)
+            self.delays.insert(index, delay)
+            self.ids.add(delay.id)
+            if delay.start_dt is not None and delay.end_dt is not None:
+                self.max_span = max(self.max_span, _as_utc(delay.end_dt, _MAX_DT) - key[0])
+
+    def window(self, lo: dt.datetime, hi: dt.datetime) -> list[Delay]:
+        if lo == _MIN_DT and hi == _MAX_DT:
+            return list(self.delays)
+        # Anything starting earlier than `lo - max_span` has already ended.
+        first = bisect.bisect_left(self.keys, (lo - self.max_span if lo > _MIN_DT + self.max_span else _MIN_DT, ""))
+        last = bisect.bisect_right(self.keys, (hi, _MAX_ID))
+        return [
+            delay
+            for delay in self.delays[first:last]
+            if delay.start_dt is not None and _as_utc(delay.end_dt, _MAX_DT) >= lo
+        ]
+
+
+class DelayStore:
+    """
+    Process-wide cache of project delays as a sorted interval set.
+
+    A request for `(time_min, time_max)` only sends the parts of that window
+    not fetched before to the backend. Each gap is keyset-paginated on start
+    time, asking the backend for start order, and bounded gaps wider than a
+    slice are fetched concurrently in slices. A page that is not in ascending
+    start order, or that cannot move the cursor forward, falls back to offset
+    paging over the range rather than skipping rows; a range is only marked as
+    fetched once a short page proves it was read to the end. Entries are
+    scoped by project access, expire after `ttl_seconds`, and are dropped when
+    the project's `delays:` or `project:` tag is invalidated.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch=None,
+        page_size: int = DELAY_PAGE_SIZE,
+        max_workers: int = DELAY_MAX_WORKERS,
+        slice_width: dt.timedelta = DELAY_SLICE,
+        ttl_seconds: float = DELAY_CACHE_TTL_SECONDS,
+        clock=time.monotonic,
+    ):
+        self._fetch = fetch
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.slice_width = slice_width
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._projects: dict[tuple[str, str], _ProjectDelays] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def _fetch_page(
+        self,
+        headers: dict,
+        project_id: str,
+        lo: dt.datetime,
+        hi: dt.datetime,
+        *,
+        offset: int = 0,
+    ) -> list[Delay]:
+        fetch = self._fetch or fetch_delays
+        with self._lock:
+            self.requests += 1
+        payload = fetch(
+            headers=headers,
+            project_id=project_id,
+            time_min=lo if lo > _MIN_DT else None,
+            time_max=hi if hi < _MAX_DT else None,
+            limit=self.page_size,
+            offset=offset or None,
+            order=DELAY_ORDER,
+        )
+        return parse_model_list(Delay, payload)
+
+    def _fetch_range(
+        self, headers: dict, project_id: str, lo: dt.datetime, hi: dt.datetime
+    ) -> tuple[list[Delay], bool]:
+        """Delays in `[lo, hi]`, and whether the range was read to its end."""
+        delays: dict[str, Delay] = {}
+        cursor = lo
+        while True:
+            page = self._fetch_page(headers, project_id, cursor, hi)
+            delays.update((delay.id, delay) for delay in page)
+            if len(page) < self.page_size:
+                return list(delays.values()), True
+            keys = [_sort_key(delay) for delay in page]
+            next_cursor = keys[-1][0]
+            if keys != sorted(keys) or next_cursor <= cursor:
+                # The cursor would skip unread rows (pages not in start order) or
+                # never advance (more than a page starting at once).
+                logger.warning(
+                    "Cannot keyset-page delays for %s from %s; paging the range by offset.",
+                    project_id,
+                    cursor.isoformat(),
+                )
+                return self._fetch_range_by_offset(headers, project_id, lo, hi)
+            cursor = next_cursor
+
+    def _fetch_range_by_offset(
+        self, headers: dict, project_id: str, lo: dt.datetime, hi: dt.datetime
+    ) -> tuple[list[Delay], bool]:
+        delays: dict[str, Delay] = {}
+        offset = 0
+        while True:
+            page = self._fetch_page(headers, project_id, lo, hi, offset=offset)
+            read = len(delays)
+            delays.update((delay.id, delay) for delay in page)
+            if len(page) < self.page_size:
+                return list(delays.values()), True
+            if len(delays) == read:
+                # The offset was ignored too: keep the rows, but refetch the range next time.
+                logger.warning(
+                    "Cannot page delays for %s by offset; leaving %s to %s uncached.",
+                    project_id,
+                    lo.isoformat(),
+                    hi.isoformat(),
+                )
+                return list(delays.values()), False
+            offset += self.page_size
+
+    def _slices(self, lo: dt.datetime, hi: dt.datetime) -> list[tuple[dt.datetime, dt.datetime]]:
+        # Open-ended ranges are paged as one: slicing them up to "now" costs a
+        # request per slice however few delays there are.
+        if lo == _MIN_DT or hi == _MAX_DT or hi - lo <= self.slice_width:
+            return [(lo, hi)]
+        slices: list[tuple[dt.datetime, dt.datetime]] = []
+        start = lo
+        while start < hi:
+            end = min(start + self.slice_width, hi)
+            slices.append((start, end))
+            start = end
+        return slices
+
+    def _load_gap(
+        self, headers: dict, project_id: str, lo: dt.datetime, hi: dt.datetime
+    ) -> tuple[list[Delay], bool]:
+        slices = self._slices(lo, hi)
+        if len(slices) == 1 or self.max_workers <= 1:
+            results = [self._fetch_range(headers, project_id, start, end) for start, end in slices]
+        else:
+            fetch_range = with_script_ctx(self._fetch_range)
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(slices))) as pool:
+                futures = [pool.submit(fetch_range, headers, project_id, start, end) for start, end in slices]
+                results = [future.result() for future in futures]
+        return [delay for delays, _ in results for delay in delays], all(complete for _, complete in results)
+
+    def get(
+        self,
+        headers: dict,
+        project_id: str | UUID,
+        *,
+        time_min: dt.datetime | None = None,
+        time_max: dt.datetime | None = None,
+    ) -> list[Delay]:
+        project_id = str(project_id)
+        lo, hi = _as_utc(time_min, _MIN_DT), _as_utc(time_max, _MAX_DT)
+        key = (project_id, project_access_scope(headers, project_id))
+        now = self._clock()
+        with self._lock:
+            entry = self._projects.get(key)
+            if entry is None or now - entry.loaded_at > self.ttl_seconds:
+                entry = self._projects[key] = _ProjectDelays(loaded_at=now)
+                while len(self._projects) > DELAY_MAX_PROJECTS:
+                    self._projects.pop(next(iter(self._projects)))
+            gaps = entry.gaps(lo, hi)
+
+        for gap_lo, gap_hi in gaps:
+            loaded, complete = self._load_gap(headers, project_id, gap_lo, gap_hi)
+            with self._lock:
+                entry.add(loaded)
+                if complete:
+                    entry.cover(gap_lo, gap_hi)
+
+        with self._lock:
+            return entry.window(lo, hi)
+
+    def invalidate(self, project_id: str | UUID | None = None) -> int:
+        with self._lock:
+            doomed = [key for key in self._projects if project_id is None or key[0] == str(project_id)]
+            for key in doomed:
+                del self._projects[key]
+        return len(doomed)
+
+    def invalidate_tags(self, tags: frozenset[str]) -> int:
+        with self._lock:
+            project_ids = {key[0] for key in self._projects}
+        return sum(
+            self.invalidate(project_id)
+            for project_id in project_ids
+            if delays_tag(project_id) in tags or project_tag(project_id) in tags
+        )
+
+
+_store = DelayStore()
+get_cache_registry().add_invalidation_listener(_store.invalidate_tags)
+
+
+def get_delay_store() -> DelayStore:
+    return _store
+
 
 def get_delays(
         headers: dict,
@@ -16,32 +284,35 @@ def get_delays(
         shift_assignment_id: Optional[str] = None,
         time_min: Optional[dt.datetime] = None,
         time_max: Optional[dt.datetime] = None,
-        limit: Optional[int] = 200,
+        limit: Optional[int] = None,
         ) -> list[Delay]:
     
     try:
-        data = fetch_delays(
-            headers=headers,
-            project_id=project_id,
-            delay_type=delay_type,
-            shift_assignment_id=shift_assignment_id,
-            time_min=time_min,
-            time_max=time_max,
-            limit=limit,
-            )
-    except Exception as e:
+        data = _store.get(headers, project_id, time_min=time_min, time_max=time_max)
+    except Exception:
+        # Pages render without delays when the backend is unavailable, but the failure is not silent.
+        logger.exception("Failed to load delays for project %s", project_id)
         return []
     
     if not data:
         return []
 
     delays: list[Delay] = []
-    for delay_dict in data:
-        delay = Delay.model_validate(delay_dict)
+    for delay in data:
+        if delay_type and delay.delay_type != delay_type:
+            continue
+        if shift_assignment_id and delay.shift_assignment_id != shift_assignment_id:
+            continue
 
-        delay.start_dt = delay.start_dt.astimezone(timezone)
-        delay.end_dt = delay.end_dt.astimezone(timezone)
-
-        delays.append(delay)
+        delays.append(
+            delay.model_copy(
+                update={
+                    "start_dt": _from_utc_to_project_tz(delay.start_dt, timezone),
+                    "end_dt": _from_utc_to_project_tz(delay.end_dt, timezone),
+                }
+            )
+        )
+        if limit and len(delays) >= limit:
+            break
 
     return delays
@@ -1,19 +1,48 @@
+from __future__ import annotations
+
 from uuid import UUID
-from typing import Optional
+from typing import Any, Callable, Optional
+import bisect
 import datetime as dt
+import hashlib
+import json
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from itertools import islice
 from zoneinfo import ZoneInfo
+
+import streamlit as st
+
 from models.event import EventIn
+from models.parsing import parse_model_list
 
 from logic.backend.api_client import fetch_events
 
+FEED_BUFFER_SIZE = 500
+FEED_INITIAL_EVENTS = 50
+FEED_POLL_PAGE_SIZE = 100
+FEED_POLL_INTERVAL_SECONDS = 5.0
+FEED_MAX_QUERIES = 8
+# Re-ask for a little history behind the cursor so events committed with the
+# same (or a slightly skewed) timestamp are not missed; duplicates are dropped by id.
+FEED_CURSOR_OVERLAP = dt.timedelta(seconds=5)
+
+
+def _parse_events(payload: list[dict] | None, timezone: ZoneInfo) -> list[EventIn]:
+    events = parse_model_list(EventIn, payload)
+    for event in events:
+        event.ts = event.ts.astimezone(tz=timezone)
+    return events
+
 
 def get_events(
-        headers: dict, 
-        project_id: Optional[str | UUID] = None, 
-        from_dt: Optional[dt.datetime] = None, 
+        headers: dict,
+        project_id: Optional[str | UUID] = None,
+        from_dt: Optional[dt.datetime] = None,
         n_events: Optional[int] = 10,
         timezone: ZoneInfo = ZoneInfo("America/Vancouver")) -> list[EventIn]:
-    
+
     try:
         events_response = fetch_events(
             headers=headers,
@@ -23,11 +52,249 @@ def get_events(
         )
     except Exception:
         return []
-    
-    events = [EventIn.model_validate(event) for event in events_response]
 
-    for event in events:
-        event.ts = event.ts.astimezone(tz=timezone)
+    return _parse_events(events_response, timezone)
 
-    return events
-    
\ No newline at end of file
+
+def _search_text(event: EventIn) -> str:
+    return " ".join(
+        [
+            event.user_name,
+            event.message,
+            event.event_type,
+            event.project_id,
+            event.task_id or "",
+            json.dumps(event.payload, default=str),
+        ]
+    ).lower()
+
+
+@dataclass(frozen=True)
+class FeedQuery:
+    q: str = ""
+    project_filter: frozenset[str] = frozenset()
+    type_filter: frozenset[str] = frozenset()
+
+    def matches(self, event: EventIn, search_text: str) -> bool:
+        if self.project_filter and event.project_id not in self.project_filter:
+            return False
+        if self.type_filter and event.event_type.lower() not in self.type_filter:
+            return False
+        return not self.q or self.q in search_text
+
+
+@dataclass
+class _MatchIndex:
+    # Matching events bucketed by local day, each bucket newest first.
+    seq: int
+    evictions: int
+    by_day: dict[dt.date, list[EventIn]] = field(default_factory=dict)
+
+
+class EventFeedStore:
+    """
+    Bounded, newest-first buffer of feed events for one user.
+
+    `refresh` only asks the backend for events newer than the cursor, and only
+    those are validated and localized. Filter matches are kept per query and
+    extended with each batch of new events, so reruns with nothing new do no
+    per-event work.
+    """
+
+    def __init__(
+        self,
+        *,
+        timezone: ZoneInfo = ZoneInfo("America/Vancouver"),
+        capacity: int = FEED_BUFFER_SIZE,
+        poll_interval: float = FEED_POLL_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.timezone = timezone
+        self.capacity = capacity
+        self.poll_interval = poll_interval
+        self._clock = clock
+        self._events: list[EventIn] = []  # oldest -> newest
+        self._keys: list[tuple[dt.datetime, int]] = []
+        self._by_id: dict[str, tuple[EventIn, int]] = {}
+        self._search: dict[str, str] = {}
+        self._seq = 0
+        self._log: deque[tuple[int, EventIn]] = deque(maxlen=capacity)
+        self._evictions = 0
+        self._last_poll: float | None = None
+        self._indexes: OrderedDict[FeedQuery, _MatchIndex] = OrderedDict()
+        self.event_types: set[str] = set()
+
+    @property
+    def cursor(self) -> dt.datetime | None:
+        return self._events[-1].ts if self._events else None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def events(self) -> list[EventIn]:
+        return self._events[::-1]
+
+    def latest(self, n: int) -> list[EventIn]:
+        return self._events[: -n - 1 : -1] if n > 0 else []
+
+    def refresh(self, headers: dict, *, force: bool = False, initial: int = FEED_INITIAL_EVENTS) -> int:
+        """Pull events newer than the cursor; returns how many were added."""
+        now = self._clock()
+        if not force and self._last_poll is not None and now - self._last_poll < self.poll_interval:
+            return 0
+        self._last_poll = now
+
+        cursor = self.cursor
+        if cursor is None:
+            page_size = min(max(initial, 1), self.capacity)
+            payload = fetch_events(headers=headers, n_events=page_size)
+        else:
+            page_size = FEED_POLL_PAGE_SIZE
+            payload = fetch_events(headers=headers, from_dt=cursor - FEED_CURSOR_OVERLAP, n_events=page_size)
+
+        events = _parse_events(payload, self.timezone)
+        if cursor is not None and len(events) >= page_size:
+            # The backend may hold more new events than one page; the buffer
+            # would have a hole between the old cursor and this page.
+            self.clear()
+        return self.add(events)
+
+    def add(self, events: list[EventIn]) -> int:
+        added = 0
+        for event in events:
+            if event.id in self._by_id:
+                continue
+            self._seq += 1
+            key = (event.ts, self._seq)
+            index = bisect.bisect(self._keys, key)
+            self._keys.insert(index, key)
+            self._events.insert(index, event)
+            self._by_id[event.id] = (event, self._seq)
+            self._log.append((self._seq, event))
+            self._search[event.id] = _search_text(event)
+            self.event_types.add(event.event_type)
+            added += 1
+
+        overflow = len(self._events) - self.capacity
+        if overflow > 0:
+            for event in self._events[:overflow]:
+                del self._by_id[event.id]
+                del self._search[event.id]
+            del self._events[:overflow]
+            del self._keys[:overflow]
+            self._evictions += overflow
+        return added
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._keys.clear()
+        self._by_id.clear()
+        self._search.clear()
+        self._log.clear()
+        self._indexes.clear()
+        self.event_types.clear()
+
+    def _live(self, event: EventIn, seq: int) -> bool:
+        entry = self._by_id.get(event.id)
+        return entry is not None and entry[1] == seq
+
+    def _index(self, query: FeedQuery) -> _MatchIndex:
+        index = self._indexes.get(query)
+        if index is None:
+            index = _MatchIndex(seq=0, evictions=self._evictions)
+            self._indexes[query] = index
+            while len(self._indexes) > FEED_MAX_QUERIES:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(query)
+
+        if index.evictions != self._evictions:
+            # Evictions only drop the oldest events, so only the oldest
+            # remaining day and anything before it can hold stale entries.
+            oldest_day = self._events[0].ts.date() if self._events else None
+            for day in list(index.by_day):
+                if oldest_day is not None and day > oldest_day:
+                    continue
+                bucket = [event for event in index.by_day[day] if event.id in self._by_id]
+                if bucket:
+                    index.by_day[day] = bucket
+                else:
+                    del index.by_day[day]
+            index.evictions = self._evictions
+
+        if index.seq < self._seq:
+            if not self._log or self._log[0][0] > index.seq + 1:
+                # Too far behind the insertion log; rebuild from the buffer.
+                index.by_day.clear()
+                added = [(self._by_id[event.id][1], event) for event in self._events]
+            else:
+                added = list(islice(self._log, index.seq + 1 - self._log[0][0], None))
+            for seq, event in added:
+                if not self._live(event, seq) or not query.matches(event, self._search[event.id]):
+                    continue
+                bucket = index.by_day.setdefault(event.ts.date(), [])
+                # Buckets are newest first and new events are usually the newest.
+                position = 0
+                while position < len(bucket) and bucket[position].ts > event.ts:
+                    position += 1
+                bucket.insert(position, event)
+            index.seq = self._seq
+        return index
+
+    def grouped(
+        self,
+        query: FeedQuery,
+        *,
+        since: dt.datetime | None = None,
+        exclude_ids: set[str] | None = None,
+        newest_first: bool = True,
+    ) -> dict[dt.date, list[EventIn]]:
+        index = self._index(query)
+        min_day = since.astimezone(self.timezone).date() if since is not None else None
+        groups: dict[dt.date, list[EventIn]] = {}
+        for day in sorted(index.by_day, reverse=newest_first):
+            if min_day is not None and day < min_day:
+                continue
+            bucket = index.by_day[day]
+            if (min_day is not None and day == min_day) or exclude_ids:
+                bucket = [
+                    event
+                    for event in bucket
+                    if (since is None or event.ts >= since) and not (exclude_ids and event.id in exclude_ids)
+                ]
+            if not bucket:
+                continue
+            groups[day] = bucket if newest_first else bucket[::-1]
+        return groups
+
+    def filtered(self, query: FeedQuery, **kwargs: Any) -> list[EventIn]:
+        return [event for bucket in self.grouped(query, **kwargs).values() for event in bucket]
+
+
+def _feed_scope(headers: dict | None) -> str:
+    raw = json.dumps({"auth": (headers or {}).get("Authorization"), "org": (headers or {}).get("X-Organization-Id")})
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+def get_event_feed(
+        headers: dict,
+        timezone: ZoneInfo = ZoneInfo("America/Vancouver"),
+        *,
+        initial: int = FEED_INITIAL_EVENTS,
+        force: bool = False) -> EventFeedStore:
+    """
+    The session's feed store for these credentials, refreshed incrementally.
+
+    Fetch errors leave the buffer as it was, like `get_events` returning [].
+    """
+    scope = _feed_scope(headers)
+    store = st.session_state.get("event_feed")
+    if not isinstance(store, EventFeedStore) or st.session_state.get("event_feed_scope") != scope or store.timezone != timezone:
+        store = EventFeedStore(timezone=timezone)
+        st.session_state["event_feed"] = store
+        st.session_state["event_feed_scope"] = scope
+    try:
+        store.refresh(headers, force=force, initial=initial)
+    except Exception:
+        pass
+    return store
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from cachetools import LRUCache
+
+from logic.backend.instrumentation import backend_session, record_cache_lookup
+
+# Optional on-disk tier. Entries are the JSON response bodies themselves,
+# unencrypted, and include auth-scoped data (project snapshots, project lists,
+# reference data) for every user who loaded it. Only point this at a directory
+# on a private volume that nothing else can read; it is created owner-only.
+HTTP_CACHE_DIR_ENV = "GANTTBUDDY_HTTP_CACHE_DIR"
+HTTP_CACHE_MAX_ENTRIES = 512
+
+# Headers that change what the backend is allowed to return to the caller.
+_SCOPE_HEADERS = ("Authorization", "X-Organization-Id")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: Any
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+
+@dataclass
+class ValidationCacheStats:
+    fresh: int = 0
+    revalidated: int = 0
+    uncached: int = 0
+    disk_hits: int = 0
+
+
+def validation_key(url: str, *, headers: dict | None, params: dict[str, Any] | None = None) -> str:
+    scope = {name: (headers or {}).get(name) for name in _SCOPE_HEADERS}
+    normalized_params = sorted((str(key), str(value)) for key, value in (params or {}).items())
+    raw = json.dumps([url, normalized_params, scope], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ValidationCache:
+    """
+    Stores response bodies alongside their ETag / Last-Modified validators.
+
+    Entries live in a bounded in-memory LRU, with an optional on-disk tier so a
+    restarted container can still send conditional requests. The disk tier
+    stores bodies in plaintext; see `HTTP_CACHE_DIR_ENV`.
+    """
+
+    def __init__(self, *, max_entries: int = HTTP_CACHE_MAX_ENTRIES, disk_dir: str | Path | None = None):
+        self._memory: LRUCache[str, CachedResponse] = LRUCache(maxsize=max_entries)
+        self._lock = threading.Lock()
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.stats = ValidationCacheStats()
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / f"{key}.json"
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            entry = CachedResponse(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        with self._lock:
+            self._memory[key] = entry
+            self.stats.disk_hits += 1
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._memory[key] = entry
+
+        path = self._disk_path(key)
+        if path is None:
+            return
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+            tmp_path.chmod(0o600)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+        path = self._disk_path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        if self.disk_dir is not None:
+            for path in self.disk_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+
+_cache: ValidationCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_validation_cache() -> ValidationCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ValidationCache(disk_dir=os.getenv(HTTP_CACHE_DIR_ENV) or None)
+        return _cache
+
+
+def conditional_get_json(
+    url: str,
+    *,
+    headers: dict | None,
+    params: dict[str, Any] | None = None,
+    timeout: int = 30,
+    cache: ValidationCache | None = None,
+    record_lookup: bool = True,
+) -> Any:
+    """
+    GET `url`, revalidating any cached body with If-None-Match / If-Modified-Since.
+
+    A 304 reuses the cached body; a 200 replaces it when the response carries a
+    validator. Responses without validators are returned but not stored.
+    Callers that count the lookup in their own cache pass `record_lookup=False`.
+    """
+    if cache is None:
+        cache = get_validation_cache()
+    key = validation_key(url, headers=headers, params=params)
+    cached = cache.get(key)
+
+    request_headers = dict(headers or {})
+    if cached is not None:
+        if cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+
+    response = backend_session.get(url, headers=request_headers, params=params, timeout=timeout)
+
+    if response.status_code == 304 and cached is not None:
+        cache.record("revalidated")
+        if record_lookup:
+            record_cache_lookup(url, hit=True)
+        return cached.body
+    if record_lookup:
+        record_cache_lookup(url, hit=False)
+
+    # Errors keep their response attached so callers can report the backend's body.
+    response.raise_for_status()
+
+    payload = response.json()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        cache.record("fresh")
+        cache.put(
+            key,
+            CachedResponse(
+                body=payload,
+                etag=etag,
+                last_modified=last_modified,
+                stored_at=time.time(),
+            ),
+        )
+    else:
+        cache.record("uncached")
+        if cached is not None:
+            cache.discard(key)
+    return payload
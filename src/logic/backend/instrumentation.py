@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import bisect
+import json
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+LATENCY_BUCKETS_SECONDS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LATENCY_SAMPLE_SIZE = 512
+
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+|[0-9a-fA-F]{24,})$"
+)
+
+
+def endpoint_template(url: str) -> str:
+    """Collapse ids in a backend URL path, e.g. `/projects/{id}/snapshot`."""
+    path = urlparse(url).path or "/"
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return "/".join(segments) or "/"
+
+
+@dataclass
+class EndpointMetrics:
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    latency_sum: float = 0.0
+    bucket_counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_SECONDS) + 1))
+    response_bytes: int = 0
+    status_codes: Counter = field(default_factory=Counter)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    recent_latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_SIZE))
+
+    def percentile(self, q: float) -> float | None:
+        if not self.recent_latencies:
+            return None
+        ordered = sorted(self.recent_latencies)
+        index = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+
+class BackendMetrics:
+    def __init__(self) -> None:
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _metrics(self, method: str, template: str) -> EndpointMetrics:
+        key = (method.upper(), template)
+        metrics = self._endpoints.get(key)
+        if metrics is None:
+            metrics = self._endpoints[key] = EndpointMetrics()
+        return metrics
+
+    def record_request(
+        self,
+        *,
+        method: str,
+        template: str,
+        status: int | str,
+        elapsed: float,
+        response_bytes: int = 0,
+        retries: int = 0,
+    ) -> None:
+        with self._lock:
+            metrics = self._metrics(method, template)
+            metrics.count += 1
+            metrics.latency_sum += elapsed
+            metrics.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS_SECONDS, elapsed)] += 1
+            metrics.recent_latencies.append(elapsed)
+            metrics.response_bytes += response_bytes
+            metrics.retries += retries
+            metrics.status_codes[str(status)] += 1
+            if not isinstance(status, int) or status >= 400:
+                metrics.errors += 1
+
+    def record_cache(self, *, method: str, template: str, hit: bool) -> None:
+        with self._lock:
+            metrics = self._metrics(method, template)
+            if hit:
+                metrics.cache_hits += 1
+            else:
+                metrics.cache_misses += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = []
+            for (method, template), metrics in sorted(self._endpoints.items(), key=lambda item: item[0][1]):
+                rows.append(
+                    {
+                        "method": method,
+                        "endpoint": template,
+                        "count": metrics.count,
+                        "errors": metrics.errors,
+                        "retries": metrics.retries,
+                        "latency_avg_s": metrics.latency_sum / metrics.count if metrics.count else None,
+                        "latency_p50_s": metrics.percentile(0.50),
+                        "latency_p95_s": metrics.percentile(0.95),
+                        "latency_p99_s": metrics.percentile(0.99),
+                        "latency_buckets": dict(
+                            zip([*map(str, LATENCY_BUCKETS_SECONDS), "+Inf"], metrics.bucket_counts)
+                        ),
+                        "response_bytes": metrics.response_bytes,
+                        "status_codes": dict(metrics.status_codes),
+                        "cache_hits": metrics.cache_hits,
+                        "cache_misses": metrics.cache_misses,
+                    }
+                )
+            return rows
+
+    def to_json(self) -> str:
+        return json.dumps({"generated_at": time.time(), "endpoints": self.snapshot()}, indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = [
+            "# HELP ganttbuddy_backend_request_seconds Backend request latency.",
+            "# TYPE ganttbuddy_backend_request_seconds histogram",
+        ]
+        rows = self.snapshot()
+        for row in rows:
+            labels = f'method="{row["method"]}",endpoint="{row["endpoint"]}"'
+            cumulative = 0
+            for bucket, count in row["latency_buckets"].items():
+                cumulative += count
+                lines.append(f'ganttbuddy_backend_request_seconds_bucket{{{labels},le="{bucket}"}} {cumulative}')
+            latency_sum = (row["latency_avg_s"] or 0.0) * row["count"]
+            lines.append(f"ganttbuddy_backend_request_seconds_sum{{{labels}}} {latency_sum:.6f}")
+            lines.append(f"ganttbuddy_backend_request_seconds_count{{{labels}}} {row['count']}")
+
+        counters = (
+            ("ganttbuddy_backend_response_bytes_total", "Backend response body bytes.", "response_bytes"),
+            ("ganttbuddy_backend_retries_total", "Backend request retries.", "retries"),
+            ("ganttbuddy_backend_cache_hits_total", "Client cache hits per endpoint.", "cache_hits"),
+            ("ganttbuddy_backend_cache_misses_total", "Client cache misses per endpoint.", "cache_misses"),
+        )
+        for name, help_text, column in counters:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for row in rows:
+                lines.append(f'{name}{{method="{row["method"]}",endpoint="{row["endpoint"]}"}} {row[column]}')
+
+        lines.append("# HELP ganttbuddy_backend_responses_total Backend responses by status code.")
+        lines.append("# TYPE ganttbuddy_backend_responses_total counter")
+        for row in rows:
+            for status, count in sorted(row["status_codes"].items()):
+                lines.append(
+                    f'ganttbuddy_backend_responses_total{{method="{row["method"]}",endpoint="{row["endpoint"]}",status="{status}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+_metrics = BackendMetrics()
+
+
+def get_backend_metrics() -> BackendMetrics:
+    return _metrics
+
+
+def record_cache_lookup(url: str, *, hit: bool, method: str = "GET") -> None:
+    _metrics.record_cache(method=method, template=endpoint_template(url), hit=hit)
+
+
+class InstrumentedSession(requests.Session):
+    """
+    Shared `requests.Session` for backend calls.
+
+    Reuses pooled connections and records latency, bytes, status and retries per
+    endpoint. It serves every user, so it keeps no cookies: a Set-Cookie from
+    one user's response must never be sent with another user's request.
+    """
+
+    def __init__(self, metrics: BackendMetrics | None = None) -> None:
+        super().__init__()
+        self.metrics = metrics or _metrics
+        self.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        template = endpoint_template(url)
+        started = time.perf_counter()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException as exc:
+            self.metrics.record_request(
+                method=method,
+                template=template,
+                status=type(exc).__name__,
+                elapsed=time.perf_counter() - started,
+            )
+            raise
+
+        retries = getattr(getattr(response.raw, "retries", None), "history", ()) or ()
+        response_bytes = 0 if kwargs.get("stream") else len(response.content or b"")
+        self.metrics.record_request(
+            method=method,
+            template=template,
+            status=response.status_code,
+            elapsed=time.perf_counter() - started,
+            response_bytes=response_bytes,
+            retries=len(retries),
+        )
+        return response
+
+
+backend_session = InstrumentedSession()
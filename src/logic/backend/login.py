@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import os
-import requests
 import streamlit as st
 
 from logic.backend.api_client import get_current_user
 from logic.backend.config import get_backend_environment_config
+from logic.backend.instrumentation import backend_session
 
 CONFIG = get_backend_environment_config()
 API_BASE = CONFIG.api_base_url
@@ -16,7 +16,7 @@ def _auth_provider_name() -> str | None:
 
 
 def exchange_oidc_token(id_token: str) -> str:
-    response = requests.post(
+    response = backend_session.post(
         f"{API_BASE}/auth/oidc/exchange",
         json={"id_token": id_token},
         timeout=10,
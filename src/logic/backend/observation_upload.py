@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Iterator
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import requests
+
+from logic.backend.api_client import API_BASE
+from logic.backend.instrumentation import backend_session
+from logic.backend.pagination import ProgressCallback, with_script_ctx
+from logic.backend.signals import clear_signal_caches, signal_tag
+from models.signals import SignalDataType
+
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+UPLOAD_MAX_WORKERS = 4
+UPLOAD_MAX_ATTEMPTS = 4
+UPLOAD_BACKOFF_SECONDS = 0.5
+_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+_VALUE_COLUMNS = {
+    SignalDataType.NUMERIC: "numeric_value",
+    SignalDataType.BOOLEAN: "boolean_value",
+}
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "n", "off"})
+
+
+def read_observation_file(file: str | BinaryIO, *, name: str | None = None) -> pd.DataFrame:
+    """Load a CSV or Parquet upload; the format is picked from the file name."""
+    file_name = (name or getattr(file, "name", None) or str(file)).lower()
+    if file_name.endswith((".parquet", ".pq")):
+        return pd.read_parquet(file)
+    if file_name.endswith((".csv", ".txt", ".csv.gz")):
+        return pd.read_csv(file)
+    raise ValueError(f"Unsupported observation file {file_name!r}; use CSV or Parquet.")
+
+
+def _timestamps_utc(df: pd.DataFrame, timezone: ZoneInfo) -> pd.Series:
+    if "timestamp_utc" in df.columns:
+        return pd.to_datetime(df["timestamp_utc"], utc=True, errors="coerce", format="mixed")
+    column = "timestamp_local" if "timestamp_local" in df.columns else "timestamp"
+    if column not in df.columns:
+        raise ValueError("Observations need a timestamp_local, timestamp or timestamp_utc column.")
+    stamps = pd.to_datetime(df[column], errors="coerce", format="mixed")
+    if isinstance(stamps.dtype, pd.DatetimeTZDtype):
+        return stamps.dt.tz_convert("UTC")
+    # The zone name keeps pandas on its vectorized tz database path; a ZoneInfo
+    # object is consulted row by row.
+    zone = getattr(timezone, "key", None) or timezone
+    # Wall times repeated at a DST fall-back take the first (daylight) offset,
+    # like `replace(tzinfo=...)` with fold=0, rather than being dropped.
+    first_occurrence = np.ones(len(stamps), dtype=bool)
+    return stamps.dt.tz_localize(zone, ambiguous=first_occurrence, nonexistent="shift_forward").dt.tz_convert("UTC")
+
+
+def _boolean_values(values: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(values):
+        return values.astype("boolean")
+    text = values.astype("string").str.strip().str.lower()
+    return pd.Series(
+        np.where(text.isin(_TRUE_STRINGS), True, np.where(text.isin(_FALSE_STRINGS), False, None)),
+        index=values.index,
+        dtype="boolean",
+    )
+
+
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    if name in df.columns:
+        return df[name]
+    return pd.Series(None, index=df.index, dtype="object")
+
+
+def prepare_observations(df: pd.DataFrame, data_type: SignalDataType, *, timezone: ZoneInfo) -> pd.DataFrame:
+    """
+    Validate and normalize observation rows in one vectorized pass.
+
+    Returns the payload columns with `timestamp_utc` as ISO strings; rows
+    without a parseable timestamp or a value for the signal's type are dropped.
+    """
+    stamps = _timestamps_utc(df, timezone)
+    value_column = _VALUE_COLUMNS.get(data_type, "text_value")
+    if data_type == SignalDataType.NUMERIC:
+        values = pd.to_numeric(_column(df, value_column if value_column in df.columns else "value"), errors="coerce")
+    elif data_type == SignalDataType.BOOLEAN:
+        values = _boolean_values(_column(df, value_column if value_column in df.columns else "value"))
+    else:
+        values = _column(df, value_column if value_column in df.columns else "value").astype("string").str.strip()
+        values = values.mask(values == "")
+
+    keep = stamps.notna() & values.notna()
+    iso = np.char.add(np.datetime_as_string(stamps[keep].dt.tz_localize(None).to_numpy(dtype="datetime64[us]"), unit="us"), "Z")
+    out = pd.DataFrame({"timestamp_utc": iso, value_column: values[keep].to_numpy()})
+    for name in ("quality_code", "source_record_key"):
+        text = _column(df, name)[keep].astype("string").str.strip()
+        out[name] = text.mask(text == "").to_numpy()
+    if data_type == SignalDataType.NUMERIC:
+        out[value_column] = out[value_column].astype("float64")
+    return out.reset_index(drop=True)
+
+
+def assign_record_keys(prepared: pd.DataFrame, signal_id: str) -> pd.DataFrame:
+    """
+    Fill missing `source_record_key`s with a key derived from the signal and the
+    row's timestamp and value, so re-sending a row cannot duplicate it.
+    """
+    missing = prepared["source_record_key"].isna()
+    if not missing.any():
+        return prepared
+    value_column = next(column for column in prepared.columns if column.endswith("_value"))
+    basis = (signal_id + "|" + prepared.loc[missing, "timestamp_utc"] + "|" + prepared.loc[missing, value_column].astype(str))
+    keyed = prepared.copy()
+    keyed.loc[missing, "source_record_key"] = basis.map(lambda text: "auto-" + hashlib.sha1(text.encode("utf-8")).hexdigest()[:20])
+    return keyed
+
+
+def observation_records(prepared: pd.DataFrame) -> list[dict[str, Any]]:
+    return prepared.astype(object).where(prepared.notna(), None).to_dict(orient="records")
+
+
+@dataclass(frozen=True)
+class ObservationChunk:
+    index: int
+    rows: int
+    raw_bytes: int
+    body: bytes
+    idempotency_key: str
+
+
+def iter_gzip_chunks(prepared: pd.DataFrame, *, max_bytes: int = UPLOAD_CHUNK_BYTES) -> Iterator[ObservationChunk]:
+    """Split rows into `{"observations": [...]}` bodies of at most `max_bytes` before gzip."""
+    if prepared.empty:
+        return
+    lines = prepared.to_json(orient="records", lines=True, date_format="iso").rstrip("\n").split("\n")
+    sizes = np.fromiter((len(line) + 1 for line in lines), dtype=np.int64, count=len(lines))
+    envelope = len('{"observations":[]}')
+    budget = max(max_bytes - envelope, int(sizes.max()))
+    ends = np.cumsum(sizes)
+    start, index = 0, 0
+    while start < len(lines):
+        offset = int(ends[start - 1]) if start else 0
+        stop = max(int(np.searchsorted(ends, offset + budget, side="right")), start + 1)
+        raw = ('{"observations":[' + ",".join(lines[start:stop]) + "]}").encode("utf-8")
+        yield ObservationChunk(
+            index=index,
+            rows=stop - start,
+            raw_bytes=len(raw),
+            body=gzip.compress(raw, compresslevel=5),
+            idempotency_key=hashlib.sha256(raw).hexdigest(),
+        )
+        start, index = stop, index + 1
+
+
+@dataclass
+class UploadReport:
+    rows: int = 0
+    chunks: int = 0
+    raw_bytes: int = 0
+    sent_bytes: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _post_chunk(
+    headers: dict,
+    project_id: str,
+    signal_id: str,
+    chunk: ObservationChunk,
+    *,
+    max_attempts: int = UPLOAD_MAX_ATTEMPTS,
+    backoff: float | None = None,
+) -> int:
+    backoff = UPLOAD_BACKOFF_SECONDS if backoff is None else backoff
+    path = f"/projects/{project_id}/signals/{signal_id}/observations"
+    request_headers = {
+        **headers,
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+        "Idempotency-Key": chunk.idempotency_key,
+    }
+    for attempt in range(max_attempts):
+        response: requests.Response | None = None
+        try:
+            response = backend_session.post(f"{API_BASE}{path}", headers=request_headers, data=chunk.body, timeout=60)
+            if response.status_code not in _RETRY_STATUSES:
+                response.raise_for_status()
+                return attempt
+        except requests.HTTPError as exc:
+            raise ValueError(f"POST {path} chunk {chunk.index} failed: {exc} {response.text if response is not None else ''}".strip()) from exc
+        except requests.RequestException as exc:
+            if attempt == max_attempts - 1:
+                raise ValueError(f"POST {path} chunk {chunk.index} failed: {exc}") from exc
+        if attempt < max_attempts - 1:
+            time.sleep(backoff * 2**attempt)
+    body = response.text if response is not None else ""
+    raise ValueError(f"POST {path} chunk {chunk.index} failed after {max_attempts} attempts: {body}".strip())
+
+
+def upload_observations(
+    headers: dict,
+    project_id: str,
+    signal_id: str,
+    prepared: pd.DataFrame,
+    *,
+    max_bytes: int = UPLOAD_CHUNK_BYTES,
+    max_workers: int = UPLOAD_MAX_WORKERS,
+    on_progress: ProgressCallback | None = None,
+) -> UploadReport:
+    """
+    Upload prepared observations as gzip chunks on a small thread pool.
+
+    Every row carries a `source_record_key` and every chunk an
+    `Idempotency-Key`, so chunks retried after a timeout are not stored twice.
+    `on_progress(rows_done, rows_total)` is called on the caller's thread.
+    """
+    started = time.perf_counter()
+    prepared = assign_record_keys(prepared, signal_id)
+    report = UploadReport()
+    total = len(prepared)
+    post = with_script_ctx(_post_chunk)
+    workers = max(max_workers, 1)
+
+    def collect(done: set[Future]) -> None:
+        for future in done:
+            report.retries += future.result()
+            report.rows += in_flight.pop(future).rows
+            if on_progress is not None:
+                on_progress(report.rows, total)
+
+    in_flight: dict[Future, ObservationChunk] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for chunk in iter_gzip_chunks(prepared, max_bytes=max_bytes):
+                # Only a couple of compressed chunks per worker are held at once.
+                if len(in_flight) >= workers * 2:
+                    collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+                in_flight[pool.submit(post, headers, project_id, signal_id, chunk)] = chunk
+                report.chunks += 1
+                report.raw_bytes += chunk.raw_bytes
+                report.sent_bytes += len(chunk.body)
+            while in_flight:
+                collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+    finally:
+        if report.rows:
+            clear_signal_caches(signal_tag(signal_id), namespaces=())
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def upload_observation_file(
+    headers: dict,
+    project_id: str,
+    signal_id: str,
+    file: str | BinaryIO | bytes,
+    *,
+    data_type: SignalDataType,
+    timezone: ZoneInfo,
+    name: str | None = None,
+    **kwargs: Any,
+) -> UploadReport:
+    if isinstance(file, bytes):
+        file = io.BytesIO(file)
+    prepared = prepare_observations(read_observation_file(file, name=name), data_type, timezone=timezone)
+    return upload_observations(headers, project_id, signal_id, prepared, **kwargs)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, TypeVar
+
+import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_WORKERS = 4
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[int], dict]
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass(frozen=True)
+class PageResult:
+    page: int
+    items: list[dict[str, Any]]
+    loaded: int
+    total: int
+
+
+def page_count(total: int, page_size: int) -> int:
+    return max((total - 1) // page_size + 1, 1)
+
+
+def missing_ranges(covered: list[tuple[Any, Any]], lo: Any, hi: Any) -> list[tuple[Any, Any]]:
+    """Parts of `[lo, hi]` not inside any of the sorted, disjoint `covered` ranges."""
+    gaps: list[tuple[Any, Any]] = []
+    cursor = lo
+    for start, end in covered:
+        if end < cursor:
+            continue
+        if start > hi:
+            break
+        if start > cursor:
+            gaps.append((cursor, start))
+        cursor = max(cursor, end)
+        if cursor >= hi:
+            break
+    if cursor < hi:
+        gaps.append((cursor, hi))
+    return gaps
+
+
+def merge_range(covered: list[tuple[Any, Any]], lo: Any, hi: Any) -> list[tuple[Any, Any]]:
+    merged: list[tuple[Any, Any]] = []
+    for start, end in sorted([*covered, (lo, hi)]):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def with_script_ctx(fn: Callable[..., T]) -> Callable[..., T]:
+    # Workers inherit the caller's ScriptRunContext so st.cache_data lookups
+    # behave exactly like they do on the main script thread.
+    ctx = get_script_run_ctx(suppress_warning=True)
+
+    def _run(*args: Any, **kwargs: Any) -> T:
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+
+    return _run
+
+
+def iter_pages(
+    fetch_page: PageFetcher,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[PageResult]:
+    """
+    Yield every page of a `{"items": [...], "total": n}` endpoint.
+
+    Page 1 is fetched first to learn `total`; pages 2..N are then fetched on a
+    bounded thread pool and yielded in completion order.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    first_page = fetch_page(1)
+    items = list(first_page.get("items", []))
+    total = int(first_page.get("total", len(items)))
+    loaded = len(items)
+    yield PageResult(page=1, items=items, loaded=loaded, total=total)
+
+    remaining = range(2, page_count(total, page_size) + 1)
+    if not remaining:
+        return
+
+    run = with_script_ctx(fetch_page)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(remaining))) as pool:
+        futures = {pool.submit(run, page): page for page in remaining}
+        try:
+            for future in as_completed(futures):
+                page_items = list(future.result().get("items", []))
+                loaded += len(page_items)
+                yield PageResult(page=futures[future], items=page_items, loaded=loaded, total=total)
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def fetch_all_pages_frame(
+    fetch_page: PageFetcher,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_progress: ProgressCallback | None = None,
+    on_frame: Callable[[pd.DataFrame], None] | None = None,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from every page, in page order.
+
+    Without `on_frame` the pages are concatenated once, after the last one
+    lands. With it, pages are appended as soon as every page before them has
+    arrived, and `on_frame` receives the grown frame after each append so
+    callers can render rows before the last page lands.
+    """
+    frames: dict[int, pd.DataFrame] = {}
+    frame = pd.DataFrame()
+    appended = 0
+    for result in iter_pages(fetch_page, page_size=page_size, max_workers=max_workers):
+        frames[result.page] = pd.DataFrame(result.items)
+        if on_progress is not None:
+            on_progress(result.loaded, result.total)
+        if on_frame is not None and appended + 1 in frames:
+            ready = [frame]
+            while appended + 1 in frames:
+                appended += 1
+                ready.append(frames.pop(appended))
+            frame = _concat_pages(ready)
+            on_frame(frame)
+    return _concat_pages([frame, *(frames[page] for page in sorted(frames))])
+
+
+def _concat_pages(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    ordered = [frame for frame in frames if not frame.empty]
+    if not ordered:
+        return pd.DataFrame()
+    if len(ordered) == 1:
+        return ordered[0]
+    return pd.concat(ordered, ignore_index=True)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Hashable, Iterable
+
+from logic.cache_registry import get_cache_registry
+
+REFERENCE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+REFERENCE_CACHE_TTL_SECONDS = 300
+
+
+@dataclass
+class ReferenceCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+@dataclass
+class _Blob:
+    data: bytes
+    refs: int = 0
+
+
+@dataclass
+class _Entry:
+    digest: str
+    namespace: str
+    tags: frozenset[str]
+    expires_at: float
+
+
+class SharedReferenceCache:
+    """
+    Process-wide LRU + TTL cache for read-mostly reference payloads.
+
+    Payloads are stored once as canonical JSON, addressed by their sha256, so
+    identical responses seen by different scopes share memory. Every `get`
+    returns a fresh decoded copy, which keeps sessions from mutating each
+    other's data.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = REFERENCE_CACHE_MAX_BYTES,
+        ttl_seconds: float = REFERENCE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._blobs: dict[str, _Blob] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = ReferenceCacheStats()
+
+    def _release(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        blob = self._blobs[entry.digest]
+        blob.refs -= 1
+        if blob.refs <= 0:
+            del self._blobs[entry.digest]
+            self._bytes -= len(blob.data)
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._release(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            data = self._blobs[entry.digest].data
+        return json.loads(data)
+
+    def put(self, key: Hashable, payload: Any, *, namespace: str, tags: Iterable[str] = ()) -> None:
+        data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if key in self._entries:
+                self._release(key)
+            blob = self._blobs.get(digest)
+            if blob is None:
+                blob = self._blobs[digest] = _Blob(data=data)
+                self._bytes += len(data)
+            blob.refs += 1
+            self._entries[key] = _Entry(
+                digest=digest,
+                namespace=namespace,
+                tags=frozenset(tags),
+                expires_at=self._clock() + self.ttl_seconds,
+            )
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                oldest = next(iter(self._entries))
+                self._release(oldest)
+                self.stats.evictions += 1
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        *,
+        namespace: str,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        payload = loader()
+        self.put(key, payload, namespace=namespace, tags=tags)
+        return payload
+
+    def invalidate(self, *, tags: Iterable[str] = (), namespace: str | None = None) -> int:
+        wanted = set(tags)
+        with self._lock:
+            doomed = [
+                key
+                for key, entry in self._entries.items()
+                if (namespace is not None and entry.namespace == namespace) or not entry.tags.isdisjoint(wanted)
+            ]
+            for key in doomed:
+                self._release(key)
+            self.stats.invalidations += len(doomed)
+        return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._blobs.clear()
+            self._bytes = 0
+
+    def memory_stats(self) -> dict[str, Any]:
+        with self._lock:
+            logical_bytes = sum(len(self._blobs[entry.digest].data) for entry in self._entries.values())
+            by_namespace: dict[str, int] = {}
+            for entry in self._entries.values():
+                by_namespace[entry.namespace] = by_namespace.get(entry.namespace, 0) + 1
+            return {
+                "entries": len(self._entries),
+                "unique_payloads": len(self._blobs),
+                "stored_bytes": self._bytes,
+                "logical_bytes": logical_bytes,
+                "dedup_saved_bytes": logical_bytes - self._bytes,
+                "max_bytes": self.max_bytes,
+                "entries_by_namespace": by_namespace,
+                **asdict(self.stats),
+            }
+
+
+_cache = SharedReferenceCache()
+get_cache_registry().add_invalidation_listener(lambda tags: _cache.invalidate(tags=tags))
+
+
+def get_reference_cache() -> SharedReferenceCache:
+    return _cache
+
+
+def reference_cache_stats() -> dict[str, Any]:
+    return _cache.memory_stats()
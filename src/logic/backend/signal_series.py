@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import datetime as dt
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from logic.backend.api_client import project_access_scope
+from logic.backend.pagination import merge_range, missing_ranges
+from logic.backend.signals import (
+    OBSERVATION_SCHEMA,
+    SIGNALS_TAG,
+    iter_observation_chunks,
+    observation_chunks_to_frame,
+    signal_tag,
+    signals_tag,
+)
+from logic.cache_registry import get_cache_registry, project_tag
+from models.signals import SignalDataType
+
+SERIES_MEMORY_BUDGET_BYTES = 64 * 1024 * 1024
+SERIES_CACHE_TTL_SECONDS = 300
+
+_MIN_DT = dt.datetime.min.replace(tzinfo=dt.UTC)
+_MAX_DT = dt.datetime.max.replace(tzinfo=dt.UTC)
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.UTC)
+_ONE_US = dt.timedelta(microseconds=1)
+
+
+def _as_utc(value: dt.datetime | None, default: dt.datetime) -> dt.datetime:
+    if value is None:
+        return default
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt.UTC)
+    return value.astimezone(dt.UTC)
+
+
+def _micros(value: dt.datetime) -> int:
+    return (value - _EPOCH) // _ONE_US
+
+
+@dataclass
+class _SignalSeries:
+    """Observations of one signal in timestamp order, plus the ranges already fetched."""
+
+    loaded_at: float
+    table: pa.Table = field(default_factory=OBSERVATION_SCHEMA.empty_table)
+    stamps: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    covered: list[tuple[dt.datetime, dt.datetime]] = field(default_factory=list)
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes + self.stamps.nbytes
+
+    def stitch(self, chunks: list[pa.Table]) -> None:
+        if not chunks:
+            return
+        fresh = pa.concat_tables(chunks)
+        # Gap fetches overlap on their boundary timestamps; keep the first copy.
+        if self.table.num_rows:
+            fresh = fresh.filter(pc.invert(pc.is_in(fresh.column("id"), value_set=self.table.column("id"))))
+        if fresh.num_rows == 0:
+            return
+        table = pa.concat_tables([self.table, fresh]).combine_chunks()
+        self.table = table.sort_by([("timestamp_utc", "ascending"), ("id", "ascending")])
+        self.stamps = self.table.column("timestamp_utc").cast(pa.int64()).to_numpy()
+
+    def bounds(self, lo: dt.datetime, hi: dt.datetime) -> tuple[int, int]:
+        first = 0 if lo == _MIN_DT else int(np.searchsorted(self.stamps, _micros(lo), side="left"))
+        last = len(self.stamps) if hi == _MAX_DT else int(np.searchsorted(self.stamps, _micros(hi), side="right"))
+        return first, last
+
+    def window(self, lo: dt.datetime, hi: dt.datetime, max_rows: int | None) -> pa.Table:
+        first, last = self.bounds(lo, hi)
+        if max_rows is not None:
+            last = min(last, first + max_rows)
+        return self.table.slice(first, last - first)
+
+
+class SignalSeriesStore:
+    """
+    Process-wide, per-signal cache of observations as sorted Arrow columns.
+
+    A window request only fetches the parts of `[start, end]` that no earlier
+    request covered, and stitches them into the signal's column store, so
+    nudging the window pickers costs one small gap fetch instead of a full
+    reload. Series are scoped by project access, expire after `ttl_seconds`,
+    are evicted least recently used once `memory_budget` bytes are held, and
+    are dropped when a `signal:`, `signals:` or `project:` tag covering them is
+    invalidated.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch=None,
+        memory_budget: int = SERIES_MEMORY_BUDGET_BYTES,
+        ttl_seconds: float = SERIES_CACHE_TTL_SECONDS,
+        clock=time.monotonic,
+    ):
+        self._fetch = fetch
+        self.memory_budget = memory_budget
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._series: OrderedDict[tuple[str, str, str], _SignalSeries] = OrderedDict()
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(series.nbytes for series in self._series.values())
+
+    def _load_gap(
+        self,
+        headers: dict,
+        project_id: str,
+        signal_id: str,
+        lo: dt.datetime,
+        hi: dt.datetime,
+        max_rows: int | None,
+    ) -> tuple[list[pa.Table], dt.datetime]:
+        fetch = self._fetch or iter_observation_chunks
+        with self._lock:
+            self.requests += 1
+        chunks = list(
+            fetch(
+                headers,
+                project_id,
+                signal_id,
+                start=lo if lo > _MIN_DT else None,
+                end=hi if hi < _MAX_DT else None,
+                max_rows=max_rows,
+            )
+        )
+        loaded = sum(chunk.num_rows for chunk in chunks)
+        if max_rows is None or loaded < max_rows:
+            return chunks, hi
+        # Truncated: only the rows before the last timestamp are known complete.
+        last = chunks[-1].column("timestamp_utc")[-1].as_py()
+        return chunks, max(lo, last - _ONE_US)
+
+    def _evict(self, keep: tuple[str, str, str]) -> None:
+        total = sum(series.nbytes for series in self._series.values())
+        for key in list(self._series):
+            if total <= self.memory_budget:
+                break
+            if key == keep:
+                continue
+            total -= self._series.pop(key).nbytes
+
+    def get(
+        self,
+        headers: dict,
+        project_id: str,
+        signal_id: str,
+        *,
+        start: dt.datetime | None = None,
+        end: dt.datetime | None = None,
+        max_rows: int | None = None,
+    ) -> pa.Table:
+        lo, hi = _as_utc(start, _MIN_DT), _as_utc(end, _MAX_DT)
+        key = (str(project_id), project_access_scope(headers, project_id), str(signal_id))
+        now = self._clock()
+        with self._lock:
+            series = self._series.get(key)
+            if series is None or now - series.loaded_at > self.ttl_seconds:
+                series = self._series[key] = _SignalSeries(loaded_at=now)
+            self._series.move_to_end(key)
+            gaps = missing_ranges(series.covered, lo, hi)
+
+        for gap_lo, gap_hi in gaps:
+            if max_rows is not None and gap_lo > lo:
+                # Enough rows before this gap already answer a capped window.
+                with self._lock:
+                    first, before_gap = series.bounds(lo, gap_lo + _ONE_US)
+                if before_gap - first >= max_rows:
+                    break
+            chunks, covered_to = self._load_gap(headers, str(project_id), str(signal_id), gap_lo, gap_hi, max_rows)
+            with self._lock:
+                series.stitch(chunks)
+                series.covered = merge_range(series.covered, gap_lo, covered_to)
+                self._evict(keep=key)
+            if covered_to < gap_hi:
+                break
+
+        with self._lock:
+            return series.window(lo, hi, max_rows)
+
+    def invalidate(self, project_id: str | None = None, signal_id: str | None = None) -> int:
+        with self._lock:
+            doomed = [
+                key
+                for key in self._series
+                if (project_id is None or key[0] == str(project_id)) and (signal_id is None or key[2] == str(signal_id))
+            ]
+            for key in doomed:
+                del self._series[key]
+        return len(doomed)
+
+    def invalidate_tags(self, tags: frozenset[str]) -> int:
+        if SIGNALS_TAG in tags:
+            return self.invalidate()
+        with self._lock:
+            doomed = [
+                key
+                for key in self._series
+                if signal_tag(key[2]) in tags or signals_tag(key[0]) in tags or project_tag(key[0]) in tags
+            ]
+            for key in doomed:
+                del self._series[key]
+        return len(doomed)
+
+
+_store = SignalSeriesStore()
+get_cache_registry().add_invalidation_listener(_store.invalidate_tags)
+
+
+def get_signal_series_store() -> SignalSeriesStore:
+    return _store
+
+
+def fetch_observation_frame(
+    headers: dict,
+    project_id: str,
+    signal_id: str,
+    *,
+    timezone: ZoneInfo,
+    data_type: SignalDataType,
+    start: dt.datetime | None = None,
+    end: dt.datetime | None = None,
+    max_rows: int | None = None,
+) -> pd.DataFrame:
+    table = _store.get(headers, project_id, signal_id, start=start, end=end, max_rows=max_rows)
+    return observation_chunks_to_frame([table], timezone=timezone, data_type=data_type)
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import datetime as dt
 from json import JSONDecodeError
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 from zoneinfo import ZoneInfo
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import requests
-import streamlit as st
 
-from logic.backend.api_client import API_BASE
+from logic.backend.api_client import API_BASE, shared_reference_get
+from logic.backend.instrumentation import backend_session
+from logic.backend.reference_cache import get_reference_cache
+from logic.cache_registry import invalidate_tags, project_tag, tagged_cache_data
 from models.signals import (
     DataSource,
     DataSourceType,
@@ -21,11 +25,26 @@ from models.signals import (
     parse_data_sources,
     parse_ingestion_runs,
     parse_intervals,
-    parse_observations,
+    parse_observations_json,
     parse_signal_definitions,
 )
 
 
+SIGNALS_TAG = "signals"
+
+
+def signals_tag(project_id: str) -> str:
+    return f"signals:{project_id}"
+
+
+def signal_tag(signal_id: str) -> str:
+    return f"signal:{signal_id}"
+
+
+def data_source_tag(data_source_id: str) -> str:
+    return f"data-source:{data_source_id}"
+
+
 def _request_json(
     *,
     method: str,
@@ -33,10 +52,12 @@ def _request_json(
     headers: dict,
     params: Optional[dict[str, Any]] = None,
     json: Optional[dict[str, Any]] = None,
+    parse: Optional[Callable[[bytes], Any]] = None,
 ) -> Any:
+    """Decoded JSON body, or `parse(body)` when given (e.g. a pydantic `validate_json`)."""
     response: requests.Response | None = None
     try:
-        response = requests.request(
+        response = backend_session.request(
             method=method,
             url=f"{API_BASE}{path}",
             headers=headers,
@@ -47,7 +68,7 @@ def _request_json(
         response.raise_for_status()
         if not response.content:
             return None
-        return response.json()
+        return parse(response.content) if parse is not None else response.json()
     except requests.RequestException as exc:
         body = ""
         if response is not None:
@@ -68,7 +89,6 @@ def _to_utc_iso(value: dt.datetime | None, timezone: ZoneInfo) -> str | None:
     return value.astimezone(dt.UTC).isoformat().replace("+00:00", "Z")
 
 
-@st.cache_data(show_spinner=False)
 def fetch_signal_definitions(
     headers: dict,
     project_id: str,
@@ -80,16 +100,24 @@ def fetch_signal_definitions(
         params["data_type"] = data_type.value
     if data_source_id:
         params["data_source_id"] = data_source_id
-    payload = _request_json(
-        method="GET",
-        path=f"/projects/{project_id}/signals",
+    payload = shared_reference_get(
+        "signal_definitions",
+        url=f"{API_BASE}/projects/{project_id}/signals",
         headers=headers,
-        params=params or None,
+        params={"project_id": project_id, **params},
+        tags=(project_tag(project_id),),
+        per_user=True,
+        loader=lambda: _request_json(
+            method="GET",
+            path=f"/projects/{project_id}/signals",
+            headers=headers,
+            params=params or None,
+        ),
     )
     return parse_signal_definitions(payload)
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(SIGNALS_TAG, "signals:{project_id}", "signal:{signal_id}", show_spinner=False)
 def fetch_signal_definition(headers: dict, project_id: str, signal_id: str) -> SignalDefinition:
     payload = _request_json(
         method="GET",
@@ -106,7 +134,7 @@ def create_signal_definition(headers: dict, project_id: str, payload: dict[str,
         headers=headers,
         json=payload,
     )
-    clear_signal_caches()
+    clear_signal_caches(namespaces=("signal_definitions",))
     return SignalDefinition.model_validate(data)
 
 
@@ -117,7 +145,7 @@ def update_signal_definition(headers: dict, project_id: str, signal_id: str, pay
         headers=headers,
         json=payload,
     )
-    clear_signal_caches()
+    clear_signal_caches(signal_tag(signal_id), namespaces=("signal_definitions",))
     return SignalDefinition.model_validate(data)
 
 
@@ -127,10 +155,9 @@ def delete_signal_definition(headers: dict, project_id: str, signal_id: str) ->
         path=f"/projects/{project_id}/signals/{signal_id}",
         headers=headers,
     )
-    clear_signal_caches()
+    clear_signal_caches(signal_tag(signal_id), namespaces=("signal_definitions",))
 
 
-@st.cache_data(show_spinner=False)
 def fetch_data_sources(
     headers: dict,
     project_id: str,
@@ -142,16 +169,24 @@ def fetch_data_sources(
         params["source_type"] = source_type.value
     if is_active is not None:
         params["is_active"] = str(is_active).lower()
-    payload = _request_json(
-        method="GET",
-        path=f"/projects/{project_id}/data-sources",
+    payload = shared_reference_get(
+        "data_sources",
+        url=f"{API_BASE}/projects/{project_id}/data-sources",
         headers=headers,
-        params=params or None,
+        params={"project_id": project_id, **params},
+        tags=(project_tag(project_id),),
+        per_user=True,
+        loader=lambda: _request_json(
+            method="GET",
+            path=f"/projects/{project_id}/data-sources",
+            headers=headers,
+            params=params or None,
+        ),
     )
     return parse_data_sources(payload)
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(SIGNALS_TAG, "signals:{project_id}", "data-source:{data_source_id}", show_spinner=False)
 def fetch_data_source(headers: dict, project_id: str, data_source_id: str) -> DataSource:
     payload = _request_json(
         method="GET",
@@ -168,7 +203,7 @@ def create_data_source(headers: dict, project_id: str, payload: dict[str, Any])
         headers=headers,
         json=payload,
     )
-    clear_signal_caches()
+    clear_signal_caches(namespaces=("data_sources",))
     return DataSource.model_validate(data)
 
 
@@ -179,7 +214,7 @@ def update_data_source(headers: dict, project_id: str, data_source_id: str, payl
         headers=headers,
         json=payload,
     )
-    clear_signal_caches()
+    clear_signal_caches(data_source_tag(data_source_id), namespaces=("data_sources",))
     return DataSource.model_validate(data)
 
 
@@ -189,7 +224,7 @@ def delete_data_source(headers: dict, project_id: str, data_source_id: str) -> N
         path=f"/projects/{project_id}/data-sources/{data_source_id}",
         headers=headers,
     )
-    clear_signal_caches()
+    clear_signal_caches(data_source_tag(data_source_id), namespaces=("data_sources",))
 
 
 def test_data_source(headers: dict, project_id: str, data_source_id: str) -> dict[str, Any] | None:
@@ -198,7 +233,7 @@ def test_data_source(headers: dict, project_id: str, data_source_id: str) -> dic
         path=f"/projects/{project_id}/data-sources/{data_source_id}/test",
         headers=headers,
     )
-    clear_signal_caches()
+    clear_signal_caches(data_source_tag(data_source_id), namespaces=("data_sources",))
     return result
 
 
@@ -208,17 +243,18 @@ def create_signal_observations(
     signal_id: str,
     observations: list[dict[str, Any]],
 ) -> list[SignalObservation]:
-    payload = _request_json(
+    created = _request_json(
         method="POST",
         path=f"/projects/{project_id}/signals/{signal_id}/observations",
         headers=headers,
         json={"observations": observations},
+        parse=parse_observations_json,
     )
-    clear_signal_caches()
-    return parse_observations(payload)
+    clear_signal_caches(signal_tag(signal_id), namespaces=())
+    return created or []
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(SIGNALS_TAG, "signals:{project_id}", "signal:{signal_id}", show_spinner=False)
 def fetch_signal_observations(
     headers: dict,
     project_id: str,
@@ -233,13 +269,14 @@ def fetch_signal_observations(
         params["start"] = start.isoformat().replace("+00:00", "Z")
     if end:
         params["end"] = end.isoformat().replace("+00:00", "Z")
-    payload = _request_json(
+    observations = _request_json(
         method="GET",
         path=f"/projects/{project_id}/signals/{signal_id}/observations",
         headers=headers,
         params=params,
+        parse=parse_observations_json,
     )
-    return parse_observations(payload)
+    return observations or []
 
 
 def delete_signal_observations(
@@ -263,10 +300,10 @@ def delete_signal_observations(
         headers=headers,
         json=payload,
     )
-    clear_signal_caches()
+    clear_signal_caches(signal_tag(signal_id), namespaces=())
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(SIGNALS_TAG, "signals:{project_id}", "signal:{signal_id}", show_spinner=False)
 def fetch_signal_intervals(
     headers: dict,
     project_id: str,
@@ -300,11 +337,11 @@ def trigger_manual_ingestion(
         headers=headers,
         json=payload,
     )
-    clear_signal_caches()
+    clear_signal_caches(signals_tag(project_id), namespaces=())
     return IngestionRun.model_validate(data)
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(SIGNALS_TAG, "signals:{project_id}", "data-source:{data_source_id}", show_spinner=False)
 def fetch_ingestion_runs(headers: dict, project_id: str, data_source_id: str) -> list[IngestionRun]:
     payload = _request_json(
         method="GET",
@@ -314,7 +351,7 @@ def fetch_ingestion_runs(headers: dict, project_id: str, data_source_id: str) ->
     return parse_ingestion_runs(payload)
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(SIGNALS_TAG, "signals:{project_id}", show_spinner=False)
 def fetch_ingestion_run(headers: dict, project_id: str, ingestion_run_id: str) -> IngestionRun:
     payload = _request_json(
         method="GET",
@@ -330,19 +367,20 @@ def rollback_ingestion_run(headers: dict, project_id: str, ingestion_run_id: str
         path=f"/projects/{project_id}/ingestions/{ingestion_run_id}/rollback",
         headers=headers,
     )
-    clear_signal_caches()
+    clear_signal_caches(signals_tag(project_id), namespaces=())
     return result
 
 
-def clear_signal_caches() -> None:
-    fetch_signal_definitions.clear()
-    fetch_signal_definition.clear()
-    fetch_data_sources.clear()
-    fetch_data_source.clear()
-    fetch_signal_observations.clear()
-    fetch_signal_intervals.clear()
-    fetch_ingestion_runs.clear()
-    fetch_ingestion_run.clear()
+def clear_signal_caches(*tags: str, namespaces: tuple[str, ...] = ("signal_definitions", "data_sources")) -> None:
+    """
+    Drop cached signal data tagged with any of `tags` plus the shared reference
+    lists in `namespaces`; pass `SIGNALS_TAG` to drop every signal cache.
+    """
+    reference_cache = get_reference_cache()
+    for namespace in namespaces:
+        reference_cache.invalidate(namespace=namespace)
+    if tags:
+        invalidate_tags(*tags)
 
 
 def observations_to_frame(
@@ -362,6 +400,128 @@ def observations_to_frame(
     return df.sort_values("timestamp_local")
 
 
+OBSERVATION_PAGE_SIZE = 5000
+
+OBSERVATION_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("timestamp_utc", pa.timestamp("us", tz="UTC")),
+        ("numeric_value", pa.float64()),
+        ("boolean_value", pa.bool_()),
+        ("text_value", pa.string()),
+        ("quality_code", pa.string()),
+        ("source_record_key", pa.string()),
+        ("ingestion_run_id", pa.string()),
+    ]
+)
+
+
+def _utc_param(value: dt.datetime) -> str:
+    return value.astimezone(dt.UTC).isoformat().replace("+00:00", "Z")
+
+
+def observations_page_to_table(rows: list[dict[str, Any]]) -> pa.Table:
+    """Build Arrow columns straight from a page of JSON rows, without per-row models."""
+    columns = []
+    for field in OBSERVATION_SCHEMA:
+        values = [row.get(field.name) for row in rows]
+        if field.name == "timestamp_utc":
+            columns.append(pa.array(values, type=pa.string()).cast(field.type))
+        else:
+            columns.append(pa.array(values, type=field.type, from_pandas=True))
+    return pa.Table.from_arrays(columns, schema=OBSERVATION_SCHEMA)
+
+
+def iter_observation_chunks(
+    headers: dict,
+    project_id: str,
+    signal_id: str,
+    *,
+    start: dt.datetime | None = None,
+    end: dt.datetime | None = None,
+    page_size: int = OBSERVATION_PAGE_SIZE,
+    max_rows: int | None = None,
+) -> Iterator[pa.Table]:
+    """
+    Yield observations in `[start, end]` as Arrow tables, one per page.
+
+    Pages are keyed on the last timestamp seen (the backend returns rows in
+    timestamp order) rather than a growing offset; `offset` only skips rows
+    that share that timestamp and were already yielded, so deep pages cost
+    the backend the same as the first one.
+    """
+    cursor = start
+    seen_at_cursor = 0
+    remaining = max_rows
+    while remaining is None or remaining > 0:
+        limit = page_size if remaining is None else min(page_size, remaining)
+        params: dict[str, Any] = {"limit": limit, "offset": seen_at_cursor}
+        if cursor:
+            params["start"] = _utc_param(cursor)
+        if end:
+            params["end"] = _utc_param(end)
+        rows = _request_json(
+            method="GET",
+            path=f"/projects/{project_id}/signals/{signal_id}/observations",
+            headers=headers,
+            params=params,
+        ) or []
+        if not rows:
+            return
+
+        table = observations_page_to_table(rows)
+        del rows
+        yield table
+        if remaining is not None:
+            remaining -= table.num_rows
+        if table.num_rows < limit:
+            return
+
+        timestamps = table.column("timestamp_utc")
+        last = timestamps[-1]
+        # Rows arrive in timestamp order, so every tie with `last` is at the tail.
+        ties = pc.sum(pc.equal(timestamps, last)).as_py()
+        if cursor is not None and last.as_py() == cursor:
+            seen_at_cursor += ties
+        else:
+            cursor, seen_at_cursor = last.as_py(), ties
+
+
+def observation_chunks_to_frame(
+    chunks: Iterable[pa.Table],
+    *,
+    timezone: ZoneInfo,
+    data_type: SignalDataType,
+) -> pd.DataFrame:
+    """
+    Concatenate streamed chunks into the frame `observations_to_frame` produces.
+
+    Chunks stay in Arrow until the single `to_pandas` at the end, so peak
+    memory is the compact columns plus one page of raw JSON.
+    """
+    table = pa.concat_tables([*chunks, OBSERVATION_SCHEMA.empty_table()])
+    if table.num_rows == 0:
+        return pd.DataFrame(columns=["timestamp_utc", "value", "quality_code", "source_record_key"])
+
+    df = table.to_pandas()
+    if data_type == SignalDataType.NUMERIC:
+        df["value"] = df["numeric_value"]
+    elif data_type == SignalDataType.BOOLEAN:
+        df["value"] = df["boolean_value"]
+    else:
+        df["value"] = df["text_value"].fillna(df["numeric_value"].astype(object)).fillna(df["boolean_value"])
+    df = df.drop(columns=["numeric_value", "boolean_value", "text_value"])
+    for column in ("quality_code", "source_record_key", "ingestion_run_id"):
+        df[column] = df[column].fillna("")
+
+    df["timestamp_local"] = df["timestamp_utc"].dt.tz_convert(timezone)
+    if data_type == SignalDataType.BOOLEAN:
+        df["value_label"] = df["value"].map({True: "True"}).fillna("False")
+    else:
+        df["value_label"] = df["value"].astype(str)
+    return df.sort_values("timestamp_local", kind="stable").reset_index(drop=True)
+
+
 def intervals_to_frame(intervals: list[SignalInterval], *, timezone: ZoneInfo) -> pd.DataFrame:
     rows: list[dict[str, Any]] = []
     for item in intervals:
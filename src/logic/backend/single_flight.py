@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import copy
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Hashable
+
+
+@dataclass
+class FlightStats:
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    errors: int = 0
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls into one execution.
+
+    The first caller for a key runs `fn`; callers that arrive while it is in
+    flight block and receive a copy of the same result (or the same error).
+    Nothing is cached once the flight lands.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+        self._stats: dict[str, FlightStats] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any], *, label: str = "default") -> Any:
+        with self._lock:
+            stats = self._stats.setdefault(label, FlightStats())
+            stats.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                stats.executions += 1
+            else:
+                flight.waiters += 1
+                stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            # Followers may hand the value to code that mutates it.
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = fn()
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                stats.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {label: asdict(stats) for label, stats in sorted(self._stats.items())}
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _single_flight
+
+
+def single_flight_stats() -> dict[str, dict[str, int]]:
+    return _single_flight.stats()
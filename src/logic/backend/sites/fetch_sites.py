@@ -1,9 +1,6 @@
-import streamlit as st
-
 from logic.backend.api_client import fetch_sites
 from models.site import SiteIn
 
-@st.cache_data
 def get_sites(headers: dict) -> list[SiteIn]:
     try:
         data = fetch_sites(headers=headers)
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import datetime as dt
+import functools
+import inspect
+import threading
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any, Callable, Hashable
+from uuid import UUID
+
+import streamlit as st
+
+REFERENCE_TAG = "reference"
+MAX_TRACKED_ENTRIES = 2048
+
+_PRIMITIVES = (str, int, float, bool, type(None), bytes, dt.date, dt.time, dt.timedelta, UUID, Enum)
+
+
+def project_tag(project_id: Any) -> str:
+    return f"project:{project_id}"
+
+
+def org_tag(organization_id: Any) -> str:
+    return f"org:{organization_id}"
+
+
+def gantt_tag(project_id: Any) -> str:
+    return f"gantt:{project_id}"
+
+
+@dataclass
+class TagStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _TrackedFunction:
+    name: str
+    clear: Callable[..., None]
+    entries: dict[Hashable, tuple[tuple, dict, frozenset[str]]]
+    # Tags of calls whose entries are not tracked: model arguments (see
+    # `_is_plain`) or calls past `max_tracked_entries`. Invalidating one of
+    # these clears the whole function; other tags still clear per entry.
+    untracked_tags: set[str] = field(default_factory=set)
+
+
+def _is_plain(value: Any) -> bool:
+    """
+    Whether `value` hashes the same for st.cache_data later. Models such as a
+    Project are edited in place before their tags are invalidated, so
+    `clear(*args)` with them would hash the edited object and miss the entry.
+    """
+    if isinstance(value, _PRIMITIVES):
+        return True
+    if isinstance(value, dict):
+        return all(_is_plain(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(item) for item in value)
+    return False
+
+
+def _entry_key(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((str(key), _entry_key(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_entry_key(item) for item in value))
+    return value
+
+
+class CacheRegistry:
+    """
+    Tracks which cached calls carry which tags so mutations can drop only the
+    affected entries instead of calling `st.cache_data.clear()`.
+    """
+
+    def __init__(self, *, max_tracked_entries: int = MAX_TRACKED_ENTRIES):
+        self.max_tracked_entries = max_tracked_entries
+        self._functions: dict[str, _TrackedFunction] = {}
+        self._stats: dict[str, TagStats] = {}
+        self._listeners: list[Callable[[frozenset[str]], int]] = []
+        self._lock = threading.RLock()
+
+    def add_invalidation_listener(self, listener: Callable[[frozenset[str]], int]) -> None:
+        """Let caches that live outside st.cache_data drop their own tagged entries."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def register_function(self, name: str, clear: Callable[..., None]) -> None:
+        with self._lock:
+            self._functions[name] = _TrackedFunction(name=name, clear=clear, entries={})
+
+    def record_call(self, name: str, args: tuple, kwargs: dict, tags: frozenset[str], *, hit: bool) -> None:
+        with self._lock:
+            for tag in tags:
+                stats = self._stats.setdefault(tag, TagStats())
+                if hit:
+                    stats.hits += 1
+                else:
+                    stats.misses += 1
+
+            tracked = self._functions.get(name)
+            if tracked is None:
+                return
+            if not (_is_plain(args) and _is_plain(kwargs)):
+                tracked.untracked_tags |= tags
+                return
+            key = (_entry_key(args), _entry_key(kwargs))
+            if key not in tracked.entries and len(tracked.entries) >= self.max_tracked_entries:
+                tracked.untracked_tags |= tags
+                return
+            tracked.entries[key] = (args, kwargs, tags)
+
+    def invalidate(self, *tags: str) -> int:
+        wanted = set(tags)
+        if not wanted:
+            return 0
+
+        to_clear: list[tuple[Callable[..., None], tuple, dict]] = []
+        with self._lock:
+            listeners = list(self._listeners)
+            for tracked in self._functions.values():
+                matched_untracked = tracked.untracked_tags & wanted
+                if matched_untracked:
+                    to_clear.append((tracked.clear, (), {}))
+                    for tag in matched_untracked:
+                        self._stats.setdefault(tag, TagStats()).evictions += 1
+                    tracked.entries.clear()
+                    tracked.untracked_tags.clear()
+                    continue
+                for key, (args, kwargs, entry_tags) in list(tracked.entries.items()):
+                    if entry_tags.isdisjoint(wanted):
+                        continue
+                    del tracked.entries[key]
+                    to_clear.append((tracked.clear, args, kwargs))
+                    for tag in entry_tags:
+                        self._stats.setdefault(tag, TagStats()).evictions += 1
+
+        for clear, args, kwargs in to_clear:
+            clear(*args, **kwargs)
+        external = sum(listener(frozenset(wanted)) for listener in listeners)
+        return len(to_clear) + external
+
+    def forget_function(self, name: str) -> None:
+        with self._lock:
+            tracked = self._functions.get(name)
+            if tracked is not None:
+                tracked.entries.clear()
+                tracked.untracked_tags.clear()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {tag: asdict(stats) for tag, stats in sorted(self._stats.items())}
+
+    def tracked_entries(self) -> dict[str, int]:
+        with self._lock:
+            return {name: len(tracked.entries) for name, tracked in self._functions.items()}
+
+
+_registry = CacheRegistry()
+_call_state = threading.local()
+
+
+def get_cache_registry() -> CacheRegistry:
+    return _registry
+
+
+def invalidate_tags(*tags: str) -> int:
+    return _registry.invalidate(*tags)
+
+
+def cache_tag_stats() -> dict[str, dict[str, int]]:
+    return _registry.stats()
+
+
+def _hashed_arguments(signature: inspect.Signature, args: tuple, kwargs: dict) -> tuple[tuple, dict]:
+    """
+    The call's arguments as st.cache_data hashes them: parameters named with a
+    leading "_" are left out of the key, so they are recorded as None.
+    """
+    names = list(signature.parameters)
+    hashed_args = tuple(
+        None if index < len(names) and names[index].startswith("_") else value
+        for index, value in enumerate(args)
+    )
+    hashed_kwargs = {name: None if name.startswith("_") else value for name, value in kwargs.items()}
+    return hashed_args, hashed_kwargs
+
+
+def _resolve_tags(signature: inspect.Signature, templates: tuple[str, ...], args: tuple, kwargs: dict) -> frozenset[str]:
+    bound = signature.bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    values = dict(bound.arguments)
+    return frozenset(template.format(**values) for template in templates)
+
+
+def tagged_cache_data(*tags: str, registry: CacheRegistry | None = None, **cache_kwargs: Any):
+    """
+    `st.cache_data` with tags resolved from the call's arguments.
+
+    Tags are `str.format` templates over the function's parameters, e.g.
+    `"project:{project_id}"` or `"project:{project.uuid}"`; plain strings such
+    as `"reference"` apply to every call. Entries are dropped one by one when
+    the hashed arguments are plain values; pass models as "_"-prefixed
+    parameters next to a plain key (id plus content version) to keep it so.
+    """
+    target = registry or _registry
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def _compute(*args: Any, **kwargs: Any) -> Any:
+            _call_state.missed = True
+            return func(*args, **kwargs)
+
+        cached = st.cache_data(**cache_kwargs)(_compute)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            resolved = _resolve_tags(signature, tags, args, kwargs)
+            previous = getattr(_call_state, "missed", False)
+            _call_state.missed = False
+            try:
+                result = cached(*args, **kwargs)
+                hit = not _call_state.missed
+            finally:
+                _call_state.missed = previous
+            hashed_args, hashed_kwargs = _hashed_arguments(signature, args, kwargs)
+            target.record_call(name, hashed_args, hashed_kwargs, resolved, hit=hit)
+            return result
+
+        def clear(*args: Any, **kwargs: Any) -> None:
+            cached.clear(*args, **kwargs)
+            if not args and not kwargs:
+                target.forget_function(name)
+
+        target.register_function(name, cached.clear)
+        wrapper.clear = clear  # type: ignore[attr-defined]
+        wrapper.cache_tags = tags  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from models.signals import SignalDataType
+
+DEFAULT_CHART_MAX_POINTS = 5000
+DEFAULT_CHART_WIDTH_PX = 1200
+POINTS_PER_PIXEL = 2
+# Numeric series longer than this many times the target are first reduced to
+# per-bucket extremes, so LTTB only ever scans a few points per output bucket.
+MINMAX_PRESELECT_RATIO = 4
+
+
+def chart_max_points() -> int:
+    """Point count above which charts are downsampled (env, then secrets, then default)."""
+    raw = os.getenv("GANTTBUDDY_CHART_MAX_POINTS")
+    if raw is None:
+        try:
+            raw = st.secrets.get("ganttbuddy", {}).get("charts", {}).get("max_points")
+        except Exception:
+            raw = None
+    try:
+        return max(int(raw), 3) if raw is not None else DEFAULT_CHART_MAX_POINTS
+    except (TypeError, ValueError):
+        return DEFAULT_CHART_MAX_POINTS
+
+
+def target_points(width_px: int, *, points_per_px: int = POINTS_PER_PIXEL) -> int:
+    return max(int(width_px) * points_per_px, 3)
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Indices of the minimum and maximum of `y` in each of `n_buckets` equal-count buckets, plus the ends."""
+    n = len(y)
+    if n_buckets * 2 >= n:
+        return np.arange(n)
+    buckets = np.arange(n) * n_buckets // n
+    order = np.lexsort((y, buckets))
+    sorted_buckets = buckets[order]
+    starts = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+    ends = np.r_[starts[1:] - 1, n - 1]
+    return np.unique(np.concatenate(([0, n - 1], order[starts], order[ends])))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: keep the first and last points and, per
+    bucket in between, the point spanning the largest triangle with the point
+    kept before it and the mean of the next bucket.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+    # Mean of every bucket, with the last point standing in after the final bucket.
+    counts = np.diff(edges)
+    mean_x = np.r_[np.add.reduceat(x[: n - 1], edges[:-1]) / counts, x[-1]]
+    mean_y = np.r_[np.add.reduceat(y[: n - 1], edges[:-1]) / counts, y[-1]]
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket in range(n_out - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        next_x, next_y = mean_x[bucket + 1], mean_y[bucket + 1]
+        area = np.abs(
+            (x[previous] - next_x) * (y[lo:hi] - y[previous]) - (x[previous] - x[lo:hi]) * (next_y - y[previous])
+        )
+        previous = lo + int(np.argmax(area))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def run_length_indices(values: pd.Series) -> np.ndarray:
+    """First and last row of every run of equal consecutive values."""
+    n = len(values)
+    if n <= 2:
+        return np.arange(n)
+    codes = pd.factorize(values, use_na_sentinel=False)[0]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:] - 1, n - 1]
+    return np.unique(np.concatenate((starts, ends)))
+
+
+def downsample_observations(
+    df: pd.DataFrame,
+    data_type: SignalDataType,
+    *,
+    width_px: int = DEFAULT_CHART_WIDTH_PX,
+    max_points: int | None = None,
+) -> pd.DataFrame:
+    """
+    Rows of a time-sorted observation frame worth drawing at `width_px`.
+
+    Frames at or under `max_points` rows are returned unchanged. Numeric
+    signals keep their visual shape via min/max pre-selection and LTTB;
+    boolean and text signals keep the edges of every run of equal states.
+    """
+    limit = chart_max_points() if max_points is None else max_points
+    if len(df) <= limit:
+        return df
+
+    if data_type != SignalDataType.NUMERIC:
+        return df.iloc[run_length_indices(df["value_label"])]
+
+    values = pd.to_numeric(df["value"], errors="coerce").to_numpy(dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(values))
+    n_out = min(target_points(width_px), limit)
+    if len(valid) <= n_out:
+        return df.iloc[valid]
+
+    stamps = pd.DatetimeIndex(df["timestamp_utc"]).asi8[valid]
+    y = values[valid]
+    keep = np.arange(len(valid))
+    if len(valid) > n_out * MINMAX_PRESELECT_RATIO:
+        keep = minmax_indices(y, n_out * MINMAX_PRESELECT_RATIO // 2)
+    x = (stamps[keep] - stamps[keep[0]]).astype(np.float64)
+    chosen = keep[lttb_indices(x, y[keep], n_out)]
+    return df.iloc[valid[chosen]]
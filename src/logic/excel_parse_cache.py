@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Hashable
+
+EXCEL_PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+EXCEL_PARSE_CACHE_MAX_ENTRIES = 16
+
+
+@dataclass
+class ExcelParseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExcelParseCache:
+    """
+    Process-wide LRU of parsed Excel uploads, keyed by (sha256 of the bytes, parameters, infer flag).
+
+    The import preview and the import itself parse the same upload, and users
+    re-upload the same workbook; with the parse keyed by content both become a
+    hash lookup. Values are treated as read-only by callers.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = EXCEL_PARSE_CACHE_MAX_BYTES,
+        max_entries: int = EXCEL_PARSE_CACHE_MAX_ENTRIES,
+    ):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stats = ExcelParseCacheStats()
+
+    def get_or_parse(self, key: Hashable, parse: Callable[[], Any], *, nbytes: Callable[[Any], int]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0]
+            self.stats.misses += 1
+
+        # Parse outside the lock; two sessions racing on the same upload both parse once.
+        value = parse()
+        size = nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > 1 and (
+                self._bytes > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.stats.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def memory_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "stored_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                **asdict(self.stats),
+            }
+
+
+_cache = ExcelParseCache()
+
+
+def get_excel_parse_cache() -> ExcelParseCache:
+    return _cache
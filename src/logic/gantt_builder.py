@@ -5,7 +5,7 @@ import plotly.graph_objects as go
 import plotly.express as px
 
 import streamlit as st
-from streamlit import cache_data
+from logic.cache_registry import tagged_cache_data
 
 from logic.plot_utilities import adjust_color_any
 from plotly.colors import qualitative as q
@@ -15,11 +15,18 @@ from models.project import Project
 from models.gantt_models import GanttInputs
 from models.gantt_state import GanttState
 
+# Each edit of a project is a new cache entry; bound what stale figures can pile up.
+GANTT_CACHE_TTL_SECONDS = 600
+GANTT_CACHE_MAX_ENTRIES = 32
+
 # -----------------------------
 # Label formatting helpers
 # -----------------------------
 
 import datetime as dt
+import hashlib
+import pickle
+from dataclasses import astuple
 from typing import Iterable, Optional
 
 import numpy as np
@@ -306,8 +313,11 @@ def build_color_map(df: pd.DataFrame, planned_color: str, actual_color: str) ->
     return color_map
 
 
-@cache_data
-def build_gantt_df(project: Project, inputs: GanttState) -> pd.DataFrame | None:
+def _gantt_df(
+    project: Project,
+    inputs: GanttState,
+    signal_stats: tuple[tuple[str, str], ...] | None = None,
+) -> pd.DataFrame | None:
     rows: list[dict] = []
     phases = project.phases
 
@@ -451,9 +461,43 @@ def build_gantt_df(project: Project, inputs: GanttState) -> pd.DataFrame | None:
         lambda r: _format_duration(r["ActualDuration"], r["DurationResolution"]), axis=1
     )
 
+    summaries = dict(signal_stats or ())
+    df["SignalSummary"] = df["UUID"].map(lambda uuid: summaries.get(str(uuid), "") if uuid is not None else "")
+
     return df
 
 
+def _project_version(project: Project) -> str:
+    """Content hash of `project`, which is edited in place between reruns."""
+    return hashlib.sha1(pickle.dumps(project, protocol=pickle.HIGHEST_PROTOCOL), usedforsecurity=False).hexdigest()
+
+
+# The caches key on plain values (project id, content version, Gantt settings) and
+# take the models as "_" arguments, so a project's tags drop only its own entries.
+@tagged_cache_data("project:{project_id}", "gantt:{project_id}", ttl=GANTT_CACHE_TTL_SECONDS, max_entries=GANTT_CACHE_MAX_ENTRIES)
+def _cached_gantt_df(
+    project_id: str,
+    version: str,
+    state: tuple,
+    signal_stats: tuple[tuple[str, str], ...] | None,
+    _project: Project,
+    _inputs: GanttState,
+) -> pd.DataFrame | None:
+    return _gantt_df(_project, _inputs, signal_stats)
+
+
+def build_gantt_df(
+    project: Project,
+    inputs: GanttState,
+    signal_stats: tuple[tuple[str, str], ...] | None = None,
+) -> pd.DataFrame | None:
+    """
+    `signal_stats` holds (task uuid, summary) pairs from
+    `logic.signal_join.signal_hover_text`; they fill the `SignalSummary` column.
+    """
+    return _cached_gantt_df(str(project.uuid), _project_version(project), astuple(inputs), signal_stats, project, inputs)
+
+
 def _apply_selection_styling(fig: go.Figure, selected_uuid: str | None) -> None:
     """
     Visually highlight the selected task:
@@ -474,7 +518,7 @@ def _apply_selection_styling(fig: go.Figure, selected_uuid: str | None) -> None:
             continue
 
         # customdata schema below:
-        # [Label, Start_str, Finish_str, Type, UUID, Level, PhaseID, Status, PlannedDur_str, ActualDur_str, IsMilestone]
+        # [Label, Start_str, Finish_str, Type, UUID, Level, PhaseID, Status, PlannedDur_str, ActualDur_str, IsMilestone, SignalSummary]
         uuids = [row[4] for row in cd]
 
         is_selected = [u == selected_uuid for u in uuids]
@@ -497,14 +541,15 @@ def _apply_selection_styling(fig: go.Figure, selected_uuid: str | None) -> None:
             tr.update(zorder=10)
 
 
-@cache_data
-def build_timeline(
+def _timeline(
     project: Project,
     inputs: GanttState,
+    version: str,
     selected_uuid: str | None = None,
     delay_windows: tuple[tuple[str, str, dt.datetime, dt.datetime, int, str], ...] | None = None,
+    signal_stats: tuple[tuple[str, str], ...] | None = None,
 ) -> go.Figure:
-    df = build_gantt_df(project, inputs)
+    df = _cached_gantt_df(str(project.uuid), version, astuple(inputs), signal_stats, project, inputs)
     if df is None or df.empty:
         raise ValueError(f"No data available to build Gantt timeline for project '{project.name}'.")
 
@@ -583,6 +628,7 @@ def build_timeline(
             "PlannedDur_str", #8
             "ActualDur_str",  #9
             "IsMilestone",    #10
+            "SignalSummary",  #11
         ],
     )
 
@@ -644,6 +690,7 @@ def build_timeline(
                         df_ms["PlannedDur_str"],
                         df_ms["ActualDur_str"],
                         df_ms["IsMilestone"],
+                        df_ms["SignalSummary"],
                     ],
                     axis=1,
                 ),
@@ -673,6 +720,7 @@ def build_timeline(
             "<b>Planned</b>: %{customdata[8]}",
             "<b>Actual</b>: %{customdata[9]}",
             "<b>Status</b>: %{customdata[7]}",
+            *(["%{customdata[11]}"] if signal_stats else []),
             "<span style='opacity:0.7'>Click to select</span>",
         ]) + "<extra></extra>"
 
@@ -712,6 +760,39 @@ def build_timeline(
     return fig
 
 
+@tagged_cache_data("project:{project_id}", "gantt:{project_id}", ttl=GANTT_CACHE_TTL_SECONDS, max_entries=GANTT_CACHE_MAX_ENTRIES)
+def _cached_timeline(
+    project_id: str,
+    version: str,
+    state: tuple,
+    selected_uuid: str | None,
+    delay_windows: tuple[tuple[str, str, dt.datetime, dt.datetime, int, str], ...] | None,
+    signal_stats: tuple[tuple[str, str], ...] | None,
+    _project: Project,
+    _inputs: GanttState,
+) -> go.Figure:
+    return _timeline(_project, _inputs, version, selected_uuid, delay_windows, signal_stats)
+
+
+def build_timeline(
+    project: Project,
+    inputs: GanttState,
+    selected_uuid: str | None = None,
+    delay_windows: tuple[tuple[str, str, dt.datetime, dt.datetime, int, str], ...] | None = None,
+    signal_stats: tuple[tuple[str, str], ...] | None = None,
+) -> go.Figure:
+    return _cached_timeline(
+        str(project.uuid),
+        _project_version(project),
+        astuple(inputs),
+        selected_uuid,
+        delay_windows,
+        signal_stats,
+        project,
+        inputs,
+    )
+
+
 # -----------------------------
 # Optional: Click handling in Streamlit
 # -----------------------------
@@ -738,7 +819,7 @@ def render_gantt_with_click_selection(fig: go.Figure, key: str = "gantt"):
         cd = pt.get("customdata", None)
         if cd:
             # cd schema:
-            # [Label, Start_str, Finish_str, Type, UUID, Level, PhaseID, Status, PlannedDur_str, ActualDur_str, IsMilestone]
+            # [Label, Start_str, Finish_str, Type, UUID, Level, PhaseID, Status, PlannedDur_str, ActualDur_str, IsMilestone, SignalSummary]
             uuid = cd[4]
             level = cd[5]
             phase_id = cd[6]
@@ -3,16 +3,23 @@ import json
 import math
 import os
 import re
+import time
+import tracemalloc
 import warnings
 from dataclasses import dataclass, field
-from io import BytesIO
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
+from pandas.io.parsers import TextParser
 
+from logic.excel_parse_cache import content_digest, get_excel_parse_cache
 from logic.generate_id import new_id as new_phase_id
+from logic.utils import paused_gc
+from logic.xlsx_stream import SheetBounds, StreamedSheet, StreamedWorkbook
 from models.constraint import Constraint, ConstraintRelation
 from models.phase import Phase
 from models.project import Project
@@ -60,6 +67,14 @@ class ExcelParameters:
                 if col.name == key:
                     return col.column
         raise KeyError(f"Column name '{key}' not found in columns.")
+
+    def cache_key(self) -> tuple:
+        return (
+            self.sheet_name,
+            tuple((col.name, col.column) for col in self.columns),
+            self.project_name_cell,
+            self.start_row,
+        )
     
 
 class ProjectLoader():
@@ -104,14 +119,57 @@ warnings.filterwarnings(
 @dataclass
 class ExcelReadContext:
     data: bytes
-    excel_file: pd.ExcelFile
-    workbook_values: Workbook
-    workbook_formulas: Workbook | None = None
+    workbook: StreamedWorkbook
+    plan_sheet: StreamedSheet
+
+
+@dataclass(frozen=True)
+class ParsedExcelImport:
+    """
+        Everything read from an upload, before any IDs are minted. Shared through
+        the parse cache, so it must not be mutated; models are copied on use.
+    """
+    schedule: pd.DataFrame
+    start_formulas: dict[int, str | None]
+    end_formulas: dict[int, str | None]
+    # Inferred predecessor edges between schedule positions; see `_formula_graph`.
+    formula_edges: pd.DataFrame
+    project_name: Any
+    project_id: str | None
+    project_type: ProjectType
+    metadata: RelineMetadata | None
+    shift_definition: ShiftDefinition
+    shift_assignments: list[ShiftAssignment]
+    # Task datetime columns localized to the shift definition's timezone.
+    localized: dict[str, list[dt.datetime | None]]
+    # Wall-clock seconds per parse stage, in order; reported by the import benchmark.
+    stage_seconds: dict[str, float] = field(default_factory=dict, compare=False)
+    # Peak traced MB per stage; only filled while tracemalloc is tracing.
+    stage_peak_mb: dict[str, float] = field(default_factory=dict, compare=False)
+
+    def nbytes(self) -> int:
+        formulas = sum(len(text or "") for text in (*self.start_formulas.values(), *self.end_formulas.values()))
+        datetimes = 64 * sum(len(values) for values in self.localized.values())
+        frames = sum(int(frame.memory_usage(index=True, deep=True).sum()) for frame in (self.schedule, self.formula_edges))
+        return frames + formulas + datetimes
 
 class ExcelProjectLoader():
 
     _phase_pat = re.compile(r"\b(\d+(?:\.\d+)?)\s*day(s)?\b", re.IGNORECASE)
+    _phase_test_pat = re.compile(r"\b\d+(?:\.\d+)?\s*days?\b", re.IGNORECASE)  # _phase_pat without groups
     _hours_pat = re.compile(r"\b(\d+(?:\.\d+)?)\s*hour(s)?\b", re.IGNORECASE)
+    # Checked in this order, matching `_infer_task_type`.
+    _task_type_pats = (
+        (TaskType.INCH, re.compile(r"inch")),
+        (TaskType.STRIP, re.compile(r"strip|remove")),
+        (TaskType.INSTALL, re.compile(r"install")),
+    )
+    _task_datetime_columns = ("PLANNED START", "PLANNED END", "ACTUAL START", "ACTUAL END")
+    _bool_tokens = {
+        "": True,
+        **{token: True for token in ("true", "t", "yes", "y", "1", "on")},
+        **{token: False for token in ("false", "f", "no", "n", "0", "off")},
+    }
     _cell_ref_pat = re.compile(
         r"^\s*=?(?:'[^']+'!)?\$?([A-Z]{1,3})\$?(\d+)\s*$",
         re.IGNORECASE,
@@ -120,6 +178,18 @@ class ExcelProjectLoader():
         r"^\s*=?(?:'[^']+'!)?\$?([A-Z]{1,3})\$?(\d+)\s*(?:(\+|-)\s*([0-9]+(?:\.[0-9]+)?(?:/[0-9]+(?:\.[0-9]+)?)?))?\s*$",
         re.IGNORECASE,
     )
+    # Same matches as _cell_ref_with_offset_pat, with the offset's numerator/denominator split.
+    _cell_ref_offset_parts_pat = re.compile(
+        r"^\s*=?(?:'[^']+'!)?\$?([A-Z]{1,3})\$?(\d+)\s*(?:(\+|-)\s*([0-9]+(?:\.[0-9]+)?)(?:/([0-9]+(?:\.[0-9]+)?))?)?\s*$",
+        re.IGNORECASE,
+    )
+    # Cells the loaders read from the secondary sheets; nothing else is parsed.
+    _secondary_sheet_bounds = {
+        "Project Inputs": SheetBounds(columns=frozenset({4}), max_row=14),
+        "metadata": SheetBounds(columns=frozenset(range(1, 12)), max_row=2),
+        "shift_definition": SheetBounds(columns=frozenset(range(1, 7))),
+        "shift_assignments": SheetBounds(columns=frozenset(range(1, 7))),
+    }
 
     @staticmethod
     def _is_nan(x: Any) -> bool:
@@ -261,39 +331,78 @@ class ExcelProjectLoader():
     @staticmethod
     def _build_read_context(
         data: bytes,
+        params: ExcelParameters,
         include_formulas: bool = False,
     ) -> ExcelReadContext:
-        return ExcelReadContext(
-            data=data,
-            excel_file=pd.ExcelFile(BytesIO(data), engine="openpyxl"),
-            workbook_values=load_workbook(BytesIO(data), read_only=True, data_only=True),
-            workbook_formulas=(
-                load_workbook(BytesIO(data), read_only=True, data_only=False)
-                if include_formulas
-                else None
+        """
+            Opens the workbook once and reads the plan sheet in a single pass:
+            cached values for the mapped columns (plus the project name cell) and,
+            when inferring predecessors, the planned start/end formulas.
+        """
+        workbook = StreamedWorkbook(data, bounds=ExcelProjectLoader._secondary_sheet_bounds)
+        if params.sheet_name not in workbook:
+            raise ValueError(f"Worksheet named '{params.sheet_name}' not found")
+
+        name_col, name_row = coordinate_from_string(params.project_name_cell)
+        formula_columns = (
+            frozenset({params["PLANNED START"], params["PLANNED END"]})
+            if include_formulas
+            else frozenset()
+        )
+        plan_sheet = workbook.read_sheet(
+            params.sheet_name,
+            SheetBounds(
+                columns=frozenset(col.column for col in params.columns),
+                cells=frozenset({(name_row, column_index_from_string(name_col))}),
+                formula_columns=formula_columns,
             ),
         )
+        return ExcelReadContext(data=data, workbook=workbook, plan_sheet=plan_sheet)
+
+    @staticmethod
+    def _pandas_cell(value: Any) -> Any:
+        # Mirrors pandas' openpyxl reader: blanks are "", integral floats are ints.
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    @staticmethod
+    def _frame_from_rows(rows: Iterable[list[Any]], **kwargs: Any) -> pd.DataFrame:
+        """
+            Builds the DataFrame `pd.read_excel` would for these cells, using the
+            same parser (header handling, NA strings and dtype inference).
+        """
+        data = [[ExcelProjectLoader._pandas_cell(value) for value in row] for row in rows]
+        while data and all(value == "" for value in data[-1]):
+            data.pop()
+        if not data:
+            return pd.DataFrame()
+        return TextParser(data, skip_blank_lines=False, **kwargs).read()
 
     @staticmethod
     def _load_schedule_dataframe(
-        source: bytes | pd.ExcelFile,
+        source: StreamedSheet,
         params: ExcelParameters,
     ) -> pd.DataFrame:
-        df = pd.read_excel(
-            source,
-            sheet_name=params.sheet_name,
-            header=params.start_row - 2,
-            usecols=params.get_pd_usecols(),
+        df = ExcelProjectLoader._frame_from_rows(
+            source.iter_rows(sorted(col.column for col in params.columns), min_row=params.start_row - 1),
+            header=0,
         )
 
         df.columns = params.get_col_names()
         df["_excel_row"] = list(range(params.start_row, params.start_row + len(df)))
-        df = df.drop(0)
+        return ExcelProjectLoader._normalize_schedule_frame(df.drop(0))
 
+    @staticmethod
+    def _normalize_schedule_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """
+            Blank notes and actuals, stripped activity names and parsed datetime
+            columns; rows without an activity are dropped.
+        """
         df["NOTES"] = df["NOTES"].fillna("")
-        df["ACTUAL START"] = df["ACTUAL START"].replace({pd.NaT: None})
-        df["ACTUAL END"] = df["ACTUAL END"].replace({pd.NaT: None})
-        df["ACTIVITY"] = df["ACTIVITY"].map(ExcelProjectLoader._coerce_str)
+        df["ACTIVITY"] = ExcelProjectLoader._coerce_str_column(df["ACTIVITY"])
         for col in ("PLANNED START", "PLANNED END", "ACTUAL START", "ACTUAL END"):
             df[col] = pd.to_datetime(df[col], errors="coerce")
         df = df[df["ACTIVITY"] != ""].reset_index(drop=True)
@@ -350,74 +459,17 @@ class ExcelProjectLoader():
 
     @staticmethod
     def _extract_formula_map(
-        workbook_formulas: Workbook | None,
+        plan_sheet: StreamedSheet | None,
         params: ExcelParameters,
         excel_rows: list[int],
         *,
         column_name: str,
     ) -> dict[int, str | None]:
-        if workbook_formulas is None or not excel_rows:
+        if plan_sheet is None or not plan_sheet.formulas or not excel_rows:
             return {}
 
-        formula_sheet = workbook_formulas[params.sheet_name]
         formula_col = params[column_name]
-        formula_by_row: dict[int, str | None] = {}
-
-        for row_cells in formula_sheet.iter_rows(
-            min_row=min(excel_rows),
-            max_row=max(excel_rows),
-            min_col=formula_col,
-            max_col=formula_col,
-        ):
-            cell = row_cells[0]
-            formula_by_row[cell.row] = cell.value if isinstance(cell.value, str) else None
-
-        return formula_by_row
-
-    @staticmethod
-    def _build_constraint_from_formula_reference(
-        *,
-        predecessor_id: str,
-        predecessor_kind: str,
-        ref_col: str,
-        planned_start_col_letter: str,
-        planned_end_col_letter: str,
-        successor_field: str,
-        offset_days: float,
-    ) -> Constraint | None:
-        relation: ConstraintRelation | None = None
-        if successor_field == "start":
-            if ref_col == planned_start_col_letter:
-                relation = ConstraintRelation.SS
-            elif ref_col == planned_end_col_letter:
-                relation = ConstraintRelation.FS
-        elif successor_field == "end":
-            if ref_col == planned_start_col_letter:
-                relation = ConstraintRelation.SF
-            elif ref_col == planned_end_col_letter:
-                relation = ConstraintRelation.FF
-
-        if relation is None:
-            return None
-
-        return Constraint(
-            predecessor_id=predecessor_id,
-            predecessor_kind=predecessor_kind,
-            relation_type=relation,
-            lag=dt.timedelta(days=offset_days),
-        )
-
-    @staticmethod
-    def _dedupe_constraints(constraints: list[Constraint]) -> list[Constraint]:
-        deduped: list[Constraint] = []
-        seen: set[tuple[str, str]] = set()
-        for constraint in constraints:
-            dedupe_key = (constraint.predecessor_id, constraint.predecessor_kind)
-            if dedupe_key in seen:
-                continue
-            seen.add(dedupe_key)
-            deduped.append(constraint)
-        return deduped
+        return {excel_row: plan_sheet.formula(excel_row, formula_col) for excel_row in excel_rows}
 
     @staticmethod
     def _constraint_preview(constraint: Constraint) -> str:
@@ -449,160 +501,430 @@ class ExcelProjectLoader():
             return parsed.replace(tzinfo=timezone)
         return parsed.astimezone(timezone)
 
+    # Column-wise versions of the cell coercions above, applied once per import.
+
     @staticmethod
-    def _build_schedule_rows(
-        context: ExcelReadContext,
+    def _coerce_str_column(values: pd.Series) -> pd.Series:
+        return values.where(values.notna(), "").astype(str).str.strip()
+
+    @staticmethod
+    def _is_phase_column(durations: pd.Series) -> pd.Series:
+        if pd.api.types.is_numeric_dtype(durations):
+            return pd.Series(False, index=durations.index)
+        # Numbers never stringify to "<n> day(s)", so only the text needs checking.
+        text = durations.astype(str).str.strip()
+        return durations.notna() & text.str.contains(ExcelProjectLoader._phase_test_pat)
+
+    @staticmethod
+    def _split_predecessor_column(values: pd.Series) -> pd.Series:
+        # A plain split per filled cell: a groupby over the exploded IDs costs more than it saves.
+        out = [
+            [pred for pred in map(str.strip, text.split(",")) if pred] if text else []
+            for text in ExcelProjectLoader._coerce_str_column(values).tolist()
+        ]
+        return pd.Series(out, index=values.index, dtype=object)
+
+    @staticmethod
+    def _coerce_bool_column(values: pd.Series) -> pd.Series:
+        if pd.api.types.is_bool_dtype(values):
+            return values.astype(bool)
+        if pd.api.types.is_numeric_dtype(values):
+            return values.isna() | (values.fillna(1).astype("int64") != 0)
+        tokens = ExcelProjectLoader._coerce_str_column(values).str.lower().map(ExcelProjectLoader._bool_tokens)
+        unmatched = tokens.isna()
+        if unmatched.any():
+            # Numbers such as 2 or 0.0, or invalid text, which raises like the scalar rules.
+            tokens[unmatched] = values[unmatched].map(ExcelProjectLoader._coerce_bool)
+        return tokens.astype(bool)
+
+    @staticmethod
+    def _infer_task_type_column(names: pd.Series) -> pd.Series:
+        # Activity names repeat across phases, so each distinct name is matched once.
+        codes, uniques = pd.factorize(names)
+        lowered = pd.Series(uniques, dtype=object).str.lower()
+        task_types = np.array([TaskType.GENERIC] * len(uniques), dtype=object)
+        # Lowest priority first, so earlier patterns overwrite later ones.
+        for task_type, pattern in reversed(ExcelProjectLoader._task_type_pats):
+            task_types[lowered.str.contains(pattern).to_numpy(dtype=bool)] = task_type
+        return pd.Series(task_types[codes], index=names.index, dtype=object)
+
+    @staticmethod
+    def _localize_datetime_column(
+        values: pd.Series,
+        timezone: dt.tzinfo | None,
+    ) -> list[dt.datetime | None]:
+        """
+            `_coerce_project_datetime` for a whole datetime64 column. Schedules
+            repeat timestamps (a task ends where the next starts), so each distinct
+            value is converted once and the results are shared by position.
+            `tz_localize` with a ZoneInfo is several times slower and would move
+            wall times that fall in a DST gap, which `replace(tzinfo=...)` keeps.
+        """
+        # NaT gets code -1, which picks the trailing None.
+        codes, uniques = pd.factorize(values)
+        converted = list(uniques.to_pydatetime())
+        if timezone is not None:
+            if values.dt.tz is not None:
+                converted = [value.astimezone(timezone) for value in converted]
+            else:
+                converted = [value.replace(tzinfo=timezone) for value in converted]
+        lookup = np.empty(len(converted) + 1, dtype=object)
+        lookup[:-1] = converted
+        return lookup[codes].tolist()
+
+    @staticmethod
+    def _localize_datetime_columns(
+        columns: Sequence[pd.Series],
+        timezone: dt.tzinfo | None,
+    ) -> list[list[dt.datetime | None]]:
+        """
+            `_localize_datetime_column` for several columns at once, such as the
+            `_task_datetime_columns`: planned and actual times share most of their
+            values, so the distinct values are taken across all of them.
+        """
+        if len({column.dtype for column in columns}) > 1:
+            return [ExcelProjectLoader._localize_datetime_column(column, timezone) for column in columns]
+        localized = ExcelProjectLoader._localize_datetime_column(pd.concat(columns, ignore_index=True), timezone)
+        bounds = np.cumsum([0, *map(len, columns)]).tolist()
+        return [localized[start:end] for start, end in zip(bounds, bounds[1:])]
+
+    @staticmethod
+    def _classify_schedule(df: pd.DataFrame) -> pd.DataFrame:
+        """
+            Adds the per-row classification `_build_schedule_rows` and the loader
+            need as columns: phase flag, provided UUID, predecessor IDs, planned
+            flag and task type.
+        """
+        df = df.copy()
+        df["NOTES"] = ExcelProjectLoader._coerce_str_column(df["NOTES"])
+        df["_is_phase"] = ExcelProjectLoader._is_phase_column(df["PLANNED DURATION (HOURS)"])
+        df["_uuid"] = ExcelProjectLoader._coerce_str_column(df["UUID"])
+        df["_predecessors"] = ExcelProjectLoader._split_predecessor_column(df["PREDECESSOR"])
+        df["_planned"] = ExcelProjectLoader._coerce_bool_column(df["PLANNED"])
+        df["_task_type"] = ExcelProjectLoader._infer_task_type_column(df["ACTIVITY"])
+        return df
+
+    @staticmethod
+    def _formula_reference_frame(formulas: pd.Series) -> pd.DataFrame:
+        """
+            `_parse_formula_reference` for a whole column in one regex pass:
+            `ref_col`, `ref_row` and `offset_days`, NaN where there is no plain reference.
+        """
+        parts = formulas.str.extract(ExcelProjectLoader._cell_ref_offset_parts_pat)
+        parts.columns = ["ref_col", "ref_row", "sign", "numerator", "denominator"]
+        offset_days = parts["numerator"].astype(float).fillna(0.0) / parts["denominator"].astype(float).fillna(1.0)
+        return pd.DataFrame(
+            {
+                "ref_col": parts["ref_col"].str.upper(),
+                "ref_row": parts["ref_row"].astype(float),
+                "offset_days": offset_days.where(parts["sign"] != "-", -offset_days),
+            },
+            index=formulas.index,
+        )
+
+    @staticmethod
+    def _formula_graph(
+        df: pd.DataFrame,
+        params: ExcelParameters,
+        *,
+        start_formulas: dict[int, str | None],
+        end_formulas: dict[int, str | None],
+    ) -> pd.DataFrame:
+        """
+            Predecessor edges implied by planned start/end formulas, one row per
+            constraint to create: `successor` and `predecessor` are positions in
+            `df`, plus `relation` and `lag_days`. Tasks only link to tasks and phases
+            to phases; rows with provided predecessors are skipped. Edges are
+            deduplicated per (successor, predecessor), start formulas first.
+        """
+        columns = ["successor", "predecessor", "relation", "lag_days"]
+        if not any(start_formulas.values()) and not any(end_formulas.values()):
+            return pd.DataFrame(columns=columns)
+
+        excel_rows = df["_excel_row"].to_numpy()
+        relations = {
+            ("start", get_column_letter(params["PLANNED START"])): ConstraintRelation.SS,
+            ("start", get_column_letter(params["PLANNED END"])): ConstraintRelation.FS,
+            ("end", get_column_letter(params["PLANNED START"])): ConstraintRelation.SF,
+            ("end", get_column_letter(params["PLANNED END"])): ConstraintRelation.FF,
+        }
+        refs = []
+        for successor_field, by_row in (("start", start_formulas), ("end", end_formulas)):
+            formulas = pd.Series([by_row.get(excel_row) for excel_row in excel_rows], dtype=object)
+            ref = ExcelProjectLoader._formula_reference_frame(formulas)
+            ref["successor"] = range(len(df))
+            ref["relation"] = [relations.get((successor_field, col)) for col in ref["ref_col"].tolist()]
+            ref = ref[ref["ref_row"].notna() & ref["relation"].notna()]
+            if not ref.empty:
+                refs.append(ref)
+        if not refs:
+            return pd.DataFrame(columns=columns)
+        # Stable sort keeps each successor's start edge ahead of its end edge.
+        edges = pd.concat(refs, ignore_index=True).sort_values("successor", kind="stable")
+
+        # Array join of the referenced Excel row onto schedule positions (-1: not a schedule row).
+        predecessor = pd.Index(excel_rows).get_indexer(edges["ref_row"].astype("int64"))
+        successor = edges["successor"].to_numpy()
+        is_phase = df["_is_phase"].to_numpy(dtype=bool)
+        has_provided = (df["_predecessors"].str.len() > 0).to_numpy()
+        keep = predecessor >= 0
+        keep[keep] &= (
+            (is_phase[predecessor[keep]] == is_phase[successor[keep]])
+            & (predecessor[keep] != successor[keep])
+            & ~has_provided[successor[keep]]
+        )
+        edges = edges.assign(predecessor=predecessor)[keep]
+        edges = edges.drop_duplicates(subset=["successor", "predecessor"], keep="first")
+        return edges.rename(columns={"offset_days": "lag_days"})[columns].reset_index(drop=True)
+
+    @staticmethod
+    def _parse_excel_import(
+        data: bytes,
         params: ExcelParameters,
         infer_predecessors: bool = False,
-    ) -> tuple[pd.DataFrame, list[dict[str, Any]]]:
-        df = ExcelProjectLoader._load_schedule_dataframe(context.excel_file, params)
+    ) -> ParsedExcelImport:
+        stage_seconds: dict[str, float] = {}
+        stage_peak_mb: dict[str, float] = {}
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+
+        def lap(stage: str) -> None:
+            nonlocal started
+            now = time.perf_counter()
+            stage_seconds[stage] = now - started
+            if tracing:
+                stage_peak_mb[stage] = tracemalloc.get_traced_memory()[1] / (1024.0 * 1024.0)
+                tracemalloc.reset_peak()
+            started = time.perf_counter()
 
-        planned_start_col_letter = get_column_letter(params["PLANNED START"])
-        planned_end_col_letter = get_column_letter(params["PLANNED END"])
-        start_formula_by_row = ExcelProjectLoader._extract_formula_map(
-            workbook_formulas=context.workbook_formulas,
+        context = ExcelProjectLoader._build_read_context(
+            data=data,
             params=params,
-            excel_rows=df["_excel_row"].astype(int).tolist(),
-            column_name="PLANNED START",
+            include_formulas=infer_predecessors,
         )
-        end_formula_by_row = ExcelProjectLoader._extract_formula_map(
-            workbook_formulas=context.workbook_formulas,
-            params=params,
-            excel_rows=df["_excel_row"].astype(int).tolist(),
-            column_name="PLANNED END",
+        lap("read_plan_sheet")
+        df = ExcelProjectLoader._classify_schedule(
+            ExcelProjectLoader._load_schedule_dataframe(context.plan_sheet, params)
         )
+        lap("schedule_frame")
+        excel_rows = df["_excel_row"].astype(int).tolist()
+        formulas = {
+            column_name: ExcelProjectLoader._extract_formula_map(
+                plan_sheet=context.plan_sheet,
+                params=params,
+                excel_rows=excel_rows,
+                column_name=column_name,
+            )
+            for column_name in ("PLANNED START", "PLANNED END")
+        }
+        formula_edges = ExcelProjectLoader._formula_graph(
+            df,
+            params,
+            start_formulas=formulas["PLANNED START"],
+            end_formulas=formulas["PLANNED END"],
+        )
+        lap("formula_graph")
 
-        schedule_rows: list[dict[str, Any]] = []
-        task_rows_by_excel_row: dict[int, dict[str, Any]] = {}
+        wb = context.workbook
+        project_id = ExcelProjectLoader.load_project_id(wb)
+        project_type = ExcelProjectLoader.load_project_type(wb)
+        shift_definition = ExcelProjectLoader.load_shift_definition(wb, project_id=project_id)
+        metadata = ExcelProjectLoader.load_metadata(wb) if project_type == ProjectType.MILL_RELINE else None
+        shift_assignments = ExcelProjectLoader.load_shift_assignments(wb, project_id=project_id)
+        lap("secondary_models")
+        localized = dict(zip(
+            ExcelProjectLoader._task_datetime_columns,
+            ExcelProjectLoader._localize_datetime_columns(
+                [df[col] for col in ExcelProjectLoader._task_datetime_columns],
+                shift_definition.timezone,
+            ),
+        ))
+        lap("localize")
+        return ParsedExcelImport(
+            schedule=df,
+            start_formulas=formulas["PLANNED START"],
+            end_formulas=formulas["PLANNED END"],
+            formula_edges=formula_edges,
+            project_name=context.plan_sheet[params.project_name_cell].value,
+            project_id=project_id,
+            project_type=project_type,
+            metadata=metadata,
+            shift_definition=shift_definition,
+            shift_assignments=shift_assignments,
+            localized=localized,
+            stage_seconds=stage_seconds,
+            stage_peak_mb=stage_peak_mb,
+        )
 
-        for row_data in df.to_dict(orient="records"):
-            excel_row = int(row_data["_excel_row"])
-            is_phase = ExcelProjectLoader.is_phase_cell(row_data["PLANNED DURATION (HOURS)"])
-            parsed_row = {
-                "excel_row": excel_row,
-                "is_phase": is_phase,
-                "row": row_data,
-                "uuid": None,
-                "start_formula": None,
-                "start_formula_reference": None,
-                "end_formula": None,
-                "end_formula_reference": None,
-                "provided_predecessors": ExcelProjectLoader._parse_predecessor_cell(row_data["PREDECESSOR"]),
-                "provided_constraints": [],
-                "inferred_constraints": [],
-                "resolved_constraints": [],
-                "inferred_phase_constraints": [],
-                "resolved_phase_constraints": [],
-                "predecessor_source": "provided",
-            }
-
-            start_formula_value = start_formula_by_row.get(excel_row)
-            parsed_row["start_formula"] = start_formula_value
-            parsed_row["start_formula_reference"] = ExcelProjectLoader._parse_formula_reference(start_formula_value)
-            end_formula_value = end_formula_by_row.get(excel_row)
-            parsed_row["end_formula"] = end_formula_value
-            parsed_row["end_formula_reference"] = ExcelProjectLoader._parse_formula_reference(end_formula_value)
-
-            if not is_phase:
-                uuid = ExcelProjectLoader._coerce_str(row_data["UUID"])
-                if uuid == "":
-                    uuid = new_task_id()
-                parsed_row["uuid"] = uuid
-                task_rows_by_excel_row[excel_row] = parsed_row
-            else:
-                parsed_row["uuid"] = new_phase_id()
+    @staticmethod
+    def _parsed_excel_import(
+        file,
+        params: ExcelParameters,
+        infer_predecessors: bool = False,
+    ) -> ParsedExcelImport:
+        """
+            Parse an upload once per (content, parameters, infer flag): the preview
+            and the import of the same file, and re-uploads of it, hit the cache.
+        """
+        data = ExcelProjectLoader._read_excel_bytes(file)
+        key = (content_digest(data), params.cache_key(), bool(infer_predecessors))
+        return get_excel_parse_cache().get_or_parse(
+            key,
+            lambda: ExcelProjectLoader._parse_excel_import(data, params, infer_predecessors),
+            nbytes=ParsedExcelImport.nbytes,
+        )
 
-            schedule_rows.append(parsed_row)
+    @staticmethod
+    def _build_schedule_rows(
+        parsed: ParsedExcelImport,
+        params: ExcelParameters,
+        infer_predecessors: bool = False,
+    ) -> tuple[pd.DataFrame, list[dict[str, Any]]]:
+        df = parsed.schedule
+        start_formula_by_row = parsed.start_formulas
+        end_formula_by_row = parsed.end_formulas
 
-        phase_rows_by_excel_row = {
-            parsed_row["excel_row"]: parsed_row
-            for parsed_row in schedule_rows
-            if parsed_row["is_phase"]
-        }
+        schedule_rows: list[dict[str, Any]] = []
 
-        for parsed_row in schedule_rows:
-            provided_predecessors = parsed_row["provided_predecessors"]
+        # Plain column lists rather than to_dict(): no per-cell boxing through pandas.
+        columns = list(df.columns)
+        for values in zip(*(df[col].tolist() for col in columns)):
+            row_data = dict(zip(columns, values))
+            excel_row = int(row_data["_excel_row"])
+            is_phase = bool(row_data["_is_phase"])
+            provided_predecessors = list(row_data["_predecessors"])
             provided_constraints = [
                 Constraint(
                     predecessor_id=predecessor_id,
-                    predecessor_kind="phase" if parsed_row["is_phase"] else "task",
+                    predecessor_kind="phase" if is_phase else "task",
                     relation_type=ConstraintRelation.FS,
                 )
                 for predecessor_id in provided_predecessors
             ]
-            resolved_constraints = list(provided_constraints) if not parsed_row["is_phase"] else []
-            predecessor_source = "provided" if provided_predecessors else "none"
-            resolved_phase_constraints: list[Constraint] = list(provided_constraints) if parsed_row["is_phase"] else []
-
-            if (
-                infer_predecessors
-                and not parsed_row["is_phase"]
-                and not provided_predecessors
-            ):
-                inferred_task_constraints: list[Constraint] = []
-                for successor_field, ref in (
-                    ("start", parsed_row["start_formula_reference"]),
-                    ("end", parsed_row["end_formula_reference"]),
-                ):
-                    if ref is None:
-                        continue
-                    ref_col, ref_row, offset_days = ref
-                    predecessor_row = task_rows_by_excel_row.get(ref_row)
-                    if predecessor_row is None or predecessor_row["uuid"] == parsed_row["uuid"]:
-                        continue
-                    constraint = ExcelProjectLoader._build_constraint_from_formula_reference(
-                        predecessor_id=predecessor_row["uuid"],
-                        predecessor_kind="task",
-                        ref_col=ref_col,
-                        planned_start_col_letter=planned_start_col_letter,
-                        planned_end_col_letter=planned_end_col_letter,
-                        successor_field=successor_field,
-                        offset_days=offset_days,
-                    )
-                    if constraint is not None:
-                        inferred_task_constraints.append(constraint)
-
-                if inferred_task_constraints:
-                    resolved_constraints = ExcelProjectLoader._dedupe_constraints(inferred_task_constraints)
-                    parsed_row["inferred_constraints"] = list(resolved_constraints)
-                    predecessor_source = "inferred_from_formula"
-
-            if infer_predecessors and parsed_row["is_phase"] and not provided_predecessors:
-                inferred_phase_constraints: list[Constraint] = []
-                for successor_field, ref in (
-                    ("start", parsed_row["start_formula_reference"]),
-                    ("end", parsed_row["end_formula_reference"]),
-                ):
-                    if ref is None:
-                        continue
-                    ref_col, ref_row, offset_days = ref
-                    predecessor_phase_row = phase_rows_by_excel_row.get(ref_row)
-                    if predecessor_phase_row is None or predecessor_phase_row["uuid"] == parsed_row["uuid"]:
-                        continue
-                    constraint = ExcelProjectLoader._build_constraint_from_formula_reference(
-                        predecessor_id=predecessor_phase_row["uuid"],
-                        predecessor_kind="phase",
-                        ref_col=ref_col,
-                        planned_start_col_letter=planned_start_col_letter,
-                        planned_end_col_letter=planned_end_col_letter,
-                        successor_field=successor_field,
-                        offset_days=offset_days,
-                    )
-                    if constraint is not None:
-                        inferred_phase_constraints.append(constraint)
-
-                if inferred_phase_constraints:
-                    resolved_phase_constraints = ExcelProjectLoader._dedupe_constraints(inferred_phase_constraints)
-                    parsed_row["inferred_phase_constraints"] = list(resolved_phase_constraints)
-                    predecessor_source = "inferred_from_formula"
-
-            parsed_row["provided_constraints"] = list(provided_constraints)
-            parsed_row["resolved_constraints"] = resolved_constraints
-            parsed_row["resolved_phase_constraints"] = resolved_phase_constraints
-            parsed_row["predecessor_source"] = predecessor_source
+            if is_phase:
+                uuid = new_phase_id()
+            else:
+                uuid = row_data["_uuid"] or new_task_id()
+            schedule_rows.append(
+                {
+                    "excel_row": excel_row,
+                    "is_phase": is_phase,
+                    "row": row_data,
+                    "uuid": uuid,
+                    "start_formula": start_formula_by_row.get(excel_row),
+                    "end_formula": end_formula_by_row.get(excel_row),
+                    "provided_predecessors": provided_predecessors,
+                    "provided_constraints": provided_constraints,
+                    "inferred_constraints": [],
+                    "resolved_constraints": [] if is_phase else list(provided_constraints),
+                    "inferred_phase_constraints": [],
+                    "resolved_phase_constraints": list(provided_constraints) if is_phase else [],
+                    "predecessor_source": "provided" if provided_predecessors else "none",
+                }
+            )
+
+        if not infer_predecessors:
+            return df, schedule_rows
+
+        # The formula graph is already deduplicated; only the Constraint objects are built here.
+        edges = parsed.formula_edges
+        for successor, predecessor, relation, lag_days in zip(
+            edges["successor"].tolist(),
+            edges["predecessor"].tolist(),
+            edges["relation"].tolist(),
+            edges["lag_days"].tolist(),
+        ):
+            parsed_row = schedule_rows[successor]
+            is_phase = parsed_row["is_phase"]
+            parsed_row["inferred_phase_constraints" if is_phase else "inferred_constraints"].append(
+                Constraint(
+                    predecessor_id=schedule_rows[predecessor]["uuid"],
+                    predecessor_kind="phase" if is_phase else "task",
+                    relation_type=relation,
+                    lag=dt.timedelta(days=lag_days),
+                )
+            )
+
+        for parsed_row in schedule_rows:
+            if parsed_row["inferred_constraints"]:
+                parsed_row["resolved_constraints"] = list(parsed_row["inferred_constraints"])
+                parsed_row["predecessor_source"] = "inferred_from_formula"
+            elif parsed_row["inferred_phase_constraints"]:
+                parsed_row["resolved_phase_constraints"] = list(parsed_row["inferred_phase_constraints"])
+                parsed_row["predecessor_source"] = "inferred_from_formula"
 
         return df, schedule_rows
 
+    @staticmethod
+    def _populate_project(
+        project: Project,
+        df: pd.DataFrame,
+        uuids: list[str],
+        constraints: list[Sequence[Constraint]],
+        datetimes: tuple[list, list, list, list],
+    ) -> None:
+        """
+            Adds classified schedule rows (see `_classify_schedule`) to `project` as
+            phases and their tasks, in row order. `constraints` holds each row's
+            resolved phase or task constraints, `datetimes` the localized
+            `_task_datetime_columns`. This is the bulk-load path shared by every
+            import: plain column lists, and no garbage collection while the
+            project's objects are created.
+        """
+        planned_start, planned_end, actual_start, actual_end = datetimes
+        # `Task.infer_status` for the localized actuals, which are datetimes or None.
+        statuses = [
+            "NOT_STARTED" if start is None else "IN_PROGRESS" if end is None else "COMPLETE"
+            for start, end in zip(actual_start, actual_end)
+        ]
+        current_phase = None
+
+        with paused_gc():
+            for name, note, is_phase, planned, task_type, uuid, row_constraints, start, end, a_start, a_end, status in zip(
+                df["ACTIVITY"].tolist(),
+                df["NOTES"].tolist(),
+                df["_is_phase"].tolist(),
+                df["_planned"].tolist(),
+                df["_task_type"].tolist(),
+                uuids,
+                constraints,
+                planned_start,
+                planned_end,
+                actual_start,
+                actual_end,
+                statuses,
+            ):
+                if is_phase:
+                    # Commit previous phase implicitly by starting a new one.
+                    # Models copy (and dedupe) the constraint lists they are given.
+                    current_phase = Phase(name=name, uuid=uuid, constraints=row_constraints)
+                    current_phase.planned = bool(planned)
+                    project.add_phase(current_phase)
+                    continue
+
+                if current_phase is None:
+                    # Task appears before any phase. Put it under an 'Unassigned' bucket
+                    current_phase = Phase(name="Unassigned", preceding_phase=None)
+                    project.add_phase(current_phase)
+                # `Phase.add_task` for a new, manually sorted phase: append in row order.
+                current_phase.tasks[uuid] = Task(
+                    name=name,
+                    start_date=start,
+                    end_date=end,
+                    actual_end=a_end,
+                    actual_start=a_start,
+                    note=note,
+                    uuid=uuid,
+                    constraints=row_constraints,
+                    phase_id=current_phase.uuid,
+                    status=status,
+                    planned=bool(planned),
+                    task_type=task_type,
+                )
+                current_phase.task_order.append(uuid)
+
     @staticmethod
     def analyze_excel_project(
         file,
@@ -610,28 +932,20 @@ class ExcelProjectLoader():
         infer_predecessors: bool = False,
         preview_limit: int = 100,
     ) -> dict[str, Any]:
-        data = ExcelProjectLoader._read_excel_bytes(file)
-        context = ExcelProjectLoader._build_read_context(
-            data=data,
-            include_formulas=infer_predecessors,
-        )
-        _, schedule_rows = ExcelProjectLoader._build_schedule_rows(
-            context=context,
-            params=params,
-            infer_predecessors=infer_predecessors,
-        )
+        parsed = ExcelProjectLoader._parsed_excel_import(file, params, infer_predecessors)
+        with paused_gc():
+            _, schedule_rows = ExcelProjectLoader._build_schedule_rows(
+                parsed=parsed,
+                params=params,
+                infer_predecessors=infer_predecessors,
+            )
 
-        plan_sheet = context.workbook_values[params.sheet_name]
-        project_name = plan_sheet[params.project_name_cell].value or "Untitled Project"
-        project_id = ExcelProjectLoader.load_project_id(context.workbook_values)
-        project_type = ExcelProjectLoader.load_project_type(context.workbook_values)
-        metadata = (
-            ExcelProjectLoader.load_metadata(context.workbook_values)
-            if project_type == ProjectType.MILL_RELINE
-            else None
-        )
-        shift_definition = ExcelProjectLoader.load_shift_definition(context.excel_file, project_id=project_id)
-        shift_assignments = ExcelProjectLoader.load_shift_assignments(context.excel_file, project_id=project_id)
+        project_name = parsed.project_name or "Untitled Project"
+        project_id = parsed.project_id
+        project_type = parsed.project_type
+        metadata = parsed.metadata
+        shift_definition = parsed.shift_definition
+        shift_assignments = parsed.shift_assignments
 
         preview_rows: list[dict[str, Any]] = []
         inferred_count = 0
@@ -658,7 +972,7 @@ class ExcelProjectLoader():
                 {
                     "Excel Row": parsed_row["excel_row"],
                     "Type": "Phase" if parsed_row["is_phase"] else "Task",
-                    "Activity": ExcelProjectLoader._coerce_str(row["ACTIVITY"]),
+                    "Activity": row["ACTIVITY"],
                     "Planned Duration": row["PLANNED DURATION (HOURS)"],
                     "Planned Start": row["PLANNED START"],
                     "Planned End": row["PLANNED END"],
@@ -685,9 +999,7 @@ class ExcelProjectLoader():
                         for constraint in parsed_row["resolved_phase_constraints"]
                     ),
                     "Constraint Source": parsed_row["predecessor_source"],
-                    "Planned": ExcelProjectLoader._coerce_bool(row["PLANNED"])
-                    if not ExcelProjectLoader._is_nan(row["PLANNED"])
-                    else True,
+                    "Planned": bool(row["_planned"]),
                 }
             )
 
@@ -735,95 +1047,55 @@ class ExcelProjectLoader():
         params: ExcelParameters,
         infer_predecessors: bool = False,
     ) -> tuple[Project, Optional[RelineMetadata]]:
-        data = ExcelProjectLoader._read_excel_bytes(file)
-        context = ExcelProjectLoader._build_read_context(
-            data=data,
-            include_formulas=infer_predecessors,
-        )
-        _, schedule_rows = ExcelProjectLoader._build_schedule_rows(
-            context=context,
-            params=params,
-            infer_predecessors=infer_predecessors,
-        )
+        parsed = ExcelProjectLoader._parsed_excel_import(file, params, infer_predecessors)
+        with paused_gc():
+            df, schedule_rows = ExcelProjectLoader._build_schedule_rows(
+                parsed=parsed,
+                params=params,
+                infer_predecessors=infer_predecessors,
+            )
 
-        wb = context.workbook_values
-        plan_sheet = wb[params.sheet_name]
-        proj_name = plan_sheet[params.project_name_cell].value
+        proj_name = parsed.project_name
 
         project = Project(name=proj_name if proj_name else "Untitled Project")
 
-        project_id = ExcelProjectLoader.load_project_id(wb)
+        project_id = parsed.project_id
         if project_id is not None:
             project.uuid = project_id #existing project, preserve uuid for backend.
 
-        project.shift_definition = ExcelProjectLoader.load_shift_definition(
-            context.excel_file,
-            project_id=project.uuid,
-        )
-        project.shift_assignments = ExcelProjectLoader.load_shift_assignments(
-            context.excel_file,
-            project_id=project.uuid,
+        # The parsed models are shared with the cache; the project gets its own copies.
+        project.shift_definition = parsed.shift_definition.model_copy(
+            update={"project_id": project.uuid},
+            deep=True,
         )
+        # Assignment fields are all immutable, so a shallow copy is a full one.
+        project.shift_assignments = [
+            assignment.model_copy(update={"project_id": project.uuid})
+            for assignment in parsed.shift_assignments
+        ]
         if project.shift_definition is not None:
             project.timezone = project.shift_definition.timezone
-        proj_type = ExcelProjectLoader.load_project_type(wb)
+        proj_type = parsed.project_type
         project.project_type = proj_type
-        metadata = None
-        if proj_type == ProjectType.MILL_RELINE:
-            metadata = ExcelProjectLoader.load_metadata(wb)
-        current_phase = None
-        unassigned_phase = None
-
-        def mk_task(parsed_row: dict[str, Any]) -> Task:
-            row = parsed_row["row"]
-            name = ExcelProjectLoader._coerce_str(row["ACTIVITY"])
-            return Task(
-                name=name,
-                start_date=ExcelProjectLoader._coerce_project_datetime(row["PLANNED START"], project.timezone),
-                end_date=ExcelProjectLoader._coerce_project_datetime(row["PLANNED END"], project.timezone),
-                actual_end=ExcelProjectLoader._coerce_project_datetime(row["ACTUAL END"], project.timezone),
-                actual_start=ExcelProjectLoader._coerce_project_datetime(row["ACTUAL START"], project.timezone),
-                note=ExcelProjectLoader._coerce_str(row["NOTES"]),
-                uuid=parsed_row["uuid"],
-                constraints=list(parsed_row["resolved_constraints"]),
-                planned=ExcelProjectLoader._coerce_bool(row["PLANNED"]) if not ExcelProjectLoader._is_nan(row["PLANNED"]) else True,
-                task_type=ExcelProjectLoader._infer_task_type(name),
-            )
-
-        phase_ctr = 1
-        task_ctr = 1
-        for parsed_row in schedule_rows:
-            row = parsed_row["row"]
-            dur_cell = row["PLANNED DURATION (HOURS)"]
-            if parsed_row["is_phase"]:
-                # Commit previous phase implicitly by starting a new one
-                new_phase = Phase(
-                    name=ExcelProjectLoader._coerce_str(row["ACTIVITY"]),
-                    uuid=parsed_row["uuid"],
-                    constraints=list(parsed_row["resolved_phase_constraints"]),
-                )
-                new_phase.planned = ExcelProjectLoader._coerce_bool(row["PLANNED"]) if not ExcelProjectLoader._is_nan(row["PLANNED"]) else True
-                project.add_phase(new_phase)
-                phase_ctr += 1
-                task_ctr = 1
-                current_phase = new_phase
-            else:
-                task = mk_task(parsed_row)
-                task.infer_status()
-                task_ctr += 1
-                if current_phase is None:
-                    # Task appears before any phase. Put it under an 'Unassigned' bucket
-                    if unassigned_phase is None:
-                        unassigned_phase = Phase(
-                            name="Unassigned",
-                            preceding_phase=None,
-                        )
-                        project.add_phase(unassigned_phase)
-                        phase_ctr += 1
-                    unassigned_phase.add_task(task)
-                else:
-                    current_phase.add_task(task)
-
+        metadata = parsed.metadata.model_copy(deep=True) if parsed.metadata is not None else None
+
+        if project.timezone == parsed.shift_definition.timezone:
+            datetimes = tuple(parsed.localized[col] for col in ExcelProjectLoader._task_datetime_columns)
+        else:
+            datetimes = tuple(ExcelProjectLoader._localize_datetime_columns(
+                [df[col] for col in ExcelProjectLoader._task_datetime_columns],
+                project.timezone,
+            ))
+        ExcelProjectLoader._populate_project(
+            project,
+            df,
+            uuids=[parsed_row["uuid"] for parsed_row in schedule_rows],
+            constraints=[
+                parsed_row["resolved_phase_constraints" if parsed_row["is_phase"] else "resolved_constraints"]
+                for parsed_row in schedule_rows
+            ],
+            datetimes=datetimes,
+        )
         return project, metadata
     
     @staticmethod
@@ -965,14 +1237,31 @@ class ExcelProjectLoader():
         raise TypeError(f"Unsupported time value type: {type(x)} ({x!r})")
 
     @staticmethod
-    def load_shift_definition(file, project_id: str, sheet_name: str="shift_definition") -> ShiftDefinition:
-        source = BytesIO(file) if isinstance(file, bytes) else file
-        df = pd.read_excel(
-            source,
-            sheet_name=sheet_name,
+    def _load_secondary_frame(file, sheet_name: str, names: list[str]) -> pd.DataFrame:
+        """
+            The first len(names) columns of a sheet with a header row, as
+            `pd.read_excel(header=0, usecols=..., names=names)` would return them.
+            `file` is a StreamedWorkbook or anything `_read_excel_bytes` accepts.
+        """
+        wb = (
+            file
+            if isinstance(file, StreamedWorkbook)
+            else StreamedWorkbook(ExcelProjectLoader._read_excel_bytes(file))
+        )
+        if sheet_name not in wb:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        return ExcelProjectLoader._frame_from_rows(
+            wb[sheet_name].iter_rows(range(1, len(names) + 1)),
             header=0,
-            usecols="A:F",
-            names=["id", "project_id", "day_start_time", "night_start_time", "shift_length_hours", "timezone"]
+            names=names,
+        )
+
+    @staticmethod
+    def load_shift_definition(file, project_id: str, sheet_name: str="shift_definition") -> ShiftDefinition:
+        df = ExcelProjectLoader._load_secondary_frame(
+            file,
+            sheet_name,
+            names=["id", "project_id", "day_start_time", "night_start_time", "shift_length_hours", "timezone"],
         )
 
         df["day_start_time"] = df["day_start_time"].map(ExcelProjectLoader.coerce_time)
@@ -984,12 +1273,9 @@ class ExcelProjectLoader():
     
     @staticmethod
     def load_shift_assignments(file, project_id: str, sheet_name: str="shift_assignments") -> list[ShiftAssignment]:
-        source = BytesIO(file) if isinstance(file, bytes) else file
-        df = pd.read_excel(
-            source,
-            sheet_name=sheet_name,
-            header=0,
-            usecols="A:F",
+        df = ExcelProjectLoader._load_secondary_frame(
+            file,
+            sheet_name,
             names=["id", "project_id", "shift_type", "crew_id", "start_date", "end_date"],
         )
         df["start_date"] = pd.to_datetime(df["start_date"], errors="raise")
@@ -0,0 +1,240 @@
+"""
+Bulk schedule import from CSV or Parquet exports (P6, MS Project, ...).
+
+The mapped columns are read with pyarrow in one pass and classified with
+Arrow kernels under the same rules as `ExcelProjectLoader` (stripped text,
+phase detection, predecessor lists, planned flags, task types), then go
+through the Excel import's bulk project build. Flat files carry no formulas,
+metadata or shift sheets, so constraints come from the predecessor column
+only.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from pathlib import Path
+from typing import Literal, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from logic.generate_id import new_id as new_phase_id
+from logic.load_project import ExcelParameters, ExcelProjectLoader
+from logic.utils import paused_gc
+from models.constraint import Constraint, ConstraintRelation
+from models.project import Project
+from models.task import TaskType
+from models.task import new_id as new_task_id
+
+TabularFormat = Literal["csv", "parquet"]
+
+_PARQUET_MAGIC = b"PAR1"
+# Read as text whatever pyarrow would infer: mixed "1.5" / "2 Days" cells and IDs.
+_TEXT_COLUMNS = ("ACTIVITY", "PLANNED DURATION (HOURS)", "NOTES", "PREDECESSOR", "UUID", "PLANNED")
+_TRUE_TOKENS = pa.array([token for token, value in ExcelProjectLoader._bool_tokens.items() if value])
+_FALSE_TOKENS = pa.array([token for token, value in ExcelProjectLoader._bool_tokens.items() if not value])
+_NUMBER_PATTERN = r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$"
+
+
+class TabularProjectLoader:
+
+    @staticmethod
+    def detect_format(file, file_format: Optional[TabularFormat] = None) -> TabularFormat:
+        """The explicit format, else the file name's suffix, else Parquet's magic bytes."""
+        if file_format is not None:
+            return file_format
+        suffix = Path(str(getattr(file, "name", ""))).suffix.lower()
+        if suffix == ".csv":
+            return "csv"
+        if suffix in (".parquet", ".pq"):
+            return "parquet"
+        data = ExcelProjectLoader._read_excel_bytes(file)
+        return "parquet" if data[:4] == _PARQUET_MAGIC else "csv"
+
+    @staticmethod
+    def read_schedule_table(
+        file,
+        params: ExcelParameters,
+        file_format: Optional[TabularFormat] = None,
+    ) -> pa.Table:
+        """
+            The mapped schedule columns, named as in `params`. Columns are matched
+            by position like in the sheet (`DataColumn.column`, 1-based); the
+            file's first row is its header.
+        """
+        file_format = TabularProjectLoader.detect_format(file, file_format)
+        data = ExcelProjectLoader._read_excel_bytes(file)
+        positions = [col.column - 1 for col in params.columns]
+
+        if file_format == "parquet":
+            table = pq.read_table(pa.BufferReader(data))
+        else:
+            if b"\n" not in data.strip():
+                # pyarrow cannot skip the header of a file that has nothing after it.
+                raise ValueError("CSV file has no schedule rows below its header.")
+            table = pa_csv.read_csv(
+                pa.BufferReader(data),
+                read_options=pa_csv.ReadOptions(autogenerate_column_names=True, skip_rows=1),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={
+                        f"f{col.column - 1}": pa.string()
+                        for col in params.columns
+                        if col.name in _TEXT_COLUMNS
+                    },
+                ),
+            )
+
+        if max(positions) >= table.num_columns:
+            missing = [col.name for col in params.columns if col.column > table.num_columns]
+            raise ValueError(
+                f"File has {table.num_columns} columns; mapped columns {', '.join(missing)} are past the end."
+            )
+        return table.select(positions).rename_columns(params.get_col_names())
+
+    @staticmethod
+    def _text(column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """`ExcelProjectLoader._coerce_str_column` in Arrow: blanks as "", stripped."""
+        return pc.utf8_trim_whitespace(pc.fill_null(column.cast(pa.string()), ""))
+
+    @staticmethod
+    def _is_phase(durations: pa.ChunkedArray) -> pa.ChunkedArray:
+        if not (pa.types.is_string(durations.type) or pa.types.is_large_string(durations.type)):
+            # Numbers never read as "<n> day(s)".
+            return pa.chunked_array([pa.repeat(pa.scalar(False), len(durations))])
+        pattern = ExcelProjectLoader._phase_test_pat.pattern
+        return pc.fill_null(pc.match_substring_regex(durations, pattern, ignore_case=True), False)
+
+    @staticmethod
+    def _predecessors(values: pa.ChunkedArray) -> list[tuple[str, ...]]:
+        # One split over the column, then the stripped IDs regrouped by row
+        # without the blanks. Most rows have none and share the empty tuple.
+        lists = pc.split_pattern(TabularProjectLoader._text(values).combine_chunks(), ",")
+        ids = pc.utf8_trim_whitespace(pc.list_flatten(lists))
+        keep = pc.not_equal(ids, "")
+        grouped: dict[int, list[str]] = {}
+        for row, predecessor_id in zip(
+            pc.filter(pc.list_parent_indices(lists), keep).to_pylist(),
+            pc.filter(ids, keep).to_pylist(),
+        ):
+            grouped.setdefault(row, []).append(predecessor_id)
+        out: list[tuple[str, ...]] = [()] * len(lists)
+        for row, predecessors in grouped.items():
+            out[row] = tuple(predecessors)
+        return out
+
+    @staticmethod
+    def _planned(values: pa.ChunkedArray) -> np.ndarray:
+        """`ExcelProjectLoader._coerce_bool_column` in Arrow: blank is True."""
+        if pa.types.is_boolean(values.type):
+            return pc.fill_null(values, True).to_numpy()
+        if pa.types.is_integer(values.type) or pa.types.is_floating(values.type):
+            return pc.fill_null(pc.not_equal(values, 0), True).to_numpy()
+        text = TabularProjectLoader._text(values)
+        # Numeric text is a number in the sheet: 0 is False, anything else True.
+        numeric = pc.match_substring_regex(text, _NUMBER_PATTERN)
+        numbers = pc.cast(pc.if_else(numeric, text, pa.scalar(None, pa.string())), pa.float64())
+        planned = pc.fill_null(pc.not_equal(numbers, 0.0), False).to_numpy()
+        tokens = pc.utf8_lower(text)
+        planned |= pc.is_in(tokens, value_set=_TRUE_TOKENS).to_numpy()
+        unmatched = ~(numeric.to_numpy() | planned | pc.is_in(tokens, value_set=_FALSE_TOKENS).to_numpy())
+        if unmatched.any():
+            # Invalid text, which raises like the scalar rules.
+            cells = pc.filter(values, pa.array(unmatched)).to_pylist()
+            planned[unmatched] = [ExcelProjectLoader._coerce_bool(cell) for cell in cells]
+        return planned
+
+    @staticmethod
+    def _task_types(names: pa.ChunkedArray) -> list[TaskType]:
+        lowered = pc.utf8_lower(names)
+        codes = np.zeros(len(names), dtype=np.int8)
+        # Lowest priority first, so earlier patterns overwrite later ones.
+        for code, (_, pattern) in reversed(list(enumerate(ExcelProjectLoader._task_type_pats, start=1))):
+            codes[pc.match_substring_regex(lowered, pattern.pattern).to_numpy(zero_copy_only=False)] = code
+        lookup = np.array([TaskType.GENERIC, *(task_type for task_type, _ in ExcelProjectLoader._task_type_pats)], dtype=object)
+        return lookup[codes].tolist()
+
+    @staticmethod
+    def _schedule_frame(table: pa.Table, first_row: int) -> pd.DataFrame:
+        """
+            `_normalize_schedule_frame` and `_classify_schedule` over the Arrow
+            table: the text is stripped, matched and split with Arrow kernels, and
+            only the classified columns are converted to pandas.
+        """
+        activity = TabularProjectLoader._text(table["ACTIVITY"])
+        keep = pc.not_equal(activity, "")
+        excel_rows = pc.filter(pa.array(np.arange(first_row, first_row + table.num_rows)), keep)
+        table = table.filter(keep)
+        activity = pc.filter(activity, keep)
+
+        df = pa.table(
+            {
+                "ACTIVITY": activity,
+                "NOTES": TabularProjectLoader._text(table["NOTES"]),
+                **{col: table[col] for col in ExcelProjectLoader._task_datetime_columns},
+                "_excel_row": excel_rows,
+                "_is_phase": TabularProjectLoader._is_phase(table["PLANNED DURATION (HOURS)"]),
+                "_uuid": TabularProjectLoader._text(table["UUID"]),
+                "_planned": TabularProjectLoader._planned(table["PLANNED"]),
+            }
+        ).to_pandas()
+        for col in ExcelProjectLoader._task_datetime_columns:
+            if not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], errors="coerce")
+        df["_predecessors"] = pd.Series(TabularProjectLoader._predecessors(table["PREDECESSOR"]), dtype=object)
+        df["_task_type"] = pd.Series(TabularProjectLoader._task_types(activity), dtype=object)
+        return df
+
+    @staticmethod
+    def load_tabular_project(
+        file,
+        params: ExcelParameters,
+        file_format: Optional[TabularFormat] = None,
+        project_name: Optional[str] = None,
+        timezone: Optional[dt.tzinfo] = None,
+    ) -> Project:
+        """
+            Builds a project from a CSV or Parquet schedule. Naive datetimes are in
+            `timezone` (the project default if not given).
+        """
+        file_format = TabularProjectLoader.detect_format(file, file_format)
+        table = TabularProjectLoader.read_schedule_table(file, params, file_format)
+        # Source row numbers: after the header line for CSV, from 1 for Parquet.
+        df = TabularProjectLoader._schedule_frame(table, 2 if file_format == "csv" else 1)
+
+        if project_name is None:
+            name = getattr(file, "name", None)
+            project_name = Path(str(name)).stem if name else "Untitled Project"
+        project = Project(name=project_name)
+        if timezone is not None:
+            project.timezone = timezone
+
+        is_phase = df["_is_phase"].tolist()
+        with paused_gc():
+            uuids = [
+                new_phase_id() if phase else (uuid or new_task_id())
+                for phase, uuid in zip(is_phase, df["_uuid"].tolist())
+            ]
+            # Same rule as the Excel import without formulas: listed predecessors, finish-to-start.
+            # Rows without any share an empty tuple; the models copy what they are given.
+            constraints = [
+                [
+                    Constraint(
+                        predecessor_id=predecessor_id,
+                        predecessor_kind="phase" if phase else "task",
+                        relation_type=ConstraintRelation.FS,
+                    )
+                    for predecessor_id in predecessors
+                ]
+                if predecessors else ()
+                for phase, predecessors in zip(is_phase, df["_predecessors"].tolist())
+            ]
+        datetimes = tuple(ExcelProjectLoader._localize_datetime_columns(
+            [df[col] for col in ExcelProjectLoader._task_datetime_columns],
+            project.timezone,
+        ))
+        ExcelProjectLoader._populate_project(project, df, uuids=uuids, constraints=constraints, datetimes=datetimes)
+        return project
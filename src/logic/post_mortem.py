@@ -7,16 +7,111 @@ from models.task import Task
 import pandas as pd
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.utils.cell import quote_sheetname
 from openpyxl.worksheet.hyperlink import Hyperlink
 
-from functools import lru_cache
-from typing import Optional
+from typing import Optional, Sequence
+
+PHASE_DELAY_COLUMNS = [
+    "Task No.",
+    "Task",
+    "Planned Start",
+    "Planned End",
+    "Planned Duration",
+    "Actual Start",
+    "Actual End",
+    "Actual Duration",
+    "Delay",
+    "Notes",
+]
+MAJOR_DELAY_COLUMNS = ["Phase", "Task No.", "Task", "Delay", "Notes"]
 
 class PostMortemAnalyzer:
 
-    #@lru_cache(maxsize=128)
+    @staticmethod
+    def _hours(start: pd.Series, end: pd.Series) -> pd.Series:
+        # Wall-clock columns, like `end - start` on a task's same-zone datetimes:
+        # a 20:00-08:00 task over a DST change is 12 hours, as `Task.planned_duration` says.
+        return (end - start) / pd.Timedelta(hours=1)
+
+    @staticmethod
+    def _wall_clock(values: list) -> pd.Series:
+        return pd.Series(
+            pd.to_datetime([v.replace(tzinfo=None) if v is not None else None for v in values]),
+            dtype="datetime64[ns]",
+        )
+
+    @staticmethod
+    def _delay_frame(phases: Sequence[Phase]) -> pd.DataFrame:
+        """
+        One row per completed task of `phases`, in schedule order, with the
+        PHASE_DELAY_COLUMNS plus "Phase" (its name) and "_phase" (its position).
+        """
+        rows = [
+            (phase_idx, phase.name, task_no, phase.tasks[tid])
+            for phase_idx, phase in enumerate(phases)
+            for task_no, tid in enumerate(phase.task_order, start=1)
+        ]
+        tasks: list[Task] = [row[3] for row in rows]
+        frame = pd.DataFrame({
+            "_phase": [row[0] for row in rows],
+            "Phase": [row[1] for row in rows],
+            "Task No.": [row[2] for row in rows],
+            "Task": [task.name for task in tasks],
+            "_planned_start": pd.Series([task.start_date for task in tasks], dtype=object),
+            "_planned_end": pd.Series([task.end_date for task in tasks], dtype=object),
+            "_actual_start": pd.Series([task.actual_start for task in tasks], dtype=object),
+            "_actual_end": pd.Series([task.actual_end for task in tasks], dtype=object),
+            "Notes": pd.Series([task.note for task in tasks], dtype=object),
+        }, index=pd.RangeIndex(len(rows)))
+
+        # ignore tasks with incomplete info
+        frame = frame[frame["_actual_start"].notna() & frame["_actual_end"].notna()].reset_index(drop=True)
+
+        frame["Planned Start"] = PostMortemAnalyzer._wall_clock(frame["_planned_start"].tolist())
+        frame["Planned End"] = PostMortemAnalyzer._wall_clock(frame["_planned_end"].tolist())
+        frame["Planned Duration"] = PostMortemAnalyzer._hours(frame["Planned Start"], frame["Planned End"])
+        frame["Actual Start"] = PostMortemAnalyzer._wall_clock(frame["_actual_start"].tolist())
+        frame["Actual End"] = PostMortemAnalyzer._wall_clock(frame["_actual_end"].tolist())
+        frame["Actual Duration"] = PostMortemAnalyzer._hours(frame["Actual Start"], frame["Actual End"])
+        # positive indicates a delay - negative indicates ahead of schedule
+        frame["Delay"] = frame["Actual Duration"] - frame["Planned Duration"]
+
+        missing_notes = frame["Notes"].isna() | (frame["Notes"] == "")
+        frame.loc[missing_notes, "Notes"] = (
+            frame.loc[missing_notes, "Actual Start"].astype(str) + " -> " + frame.loc[missing_notes, "Actual End"].astype(str)
+        )
+        return frame[["_phase", "Phase", *PHASE_DELAY_COLUMNS]]
+
+    @staticmethod
+    def task_delays(project: Project) -> pd.DataFrame:
+        """
+        Every completed task in the project with its delay, in schedule order.
+
+        Columns are "_phase" (the phase's position), "Phase" and those of `analyze_phase_delays`.
+        """
+        return PostMortemAnalyzer._delay_frame([project.phases[pid] for pid in project.phase_order])
+
+    @staticmethod
+    def _top_phase_delays(delays: pd.DataFrame, phase_count: int, n: int) -> list[pd.DataFrame]:
+        if n == -1:
+            top = delays.sort_values(by="Delay", ascending=False, kind="stable")
+        else:
+            top = delays.loc[delays.groupby("_phase")["Delay"].nlargest(n).index.get_level_values(-1)]
+        # Index each phase's rows by their position among its completed tasks.
+        top = top.set_index(delays.groupby("_phase").cumcount().loc[top.index])
+        by_phase = {phase_idx: group[PHASE_DELAY_COLUMNS] for phase_idx, group in top.groupby("_phase", sort=False)}
+        empty = delays.iloc[:0][PHASE_DELAY_COLUMNS]
+        return [by_phase.get(phase_idx, empty) for phase_idx in range(phase_count)]
+
+    @staticmethod
+    def _top_major_delays(delays: pd.DataFrame, n: int) -> pd.DataFrame:
+        if n == -1:
+            return delays.sort_values(by="Delay", ascending=False, kind="stable")[MAJOR_DELAY_COLUMNS]
+        return delays.nlargest(n, "Delay")[MAJOR_DELAY_COLUMNS]
+
     @staticmethod
     def analyze_phase_delays(phase: Phase, n: int):
         """
@@ -34,69 +129,9 @@ class PostMortemAnalyzer:
             "Delay"
             "Notes"
         """
-
-        data = {
-            "Task No.": [],
-            "Task": [],
-            "Planned Start": [],
-            "Planned End": [],
-            "Planned Duration": [],
-            "Actual Start": [],
-            "Actual End": [],
-            "Actual Duration": [],
-            "Delay": [],
-            "Notes": []
-        }
-
-        for i, tid in enumerate(phase.task_order):
-            task = phase.tasks[tid]
-            
-            # ignore tasks with incomplete info
-            if not task.completed:
-                continue
-            
-            data["Task No."].append(i+1)
-            data["Task"].append(task.name)
-
-            pstart = task.start_date.replace(tzinfo=None)
-            pend = task.end_date.replace(tzinfo=None)
-
-            data["Planned Start"].append(pstart)
-            data["Planned End"].append(pend)
-
-            pdur = task.planned_duration.total_seconds() / 3600
-            data["Planned Duration"].append(pdur)
-
-            astart = task.actual_start.replace(tzinfo=None) if task.actual_start else None
-            aend = task.actual_end.replace(tzinfo=None) if task.actual_end else None
-
-            data["Actual Start"].append(astart)
-            data["Actual End"].append(aend)
-
-
-            adur = task.actual_duration.total_seconds() / 3600
-            data["Actual Duration"].append(adur)
-            data["Delay"].append(adur - pdur) # positive indicates a delay - negative indicates ahead of schedule
-
-            notes = task.note
-            if not notes or notes == "":
-                if astart and aend:
-                    notes = f"{astart} -> {aend}"
-                else:
-                    notes = f"{pstart} -> {pend}"
-            
-            data["Notes"].append(notes)
-        
-        df = pd.DataFrame(data)
-        
-        df = df.sort_values(by='Delay',ascending=False)
-
-        if n != -1:
-            return df.head(n)
-
-        return df
+        delays = PostMortemAnalyzer._delay_frame([phase])
+        return PostMortemAnalyzer._top_phase_delays(delays, 1, n)[0]
     
-    #@lru_cache(maxsize=128)
     @staticmethod
     def analyze_project_delays(project: Project, n: int):
         """
@@ -104,45 +139,16 @@ class PostMortemAnalyzer:
         
         returns a list[pd.DataFrame] containing the n most delayed tasks in each Phase
         """
-        delays = []
-        for pid in project.phase_order:
-            phase = project.phases[pid]
-
-            delays.append(PostMortemAnalyzer.analyze_phase_delays(phase, n))
-        
-        return delays
+        delays = PostMortemAnalyzer.task_delays(project)
+        return PostMortemAnalyzer._top_phase_delays(delays, len(project.phase_order), n)
 
     @staticmethod
     def major_delays(project: Project, n: int): 
         """
         Analyzes the project and returns a DataFrame of the top n major delays across all phases
         """
-        data = {
-            "Phase": [],
-            "Task No.": [],
-            "Task": [],
-            "Delay": [],
-            "Notes": []
-        }
-
-        for pid in project.phase_order:
-            phase = project.phases[pid]
-            phase_delay_df = PostMortemAnalyzer.analyze_phase_delays(phase, -1)
-
-            for _, row in phase_delay_df.iterrows():
-                data["Phase"].append(phase.name)
-                data["Task No."].append(row["Task No."])
-                data["Task"].append(row["Task"])
-                data["Delay"].append(row["Delay"])
-                data["Notes"].append(row["Notes"])
-        
-        df = pd.DataFrame(data)
-        df = df.sort_values(by='Delay', ascending=False)
-        if n == -1:
-            return df
-        return df.head(n)
+        return PostMortemAnalyzer._top_major_delays(PostMortemAnalyzer.task_delays(project), n)
 
-    #@lru_cache(maxsize=128)
     @staticmethod
     def write_dataframe_to_sheet(df: pd.DataFrame, wb: Workbook, sheet_name: str, include_index: bool = False):
 
@@ -156,6 +162,12 @@ class PostMortemAnalyzer:
 
         return wb
 
+    @staticmethod
+    def _link_cell(ws, sheet_name: str):
+        cell = WriteOnlyCell(ws, value="Go To Sheet")
+        cell.hyperlink = Hyperlink(ref="", location=f"{quote_sheetname(sheet_name)}!A1")
+        cell.style = "Hyperlink"
+        return cell
 
     @staticmethod
     def write_index_sheet(project: Project, wb: Workbook):
@@ -165,75 +177,47 @@ class PostMortemAnalyzer:
         )
 
         ws.append(["Sheet Name", "Description", "Link"])
-        ws.append(["Major Delays", "Top delayed tasks across all phases", "Go To Sheet"])
-        name_col = ws.cell(row=2, column=1, value="Major Delays")
-        desc_col = ws.cell(row=2, column=2, value="Top delayed tasks across all phases")
-        link_col = ws.cell(row=2, column=3, value="Go To Sheet")
-        link_col.hyperlink = Hyperlink(
-            ref=link_col.coordinate,
-            location=f"{quote_sheetname('Major Delays')}!A1"
-        )
-        link_col.style = "Hyperlink"
+        ws.append(["Major Delays", "Top delayed tasks across all phases", PostMortemAnalyzer._link_cell(ws, "Major Delays")])
         for i, pid in enumerate(project.phase_order):
-            name = project.phases[pid].name
-            num_col = ws.cell(row=3+i, column=1, value=f"Phase-{i+1}")
-            name_cell = ws.cell(row=3+i, column=2, value=name)
-            link_cell = ws.cell(row=3+i, column=3, value="Go To Sheet")
-
             sheet_name = f"Phase-{i+1}"
             if sheet_name not in wb.sheetnames:
                 raise KeyError(f"Sheet {sheet_name} not found in output workbook.")
-            
-            link_cell.hyperlink = Hyperlink(
-                ref=link_cell.coordinate,
-                location=f"{quote_sheetname(sheet_name)}!A1"
-            )
-            link_cell.style = "Hyperlink"
+
+            ws.append([sheet_name, project.phases[pid].name, PostMortemAnalyzer._link_cell(ws, sheet_name)])
 
         return wb
 
     @staticmethod
     def write_major_delays(wb: Workbook, project: Project, n: int=10):
-        delays_df = PostMortemAnalyzer.major_delays(project, n)
-        ws = wb.create_sheet(
-            title="Major Delays",
-            index=0
-        )
-
-        PostMortemAnalyzer.write_dataframe_to_sheet(
-            df=delays_df,
+        return PostMortemAnalyzer.write_dataframe_to_sheet(
+            df=PostMortemAnalyzer.major_delays(project, n),
             wb=wb,
             sheet_name="Major Delays"
         )
-        return wb
 
-    #@lru_cache(maxsize=128)
     @staticmethod
     def write_post_mortem(project: Project, n: int) -> Workbook:
-        wb = Workbook() 
-
-        wb = PostMortemAnalyzer.write_major_delays(
-            wb=wb,
-            project=project,
-            n=n
-        )
-
-        for i, pid in enumerate(project.phase_order):
-            phase = project.phases[pid]
-            sheet_name = f"Phase-{i+1}"
-
-            ws = wb.create_sheet(
-                title=sheet_name,
-                index=i
-            ) 
-
-            phase_delay = PostMortemAnalyzer.analyze_phase_delays(phase, n)
+        """
+            Builds the post mortem workbook: an index, the n most delayed tasks of each
+            phase and the n largest delays overall. The workbook is write-only, so it
+            can be saved once.
+        """
+        wb = Workbook(write_only=True)
+        delays = PostMortemAnalyzer.task_delays(project)
 
+        phase_delays = PostMortemAnalyzer._top_phase_delays(delays, len(project.phase_order), n)
+        for i, phase_delay in enumerate(phase_delays):
             wb = PostMortemAnalyzer.write_dataframe_to_sheet(
                 df=phase_delay,
                 wb=wb,
-                sheet_name=sheet_name
+                sheet_name=f"Phase-{i+1}"
             )
+
+        wb = PostMortemAnalyzer.write_dataframe_to_sheet(
+            df=PostMortemAnalyzer._top_major_delays(delays, n),
+            wb=wb,
+            sheet_name="Major Delays"
+        )
         try:
             wb = PostMortemAnalyzer.write_index_sheet(
                 project=project,
@@ -242,7 +226,6 @@ class PostMortemAnalyzer:
         except KeyError as ex:
             print(f"Error writing index sheet for {project.name} post mortem: {str(ex)}. A sheet did not exist when constructing the index page.")
 
-    
         return wb
     
 
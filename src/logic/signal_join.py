@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Literal
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from logic.backend.signal_series import get_signal_series_store
+from logic.backend.signals import observation_chunks_to_frame
+from logic.cache_registry import tagged_cache_data
+from models.project import Project
+from models.signals import SignalDataType, SignalDefinition
+
+SIGNAL_JOIN_MAX_ROWS = 2_000_000
+
+WindowKey = tuple[tuple[str, str, str, str, str], ...]
+
+_NS_PER_HOUR = 3_600_000_000_000
+
+
+def _to_utc(value: dt.datetime | None, timezone: ZoneInfo) -> dt.datetime | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone)
+    return value.astimezone(dt.UTC)
+
+
+def task_windows(project: Project, *, basis: Literal["actual", "planned"] = "actual") -> pd.DataFrame:
+    """
+    One row per task with a usable window, in UTC.
+
+    With `basis="actual"` tasks use their actual start/end where both exist and
+    fall back to the planned window otherwise.
+    """
+    rows = []
+    for pid in project.phase_order:
+        phase = project.phases[pid]
+        for task in phase.get_task_list():
+            start, end = getattr(task, "start_date", None), getattr(task, "end_date", None)
+            actual_start, actual_end = getattr(task, "actual_start", None), getattr(task, "actual_end", None)
+            if basis == "actual" and actual_start is not None and actual_end is not None:
+                start, end = actual_start, actual_end
+            start, end = _to_utc(start, project.timezone), _to_utc(end, project.timezone)
+            if start is None or end is None or end < start:
+                continue
+            rows.append((str(task.uuid), task.name, phase.name, start, end))
+    windows = pd.DataFrame(rows, columns=["uuid", "task", "phase", "start_utc", "end_utc"])
+    for column in ("start_utc", "end_utc"):
+        windows[column] = pd.to_datetime(windows[column], utc=True)
+    return windows
+
+
+def window_key(windows: pd.DataFrame) -> WindowKey:
+    """Hashable stand-in for a window frame; changes whenever any task window does."""
+    return tuple(
+        zip(
+            windows["uuid"],
+            windows["task"],
+            windows["phase"],
+            windows["start_utc"].map(pd.Timestamp.isoformat),
+            windows["end_utc"].map(pd.Timestamp.isoformat),
+        )
+    )
+
+
+def _windows_from_key(key: WindowKey) -> pd.DataFrame:
+    windows = pd.DataFrame(list(key), columns=["uuid", "task", "phase", "start_utc", "end_utc"])
+    for column in ("start_utc", "end_utc"):
+        windows[column] = pd.to_datetime(windows[column], utc=True)
+    return windows
+
+
+def _sparse_table(values: np.ndarray, reduce: np.ufunc) -> list[np.ndarray]:
+    # levels[k][i] = reduce(values[i : i + 2**k])
+    levels = [values]
+    span = 1
+    while span * 2 <= len(values):
+        previous = levels[-1]
+        levels.append(reduce(previous[:-span], previous[span:]))
+        span *= 2
+    return levels
+
+
+def _range_reduce(levels: list[np.ndarray], lo: np.ndarray, hi: np.ndarray, reduce: np.ufunc) -> np.ndarray:
+    """`reduce` over `values[lo:hi]` per window in O(1) each; NaN where the range is empty."""
+    out = np.full(len(lo), np.nan)
+    filled = hi > lo
+    if not filled.any():
+        return out
+    lo, hi = lo[filled], hi[filled]
+    level = np.floor(np.log2(hi - lo)).astype(np.int64)
+    result = np.empty(len(lo))
+    for k in np.unique(level):
+        at = level == k
+        table = levels[k]
+        result[at] = reduce(table[lo[at]], table[hi[at] - (1 << k)])
+    out[filled] = result
+    return out
+
+
+def join_numeric(windows: pd.DataFrame, stamps: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+    """Mean, min, max and sample count of the samples inside each `[start, end]` window."""
+    starts = windows["start_utc"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    ends = windows["end_utc"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    lo = np.searchsorted(stamps, starts, side="left")
+    hi = np.searchsorted(stamps, ends, side="right")
+    counts = hi - lo
+    prefix = np.concatenate(([0.0], np.cumsum(values)))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.where(counts > 0, (prefix[hi] - prefix[lo]) / counts, np.nan)
+    return pd.DataFrame(
+        {
+            "uuid": windows["uuid"].to_numpy(),
+            "samples": counts,
+            "mean": means,
+            "min": _range_reduce(_sparse_table(values, np.minimum), lo, hi, np.minimum),
+            "max": _range_reduce(_sparse_table(values, np.maximum), lo, hi, np.maximum),
+        }
+    )
+
+
+def join_states(windows: pd.DataFrame, stamps: np.ndarray, labels: np.ndarray) -> pd.DataFrame:
+    """
+    Hours spent in each state inside every window, treating each observation's
+    state as held until the next observation.
+    """
+    starts = windows["start_utc"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    ends = windows["end_utc"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    codes, states = pd.factorize(labels)
+    held = np.diff(stamps, append=stamps[-1]) if len(stamps) else stamps
+    start_at = np.searchsorted(stamps, starts, side="right") - 1
+    end_at = np.searchsorted(stamps, ends, side="right") - 1
+    lo = np.searchsorted(stamps, starts, side="left")
+    hi = np.searchsorted(stamps, ends, side="right")
+
+    out = pd.DataFrame({"uuid": windows["uuid"].to_numpy(), "samples": hi - lo})
+    for code, state in enumerate(states):
+        in_state = codes == code
+        # elapsed[i]: time spent in `state` before observation i.
+        elapsed = np.concatenate(([0], np.cumsum(np.where(in_state, held, 0))))[:-1]
+
+        def spent_until(times: np.ndarray, at: np.ndarray) -> np.ndarray:
+            safe = np.clip(at, 0, None)
+            value = elapsed[safe] + np.where(in_state[safe], times - stamps[safe], 0)
+            return np.where(at >= 0, value, 0)
+
+        out[f"hours_{state}"] = (spent_until(ends, end_at) - spent_until(starts, start_at)) / _NS_PER_HOUR
+    return out
+
+
+def join_signal_to_tasks(windows: pd.DataFrame, observations: pd.DataFrame, data_type: SignalDataType) -> pd.DataFrame:
+    """Per-task aggregates of a time-sorted observation frame (see `observation_chunks_to_frame`)."""
+    if windows.empty:
+        return pd.DataFrame(columns=["uuid", "samples"])
+    if observations.empty:
+        return pd.DataFrame({"uuid": windows["uuid"].to_numpy(), "samples": 0})
+
+    stamps = observations["timestamp_utc"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+    if data_type == SignalDataType.NUMERIC:
+        values = pd.to_numeric(observations["value"], errors="coerce").to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values)
+        return join_numeric(windows, stamps[valid], values[valid])
+    return join_states(windows, stamps, observations["value_label"].to_numpy())
+
+
+@tagged_cache_data("signal:{signal_id}", "signals:{project_id}", "project:{project_id}", show_spinner=False)
+def task_signal_aggregates(
+    headers: dict,
+    project_id: str,
+    signal_id: str,
+    data_type: SignalDataType,
+    windows: WindowKey,
+) -> pd.DataFrame:
+    """
+    `join_signal_to_tasks` for one signal over the given task windows.
+
+    Cached per signal and window key, so the join reruns only when the signal's
+    data or any task window changes.
+    """
+    frame = _windows_from_key(windows)
+    if frame.empty:
+        return join_signal_to_tasks(frame, pd.DataFrame(), data_type)
+    table = get_signal_series_store().get(
+        headers,
+        project_id,
+        signal_id,
+        start=frame["start_utc"].min().to_pydatetime(),
+        end=frame["end_utc"].max().to_pydatetime(),
+        max_rows=SIGNAL_JOIN_MAX_ROWS,
+    )
+    observations = observation_chunks_to_frame([table], timezone=ZoneInfo("UTC"), data_type=data_type)
+    return join_signal_to_tasks(frame, observations, data_type)
+
+
+def _format_number(value: float) -> str:
+    return f"{value:,.1f}" if abs(value) < 1e6 else f"{value:,.3g}"
+
+
+def signal_hover_text(aggregates: pd.DataFrame, signal: SignalDefinition) -> tuple[tuple[str, str], ...]:
+    """(task uuid, one-line summary) pairs for the Gantt hover; tasks without samples are skipped."""
+    unit = f" {signal.unit}" if signal.unit else ""
+    texts = []
+    for row in aggregates[aggregates["samples"] > 0].to_dict(orient="records"):
+        if "mean" in row:
+            text = (
+                f"mean {_format_number(row['mean'])}{unit} "
+                f"(min {_format_number(row['min'])}, max {_format_number(row['max'])}, n={row['samples']})"
+            )
+        else:
+            hours = sorted(
+                ((key.removeprefix("hours_"), value) for key, value in row.items() if key.startswith("hours_")),
+                key=lambda item: -item[1],
+            )
+            text = " · ".join(f"{state} {value:.1f}h" for state, value in hours if value > 0) or f"n={row['samples']}"
+        texts.append((row["uuid"], f"{signal.name}: {text}"))
+    return tuple(texts)
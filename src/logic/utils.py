@@ -1,7 +1,24 @@
+import gc
+from contextlib import contextmanager
 from datetime import datetime
 
 def _none_min(x):  # for dates
     return x if x is not None else datetime.max
 
 def now_iso() -> str:
-    return datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z"
\ No newline at end of file
+    return datetime.datetime.utcnow().isoformat(timespec="seconds") + "Z"
+
+@contextmanager
+def paused_gc():
+    """
+        Pause the cyclic garbage collector while building many long-lived objects.
+        Each collection would rescan everything built so far, and none of it is
+        garbage yet.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
@@ -0,0 +1,414 @@
+"""
+Arrow export of projects for analytics.
+
+A project becomes one typed table per entity (projects, phases, tasks,
+constraints, delays, shift_assignments), each keyed by project_id. Enum
+columns are dictionary-encoded against the enum's full list of values, so
+every export shares the same dictionaries. Timestamps are UTC with the zone
+in the type, so all projects share one schema; each project's own timezone
+is in the projects table. Tables can be written as Parquet files or Arrow
+IPC streams, or appended to a dataset partitioned by project_id.
+
+Only attribute reads touch the model objects. Durations, delays and the
+phase rollups are computed with Arrow kernels over whole columns.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import shutil
+from functools import cached_property
+from itertools import chain
+from operator import attrgetter
+from pathlib import Path
+from typing import Literal, Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from models.constraint import ConstraintRelation
+from models.delay import Delay, DelayType
+from models.project import Project
+from models.project_type import ProjectType
+from models.task import TaskStatus, TaskType
+
+ArrowFormat = Literal["parquet", "ipc"]
+
+TIMESTAMP = pa.timestamp("us", tz="UTC")
+ENUM = pa.dictionary(pa.int8(), pa.string())
+
+_TASK_TYPES = tuple(t.value for t in TaskType)
+_TASK_STATUSES = tuple(s.value for s in TaskStatus)
+_RELATIONS = tuple(r.value for r in ConstraintRelation)
+_DELAY_TYPES = tuple(t.value for t in DelayType)
+_PROJECT_TYPES = tuple(t.name for t in ProjectType)
+_KINDS = ("phase", "task")
+_SHIFT_TYPES = ("day", "night")
+
+SCHEMAS: dict[str, pa.Schema] = {
+    "projects": pa.schema(
+        [
+            ("project_id", pa.string()),
+            ("name", pa.string()),
+            ("description", pa.string()),
+            ("project_type", ENUM),
+            ("timezone", pa.string()),
+            ("site_id", pa.string()),
+            ("closed", pa.bool_()),
+        ]
+    ),
+    "phases": pa.schema(
+        [
+            ("project_id", pa.string()),
+            ("phase_id", pa.string()),
+            ("position", pa.int32()),
+            ("name", pa.string()),
+            ("planned", pa.bool_()),
+            ("planned_start", TIMESTAMP),
+            ("planned_end", TIMESTAMP),
+            ("actual_start", TIMESTAMP),
+            ("actual_end", TIMESTAMP),
+            ("task_count", pa.int32()),
+            ("completed_count", pa.int32()),
+        ]
+    ),
+    "tasks": pa.schema(
+        [
+            ("project_id", pa.string()),
+            ("phase_id", pa.string()),
+            ("task_id", pa.string()),
+            ("position", pa.int32()),
+            ("name", pa.string()),
+            ("task_type", ENUM),
+            ("status", ENUM),
+            ("planned", pa.bool_()),
+            ("planned_start", TIMESTAMP),
+            ("planned_end", TIMESTAMP),
+            ("actual_start", TIMESTAMP),
+            ("actual_end", TIMESTAMP),
+            ("planned_hours", pa.float64()),
+            ("actual_hours", pa.float64()),
+            ("delay_hours", pa.float64()),
+            ("note", pa.string()),
+        ]
+    ),
+    "constraints": pa.schema(
+        [
+            ("project_id", pa.string()),
+            ("successor_id", pa.string()),
+            ("successor_kind", ENUM),
+            ("predecessor_id", pa.string()),
+            ("predecessor_kind", ENUM),
+            ("relation_type", ENUM),
+            ("lag", pa.duration("us")),
+        ]
+    ),
+    "delays": pa.schema(
+        [
+            ("project_id", pa.string()),
+            ("delay_id", pa.string()),
+            ("delay_type", ENUM),
+            ("duration_minutes", pa.int32()),
+            ("description", pa.string()),
+            ("start", TIMESTAMP),
+            ("end", TIMESTAMP),
+            ("shift_assignment_id", pa.string()),
+            ("created_by", pa.string()),
+            ("created_at", TIMESTAMP),
+            ("updated_by", pa.string()),
+            ("updated_at", TIMESTAMP),
+        ]
+    ),
+    "shift_assignments": pa.schema(
+        [
+            ("project_id", pa.string()),
+            ("assignment_id", pa.string()),
+            ("crew_id", pa.string()),
+            ("shift_type", ENUM),
+            ("start_date", pa.date32()),
+            ("end_date", pa.date32()),
+        ]
+    ),
+}
+
+_SUFFIXES: dict[str, str] = {"parquet": ".parquet", "ipc": ".arrows"}
+# Dataset fragments are IPC files rather than streams.
+_DATASET_SUFFIXES: dict[str, str] = {"parquet": ".parquet", "ipc": ".arrow"}
+_PARTITIONING = ds.partitioning(pa.schema([("project_id", pa.string())]), flavor="hive")
+
+
+def _values(objects: Sequence, attr: str) -> list:
+    return list(map(attrgetter(attr), objects))
+
+
+def _enum(values: list, vocabulary: tuple[str, ...]) -> pa.DictionaryArray:
+    """`values` indexed into `vocabulary`; nulls stay null, anything else not in it raises."""
+    dictionary = pa.array(vocabulary, pa.string())
+    strings = pa.array(values, pa.string())
+    indices = pc.index_in(strings, value_set=dictionary)
+    if indices.null_count != strings.null_count:
+        unknown = pc.filter(strings, pc.and_(pc.is_null(indices), pc.is_valid(strings)))
+        raise ValueError(f"Values {sorted(set(unknown.to_pylist()))} are not one of {list(vocabulary)}.")
+    return pa.DictionaryArray.from_arrays(indices.cast(pa.int8()), dictionary)
+
+
+def _timestamps(values: list, timezone: dt.tzinfo) -> pa.Array:
+    """UTC timestamps; naive values are wall-clock times in `timezone`, as in the Excel export."""
+    return pa.array(
+        [value.replace(tzinfo=timezone) if value is not None and value.tzinfo is None else value for value in values],
+        TIMESTAMP,
+    )
+
+
+def _hours(start: pa.Array, end: pa.Array, timezone: dt.tzinfo) -> pa.Array:
+    """Wall-clock hours in `timezone` like the post-mortem: a 19:00-07:00 shift is 12 hours across DST changes."""
+    local = pa.timestamp("us", tz=str(timezone))
+    elapsed = pc.subtract(pc.local_timestamp(end.cast(local)), pc.local_timestamp(start.cast(local)))
+    return pc.divide(elapsed.cast(pa.int64()).cast(pa.float64()), 3_600_000_000.0)
+
+
+def _table(name: str, project_id: str, columns: dict[str, pa.Array | list], rows: int) -> pa.Table:
+    schema = SCHEMAS[name]
+    arrays = [pa.repeat(pa.scalar(project_id, pa.string()), rows)]
+    arrays += [
+        pa.array(columns[field.name], field.type) if isinstance(columns[field.name], list) else columns[field.name]
+        for field in schema
+        if field.name != "project_id"
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class ArrowProject:
+
+    def __init__(self, project: Project, delays: Optional[Sequence[Delay]] = None):
+        """
+            `delays` are the project's logged delays (see `logic.backend.delays.get_delays`);
+            the tasks table carries each task's own delay against plan.
+        """
+        self.project = project
+        self.delays = list(delays or [])
+
+    @cached_property
+    def tables(self) -> dict[str, pa.Table]:
+        tasks = self._tasks_table()
+        return {
+            "projects": self._projects_table(),
+            "phases": self._phases_table(tasks),
+            "tasks": tasks,
+            "constraints": self._constraints_table(),
+            "delays": self._delays_table(),
+            "shift_assignments": self._shift_assignments_table(),
+        }
+
+    @cached_property
+    def _phases(self) -> list:
+        return [self.project.phases[pid] for pid in self.project.phase_order]
+
+    @cached_property
+    def _tasks(self) -> list:
+        return [phase.tasks[tid] for phase in self._phases for tid in phase.task_order]
+
+    def _projects_table(self) -> pa.Table:
+        project = self.project
+        return _table(
+            "projects",
+            project.uuid,
+            {
+                "name": [project.name],
+                "description": [project.description],
+                "project_type": _enum([project.project_type.name], _PROJECT_TYPES),
+                "timezone": [str(project.timezone)],
+                "site_id": [project.site_id],
+                "closed": [project.closed],
+            },
+            1,
+        )
+
+    def _tasks_table(self) -> pa.Table:
+        tasks = self._tasks
+        counts = np.fromiter(map(len, map(attrgetter("task_order"), self._phases)), dtype=np.int64, count=len(self._phases))
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+
+        timezone = self.project.timezone
+        planned_start = _timestamps(_values(tasks, "start_date"), timezone)
+        planned_end = _timestamps(_values(tasks, "end_date"), timezone)
+        actual_start = _timestamps(_values(tasks, "actual_start"), timezone)
+        actual_end = _timestamps(_values(tasks, "actual_end"), timezone)
+        planned_hours = _hours(planned_start, planned_end, timezone)
+        actual_hours = _hours(actual_start, actual_end, timezone)
+        return _table(
+            "tasks",
+            self.project.uuid,
+            {
+                "phase_id": pa.array(np.repeat(np.array(_values(self._phases, "uuid"), dtype=object), counts), pa.string()),
+                "task_id": _values(tasks, "uuid"),
+                "position": pa.array(np.arange(len(tasks)) - starts + 1, pa.int32()),
+                "name": _values(tasks, "name"),
+                "task_type": _enum(_values(tasks, "task_type"), _TASK_TYPES),
+                "status": _enum(_values(tasks, "status"), _TASK_STATUSES),
+                "planned": _values(tasks, "planned"),
+                "planned_start": planned_start,
+                "planned_end": planned_end,
+                "actual_start": actual_start,
+                "actual_end": actual_end,
+                "planned_hours": planned_hours,
+                "actual_hours": actual_hours,
+                # As in the post-mortem: positive is behind plan, null until the task is complete.
+                "delay_hours": pc.subtract(actual_hours, planned_hours),
+                "note": _values(tasks, "note"),
+            },
+            len(tasks),
+        )
+
+    def _phases_table(self, tasks: pa.Table) -> pa.Table:
+        phases = self._phases
+        completed = pc.and_(pc.is_valid(tasks["actual_start"]), pc.is_valid(tasks["actual_end"]))
+        rollup = (
+            tasks.select(["phase_id", "planned_start", "planned_end", "actual_start", "actual_end"])
+            .append_column("completed", pc.cast(completed, pa.int32()))
+            .group_by("phase_id")
+            .aggregate(
+                [
+                    ("planned_start", "min"),
+                    ("planned_end", "max"),
+                    ("actual_start", "min"),
+                    ("actual_end", "max"),
+                    ("phase_id", "count"),
+                    ("completed", "sum"),
+                ]
+            )
+        )
+        phase_ids = pa.array(_values(phases, "uuid"), pa.string())
+        rows = pc.index_in(phase_ids, value_set=rollup["phase_id"])
+        # Phases without tasks have no rollup row: index null, so every rolled-up value is null.
+        rollup = rollup.take(rows)
+        completed_count = pc.fill_null(rollup["completed_sum"], 0).cast(pa.int32())
+        # Like `Phase.actual_start`/`actual_end`: only once a task in the phase is complete.
+        has_actuals = pc.greater(completed_count, 0)
+        null_timestamp = pa.scalar(None, TIMESTAMP)
+        return _table(
+            "phases",
+            self.project.uuid,
+            {
+                "phase_id": phase_ids,
+                "position": pa.array(np.arange(1, len(phases) + 1), pa.int32()),
+                "name": _values(phases, "name"),
+                "planned": _values(phases, "planned"),
+                "planned_start": rollup["planned_start_min"].combine_chunks(),
+                "planned_end": rollup["planned_end_max"].combine_chunks(),
+                "actual_start": pc.if_else(has_actuals, rollup["actual_start_min"], null_timestamp).combine_chunks(),
+                "actual_end": pc.if_else(has_actuals, rollup["actual_end_max"], null_timestamp).combine_chunks(),
+                "task_count": pc.fill_null(rollup["phase_id_count"], 0).cast(pa.int32()).combine_chunks(),
+                "completed_count": completed_count.combine_chunks(),
+            },
+            len(phases),
+        )
+
+    def _constraints_table(self) -> pa.Table:
+        owners = [*self._phases, *self._tasks]
+        per_owner = _values(owners, "constraints")
+        counts = np.fromiter(map(len, per_owner), dtype=np.int64, count=len(owners))
+        constraints = list(chain.from_iterable(per_owner))
+        kinds = np.repeat(np.array(["phase", "task"], dtype=object), [len(self._phases), len(self._tasks)])
+        return _table(
+            "constraints",
+            self.project.uuid,
+            {
+                "successor_id": pa.array(np.repeat(np.array(_values(owners, "uuid"), dtype=object), counts), pa.string()),
+                "successor_kind": _enum(np.repeat(kinds, counts).tolist(), _KINDS),
+                "predecessor_id": _values(constraints, "predecessor_id"),
+                "predecessor_kind": _enum(_values(constraints, "predecessor_kind"), _KINDS),
+                "relation_type": _enum(_values(constraints, "relation_type"), _RELATIONS),
+                "lag": _values(constraints, "lag"),
+            },
+            len(constraints),
+        )
+
+    def _delays_table(self) -> pa.Table:
+        delays = self.delays
+        return _table(
+            "delays",
+            self.project.uuid,
+            {
+                "delay_id": _values(delays, "id"),
+                "delay_type": _enum(_values(delays, "delay_type"), _DELAY_TYPES),
+                "duration_minutes": _values(delays, "duration_minutes"),
+                "description": _values(delays, "description"),
+                "start": _values(delays, "start_dt"),
+                "end": _values(delays, "end_dt"),
+                "shift_assignment_id": _values(delays, "shift_assignment_id"),
+                "created_by": _values(delays, "created_by"),
+                "created_at": _values(delays, "created_at"),
+                "updated_by": _values(delays, "updated_by"),
+                "updated_at": _values(delays, "updated_at"),
+            },
+            len(delays),
+        )
+
+    def _shift_assignments_table(self) -> pa.Table:
+        assignments = self.project.shift_assignments or []
+        return _table(
+            "shift_assignments",
+            self.project.uuid,
+            {
+                "assignment_id": _values(assignments, "id"),
+                "crew_id": _values(assignments, "crew_id"),
+                "shift_type": _enum(_values(assignments, "shift_type"), _SHIFT_TYPES),
+                "start_date": _values(assignments, "start_date"),
+                "end_date": _values(assignments, "end_date"),
+            },
+            len(assignments),
+        )
+
+    def write_parquet(self, directory: str | Path) -> list[Path]:
+        """Writes `<table>.parquet` for every table into `directory`."""
+        return self._write(directory, "parquet")
+
+    def write_ipc(self, directory: str | Path) -> list[Path]:
+        """Writes every table as an Arrow IPC stream, `<table>.arrows`, into `directory`."""
+        return self._write(directory, "ipc")
+
+    def _write(self, directory: str | Path, file_format: ArrowFormat) -> list[Path]:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for name, table in self.tables.items():
+            path = directory / f"{name}{_SUFFIXES[file_format]}"
+            if file_format == "parquet":
+                pq.write_table(table, path)
+            else:
+                with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_stream(sink, table.schema) as writer:
+                    writer.write_table(table)
+            paths.append(path)
+        return paths
+
+    def append_to_dataset(self, root: str | Path, file_format: ArrowFormat = "parquet") -> None:
+        """
+            Adds the project to the dataset at `root`: one directory per table,
+            partitioned as `project_id=<uuid>`. Exporting a project again
+            replaces its partitions.
+        """
+        root = Path(root)
+        for name, table in self.tables.items():
+            partition = root / name / f"project_id={self.project.uuid}"
+            if partition.exists():
+                shutil.rmtree(partition)
+            ds.write_dataset(
+                table,
+                root / name,
+                format=file_format,
+                partitioning=_PARTITIONING,
+                basename_template=f"part-{{i}}{_DATASET_SUFFIXES[file_format]}",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+
+
+def open_dataset(root: str | Path, name: str, file_format: ArrowFormat = "parquet") -> ds.Dataset:
+    """One table of a dataset written by `ArrowProject.append_to_dataset`, across all its projects."""
+    path = Path(root) / name
+    if not path.exists():
+        return ds.dataset([], schema=SCHEMAS[name])
+    return ds.dataset(path, schema=SCHEMAS[name], format=file_format, partitioning=_PARTITIONING)
@@ -1,122 +1,378 @@
-import pandas as pd
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
+"""
+Excel export of a project into the Gantt template.
+
+The template is parsed once per process: its package parts, the schedule
+sheet split into rows, and its styles. An export then copies the untouched
+parts and streams the schedule sheet's XML row by row, so memory does not
+grow with the number of tasks. Cells are styled like openpyxl would when
+setting font/fill/alignment on a template cell: the template cell's format
+with those parts replaced. The formats are shared across exports.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import re
+import threading
+import zipfile
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain
 from pathlib import Path
-from models.project import Project
+from typing import Any, BinaryIO, Iterator
+from xml.sax.saxutils import escape
+
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Alignment, Font
+from openpyxl.styles.numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_REVERSE, is_date_format
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, range_boundaries
+from openpyxl.utils.datetime import to_excel
+from openpyxl.utils.exceptions import IllegalCharacterError
+from openpyxl.xml.functions import tostring
+
+from logic.xlsx_stream import StreamedWorkbook
+from models.excel_format import ExcelFormat
 from models.phase import Phase
+from models.project import Project
 from models.task import Task
-from models.excel_format import ExcelFormat
+
+TEMPLATE_PATH = Path(__file__).parent.parent / "assets" / "Gantt_Excel_Template.xlsx"
+# The number format openpyxl gives a datetime written into a General cell.
+DATETIME_NUMBER_FORMAT = "yyyy-mm-dd h:mm:ss"
+ROWS_PER_WRITE = 512
+
+TITLE_FONT = Font(name="Calibri", size=20, bold=True)
+TITLE_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+HEADER_FONT = Font(name="Calibri", size=12, bold=True)
+HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+
+_ROW_PAT = re.compile(r"<row\b([^>]*?)(?:/>|>(.*?)</row>)", re.DOTALL)
+_CELL_PAT = re.compile(r'<c r="([A-Z]+)(\d+)"([^>]*?)(?:/>|>.*?</c>)', re.DOTALL)
+_ATTR_PAT = re.compile(r'([\w:]+)="([^"]*)"')
+_DIMENSION_PAT = re.compile(r'<dimension ref="([^"]+)"\s*/>')
+
+
+def _xml(style: Any) -> str | None:
+    return None if style is None else tostring(style.to_tree()).decode()
+
+
+def _without_attrs(attrs: str, *names: str) -> str:
+    return "".join(f' {key}="{value}"' for key, value in _ATTR_PAT.findall(attrs) if key not in names)
+
+
+@dataclass(frozen=True)
+class CellStyle:
+    """Parts of a cell format an export sets; `None` keeps the template cell's."""
+
+    font: str | None = None
+    fill: str | None = None
+    alignment: str | None = None
+
+    @staticmethod
+    def of(font: Font | None = None, fill: Any = None, alignment: Alignment | None = None) -> CellStyle:
+        return CellStyle(font=_xml(font), fill=_xml(fill), alignment=_xml(alignment))
+
+
+class _StyleSheet:
+    """
+    The template's styles.xml plus the cell formats exports have added.
+    Append-only, so every export can write whatever it currently holds.
+    """
+
+    _LISTS = (("numFmts", "numFmt"), ("fonts", "font"), ("fills", "fill"), ("cellXfs", "xf"))
+
+    def __init__(self, xml: str):
+        self._xml = xml
+        self._lock = threading.Lock()
+        self._items: dict[str, list[str]] = {}
+        for tag, child in self._LISTS:
+            match = re.search(rf"<{tag}\b[^>]*>(.*?)</{tag}>", xml, re.DOTALL)
+            body = match.group(1) if match else ""
+            self._items[tag] = re.findall(rf"<{child}\b[^>]*?/>|<{child}\b[^>]*?>.*?</{child}>", body, re.DOTALL)
+        self._custom_formats = {
+            int(attrs["numFmtId"]): attrs["formatCode"]
+            for attrs in (dict(_ATTR_PAT.findall(item)) for item in self._items["numFmts"])
+        }
+        self._formats: dict[tuple[int, CellStyle, bool], int] = {}
+
+    def _index(self, tag: str, item: str) -> int:
+        items = self._items[tag]
+        if item in items:
+            return items.index(item)
+        items.append(item)
+        return len(items) - 1
+
+    def _date_format_id(self) -> int:
+        if DATETIME_NUMBER_FORMAT in BUILTIN_FORMATS_REVERSE:
+            return BUILTIN_FORMATS_REVERSE[DATETIME_NUMBER_FORMAT]
+        for fmt_id, code in self._custom_formats.items():
+            if code == DATETIME_NUMBER_FORMAT:
+                return fmt_id
+        fmt_id = max([163, *self._custom_formats]) + 1
+        self._custom_formats[fmt_id] = DATETIME_NUMBER_FORMAT
+        self._items["numFmts"].append(f'<numFmt numFmtId="{fmt_id}" formatCode="{DATETIME_NUMBER_FORMAT}"/>')
+        return fmt_id
+
+    def cell_format(self, base: int, style: CellStyle, *, datetime: bool = False) -> int:
+        """Index of `base` with `style` applied, plus a datetime format if `datetime` and base has none."""
+        key = (base, style, datetime)
+        with self._lock:
+            if key in self._formats:
+                return self._formats[key]
+            xf = self._items["cellXfs"][base]
+            attrs = dict(_ATTR_PAT.findall(xf[: xf.index(">")]))
+            children = re.sub(r"<alignment\b[^>]*?(?:/>|>.*?</alignment>)", "", xf[xf.index(">") + 1 :], flags=re.DOTALL)
+            children = children.removesuffix("</xf>") if not xf.endswith("/>") else ""
+            if style.font is not None:
+                attrs.update(fontId=str(self._index("fonts", style.font)), applyFont="1")
+            if style.fill is not None:
+                attrs.update(fillId=str(self._index("fills", style.fill)), applyFill="1")
+            if style.alignment is not None:
+                attrs["applyAlignment"] = "1"
+                children = style.alignment + children
+            fmt_id = int(attrs.get("numFmtId", 0))
+            if datetime and not is_date_format(self._custom_formats.get(fmt_id, BUILTIN_FORMATS.get(fmt_id, "General"))):
+                attrs.update(numFmtId=str(self._date_format_id()), applyNumberFormat="1")
+            head = "<xf" + "".join(f' {name}="{value}"' for name, value in attrs.items())
+            index = self._formats[key] = self._index("cellXfs", f"{head}>{children}</xf>" if children else f"{head}/>")
+            return index
+
+    def render(self) -> bytes:
+        with self._lock:
+            xml = self._xml
+            for tag, _ in self._LISTS:
+                items = self._items[tag]
+                body = "".join(items)
+                pattern = re.compile(rf"<{tag}\b([^>]*?)(?:/>|>.*?</{tag}>)", re.DOTALL)
+                match = pattern.search(xml)
+                if match is None:
+                    if not items:
+                        continue
+                    # Only numFmts can be missing; it goes first in the stylesheet.
+                    opening = re.search(r"<styleSheet\b[^>]*>", xml)
+                    xml = f'{xml[: opening.end()]}<{tag} count="{len(items)}">{body}</{tag}>{xml[opening.end():]}'
+                    continue
+                attrs = _without_attrs(match.group(1), "count")
+                xml = f'{xml[: match.start()]}<{tag} count="{len(items)}"{attrs}>{body}</{tag}>{xml[match.end():]}'
+            return xml.encode("utf-8")
+
+
+@dataclass(frozen=True)
+class _TemplateRow:
+    attrs: str
+    xml: str
+    # column -> (style index, cell XML)
+    cells: dict[int, tuple[int, str]]
+
+
+@dataclass(frozen=True)
+class _Template:
+    # Parts copied unchanged (calcChain dropped, workbook set to recalculate on load).
+    parts: dict[str, bytes]
+    sheet_part: str
+    sheet_head: str
+    sheet_tail: str
+    last_column: int
+    last_row: int
+    rows: dict[int, _TemplateRow]
+    styles: _StyleSheet
+
+
+@lru_cache(maxsize=None)
+def _load_template(path: str, sheet_name: str) -> _Template:
+    data = Path(path).read_bytes()
+    sheet_part = StreamedWorkbook(data).sheet_part(sheet_name)
+    with zipfile.ZipFile(BytesIO(data)) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+
+    # Cached values are stale once cells change: drop the calc chain and recalculate on open.
+    calc_chain = next((name for name in parts if name.endswith("calcChain.xml")), None)
+    if calc_chain is not None:
+        del parts[calc_chain]
+        for name in ("[Content_Types].xml", "xl/_rels/workbook.xml.rels"):
+            parts[name] = re.sub(rb"<(?:Override|Relationship)\b[^>]*calcChain[^>]*/>", b"", parts[name])
+    workbook_xml = parts["xl/workbook.xml"].decode("utf-8")
+    if "<calcPr" in workbook_xml:
+        workbook_xml = re.sub(r"<calcPr\b([^>]*?)/>", lambda m: f'<calcPr{_without_attrs(m.group(1), "fullCalcOnLoad")} fullCalcOnLoad="1"/>', workbook_xml)
+    else:
+        workbook_xml = workbook_xml.replace("</workbook>", '<calcPr fullCalcOnLoad="1"/></workbook>')
+    parts["xl/workbook.xml"] = workbook_xml.encode("utf-8")
+
+    sheet_xml = parts[sheet_part].decode("utf-8")
+    data_start = sheet_xml.index("<sheetData")
+    body_start = sheet_xml.index(">", data_start) + 1
+    if sheet_xml[body_start - 2] == "/":
+        sheet_head, body, sheet_tail = sheet_xml[:data_start] + "<sheetData>", "", "</sheetData>" + sheet_xml[body_start:]
+    else:
+        body_end = sheet_xml.index("</sheetData>")
+        sheet_head, body, sheet_tail = sheet_xml[:body_start], sheet_xml[body_start:body_end], sheet_xml[body_end:]
+
+    rows: dict[int, _TemplateRow] = {}
+    for match in _ROW_PAT.finditer(body):
+        attrs = match.group(1)
+        cells = {
+            column_index_from_string(cell.group(1)): (int(dict(_ATTR_PAT.findall(cell.group(3))).get("s", 0)), cell.group(0))
+            for cell in _CELL_PAT.finditer(match.group(2) or "")
+        }
+        rows[int(dict(_ATTR_PAT.findall(attrs))["r"])] = _TemplateRow(attrs=attrs, xml=match.group(0), cells=cells)
+
+    dimension = _DIMENSION_PAT.search(sheet_head)
+    _, _, last_column, last_row = range_boundaries(dimension.group(1)) if dimension else (0, 0, 0, 0)
+    return _Template(
+        parts=parts,
+        sheet_part=sheet_part,
+        sheet_head=sheet_head,
+        sheet_tail=sheet_tail,
+        last_column=last_column or 0,
+        last_row=max([last_row or 0, *rows]),
+        rows=rows,
+        styles=_StyleSheet(parts.pop("xl/styles.xml").decode("utf-8")),
+    )
+
+
+def _cell_xml(ref: str, style: int, value: Any) -> str:
+    """A cell as openpyxl writes `value`; strings starting with "=" are formulas."""
+    if value is None or value == "":
+        return f'<c r="{ref}" s="{style}"/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}" s="{style}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}" s="{style}"><v>{value!r}</v></c>'
+    if isinstance(value, dt.datetime):
+        return f'<c r="{ref}" s="{style}"><v>{to_excel(value)!r}</v></c>'
+    text = str(value)
+    if text.startswith("=") and len(text) > 1:
+        return f'<c r="{ref}" s="{style}"><f>{escape(text[1:])}</f></c>'
+    if ILLEGAL_CHARACTERS_RE.search(text):
+        raise IllegalCharacterError(f"{text} cannot be used in worksheets.")
+    space = ' xml:space="preserve"' if text != text.strip() else ""
+    return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
 
 
 class ExcelProject:
     project: Project
     excel_format: ExcelFormat
-    cur_row: int
 
     def __init__(self, project: Project, excel_format: ExcelFormat = ExcelFormat()):
         self.project = project
         self.excel_format = excel_format
-        self.cur_row = excel_format.first_phase_row # 1 indexed
-
-    def write_project(self) -> Workbook:
-        
-        wb = openpyxl.load_workbook(Path(__file__).parent.parent / "assets" / "Gantt_Excel_Template.xlsx")
-
-        # main title cell - contains name and date range
-        name_date_cell = wb[self.excel_format.sheet_name][self.excel_format.name_date_cell]
-        name_date_cell.value = f"{self.project.name.split('\n')[0]}\n{self.project.start_date.date()} to {self.project.end_date.date()} (from GanttBuddy)"
-        name_date_cell.alignment = openpyxl.styles.Alignment(horizontal="center", vertical="center", wrap_text=True)
-        name_date_cell.font = openpyxl.styles.Font(name='Calibri', size=20, bold=True)
-
-        # project name, appears above first phase row
-        name_cell = wb[self.excel_format.sheet_name][f"{get_column_letter(self.excel_format.columns["name"])}{self.excel_format.first_phase_row - 1}"]
-        name_cell.value = self.project.name.split('\n')[0]
-        name_cell.alignment = openpyxl.styles.Alignment(horizontal="center", vertical="center")
-        name_cell.font = openpyxl.styles.Font(name='Calibri', size=12, bold=True)
-
-        # planned start column
-        planned_start_cell = wb[self.excel_format.sheet_name][f"{get_column_letter(self.excel_format.columns["planned_start"])}{self.excel_format.first_phase_row - 1}"]
-        planned_start_cell.value = self.project.start_date if self.project.start_date else None
-        planned_start_cell.alignment = openpyxl.styles.Alignment(horizontal="center", vertical="center")
-        planned_start_cell.font = openpyxl.styles.Font(name='Calibri', size=12, bold=True)
-
-        # planned end column
-        planned_end_cell = wb[self.excel_format.sheet_name][f"{get_column_letter(self.excel_format.columns["planned_end"])}{self.excel_format.first_phase_row - 1}"]
-        planned_end_cell.value = self.project.end_date if self.project.end_date else None
-        planned_end_cell.alignment = openpyxl.styles.Alignment(horizontal="center", vertical="center")
-        planned_end_cell.font = openpyxl.styles.Font(name='Calibri', size=12, bold=True)
-
-
-        for pid in self.project.phase_order:
-            phase = self.project.phases[pid]
-            self._write_phase_row(wb, phase)
+
+    def _excel_datetime(self, value: dt.datetime) -> dt.datetime:
+        # Excel has no timezones: write the project's wall-clock time.
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(self.project.timezone).replace(tzinfo=None)
+
+    def _header_rows(self) -> Iterator[tuple[int, float | None, dict[int, tuple[Any, CellStyle]]]]:
+        ef = self.excel_format
+        project = self.project
+        first_line = project.name.split("\n")[0]
+        title = CellStyle.of(font=TITLE_FONT, alignment=TITLE_ALIGNMENT)
+        header = CellStyle.of(font=HEADER_FONT, alignment=HEADER_ALIGNMENT)
+
+        title_col, title_row = coordinate_from_string(ef.name_date_cell)
+        yield title_row, None, {
+            column_index_from_string(title_col): (
+                f"{first_line}\n{project.start_date.date()} to {project.end_date.date()} (from GanttBuddy)",
+                title,
+            ),
+        }
+        yield ef.first_phase_row - 1, None, {
+            ef.columns["name"]: (first_line, header),
+            ef.columns["planned_start"]: (project.start_date if project.start_date else None, header),
+            ef.columns["planned_end"]: (project.end_date if project.end_date else None, header),
+        }
+
+    def _schedule_rows(self) -> Iterator[tuple[int, float | None, dict[int, tuple[Any, CellStyle]]]]:
+        ef = self.excel_format
+        phase_style = CellStyle.of(ef.phase_format.font, ef.phase_format.fill, ef.phase_format.alignment)
+        task_style = CellStyle.of(ef.task_format.font, ef.task_format.fill, ef.task_format.alignment)
+
+        row = ef.first_phase_row
+        task_number = 0
+        for phase_number, pid in enumerate(self.project.phase_order, start=1):
+            phase: Phase = self.project.phases[pid]
+            values = phase.to_excel_row()
+            values["number"] = values["id"] = phase_number
+            # The duration formulas tell phases from tasks when the file is imported again.
+            values["planned_duration"] = f'=ROUND(E{row}-D{row},1)&" Days ("&ROUND((E{row}-D{row})*24,1)&" Hours)"'
+            values["actual_duration"] = f'=ROUND(I{row}-H{row},1)&" Days ("&ROUND((I{row}-H{row})*24,1)&" Hours)"'
+            yield row, ef.phase_format.row_height, {
+                idx: (values.get(col_name), phase_style) for col_name, idx in ef.columns.items()
+            }
+            row += 1
+
             for tid in phase.task_order:
-                task = phase.tasks[tid]
-                self._write_task_row(wb, task)
-        
-        return wb
-    
-    def _write_phase_row(self, wb: openpyxl.Workbook, phase: Phase):
-        if phase.uuid not in [uuid for uuid in self.project.phase_order]:
-            raise ValueError(f"Provided phase {phase.name} does not exist in project {self.project.name}.")
-        
-        ws = wb[self.excel_format.sheet_name]
-        ef = self.excel_format.phase_format
-
-        # adjust row height to specified phase format
-        ws.row_dimensions[self.cur_row].height = ef.row_height
-
-        phase_row_dict = phase.to_excel_row()
-        ws.cell(row=self.cur_row, column=self.excel_format.columns["name"], value=phase.name)
-        for col_name, idx in self.excel_format.columns.items():
-            cell = ws.cell(row=self.cur_row, column=idx)
-            cell.font = ef.font
-            cell.fill = ef.fill
-            cell.alignment = ef.alignment
-
-            # handle information not available in phase_row_dict
-            to_write = phase_row_dict.get(col_name, None)
-            if col_name == "number" or col_name == "id":
-                to_write = self.project.get_phase_index(phase) + 1 # 1 indexed
-            
-            # write duration formula. This is important for differentiating between
-            # phases and tasks when reading from excel later. Also better UX
-            if col_name == "planned_duration":
-                # =ROUND(E9-D9,1)&" Days ("&ROUND((E9-D9)*24,1)&" Hours)"
-                to_write = f"=ROUND(E{cell.row}-D{cell.row},1)&\" Days (\"&ROUND((E{cell.row}-D{cell.row})*24,1)&\" Hours)\""
-
-            if col_name == "actual_duration":
-                to_write = f"=ROUND(I{cell.row}-H{cell.row},1)&\" Days (\"&ROUND((I{cell.row}-H{cell.row})*24,1)&\" Hours)\""
-            cell.value = to_write
-
-        self.cur_row += 1
-        
-    
-    def _write_task_row(self, wb: openpyxl.Workbook, task: Task):
-        ws = wb[self.excel_format.sheet_name]
-        ef = self.excel_format.task_format
-
-        # adjust row height to specified task format
-        ws.row_dimensions[self.cur_row].height = ef.row_height
-
-        task_row_dict = task.to_excel_row()
-        for col_name, idx in self.excel_format.columns.items():
-            cell = ws.cell(row=self.cur_row, column=idx)
-            cell.font = ef.font
-            cell.fill = ef.fill
-            cell.alignment = ef.alignment
-
-            # handle information not available in task_row_dict
-            to_write = task_row_dict.get(col_name, None)
-            if col_name == "number" or col_name == "id":
-                task_idx = self.project.get_task_idx(task)
-                to_write = task_idx + 1 # 1 indexed
-            
-            cell.value = to_write
-        
-        self.cur_row += 1 
-
-
-
-            
\ No newline at end of file
+                task: Task = phase.tasks[tid]
+                task_number += 1
+                values = task.to_excel_row()
+                values["number"] = values["id"] = task_number
+                yield row, ef.task_format.row_height, {
+                    idx: (values.get(col_name), task_style) for col_name, idx in ef.columns.items()
+                }
+                row += 1
+
+    def _sheet_rows(self, template: _Template) -> Iterator[str]:
+        """The schedule sheet's rows: the template's, with the project's cells written over them."""
+        styles = template.styles
+        formats: dict[tuple[int, CellStyle, bool], int] = {}
+        written = 0
+        for row, height, cells in chain(self._header_rows(), self._schedule_rows()):
+            while written + 1 < row:
+                written += 1
+                if written in template.rows:
+                    yield template.rows[written].xml
+            written = row
+
+            base = template.rows.get(row)
+            merged = dict(base.cells) if base is not None else {}
+            for column, (value, style) in cells.items():
+                if isinstance(value, dt.datetime):
+                    value = self._excel_datetime(value)
+                key = (merged.get(column, (0,))[0], style, isinstance(value, dt.datetime))
+                if key not in formats:
+                    formats[key] = styles.cell_format(key[0], style, datetime=key[2])
+                merged[column] = (formats[key], _cell_xml(f"{get_column_letter(column)}{row}", formats[key], value))
+
+            attrs = base.attrs if base is not None else f' r="{row}"'
+            if height is not None:
+                attrs = f'{_without_attrs(attrs, "ht", "customHeight")} ht="{height}" customHeight="1"'
+            yield f"<row{attrs}>{''.join(merged[column][1] for column in sorted(merged))}</row>"
+
+        for remaining in range(written + 1, template.last_row + 1):
+            if remaining in template.rows:
+                yield template.rows[remaining].xml
+
+    def write_xlsx(self, out: BinaryIO) -> None:
+        """
+            Write the project into the Gantt template as an .xlsx package to `out`.
+            The schedule sheet is streamed, so memory stays flat as the project grows.
+        """
+        template = _load_template(str(TEMPLATE_PATH), self.excel_format.sheet_name)
+        last_row = max(template.last_row, self.excel_format.first_phase_row + len(self.project.phase_order) + len(self.project.get_task_list()) - 1)
+        last_column = max(template.last_column, *self.excel_format.columns.values())
+        sheet_head = _DIMENSION_PAT.sub(f'<dimension ref="A1:{get_column_letter(last_column)}{last_row}"/>', template.sheet_head)
+
+        with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, data in template.parts.items():
+                if name != template.sheet_part:
+                    archive.writestr(name, data)
+                    continue
+                with archive.open(name, "w") as sheet:
+                    sheet.write(sheet_head.encode("utf-8"))
+                    chunk: list[str] = []
+                    for row_xml in self._sheet_rows(template):
+                        chunk.append(row_xml)
+                        if len(chunk) >= ROWS_PER_WRITE:
+                            sheet.write("".join(chunk).encode("utf-8"))
+                            chunk.clear()
+                    sheet.write(("".join(chunk) + template.sheet_tail).encode("utf-8"))
+            # Written last: the sheet may have added formats.
+            archive.writestr("xl/styles.xml", template.styles.render())
+
+    def to_xlsx_bytes(self) -> bytes:
+        buffer = BytesIO()
+        self.write_xlsx(buffer)
+        return buffer.getvalue()
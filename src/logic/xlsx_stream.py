@@ -0,0 +1,370 @@
+"""
+Streaming reader for .xlsx workbooks.
+
+openpyxl can return either cached values (`data_only=True`) or formulas, so
+reading both used to mean parsing every sheet twice, plus once more through
+pandas. This reader walks a worksheet's XML once, keeps only the requested
+columns/rows, and returns cached values and formulas side by side.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Any, Iterable, Iterator, NamedTuple
+from xml.etree.ElementTree import iterparse
+
+from openpyxl.formula.tokenizer import Token, Tokenizer
+from openpyxl.formula.translate import Translator, TranslatorError
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, get_column_letter
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_ROW = f"{_MAIN_NS}row"
+_VALUE = f"{_MAIN_NS}v"
+_FORMULA = f"{_MAIN_NS}f"
+_INLINE = f"{_MAIN_NS}is"
+_TEXT = f"{_MAIN_NS}t"
+_RUN = f"{_MAIN_NS}r"
+
+_COORD_PAT = re.compile(r"([A-Z]+)(\d+)")
+# Translator.CELL_REF_RE with the "$" anchors split into their own groups.
+_CELL_REF = re.compile(r"(\$?)([A-Za-z]{1,3})(\$?)([1-9][0-9]{0,6})$")
+
+_DATE = 1
+_TIMEDELTA = 2
+
+
+class CellValue(NamedTuple):
+    """Stand-in for an openpyxl cell; only `.value` is provided."""
+
+    value: Any
+
+
+@dataclass
+class StreamedSheet:
+    title: str
+    # column -> {row: value}; column-major keeps a long sheet's few columns compact.
+    columns: dict[int, dict[int, Any]] = field(default_factory=dict)
+    formulas: dict[tuple[int, int], str] = field(default_factory=dict)
+    max_row: int = 0
+
+    def cell(self, row: int, column: int) -> CellValue:
+        return CellValue(self.columns.get(column, {}).get(row))
+
+    def __getitem__(self, coordinate: str) -> CellValue:
+        column, row = coordinate_from_string(coordinate)
+        return self.cell(row, column_index_from_string(column))
+
+    def formula(self, row: int, column: int) -> str | None:
+        return self.formulas.get((row, column))
+
+    def iter_rows(self, columns: Iterable[int], *, min_row: int = 1, max_row: int | None = None) -> Iterator[list[Any]]:
+        """Cached values of `columns` for every row in range; missing cells are None."""
+        by_column = [self.columns.get(column, {}) for column in columns]
+        last = self.max_row if max_row is None else max_row
+        for row in range(min_row, last + 1):
+            yield [values.get(row) for values in by_column]
+
+
+@dataclass(frozen=True)
+class SheetBounds:
+    """Which cells of a sheet to keep. `None` means unbounded."""
+
+    columns: frozenset[int] | None = None
+    max_row: int | None = None
+    cells: frozenset[tuple[int, int]] = frozenset()
+    formula_columns: frozenset[int] = frozenset()
+
+    def keeps(self, row: int, column: int) -> bool:
+        return self.columns is None or column in self.columns or (row, column) in self.cells
+
+
+def _number(text: str) -> int | float:
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _text(element) -> str:
+    """Text of a shared/inline string: a plain `<t>` or rich-text runs, skipping phonetic hints."""
+    parts = []
+    for child in element:
+        if child.tag == _TEXT:
+            parts.append(child.text or "")
+        elif child.tag == _RUN:
+            run = child.find(_TEXT)
+            parts.append((run.text or "") if run is not None else "")
+    return "".join(parts)
+
+
+class _SharedFormula:
+    """
+    A shared-formula master, compiled on first use.
+
+    openpyxl's Translator re-parses every reference for every dependent cell.
+    Here plain cell references are split once into fixed and relative parts,
+    so translating a dependent is string formatting; anything else (ranges,
+    names) still goes through `Translator.translate_range`.
+    """
+
+    __slots__ = ("formula", "row", "column", "_parts")
+
+    def __init__(self, formula: str, row: int, column: int):
+        self.formula = formula
+        self.row = row
+        self.column = column
+        self._parts: list | None = None
+
+    def _compile(self) -> list:
+        parts: list = []
+        for token in Tokenizer(self.formula).items:
+            if token.type != Token.OPERAND or token.subtype != Token.RANGE:
+                parts.append(token.value)
+                continue
+            sheet, reference = Translator.strip_ws_name(token.value)
+            match = _CELL_REF.match(reference)
+            if match is None:
+                parts.append((token.value,))
+                continue
+            col_fixed, col, row_fixed, row = match.groups()
+            parts.append((sheet, col_fixed, column_index_from_string(col), col, row_fixed, int(row)))
+        return parts
+
+    def translate(self, row: int, column: int) -> str:
+        if self._parts is None:
+            self._parts = self._compile()
+        row_delta, col_delta = row - self.row, column - self.column
+        out = ["="]
+        for part in self._parts:
+            if isinstance(part, str):
+                out.append(part)
+            elif len(part) == 1:
+                out.append(Translator.translate_range(part[0], row_delta, col_delta))
+            else:
+                sheet, col_fixed, col_index, col, row_fixed, ref_row = part
+                if not col_fixed:
+                    try:
+                        col = get_column_letter(col_index + col_delta)
+                    except ValueError:
+                        raise TranslatorError("Formula out of range")
+                if not row_fixed:
+                    ref_row += row_delta
+                    if ref_row <= 0:
+                        raise TranslatorError("Formula out of range")
+                out.append(f"{sheet}{col_fixed}{col}{row_fixed}{ref_row}")
+        return "".join(out)
+
+
+def _formula(element, row: int, column: int, shared: dict[str, _SharedFormula], *, translate: bool) -> str | None:
+    """
+    Formula text of a cell as openpyxl reports it ("=..."); None for array formulas.
+
+    Shared-formula masters are always recorded, since a group may span kept and
+    skipped columns; dependents are only translated when `translate` is set.
+    """
+    kind = element.get("t")
+    if kind == "array":
+        return None
+    if kind == "shared":
+        group = element.get("si")
+        if element.text:
+            shared[group] = _SharedFormula("=" + element.text, row, column)
+            return "=" + element.text if translate else None
+        master = shared.get(group)
+        if master is None or not translate:
+            return None
+        return master.translate(row, column)
+    if not translate:
+        return None
+    return "=" + element.text if element.text else None
+
+
+class StreamedWorkbook:
+    """
+    Workbook facade over the raw xlsx bytes.
+
+    `wb[name]` reads a sheet once (limited to `bounds[name]` when given) and
+    caches it, so it can be passed to helpers written against openpyxl's
+    read-only workbooks (`sheetnames`, `wb[name].cell(row, column).value`).
+    """
+
+    def __init__(self, data: bytes, *, bounds: dict[str, SheetBounds] | None = None):
+        self._zip = zipfile.ZipFile(BytesIO(data))
+        self._bounds = dict(bounds or {})
+        self._sheets: dict[str, StreamedSheet] = {}
+        self._shared_strings: list[str] | None = None
+        self._read_workbook()
+
+    def _rels(self, part: str) -> dict[str, tuple[str, str]]:
+        """Relationship id -> (type suffix, resolved part path) for `part`."""
+        folder, name = posixpath.split(part)
+        rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+        if rels_path not in self._zip.namelist():
+            return {}
+        rels: dict[str, tuple[str, str]] = {}
+        for _, element in iterparse(self._zip.open(rels_path)):
+            if element.tag != f"{_PKG_REL_NS}Relationship":
+                continue
+            target = element.get("Target", "")
+            path = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join(folder, target))
+            rels[element.get("Id")] = (element.get("Type", "").rsplit("/", 1)[-1], path)
+        return rels
+
+    def _read_workbook(self) -> None:
+        root_rels = self._rels("")
+        workbook_part = next(
+            (path for kind, path in root_rels.values() if kind == "officeDocument"),
+            "xl/workbook.xml",
+        )
+        rels = self._rels(workbook_part)
+        self._sheet_parts: dict[str, str] = {}
+        self.epoch = CALENDAR_WINDOWS_1900
+        for _, element in iterparse(self._zip.open(workbook_part)):
+            if element.tag == f"{_MAIN_NS}sheet":
+                rel = rels.get(element.get(f"{_REL_NS}id"))
+                if rel is not None:
+                    self._sheet_parts[element.get("name")] = rel[1]
+            elif element.tag == f"{_MAIN_NS}workbookPr" and element.get("date1904") in ("1", "true"):
+                self.epoch = CALENDAR_MAC_1904
+        self.sheetnames = list(self._sheet_parts)
+        by_kind = {kind: path for kind, path in rels.values()}
+        self._shared_strings_part = by_kind.get("sharedStrings")
+        self._styles = self._read_styles(by_kind.get("styles"))
+
+    def _read_styles(self, part: str | None) -> list[int]:
+        """Per cell-format index: `_DATE`, `_TIMEDELTA` or 0."""
+        if part is None or part not in self._zip.namelist():
+            return []
+        custom: dict[int, str] = {}
+        kinds: list[int] = []
+        in_cell_xfs = False
+        for event, element in iterparse(self._zip.open(part), events=("start", "end")):
+            if element.tag == f"{_MAIN_NS}cellXfs":
+                in_cell_xfs = event == "start"
+            elif event == "end" and element.tag == f"{_MAIN_NS}numFmt":
+                custom[int(element.get("numFmtId"))] = element.get("formatCode", "")
+            elif event == "end" and in_cell_xfs and element.tag == f"{_MAIN_NS}xf":
+                fmt_id = int(element.get("numFmtId", 0))
+                code = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id, "General"))
+                kinds.append(_TIMEDELTA if is_timedelta_format(code) else _DATE if is_date_format(code) else 0)
+        return kinds
+
+    @property
+    def shared_strings(self) -> list[str]:
+        if self._shared_strings is None:
+            strings: list[str] = []
+            part = self._shared_strings_part
+            if part is not None and part in self._zip.namelist():
+                for _, element in iterparse(self._zip.open(part)):
+                    if element.tag == f"{_MAIN_NS}si":
+                        strings.append(_text(element))
+                        element.clear()
+            self._shared_strings = strings
+        return self._shared_strings
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sheet_parts
+
+    def sheet_part(self, name: str) -> str:
+        """Path of the worksheet's XML part inside the archive."""
+        if name not in self._sheet_parts:
+            raise KeyError(f"Worksheet {name} does not exist.")
+        return self._sheet_parts[name]
+
+    def __getitem__(self, name: str) -> StreamedSheet:
+        if name not in self._sheets:
+            self._sheets[name] = self.read_sheet(name, self._bounds.get(name, SheetBounds()))
+        return self._sheets[name]
+
+    def read_sheet(self, name: str, bounds: SheetBounds = SheetBounds()) -> StreamedSheet:
+        """Read the cells `bounds` keeps in a single pass over the sheet XML."""
+        if name not in self._sheet_parts:
+            raise KeyError(f"Worksheet {name} does not exist.")
+        sheet = StreamedSheet(title=name)
+        columns, formulas = sheet.columns, sheet.formulas
+        styles, epoch = self._styles, self.epoch
+        shared_strings = self.shared_strings
+        formula_columns = bounds.formula_columns
+        shared_formulas: dict[str, _SharedFormula] = {}
+        row = 0
+
+        for _, element in iterparse(self._zip.open(self._sheet_parts[name])):
+            if element.tag != _ROW:
+                continue
+
+            row = int(element.get("r") or row + 1)
+            if bounds.max_row is not None and row > bounds.max_row:
+                break
+            column = 0
+            for cell in element:
+                coordinate = cell.get("r")
+                if coordinate:
+                    column = column_index_from_string(_COORD_PAT.match(coordinate).group(1))
+                else:
+                    column += 1
+                keep = bounds.keeps(row, column)
+                if not keep and not formula_columns:
+                    continue
+
+                raw = formula = inline = None
+                for child in cell:
+                    tag = child.tag
+                    if tag == _VALUE:
+                        raw = child.text
+                    elif tag == _FORMULA:
+                        formula = child
+                    elif tag == _INLINE:
+                        inline = child
+
+                if formula is not None and formula_columns:
+                    text = _formula(
+                        formula,
+                        row,
+                        column,
+                        shared_formulas,
+                        translate=keep and column in formula_columns,
+                    )
+                    if text is not None:
+                        formulas[(row, column)] = text
+                if not keep:
+                    continue
+
+                kind = cell.get("t", "n")
+                if kind == "inlineStr":
+                    value = _text(inline) if inline is not None else None
+                elif raw is None:
+                    value = None
+                elif kind == "s":
+                    value = shared_strings[int(raw)]
+                elif kind == "str":
+                    value = raw
+                elif kind == "b":
+                    value = raw in ("1", "true")
+                elif kind == "d":
+                    value = dt.datetime.fromisoformat(raw)
+                elif kind == "e":
+                    value = None
+                else:
+                    value = _number(raw)
+                    style = int(cell.get("s") or 0)
+                    date_kind = styles[style] if style < len(styles) else 0
+                    if date_kind:
+                        value = from_excel(value, epoch, timedelta=date_kind == _TIMEDELTA)
+                if value is not None:
+                    if column not in columns:
+                        columns[column] = {}
+                    columns[column][row] = value
+                    sheet.max_row = row
+
+            # Processed rows stay in the tree as empty elements only.
+            element.clear()
+        return sheet
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from enum import Enum
-from pydantic import BaseModel, TypeAdapter, Field
+from pydantic import BaseModel, Field
 from typing import Optional, Any
 import datetime as dt
 import pandas as pd
 from uuid import UUID, uuid4
 from zoneinfo import ZoneInfo
 
+from models.parsing import list_adapter
+
 
 LOCAL_TZ = ZoneInfo("America/Vancouver")
 
@@ -67,7 +69,7 @@ class Delay(BaseModel):
         ]
 
 
-        return TypeAdapter(list[Delay]).validate_python(records)
+        return list_adapter(Delay).validate_python(records)
 
 class DelayEditorRow(BaseModel):
     """
@@ -152,7 +154,7 @@ class DelayEditorRow(BaseModel):
             if r.get("description") is None:
                 r["description"] = ""
 
-        return TypeAdapter(list[DelayEditorRow]).validate_python(records)
+        return list_adapter(DelayEditorRow).validate_python(records)
 
     @staticmethod
     def _cmp_dump(row: "DelayEditorRow") -> dict[str, Any]:
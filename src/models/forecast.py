@@ -5,7 +5,9 @@ from typing import Optional
 from zoneinfo import ZoneInfo
 
 import pandas as pd
-from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic import BaseModel, ConfigDict, Field
+
+from models.parsing import parse_model_list
 
 
 class ForecastBaseModel(BaseModel):
@@ -124,4 +126,4 @@ def parse_forecast_response(payload: dict | None) -> ForecastResponse:
 
 
 def parse_forecast_task_rows(payload: list[dict] | None) -> list[ForecastTaskRow]:
-    return TypeAdapter(list[ForecastTaskRow]).validate_python(payload or [])
+    return parse_model_list(ForecastTaskRow, payload)
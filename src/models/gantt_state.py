@@ -11,6 +11,7 @@ class GanttState:
 
     show_delay_windows: bool = False
     selected_delay_types: list[str] = field(default_factory=list)
+    signal_overlay_id: str | None = None
     x_axis_start: dt.datetime = None
     x_axis_end: dt.datetime = None
 
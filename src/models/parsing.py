@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(model: type[M]) -> TypeAdapter[list[M]]:
+    """One `TypeAdapter(list[model])` per model; building the validator is the expensive part."""
+    return TypeAdapter(list[model])
+
+
+def parse_model_list(model: type[M], payload: list[dict[str, Any]] | None) -> list[M]:
+    """Validate a whole list response in a single validator call."""
+    return list_adapter(model).validate_python(payload or [])
+
+
+def parse_model_list_json(model: type[M], raw: bytes | str | None) -> list[M]:
+    """
+    Validate a JSON array straight from the response body.
+
+    Skips building the intermediate dicts of `response.json()`, which costs
+    about as much as validating them.
+    """
+    if not raw:
+        return []
+    return list_adapter(model).validate_json(raw)
@@ -46,6 +46,8 @@ class Shift:
 
 from pydantic import BaseModel, field_validator
 
+from models.parsing import parse_model_list
+
 class ShiftDefinition(BaseModel):
     id: Optional[str] = None # filled from backend
     project_id: str
@@ -116,28 +118,29 @@ class ShiftAssignment(BaseModel):
         if missing:
             raise KeyError(f"Provided dataframe is missing required columns: {", ".join(missing)}")
         
-        id_present = "id" in df.columns
-        assignments = []
-        for _, row in df.iterrows():
-            start = row["start_date"]
-            end = row["end_date"]
-            shift_type = row["shift_type"]
-            crew_id = row["crew_id"]
-
-            if id_present:
-                id = row["id"]
-            
-            assignments.append(
-                ShiftAssignment(
-                    id=id if id_present else None,
-                    project_id=project_id if project_id else "",
-                    crew_id=crew_id,
-                    shift_type=shift_type,
-                    start_date=start,
-                    end_date=end
+        ids = df["id"].tolist() if "id" in df.columns else [None] * len(df)
+        project_id = project_id if project_id else ""
+        # One list validation instead of a model per `iterrows` row.
+        return parse_model_list(
+            ShiftAssignment,
+            [
+                {
+                    "id": id,
+                    "project_id": project_id,
+                    "crew_id": crew_id,
+                    "shift_type": shift_type,
+                    "start_date": start,
+                    "end_date": end,
+                }
+                for id, crew_id, shift_type, start, end in zip(
+                    ids,
+                    df["crew_id"].tolist(),
+                    df["shift_type"].tolist(),
+                    df["start_date"].tolist(),
+                    df["end_date"].tolist(),
                 )
-            )
-        return assignments
+            ],
+        )
     
 def assignments_to_df(assignments: list[ShiftAssignment]) -> pd.DataFrame:
     data = {
@@ -5,7 +5,9 @@ from enum import Enum
 from typing import Any, Optional
 
 import pandas as pd
-from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic import BaseModel, ConfigDict, Field
+
+from models.parsing import parse_model_list, parse_model_list_json
 
 
 class SignalDataType(str, Enum):
@@ -178,20 +180,24 @@ class IngestionRun(SignalBaseModel):
 
 
 def parse_signal_definitions(payload: list[dict[str, Any]] | None) -> list[SignalDefinition]:
-    return TypeAdapter(list[SignalDefinition]).validate_python(payload or [])
+    return parse_model_list(SignalDefinition, payload)
 
 
 def parse_data_sources(payload: list[dict[str, Any]] | None) -> list[DataSource]:
-    return TypeAdapter(list[DataSource]).validate_python(payload or [])
+    return parse_model_list(DataSource, payload)
 
 
 def parse_observations(payload: list[dict[str, Any]] | None) -> list[SignalObservation]:
-    return TypeAdapter(list[SignalObservation]).validate_python(payload or [])
+    return parse_model_list(SignalObservation, payload)
+
+
+def parse_observations_json(raw: bytes | str | None) -> list[SignalObservation]:
+    return parse_model_list_json(SignalObservation, raw)
 
 
 def parse_intervals(payload: list[dict[str, Any]] | None) -> list[SignalInterval]:
-    return TypeAdapter(list[SignalInterval]).validate_python(payload or [])
+    return parse_model_list(SignalInterval, payload)
 
 
 def parse_ingestion_runs(payload: list[dict[str, Any]] | None) -> list[IngestionRun]:
-    return TypeAdapter(list[IngestionRun]).validate_python(payload or [])
+    return parse_model_list(IngestionRun, payload)
@@ -5,8 +5,9 @@ from typing import Any
 from uuid import UUID
 
 import pandas as pd
-from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic import BaseModel, ConfigDict, Field
 
+from models.parsing import list_adapter
 from models.task import TaskStatus
 
 
@@ -31,7 +32,7 @@ class TodoUpsertRow(BaseModel):
             {k: (None if pd.isna(v) else v) for k, v in record.items()}
             for record in records
         ]
-        return TypeAdapter(list[TodoUpsertRow]).validate_python(normalized)
+        return list_adapter(TodoUpsertRow).validate_python(normalized)
 
 
 class TodoIn(BaseModel):
@@ -16,6 +16,7 @@ from ui.utils.phase_delay_plot import generate_phase_delay_plot
 from ui.create_project import create_project
 from ui.load_project import render_load_project
 from logic.backend.utils.parse_datetime import parse_backend_utc
+from logic.cache_registry import tagged_cache_data
 
 # -------------------------
 # Config
@@ -493,7 +494,7 @@ def fetch_inching(project_id: str, date_from: Optional[date], date_to: Optional[
     )
 
 
-@st.cache_data(ttl=30, show_spinner=False)
+@tagged_cache_data("project:{project_id}", ttl=30, show_spinner=False)
 def fetch_dashboard(project_id: str, date_from: Optional[date], date_to: Optional[date]) -> dict:
     params = {}
     
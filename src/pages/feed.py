@@ -17,7 +17,7 @@ from logic.backend.project_permissions import resolve_project_access, store_proj
 from logic.backend.project_list import get_projects
 
 from logic.backend.utils.parse_datetime import parse_backend_utc
-from logic.backend.events import get_events
+from logic.backend.events import EventFeedStore, FeedQuery, get_event_feed
 
 
 EVENT_TYPE_LABELS = {
@@ -103,7 +103,7 @@ def render_feed_header():
     st.caption("Changes and activity across your projects. All timestamps are in project local time.")
 
 
-def render_filters(projects: dict, events: list[EventIn]) -> dict[str, Any]:
+def render_filters(projects: dict, feed: EventFeedStore) -> dict[str, Any]:
     with st.container(border=True):
         cols = st.columns([2, 1, 1, 1])
         with cols[0]:
@@ -127,7 +127,7 @@ def render_filters(projects: dict, events: list[EventIn]) -> dict[str, Any]:
                 format_func=lambda pid: proj_label_by_id.get(pid, pid),
             )
         with c2[1]:
-            all_types = sorted({e.event_type for e in events})
+            all_types = sorted(feed.event_types)
             type_filter = st.multiselect(
                 "Event types",
                 options=all_types,
@@ -137,7 +137,7 @@ def render_filters(projects: dict, events: list[EventIn]) -> dict[str, Any]:
         with c2[2]:
             st.space("small")
             if st.button("Mark all read", icon=":material/done_all:", width="stretch"):
-                for e in events:
+                for e in feed.events():
                     st.session_state.feed_read_event_ids.add(e.id)
                 st.rerun()
 
@@ -151,13 +151,14 @@ def render_filters(projects: dict, events: list[EventIn]) -> dict[str, Any]:
     }
 
 
-def apply_filters(events: list[EventIn], filters: dict[str, Any]) -> list[EventIn]:
-    q = filters["q"].lower()
-    unread_only = filters["unread_only"]
+def apply_filters(
+    feed: EventFeedStore,
+    filters: dict[str, Any],
+    *,
+    exclude_read: bool = False,
+) -> dict[date, list[EventIn]]:
+    """Filtered events grouped by local day, served from the feed's incremental indexes."""
     window = filters["window"]
-    sort_dir = filters["sort_dir"]
-    project_filter = filters["project_filter"]
-    type_filter = filters["type_filter"]
 
     now = datetime.now(UTC)
     if window == "24h":
@@ -167,44 +168,20 @@ def apply_filters(events: list[EventIn], filters: dict[str, Any]) -> list[EventI
     elif window == "30d":
         min_dt = now - timedelta(days=30)
     else:
-        min_dt = datetime.min
-
-    out: list[EventIn] = []
-    for e in events:
-        if e.ts < min_dt:
-            continue
-        if project_filter and e.project_id not in project_filter:
-            continue
-        if type_filter and e.event_type.lower() not in type_filter:
-            continue
-        if unread_only and e.id in st.session_state.feed_read_event_ids:
-            continue
-        if q:
-            hay = " ".join(
-                [
-                    e.user_name,
-                    e.message,
-                    e.event_type,
-                    e.project_id,
-                    e.task_id or "",
-                    json.dumps(e.payload, default=str),
-                ]
-            ).lower()
-            if q not in hay:
-                continue
-        out.append(e)
-
-    reverse = sort_dir == "Newest first"
-    out.sort(key=lambda x: x.ts, reverse=reverse)
-    return out
-
-
-def group_by_day(events: list[EventIn]) -> dict[date, list[EventIn]]:
-    groups: dict[date, list[EventIn]] = {}
-    for e in events:
-        d = e.ts.date()
-        groups.setdefault(d, []).append(e)
-    return dict(sorted(groups.items(), key=lambda kv: kv[0], reverse=True))
+        min_dt = None
+
+    query = FeedQuery(
+        q=filters["q"].lower(),
+        project_filter=frozenset(filters["project_filter"]),
+        type_filter=frozenset(t.lower() for t in filters["type_filter"]),
+    )
+    read_ids = st.session_state.feed_read_event_ids
+    return feed.grouped(
+        query,
+        since=min_dt,
+        exclude_ids=read_ids if (exclude_read or filters["unread_only"]) else None,
+        newest_first=filters["sort_dir"] == "Newest first",
+    )
 
 
 def render_event_card(e: EventIn, projects: dict, unread: bool = False):
@@ -269,12 +246,11 @@ def render_event_card(e: EventIn, projects: dict, unread: bool = False):
             st.code(json.dumps(e.payload, indent=2, default=str), language="json")
 
 
-def render_activity_stream(projects: dict, events: list[EventIn], unread: bool = False):
-    if not events:
+def render_activity_stream(projects: dict, groups: dict[date, list[EventIn]], unread: bool = False):
+    if not groups:
         st.info("No activity yet.")
         return
 
-    groups = group_by_day(events)
     for d, day_events in groups.items():
         with st.expander(f"**{d.isoformat()}**"):
             for e in day_events:
@@ -330,9 +306,8 @@ def render_feed():
 
     st.markdown("---")
 
-    events = get_events(headers=headers, n_events=50)
-    filters = render_filters(projects, events)
-    filtered = apply_filters(events, filters)
+    feed = get_event_feed(headers)
+    filters = render_filters(projects, feed)
 
     left, right = st.columns([3, 1])
 
@@ -340,14 +315,13 @@ def render_feed():
         tab = st.tabs(["Activity", "Unread"])[0:2]
 
         with tab[0]:
-            render_activity_stream(projects, filtered)
+            render_activity_stream(projects, apply_filters(feed, filters))
 
         with tab[1]:
-            unread = [e for e in filtered if e.id not in st.session_state.feed_read_event_ids]
-            render_activity_stream(projects, unread, unread=True)
+            render_activity_stream(projects, apply_filters(feed, filters, exclude_read=True), unread=True)
 
     with right:
-        render_project_pulse(projects, events)
+        render_project_pulse(projects, feed.events())
 
         with st.container(border=True):
             st.markdown("### Saved views")
@@ -28,6 +28,7 @@ from logic.backend.api_client import fetch_project_snapshot, fetch_todos
 from logic.backend.import_project import snapshot_to_project
 from logic.backend.project_permissions import resolve_project_access, store_project_access
 from logic.backend.users import get_user
+from logic.cache_registry import invalidate_tags, project_tag
 from ui.todo_overview import inject_todo_panel_css, render_todo_overview_panel, todo_dataframe
 
 def open_project(project_id: str) -> None:
@@ -55,7 +56,7 @@ def open_project(project_id: str) -> None:
     if project.project_type == ProjectType.MILL_RELINE and metadata is not None:
         st.session_state["reline_metadata"] = metadata 
     
-    st.cache_data.clear() # clear cache on new project load
+    invalidate_tags(project_tag(project_id)) # drop stale caches for the opened project only
     st.session_state.plan_state = PlanState(project_id=project_id)
     st.switch_page("pages/plan.py")
 
@@ -105,7 +106,7 @@ def _severity_emoji(sev: str) -> str:
 
 from logic.backend.project_list import get_projects
 from logic.backend.activity_items import get_attention_items, count_activities
-from logic.backend.events import get_events
+from logic.backend.events import get_event_feed
 from ui.create_project import create_project
 from ui.load_project import render_load_project
 from ui.load_from_excel import go_to_excel_import
@@ -133,7 +134,7 @@ def main() -> None:
         pid = next(iter(last_proj))
 
     needs = get_attention_items(headers, timezone=ZoneInfo(st.context.timezone))
-    activity = get_events(headers, n_events=5)
+    activity = get_event_feed(headers).latest(5)
     todos_payload = fetch_todos(headers=headers)
     kpis = count_activities(needs)
 
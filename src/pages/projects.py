@@ -6,6 +6,7 @@ from logic.backend.project_list import get_projects
 from logic.backend.api_client import fetch_project_snapshot
 from logic.backend.import_project import snapshot_to_project
 from logic.backend.project_permissions import resolve_project_access, store_project_access
+from logic.cache_registry import invalidate_tags, project_tag
 
 from models.session import SessionModel
 from models.project import Project, ProjectType
@@ -72,7 +73,7 @@ def render_select_project(projects: dict):
     st.session_state["selected_project_id"] = selected_project_id
     st.session_state.plan_state = PlanState(project_id=selected_project_id)
     st.success(f"*{projects[selected_project_id]}* Loaded Successfully!")
-    st.cache_data.clear()
+    invalidate_tags(project_tag(selected_project_id))
     return
 
 
@@ -17,15 +17,19 @@ from logic.backend.api_client import (
     fetch_organization_projects_summary,
     fetch_organization_user_detail,
     fetch_organization_users_summary,
-    fetch_project_members,
     headers_for_organization,
     update_organization_user_role,
     upsert_project_member,
 )
+from logic.backend.instrumentation import get_backend_metrics
+from logic.backend.pagination import fetch_all_pages_frame
+from logic.backend.reference_cache import reference_cache_stats
+from logic.backend.single_flight import single_flight_stats
 from logic.backend.project_members import get_project_members
 from logic.backend.guards import require_admin
 from logic.backend.users import get_user
 from logic.backend.utils.parse_datetime import parse_backend_utc
+from logic.cache_registry import cache_tag_stats, invalidate_tags, org_tag
 from models.organization import OrganizationMembership
 from models.project_member import ProjectMember
 from models.user import User
@@ -61,6 +65,8 @@ PROJECT_HEALTH_COLORS = {
     "Dormant": "#7c3aed",
     "Closed": "#475467",
 }
+ADMIN_PAGE_SIZE = 100
+ADMIN_PAGE_WORKERS = 4
 
 
 @dataclass(frozen=True)
@@ -79,13 +85,11 @@ def _membership_label(membership: OrganizationMembership) -> str:
     return f"{org_name} ({membership.role})"
 
 
-def _clear_admin_caches() -> None:
-    fetch_organization_dashboard.clear()
-    fetch_organization_projects_summary.clear()
-    fetch_organization_users_summary.clear()
-    fetch_organization_user_detail.clear()
-    fetch_organization_activity.clear()
-    fetch_project_members.clear()
+def _clear_admin_caches(organization_id: str | None, project_id: str | None = None) -> None:
+    tags = [org_tag(organization_id)] if organization_id else []
+    if project_id:
+        tags.append(f"project-members:{project_id}")
+    invalidate_tags(*tags)
 
 
 def _assignable_org_roles(actor_role: str) -> list[str]:
@@ -599,60 +603,74 @@ def _project_health(row: pd.Series, stale_days: int) -> str:
     return "Healthy"
 
 
-def _load_all_projects(headers: dict, organization_id: str) -> dict:
-    first_page = fetch_organization_projects_summary(
-        headers=headers,
-        organization_id=organization_id,
-        status="all",
-        sort="last_activity_at",
-        page=1,
-        page_size=100,
-    )
-    items = list(first_page.get("items", []))
-    total = int(first_page.get("total", len(items)))
-    pages = max((total - 1) // 100 + 1, 1)
-    for page in range(2, pages + 1):
-        payload = fetch_organization_projects_summary(
+def _paged_progress(label: str):
+    placeholder = st.empty()
+    state: dict = {"loaded": 0, "total": 0, "frame": None}
+
+    def _render() -> None:
+        if state["total"] <= ADMIN_PAGE_SIZE:
+            return
+        with placeholder.container():
+            st.progress(
+                min(state["loaded"] / max(state["total"], 1), 1.0),
+                text=f"Loading {label}: {state['loaded']:,} of {state['total']:,}",
+            )
+            if state["frame"] is not None:
+                st.dataframe(state["frame"], hide_index=True, width="stretch")
+
+    def _update(loaded: int, total: int) -> None:
+        state["loaded"], state["total"] = loaded, total
+        _render()
+
+    def _preview(frame: pd.DataFrame) -> None:
+        # Rows in page order so far; replaced by the full table once every page lands.
+        state["frame"] = frame
+        _render()
+
+    return placeholder, _update, _preview
+
+
+def _load_all_projects(headers: dict, organization_id: str) -> pd.DataFrame:
+    placeholder, on_progress, on_frame = _paged_progress("projects")
+    frame = fetch_all_pages_frame(
+        lambda page: fetch_organization_projects_summary(
             headers=headers,
             organization_id=organization_id,
             status="all",
             sort="last_activity_at",
             page=page,
-            page_size=100,
-        )
-        items.extend(payload.get("items", []))
-    first_page["items"] = items
-    return first_page
+            page_size=ADMIN_PAGE_SIZE,
+        ),
+        page_size=ADMIN_PAGE_SIZE,
+        max_workers=ADMIN_PAGE_WORKERS,
+        on_progress=on_progress,
+        on_frame=on_frame,
+    )
+    placeholder.empty()
+    return frame
 
 
-def _load_all_users(headers: dict, organization_id: str) -> dict:
-    first_page = fetch_organization_users_summary(
-        headers=headers,
-        organization_id=organization_id,
-        status="all",
-        sort="last_login_at",
-        page=1,
-        page_size=100,
-    )
-    items = list(first_page.get("items", []))
-    total = int(first_page.get("total", len(items)))
-    pages = max((total - 1) // 100 + 1, 1)
-    for page in range(2, pages + 1):
-        payload = fetch_organization_users_summary(
+def _load_all_users(headers: dict, organization_id: str) -> pd.DataFrame:
+    placeholder, on_progress, on_frame = _paged_progress("users")
+    frame = fetch_all_pages_frame(
+        lambda page: fetch_organization_users_summary(
             headers=headers,
             organization_id=organization_id,
             status="all",
             sort="last_login_at",
             page=page,
-            page_size=100,
-        )
-        items.extend(payload.get("items", []))
-    first_page["items"] = items
-    return first_page
+            page_size=ADMIN_PAGE_SIZE,
+        ),
+        page_size=ADMIN_PAGE_SIZE,
+        max_workers=ADMIN_PAGE_WORKERS,
+        on_progress=on_progress,
+        on_frame=on_frame,
+    )
+    placeholder.empty()
+    return frame
 
 
-def _project_dataframe(items: list[dict[str, Any]], timezone: ZoneInfo, stale_days: int) -> pd.DataFrame:
-    df = pd.DataFrame(items or [])
+def _project_dataframe(df: pd.DataFrame, timezone: ZoneInfo, stale_days: int) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(
             columns=[
@@ -684,8 +702,7 @@ def _project_dataframe(items: list[dict[str, Any]], timezone: ZoneInfo, stale_da
     return df
 
 
-def _user_dataframe(items: list[dict[str, Any]], timezone: ZoneInfo) -> pd.DataFrame:
-    df = pd.DataFrame(items or [])
+def _user_dataframe(df: pd.DataFrame, timezone: ZoneInfo) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame(
             columns=[
@@ -784,6 +801,96 @@ def _render_activity_feed(items: list[dict[str, Any]], timezone: ZoneInfo) -> No
         )
 
 
+def _render_backend_metrics_panel() -> None:
+    metrics = get_backend_metrics()
+    rows = metrics.snapshot()
+    if not rows:
+        st.info("No backend calls have been recorded in this process yet.")
+    else:
+        endpoints_df = pd.DataFrame(rows)
+        for column in ("latency_avg_s", "latency_p50_s", "latency_p95_s", "latency_p99_s"):
+            endpoints_df[column] = (pd.to_numeric(endpoints_df[column], errors="coerce") * 1000).round(1)
+        endpoints_df["avg_kb"] = (endpoints_df["response_bytes"] / endpoints_df["count"].clip(lower=1) / 1024).round(1)
+        endpoints_df["status_codes"] = endpoints_df["status_codes"].map(
+            lambda codes: ", ".join(f"{status}: {count}" for status, count in sorted(codes.items()))
+        )
+        st.dataframe(
+            endpoints_df.sort_values("latency_p95_s", ascending=False)[
+                [
+                    "method",
+                    "endpoint",
+                    "count",
+                    "latency_p50_s",
+                    "latency_p95_s",
+                    "latency_p99_s",
+                    "avg_kb",
+                    "status_codes",
+                    "retries",
+                    "cache_hits",
+                    "cache_misses",
+                ]
+            ].rename(
+                columns={
+                    "method": "Method",
+                    "endpoint": "Endpoint",
+                    "count": "Calls",
+                    "latency_p50_s": "p50 (ms)",
+                    "latency_p95_s": "p95 (ms)",
+                    "latency_p99_s": "p99 (ms)",
+                    "avg_kb": "Avg KB",
+                    "status_codes": "Status codes",
+                    "retries": "Retries",
+                    "cache_hits": "Cache hits",
+                    "cache_misses": "Cache misses",
+                }
+            ),
+            width="stretch",
+            hide_index=True,
+        )
+
+    cache_left, cache_right = st.columns(2)
+    with cache_left:
+        st.markdown("##### Cache tags")
+        tag_stats = cache_tag_stats()
+        if tag_stats:
+            st.dataframe(
+                pd.DataFrame.from_dict(tag_stats, orient="index").rename_axis("Tag").reset_index(),
+                width="stretch",
+                hide_index=True,
+            )
+        else:
+            st.caption("No tagged cache activity yet.")
+        flights = single_flight_stats()
+        if flights:
+            st.markdown("##### Coalesced requests")
+            st.dataframe(
+                pd.DataFrame.from_dict(flights, orient="index").rename_axis("Endpoint").reset_index(),
+                width="stretch",
+                hide_index=True,
+            )
+    with cache_right:
+        st.markdown("##### Shared reference cache")
+        st.json(reference_cache_stats(), expanded=False)
+
+    export_json, export_prom = st.columns(2)
+    with export_json:
+        st.download_button(
+            "Download JSON",
+            data=metrics.to_json(),
+            file_name="ganttbuddy_backend_metrics.json",
+            mime="application/json",
+            width="stretch",
+        )
+    with export_prom:
+        st.download_button(
+            "Download Prometheus text",
+            data=metrics.to_prometheus(),
+            file_name="ganttbuddy_backend_metrics.prom",
+            mime="text/plain",
+            width="stretch",
+        )
+
+
 def _render_section_header(org_name: str, eyebrow: str, title: str, copy: str) -> None:
     st.markdown(
         f"""
@@ -995,7 +1102,7 @@ def _render_project_membership_editor(
                     except Exception as exc:
                         st.error(f"Unable to update project role: {exc}")
                     else:
-                        _clear_admin_caches()
+                        _clear_admin_caches(scoped_headers.get("X-Organization-Id"), project_id)
                         st.success(f"Updated {selected_member['name']} to {project_role_label(target_role)}.")
                         st.rerun()
             with action_right:
@@ -1015,7 +1122,7 @@ def _render_project_membership_editor(
                     except Exception as exc:
                         st.error(f"Unable to remove project member: {exc}")
                     else:
-                        _clear_admin_caches()
+                        _clear_admin_caches(scoped_headers.get("X-Organization-Id"), project_id)
                         st.success(f"Removed {selected_member['name']} from the project.")
                         st.rerun()
                 if remove_disabled:
@@ -1063,7 +1170,7 @@ def _render_project_membership_editor(
                 except Exception as exc:
                     st.error(f"Unable to add project member: {exc}")
                 else:
-                    _clear_admin_caches()
+                    _clear_admin_caches(scoped_headers.get("X-Organization-Id"), project_id)
                     st.success(f"Added {selected_candidate['name']} as {project_role_label(add_role)}.")
                     st.rerun()
 
@@ -1266,7 +1373,7 @@ def _render_users_page(
                 except Exception as exc:
                     st.error(f"Unable to update org role: {exc}")
                 else:
-                    _clear_admin_caches()
+                    _clear_admin_caches(organization_id)
                     st.success(f"Updated {selected_user['name']} to {target_role}.")
                     st.rerun()
 
@@ -1379,8 +1486,8 @@ def render_admin_overview() -> None:
 
     try:
         dashboard = fetch_organization_dashboard(headers=ctx.scoped_headers, organization_id=ctx.organization_id)
-        projects_payload = _load_all_projects(ctx.scoped_headers, ctx.organization_id)
-        users_payload = _load_all_users(ctx.scoped_headers, ctx.organization_id)
+        projects_frame = _load_all_projects(ctx.scoped_headers, ctx.organization_id)
+        users_frame = _load_all_users(ctx.scoped_headers, ctx.organization_id)
         activity_payload = fetch_organization_activity(
             headers=ctx.scoped_headers,
             organization_id=ctx.organization_id,
@@ -1392,8 +1499,8 @@ def render_admin_overview() -> None:
 
     organization = dashboard.get("organization", {})
     kpis = _kpi_lookup(dashboard.get("kpis", []))
-    projects_df = _project_dataframe(projects_payload.get("items", []), ctx.timezone, ctx.stale_days)
-    users_df = _user_dataframe(users_payload.get("items", []), ctx.timezone)
+    projects_df = _project_dataframe(projects_frame, ctx.timezone, ctx.stale_days)
+    users_df = _user_dataframe(users_frame, ctx.timezone)
     as_of = _format_ts(dashboard.get("as_of"), ctx.timezone)
 
     dau_df = _series_df(dashboard.get("daily_active_users", []), ctx.timezone, "Daily active users")
@@ -1535,19 +1642,22 @@ def render_admin_overview() -> None:
     with st.expander("Recent activity feed", expanded=False):
         _render_activity_feed(activity_payload.get("items", []), ctx.timezone)
 
+    with st.expander("Backend client metrics", expanded=False):
+        _render_backend_metrics_panel()
+
 
 def render_admin_projects() -> None:
     ctx = get_admin_context(show_stale_days=True)
 
     try:
-        projects_payload = _load_all_projects(ctx.scoped_headers, ctx.organization_id)
-        users_payload = _load_all_users(ctx.scoped_headers, ctx.organization_id)
+        projects_frame = _load_all_projects(ctx.scoped_headers, ctx.organization_id)
+        users_frame = _load_all_users(ctx.scoped_headers, ctx.organization_id)
     except Exception as exc:
         st.error(f"Unable to load admin project data: {exc}")
         return
 
-    projects_df = _project_dataframe(projects_payload.get("items", []), ctx.timezone, ctx.stale_days)
-    users_df = _user_dataframe(users_payload.get("items", []), ctx.timezone)
+    projects_df = _project_dataframe(projects_frame, ctx.timezone, ctx.stale_days)
+    users_df = _user_dataframe(users_frame, ctx.timezone)
     org_name = ctx.membership.organization.name if ctx.membership.organization else "Organization"
 
     _render_section_header(
@@ -1588,12 +1698,12 @@ def render_admin_users() -> None:
     ctx = get_admin_context(show_stale_days=False)
 
     try:
-        users_payload = _load_all_users(ctx.scoped_headers, ctx.organization_id)
+        users_frame = _load_all_users(ctx.scoped_headers, ctx.organization_id)
     except Exception as exc:
         st.error(f"Unable to load admin user data: {exc}")
         return
 
-    users_df = _user_dataframe(users_payload.get("items", []), ctx.timezone)
+    users_df = _user_dataframe(users_frame, ctx.timezone)
     org_name = ctx.membership.organization.name if ctx.membership.organization else "Organization"
 
     _render_section_header(
@@ -9,7 +9,7 @@ from ui.utils.timezones import from_datetime_input_value, to_datetime_input_valu
 import time
 from datetime import datetime, timedelta
 
-from logic.gantt_builder import build_timeline, build_gantt_df # need to clear cache when task updated.
+from logic.cache_registry import gantt_tag, invalidate_tags # need to clear cache when task updated.
 from logic.backend.project_permissions import project_is_read_only
 
 def is_timezone_aware(dt):
@@ -277,8 +277,7 @@ def render_task_edit(session, phase: Phase, task: Task):
         
         # clear timeline cache on edit to force regeneration of gantt.
         # previously, changes weren't reflected.
-        build_timeline.clear()
-        build_gantt_df.clear()
+        invalidate_tags(gantt_tag(session.project.uuid))
 
         time.sleep(1)
         st.rerun()
@@ -293,8 +292,7 @@ def render_task_edit(session, phase: Phase, task: Task):
 
         st.info(f'\'{name}\' deleted. {predecessors_had} Tasks were preceded.')
 
-        build_timeline.clear()
-        build_gantt_df.clear()
+        invalidate_tags(gantt_tag(session.project.uuid))
         time.sleep(1)
         st.rerun()
 
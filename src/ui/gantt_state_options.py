@@ -2,9 +2,10 @@ import streamlit as st
 
 from models.delay import DelayEditorRow, DelayType
 from models.gantt_state import GanttState
+from models.signals import SignalDefinition
 from logic.gantt_builder import _normalize_delay_type
 
-def render_gantt_options(state: GanttState, delay_rows: list[DelayEditorRow]):
+def render_gantt_options(state: GanttState, delay_rows: list[DelayEditorRow], signals: list[SignalDefinition] | None = None):
     st.subheader("Gantt Chart Options")
     c1, c2 = st.columns(2,border=True)
     with c1:
@@ -52,6 +53,17 @@ def render_gantt_options(state: GanttState, delay_rows: list[DelayEditorRow]):
         )
         
 
+    if signals:
+        signal_ids = [None] + [signal.id for signal in signals]
+        names = {signal.id: signal.display_name for signal in signals}
+        state.signal_overlay_id = st.selectbox(
+            "Signal summary in task hover",
+            options=signal_ids,
+            index=signal_ids.index(state.signal_overlay_id) if state.signal_overlay_id in signal_ids else 0,
+            format_func=lambda signal_id: "None" if signal_id is None else names[signal_id],
+            key="gantt_option_signal_overlay",
+        )
+
     state.shade_non_working_time = st.checkbox(
         label="Shade Non-Working Time",
         value=state.shade_non_working_time,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import streamlit as st
 
+from logic.cache_registry import invalidate_tags, project_tag
 from logic.load_project import ExcelProjectLoader, ExcelParameters, DataColumn
 
 
@@ -181,5 +182,5 @@ def render_excel_import_page() -> None:
                 elif "reline_metadata" in st.session_state:
                     del st.session_state["reline_metadata"]
 
-                st.cache_data.clear()
+                invalidate_tags(project_tag(project.uuid))
                 st.switch_page("pages/plan.py")
@@ -8,6 +8,7 @@ from logic.backend.project_list import get_projects
 from logic.backend.api_client import fetch_project_snapshot
 from logic.backend.import_project import snapshot_to_project
 from logic.backend.project_permissions import resolve_project_access, store_project_access
+from logic.cache_registry import invalidate_tags, project_tag
 
 @st.dialog(f":material/open_in_browser: Load Saved Project")
 def render_load_project() -> Project:
@@ -83,5 +84,5 @@ def render_load_project() -> Project:
     st.session_state["selected_project_id"] = selected_project_id
     st.session_state.plan_state = PlanState(project_id=selected_project_id)
     st.success(f"*{projects[selected_project_id]}* Loaded Successfully!")
-    st.cache_data.clear()
+    invalidate_tags(project_tag(selected_project_id))
     st.switch_page("pages/plan.py")
@@ -14,6 +14,9 @@ from ui.gantt_state_options import render_gantt_options
 from models.project import Project
 from logic.gantt_builder import build_timeline, _normalize_delay_type, _prep_delay_windows
 from logic.backend.delays import get_delays
+from logic.backend.signals import fetch_signal_definitions
+from logic.feature_flags import signals_enabled
+from logic.signal_join import signal_hover_text, task_signal_aggregates, task_windows, window_key
 
 from streamlit_plotly_events2 import plotly_events 
 from zoneinfo import ZoneInfo
@@ -94,7 +97,7 @@ def render_gantt_with_click_selection(fig, project_id: str, key: str = "gantt"):
         return
 
     # customdata schema (from your build_timeline custom_data list):
-    # [Label, Start_str, Finish_str, Type, UUID, Level, PhaseID, Status, PlannedDur_str, ActualDur_str, IsMilestone]
+    # [Label, Start_str, Finish_str, Type, UUID, Level, PhaseID, Status, PlannedDur_str, ActualDur_str, IsMilestone, SignalSummary]
     uuid = cd[4]
     level = cd[5]
     phase_id = cd[6]
@@ -178,8 +181,15 @@ def render_gantt(session):
 
     delay_rows = delay_rows_tz(delay_rows_naive)
 
+    signals = []
+    if signals_enabled():
+        try:
+            signals = fetch_signal_definitions(st.session_state.get("auth_headers", {}), str(session.project.uuid))
+        except Exception:
+            signals = []
+
     with st.popover(label="Gantt Chart Options"):
-        render_gantt_options(st.session_state.gantt_state, delay_rows=delay_rows)
+        render_gantt_options(st.session_state.gantt_state, delay_rows=delay_rows, signals=signals)
 
     delay_windows = None
     if delay_rows and st.session_state.gantt_state.show_delay_windows:
@@ -189,6 +199,21 @@ def render_gantt(session):
 
     selected_proj = session.project if not phase_view else phase_view
 
+    signal_stats = None
+    overlay = next((item for item in signals if item.id == st.session_state.gantt_state.signal_overlay_id), None)
+    if overlay is not None:
+        try:
+            aggregates = task_signal_aggregates(
+                st.session_state.get("auth_headers", {}),
+                str(session.project.uuid),
+                overlay.id,
+                overlay.data_type,
+                window_key(task_windows(session.project)),
+            )
+            signal_stats = signal_hover_text(aggregates, overlay)
+        except Exception as exc:
+            st.warning(f"Could not load {overlay.name} for the task hover: {exc}")
+
     selected_uuid = st.session_state.get("gantt_selected_uuid", None)
 
     inputs_for_plot = copy.copy(st.session_state.gantt_state)
@@ -203,6 +228,7 @@ def render_gantt(session):
             inputs=inputs_for_plot,
             selected_uuid=selected_uuid, # phase or task uuid to highlight.
             delay_windows=delay_windows,
+            signal_stats=signal_stats,
         )
     except ValueError as e:
         st.info(f"Add some tasks to your project to view the Gantt chart.")
@@ -22,21 +22,24 @@ from logic.backend.signals import (
     fetch_ingestion_runs,
     fetch_signal_definitions,
     fetch_signal_intervals,
-    fetch_signal_observations,
     intervals_to_frame,
-    observations_to_frame,
     rollback_ingestion_run,
     test_data_source,
     trigger_manual_ingestion,
     update_data_source,
     update_signal_definition,
 )
+from logic.backend.observation_upload import observation_records, prepare_observations, upload_observation_file
+from logic.backend.signal_series import fetch_observation_frame
+from logic.downsample import downsample_observations
 from models.session import SessionModel
 from models.signals import DataSource, DataSourceType, SignalDataType, SignalDefinition, SignalValueMode
 
 
 SOURCE_SELECT_KEY = "signals_selected_source_id"
 SIGNAL_SELECT_KEY = "signals_selected_signal_id"
+# The chart sits in the wider of two columns on a wide-layout page.
+OBSERVATION_CHART_WIDTH_PX = 900
 
 
 def _signals_css() -> None:
@@ -193,48 +196,19 @@ def _sample_editor_rows(signal: SignalDefinition, timezone, rows: int = 6) -> pd
 
 
 def _rows_to_observations(df: pd.DataFrame, signal: SignalDefinition, timezone) -> list[dict[str, Any]]:
-    records = []
-    for row in df.to_dict(orient="records"):
-        timestamp_local = row.get("timestamp_local")
-        if pd.isna(timestamp_local) or timestamp_local is None:
-            continue
-        if hasattr(timestamp_local, "to_pydatetime"):
-            timestamp_local = timestamp_local.to_pydatetime()
-        if timestamp_local.tzinfo is None:
-            timestamp_local = timestamp_local.replace(tzinfo=timezone)
-
-        payload: dict[str, Any] = {
-            "timestamp_utc": timestamp_local.astimezone(dt.UTC).isoformat().replace("+00:00", "Z"),
-            "quality_code": row.get("quality_code") or None,
-            "source_record_key": row.get("source_record_key") or None,
-        }
-        if signal.data_type == SignalDataType.NUMERIC:
-            numeric_value = row.get("numeric_value")
-            if pd.isna(numeric_value) or numeric_value is None:
-                continue
-            payload["numeric_value"] = float(numeric_value)
-        elif signal.data_type == SignalDataType.BOOLEAN:
-            boolean_value = str(row.get("boolean_value") or "").strip().lower()
-            if boolean_value not in {"true", "false"}:
-                continue
-            payload["boolean_value"] = boolean_value == "true"
-        else:
-            text_value = str(row.get("text_value") or "").strip()
-            if not text_value:
-                continue
-            payload["text_value"] = text_value
-        records.append(payload)
-    return records
+    return observation_records(prepare_observations(df, signal.data_type, timezone=timezone))
 
 
 def _render_observation_chart(df: pd.DataFrame, signal: SignalDefinition) -> None:
     if df.empty:
         st.info("No observations yet. Add a few rows below to create the first dataset for this signal.")
         return
+    chart_df = downsample_observations(df, signal.data_type, width_px=OBSERVATION_CHART_WIDTH_PX)
+    downsampled = len(chart_df) < len(df)
     if signal.data_type == SignalDataType.NUMERIC:
         chart = (
-            alt.Chart(df)
-            .mark_line(point=True, strokeWidth=3, color="#215ca3")
+            alt.Chart(chart_df)
+            .mark_line(point=not downsampled, strokeWidth=3, color="#215ca3")
             .encode(
                 x=alt.X("timestamp_local:T", title="Timestamp"),
                 y=alt.Y("value:Q", title=signal.unit or signal.name),
@@ -244,7 +218,7 @@ def _render_observation_chart(df: pd.DataFrame, signal: SignalDefinition) -> Non
         )
     else:
         chart = (
-            alt.Chart(df)
+            alt.Chart(chart_df)
             .mark_circle(size=110, color="#c46a1a")
             .encode(
                 x=alt.X("timestamp_local:T", title="Timestamp"),
@@ -254,6 +228,8 @@ def _render_observation_chart(df: pd.DataFrame, signal: SignalDefinition) -> Non
             .properties(height=280)
         )
     st.altair_chart(chart, use_container_width=True)
+    if downsampled:
+        st.caption(f"Chart shows {len(chart_df):,} of {len(df):,} points; the table and download keep every row.")
 
 
 def _get_selected_source(data_sources: list[DataSource]) -> DataSource | None:
@@ -591,27 +567,43 @@ def _render_observation_step(
     default_start = default_end - dt.timedelta(days=7)
     start_local = c1.datetime_input("Window start", value=default_start, step=dt.timedelta(minutes=15), key="signals_window_start")
     end_local = c2.datetime_input("Window end", value=default_end, step=dt.timedelta(minutes=15), key="signals_window_end")
-    limit = c3.number_input("Limit", min_value=50, max_value=5000, value=500, step=50, key="signals_window_limit")
+    limit = c3.number_input("Limit", min_value=50, max_value=200_000, value=500, step=500, key="signals_window_limit")
     start_utc, end_utc = as_project_utc_window(start_local, end_local, timezone=timezone)
 
     try:
-        observations = fetch_signal_observations(headers, project_id, selected_signal.id, start=start_utc, end=end_utc, limit=int(limit))
+        df = fetch_observation_frame(
+            headers,
+            project_id,
+            selected_signal.id,
+            timezone=timezone,
+            data_type=selected_signal.data_type,
+            start=start_utc,
+            end=end_utc,
+            max_rows=int(limit),
+        )
     except Exception as exc:
         st.error(str(exc))
         return
 
-    df = observations_to_frame(observations, timezone=timezone, data_type=selected_signal.data_type)
     left, right = st.columns([1.35, 1])
     with left:
         _render_observation_chart(df, selected_signal)
     with right:
-        st.metric("Rows in window", len(observations))
+        st.metric("Rows in window", len(df))
         st.metric("Data type", _pretty_enum(selected_signal.data_type.value))
         source_name = next((item.name for item in data_sources if item.id == selected_signal.data_source_id), "Unlinked")
         st.metric("Linked source", source_name)
 
     display_df = df[["timestamp_local", "value", "quality_code", "source_record_key", "ingestion_run_id"]] if not df.empty else df
     st.dataframe(display_df, hide_index=True, use_container_width=True)
+    if not df.empty:
+        st.download_button(
+            "Download observations (CSV)",
+            data=display_df.to_csv(index=False).encode("utf-8"),
+            file_name=f"{selected_signal.key}_observations.csv",
+            mime="text/csv",
+            key=f"download_obs_{selected_signal.id}",
+        )
 
     submitted_df = _observation_editor(selected_signal, timezone, key_prefix="signals_observations", submit_label="Create observation batch")
     if submitted_df is not None:
@@ -626,7 +618,9 @@ def _render_observation_step(
         except Exception as exc:
             st.error(str(exc))
 
-    delete_col, _ = st.columns([1, 1])
+    delete_col, upload_col = st.columns([1, 1])
+    with upload_col.popover("Bulk upload file"):
+        _render_bulk_upload(project_id, headers, selected_signal, timezone)
     with delete_col.popover("Delete observations"):
         delete_start = st.datetime_input("Delete start", value=start_local, key=f"delete_obs_start_{selected_signal.id}")
         delete_end = st.datetime_input("Delete end", value=end_local, key=f"delete_obs_end_{selected_signal.id}")
@@ -653,6 +647,41 @@ def _render_observation_step(
             st.error(str(exc))
 
 
+def _render_bulk_upload(project_id: str, headers: dict, signal: SignalDefinition, timezone) -> None:
+    value_column = {
+        SignalDataType.NUMERIC: "numeric_value",
+        SignalDataType.BOOLEAN: "boolean_value",
+    }.get(signal.data_type, "text_value")
+    st.caption(
+        f"CSV or Parquet with `timestamp_local` (or `timestamp_utc`) and `{value_column}` columns; "
+        "`quality_code` and `source_record_key` are optional."
+    )
+    uploaded = st.file_uploader("Observation file", type=["csv", "parquet"], key=f"bulk_obs_file_{signal.id}")
+    if uploaded is None or not st.button("Upload observations", key=f"bulk_obs_btn_{signal.id}"):
+        return
+    progress = st.progress(0.0, text="Uploading observations...")
+    try:
+        report = upload_observation_file(
+            headers,
+            project_id,
+            signal.id,
+            uploaded.getvalue(),
+            name=uploaded.name,
+            data_type=signal.data_type,
+            timezone=timezone,
+            on_progress=lambda done, total: progress.progress(done / max(total, 1), text=f"Uploaded {done:,} of {total:,} rows"),
+        )
+    except Exception as exc:
+        progress.empty()
+        st.error(str(exc))
+        return
+    if report.rows == 0:
+        progress.empty()
+        st.warning("No complete observation rows found in the file.")
+        return
+    st.success(f"Uploaded {report.rows:,} observations in {report.chunks} chunks ({report.rows_per_second:,.0f} rows/s).")
+
+
 def _render_ingestion_step(
     project_id: str,
     headers: dict,
@@ -1,5 +1,4 @@
 import streamlit as st
-from io import BytesIO
 
 import datetime as dt
 
@@ -81,13 +80,10 @@ def render_project_buttons(session):
                     project=session.project, 
                     excel_format=ExcelFormat()
                 )
-                wb = writer.write_project()
-                buffer = BytesIO()
-                wb.save(buffer)
-                buffer.seek(0)
+                data = writer.to_xlsx_bytes()
                 if st.download_button(
                     ":material/file_download: Excel",
-                    data=buffer,
+                    data=data,
                     file_name=f"{session.project.name}.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 ):
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.cache_registry import CacheRegistry, project_tag, tagged_cache_data
+
+
+def test_invalidate_drops_only_matching_project_entries() -> None:
+    registry = CacheRegistry()
+    calls: list[str] = []
+
+    @tagged_cache_data("project:{project_id}", registry=registry)
+    def load_snapshot(project_id: str, headers: dict) -> str:
+        calls.append(project_id)
+        return f"snapshot-{project_id}"
+
+    headers = {"Authorization": "Bearer a"}
+    load_snapshot("p1", headers)
+    load_snapshot("p2", headers)
+    load_snapshot("p1", headers)
+
+    assert calls == ["p1", "p2"]
+
+    evicted = registry.invalidate(project_tag("p1"))
+    load_snapshot("p1", headers)
+    load_snapshot("p2", headers)
+
+    assert evicted == 1
+    assert calls == ["p1", "p2", "p1"]
+    stats = registry.stats()
+    assert stats["project:p1"] == {"hits": 1, "misses": 2, "evictions": 1}
+    assert stats["project:p2"] == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_tags_resolve_attribute_templates_and_static_tags() -> None:
+    registry = CacheRegistry()
+    calls: list[str] = []
+
+    @tagged_cache_data("gantt:{project.uuid}", "reference", registry=registry)
+    def build(project, show_actual: bool = False) -> str:
+        calls.append(project.uuid)
+        return project.uuid
+
+    project = SimpleNamespace(uuid="abc")
+    build(project)
+    registry.invalidate("reference")
+    build(project)
+
+    assert calls == ["abc", "abc"]
+    assert set(registry.stats()) == {"gantt:abc", "reference"}
+
+
+def test_overflowed_tags_fall_back_to_full_clear() -> None:
+    registry = CacheRegistry(max_tracked_entries=2)
+    calls: list[int] = []
+
+    @tagged_cache_data("project:{project_id}", registry=registry)
+    def fetch(project_id: int) -> int:
+        calls.append(project_id)
+        return project_id
+
+    for project_id in (1, 2, 3):
+        fetch(project_id)
+
+    # Only the untracked call's tag needs the whole function cleared.
+    registry.invalidate(project_tag(99))
+    registry.invalidate(project_tag(2))
+    fetch(1)
+    assert calls == [1, 2, 3]
+
+    registry.invalidate(project_tag(3))
+    fetch(1)
+    assert calls == [1, 2, 3, 1]
+
+
+def test_model_arguments_edited_in_place_are_cleared_with_their_function() -> None:
+    registry = CacheRegistry()
+    calls: list[str] = []
+
+    @tagged_cache_data("gantt:{project.uuid}", registry=registry)
+    def build(project) -> str:
+        calls.append(project.name)
+        return project.name
+
+    @tagged_cache_data("project:{project_id}", registry=registry)
+    def fetch(project_id: str) -> str:
+        calls.append(project_id)
+        return project_id
+
+    project = SimpleNamespace(uuid="abc", name="before")
+    build(project)
+    fetch("abc")
+    # The caller edits the project before invalidating, so its hash no longer matches the entry.
+    project.name = "after"
+    registry.invalidate("gantt:abc")
+    project.name = "before"
+    build(project)
+    fetch("abc")
+
+    assert calls == ["before", "abc", "before"]
+    # Model arguments are not kept alive by the registry.
+    assert registry.tracked_entries() == {
+        f"{__name__}.test_model_arguments_edited_in_place_are_cleared_with_their_function.<locals>.build": 0,
+        f"{__name__}.test_model_arguments_edited_in_place_are_cleared_with_their_function.<locals>.fetch": 1,
+    }
+    assert registry.stats()["gantt:abc"]["evictions"] == 1
+
+
+def test_underscore_arguments_stay_out_of_the_tracked_key() -> None:
+    registry = CacheRegistry()
+    calls: list[str] = []
+
+    @tagged_cache_data("gantt:{project_id}", registry=registry)
+    def build(project_id: str, version: int, _project) -> str:
+        calls.append(project_id)
+        return _project.name
+
+    first, second = SimpleNamespace(name="a"), SimpleNamespace(name="b")
+    build("a", 1, first)
+    build("b", 1, second)
+    registry.invalidate("gantt:a")
+    build("a", 1, first)
+    build("b", 1, second)
+
+    assert calls == ["a", "b", "a"]
+    assert list(registry.tracked_entries().values()) == [2]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend import delays as delays_module
+from logic.backend.delays import DelayStore, delays_tag
+
+BASE = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+
+
+def _delay(i: int, *, hours: float, minutes: int = 30) -> dict:
+    start = BASE + dt.timedelta(hours=hours)
+    return {
+        "id": f"d{i}",
+        "project_id": "p1",
+        "delay_type": "EQUIPMENT" if i % 2 else "SAFETY",
+        "duration_minutes": minutes,
+        "description": "",
+        "start_dt": start.isoformat(),
+        "end_dt": (start + dt.timedelta(minutes=minutes)).isoformat(),
+        "shift_assignment_id": None,
+        "created_by": "u1",
+        "created_at": start.isoformat(),
+        "updated_at": None,
+        "updated_by": None,
+    }
+
+
+class FakeDelays:
+    """Overlap filtering, ascending by start, then offset and limit, like the backend."""
+
+    def __init__(
+        self,
+        rows: list[dict],
+        *,
+        newest_first: bool = False,
+        ignores_order: bool = False,
+        ignores_offset: bool = False,
+    ):
+        self.rows = rows
+        self.newest_first = newest_first
+        self.ignores_order = ignores_order
+        self.ignores_offset = ignores_offset
+        self.calls: list[tuple[dt.datetime | None, dt.datetime | None]] = []
+
+    def __call__(self, *, headers, project_id, time_min=None, time_max=None, limit=200, offset=None, **kwargs):
+        self.calls.append((time_min, time_max))
+        rows = self.rows if self.ignores_order else sorted(self.rows, key=lambda r: r["start_dt"], reverse=self.newest_first)
+        out = []
+        for row in rows:
+            start = dt.datetime.fromisoformat(row["start_dt"])
+            end = dt.datetime.fromisoformat(row["end_dt"])
+            if time_min is not None and end < time_min:
+                continue
+            if time_max is not None and start > time_max:
+                continue
+            out.append(row)
+        start = 0 if self.ignores_offset else offset or 0
+        return out[start : start + limit]
+
+
+@pytest.fixture(autouse=True)
+def _scope(monkeypatch) -> None:
+    monkeypatch.setattr(delays_module, "project_access_scope", lambda headers, project_id: "scope")
+
+
+def test_unbounded_read_pages_past_the_row_limit() -> None:
+    fake = FakeDelays([_delay(i, hours=i) for i in range(23)])
+    store = DelayStore(fetch=fake, page_size=5, max_workers=1)
+
+    delays = store.get({}, "p1")
+
+    assert [d.id for d in delays] == [f"d{i}" for i in range(23)]
+
+
+def test_unbounded_read_is_paged_without_slicing() -> None:
+    # Two years of delays, one a week: pages follow the data, not the calendar.
+    fake = FakeDelays([_delay(i, hours=24 * 7 * i) for i in range(104)])
+    store = DelayStore(fetch=fake, page_size=200)
+
+    delays = store.get({}, "p1", time_min=BASE)
+
+    assert len(delays) == 104
+    assert fake.calls == [(BASE, None)]
+
+
+@pytest.mark.parametrize(
+    "fake",
+    [
+        FakeDelays([_delay(i, hours=i) for i in range(12)], newest_first=True),
+        FakeDelays([_delay(i, hours=1) for i in range(12)]),
+    ],
+    ids=["newest-first", "shared-start"],
+)
+def test_pages_the_cursor_cannot_follow_fall_back_to_offset_paging(fake, caplog) -> None:
+    store = DelayStore(fetch=fake, page_size=5, max_workers=1)
+
+    delays = store.get({}, "p1")
+
+    assert sorted(d.id for d in delays) == sorted(f"d{i}" for i in range(12))
+    assert "Cannot keyset-page delays for p1" in caplog.text
+
+    fake.calls.clear()
+    assert len(store.get({}, "p1")) == 12
+    assert fake.calls == []
+
+
+def test_backend_that_ignores_order_is_read_to_the_end() -> None:
+    # Backend order is by id, not start, and there are more rows than one page.
+    rows = [_delay(i, hours=(7 * i) % 23) for i in range(23)]
+    fake = FakeDelays(rows, ignores_order=True)
+    store = DelayStore(fetch=fake, page_size=5, max_workers=1)
+
+    delays = store.get({}, "p1")
+
+    assert sorted(d.id for d in delays) == sorted(row["id"] for row in rows)
+    fake.calls.clear()
+    store.get({}, "p1")
+    assert fake.calls == []
+
+
+def test_range_read_only_in_part_is_not_cached(caplog) -> None:
+    rows = [_delay(i, hours=(7 * i) % 23) for i in range(23)]
+    fake = FakeDelays(rows, ignores_order=True, ignores_offset=True)
+    store = DelayStore(fetch=fake, page_size=5, max_workers=1)
+
+    delays = store.get({}, "p1")
+
+    assert 5 <= len(delays) < 23
+    assert "Cannot page delays for p1 by offset" in caplog.text
+    fake.calls.clear()
+    store.get({}, "p1")
+    assert fake.calls
+
+
+def test_only_uncovered_windows_go_to_the_network() -> None:
+    fake = FakeDelays([_delay(i, hours=i) for i in range(48)])
+    store = DelayStore(fetch=fake, page_size=100)
+
+    first = store.get({}, "p1", time_min=BASE, time_max=BASE + dt.timedelta(hours=10))
+    assert [d.id for d in first] == [f"d{i}" for i in range(11)]
+
+    fake.calls.clear()
+    inner = store.get({}, "p1", time_min=BASE + dt.timedelta(hours=2), time_max=BASE + dt.timedelta(hours=5))
+    assert [d.id for d in inner] == ["d2", "d3", "d4", "d5"]
+    assert fake.calls == []
+
+    wider = store.get({}, "p1", time_min=BASE + dt.timedelta(hours=5), time_max=BASE + dt.timedelta(hours=20))
+    assert fake.calls == [(BASE + dt.timedelta(hours=10), BASE + dt.timedelta(hours=20))]
+    assert [d.id for d in wider] == [f"d{i}" for i in range(5, 21)]
+
+
+def test_wide_windows_are_sliced_and_fetched_concurrently() -> None:
+    fake = FakeDelays([_delay(i, hours=12 * i, minutes=24 * 60) for i in range(60)])
+    store = DelayStore(fetch=fake, page_size=4, slice_width=dt.timedelta(days=5))
+
+    delays = store.get({}, "p1", time_min=BASE, time_max=BASE + dt.timedelta(days=30))
+
+    assert [d.id for d in delays] == [f"d{i}" for i in range(60)]
+    assert len(fake.calls) > 6
+
+
+def test_tag_invalidation_drops_cached_project() -> None:
+    fake = FakeDelays([_delay(0, hours=1)])
+    store = DelayStore(fetch=fake)
+    store.get({}, "p1")
+
+    fake.rows.append(_delay(1, hours=2))
+    assert len(store.get({}, "p1")) == 1
+    store.invalidate_tags(frozenset({delays_tag("p1")}))
+
+    assert len(store.get({}, "p1")) == 2
+
+
+def test_get_delays_filters_and_localizes(monkeypatch) -> None:
+    fake = FakeDelays([_delay(i, hours=i) for i in range(6)])
+    monkeypatch.setattr(delays_module, "_store", DelayStore(fetch=fake))
+    tz = ZoneInfo("America/Vancouver")
+
+    delays = delays_module.get_delays({}, "p1", tz, delay_type=delays_module.DelayType.EQUIPMENT)
+
+    assert [d.id for d in delays] == ["d1", "d3", "d5"]
+    assert delays[0].start_dt.tzinfo == tz
+    assert delays_module._store.get({}, "p1")[1].start_dt.tzinfo == dt.UTC
+
+
+def test_get_delays_logs_backend_failures(monkeypatch, caplog) -> None:
+    def fail(**kwargs):
+        raise ConnectionError("backend down")
+
+    monkeypatch.setattr(delays_module, "_store", DelayStore(fetch=fail))
+
+    assert delays_module.get_delays({}, "p1", dt.UTC) == []
+    assert "Failed to load delays for project p1" in caplog.text
+    assert "backend down" in caplog.text
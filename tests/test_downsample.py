@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.downsample import downsample_observations, lttb_indices, minmax_indices, run_length_indices
+from models.signals import SignalDataType
+
+
+def _frame(values, *, freq: str = "1min") -> pd.DataFrame:
+    stamps = pd.date_range("2025-03-01", periods=len(values), freq=freq, tz="UTC")
+    df = pd.DataFrame({"timestamp_utc": stamps, "value": values})
+    df["value_label"] = df["value"].astype(str)
+    return df
+
+
+def test_lttb_keeps_ends_and_spikes() -> None:
+    n = 10_000
+    y = np.zeros(n)
+    y[1234] = 50.0
+    y[8765] = -50.0
+
+    selected = lttb_indices(np.arange(n, dtype=float), y, 200)
+
+    assert len(selected) == 200
+    assert selected[0] == 0 and selected[-1] == n - 1
+    assert np.all(np.diff(selected) > 0)
+    assert {1234, 8765} <= set(selected.tolist())
+
+
+def test_minmax_keeps_bucket_extremes() -> None:
+    y = np.sin(np.linspace(0, 20, 5000))
+
+    keep = minmax_indices(y, 50)
+
+    assert y[keep].max() == y.max()
+    assert y[keep].min() == y.min()
+    assert len(keep) <= 102
+
+
+def test_run_length_keeps_transitions() -> None:
+    values = pd.Series(["off"] * 5 + ["on"] * 3 + ["off"] * 4)
+
+    assert run_length_indices(values).tolist() == [0, 4, 5, 7, 8, 11]
+
+
+def test_downsample_only_above_threshold() -> None:
+    df = _frame(np.arange(100, dtype=float))
+
+    assert downsample_observations(df, SignalDataType.NUMERIC, max_points=100) is df
+
+
+def test_numeric_downsample_targets_viewport_and_skips_missing() -> None:
+    values = np.random.default_rng(7).normal(size=200_000)
+    values[::97] = np.nan
+    values[123_456] = 40.0
+    df = _frame(values, freq="1s")
+
+    chart = downsample_observations(df, SignalDataType.NUMERIC, width_px=500, max_points=5000)
+
+    assert len(chart) == 1000
+    assert chart["value"].notna().all()
+    assert chart["timestamp_utc"].is_monotonic_increasing
+    assert 123_456 in chart.index
+
+
+def test_state_downsample_uses_run_edges() -> None:
+    df = _frame(np.repeat([True, False, True], 4000))
+
+    chart = downsample_observations(df, SignalDataType.BOOLEAN, max_points=1000)
+
+    assert chart.index.tolist() == [0, 3999, 4000, 7999, 8000, 11999]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend import events as events_module
+from logic.backend.events import FEED_POLL_PAGE_SIZE, EventFeedStore, FeedQuery
+
+BASE = dt.datetime(2026, 3, 1, 12, tzinfo=dt.UTC)
+
+
+def _event(i: int, *, minutes: int, project_id: str = "p1", event_type: str = "TASK_UPDATED") -> dict:
+    return {
+        "id": f"e{i}",
+        "project_name": "Project",
+        "ts": (BASE + dt.timedelta(minutes=minutes)).isoformat().replace("+00:00", "Z"),
+        "project_id": project_id,
+        "phase_id": None,
+        "task_id": None,
+        "user_id": "u1",
+        "user_name": "Alex",
+        "event_type": event_type,
+        "payload": {"name": f"Task {i}", "status": "IN_PROGRESS"},
+    }
+
+
+class FakeEvents:
+    def __init__(self, events: list[dict]):
+        self.events = events
+        self.calls: list[dict] = []
+
+    def __call__(self, *, headers, project_id=None, from_dt=None, n_events=10):
+        self.calls.append({"from_dt": from_dt, "n_events": n_events})
+        rows = sorted(self.events, key=lambda e: e["ts"], reverse=True)
+        if from_dt is not None:
+            rows = [e for e in rows if dt.datetime.fromisoformat(e["ts"].replace("Z", "+00:00")) > from_dt]
+        return rows[:n_events]
+
+
+@pytest.fixture
+def backend(monkeypatch) -> FakeEvents:
+    fake = FakeEvents([_event(i, minutes=i) for i in range(5)])
+    monkeypatch.setattr(events_module, "fetch_events", fake)
+    return fake
+
+
+def _store(**kwargs) -> EventFeedStore:
+    return EventFeedStore(timezone=ZoneInfo("UTC"), poll_interval=0, **kwargs)
+
+
+def test_refresh_only_pulls_events_after_cursor(backend: FakeEvents) -> None:
+    store = _store()
+    assert store.refresh({}) == 5
+    assert backend.calls[0]["from_dt"] is None
+
+    backend.events.append(_event(5, minutes=30))
+    assert store.refresh({}) == 1
+    assert backend.calls[1]["from_dt"] < store.cursor
+    assert [e.id for e in store.latest(2)] == ["e5", "e4"]
+
+    assert store.refresh({}) == 0
+
+
+def test_refresh_is_throttled(backend: FakeEvents) -> None:
+    now = [0.0]
+    store = EventFeedStore(timezone=ZoneInfo("UTC"), poll_interval=5, clock=lambda: now[0])
+    store.refresh({})
+    store.refresh({})
+    now[0] = 6.0
+    store.refresh({})
+
+    assert len(backend.calls) == 2
+
+
+def test_filter_index_extends_with_new_events(backend: FakeEvents) -> None:
+    store = _store()
+    store.refresh({})
+    query = FeedQuery(q="task 4")
+    assert [e.id for e in store.filtered(query)] == ["e4"]
+
+    backend.events.append(_event(40, minutes=60 * 24))
+    store.refresh({})
+    grouped = store.grouped(query)
+
+    assert list(grouped) == [dt.date(2026, 3, 2), dt.date(2026, 3, 1)]
+    assert [e.id for e in store.filtered(query, newest_first=False)] == ["e4", "e40"]
+    assert [e.id for e in store.filtered(FeedQuery(), exclude_ids={"e0", "e1"}, since=BASE + dt.timedelta(minutes=3))] == [
+        "e40",
+        "e4",
+        "e3",
+    ]
+
+
+def test_buffer_is_bounded_and_indexes_drop_evicted(backend: FakeEvents) -> None:
+    store = _store(capacity=3)
+    store.refresh({})
+    query = FeedQuery(project_filter=frozenset({"p1"}))
+    assert len(store.filtered(query)) == 3
+
+    backend.events.append(_event(5, minutes=40))
+    store.refresh({})
+
+    assert len(store) == 3
+    assert [e.id for e in store.filtered(query)] == ["e5", "e4", "e3"]
+
+
+def test_full_poll_page_resets_buffer(backend: FakeEvents) -> None:
+    store = _store()
+    store.refresh({})
+    backend.events.extend(_event(100 + i, minutes=100 + i) for i in range(FEED_POLL_PAGE_SIZE + 5))
+    store.refresh({})
+
+    assert len(store) == FEED_POLL_PAGE_SIZE
+    assert "e0" not in {e.id for e in store.events()}
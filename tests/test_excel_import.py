@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import datetime as dt
 import sys
+import tracemalloc
 from io import BytesIO
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
+import pandas as pd
 import pytest
 from openpyxl import Workbook
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+from logic.excel_parse_cache import get_excel_parse_cache
 from logic.load_project import DataColumn, ExcelParameters, ExcelProjectLoader
 from models.constraint import ConstraintRelation
 from models.project_type import ProjectType
@@ -115,6 +119,13 @@ def excel_bytes() -> bytes:
     return _build_excel_fixture()
 
 
+@pytest.fixture(autouse=True)
+def _clear_parse_cache():
+    get_excel_parse_cache().clear()
+    yield
+    get_excel_parse_cache().clear()
+
+
 def test_load_excel_project_builds_schedule_from_single_workbook_fixture(excel_bytes: bytes) -> None:
     project, metadata = ExcelProjectLoader.load_excel_project(
         file=excel_bytes,
@@ -218,3 +229,159 @@ def test_infer_predecessors_resolves_task_and_phase_dependencies(
     assert second_phase.constraints[0].predecessor_id == first_phase.uuid
     assert second_phase.constraints[0].predecessor_kind == "phase"
     assert second_phase.constraints[0].relation_type == ConstraintRelation.FS
+
+
+def test_blank_schedule_row_is_kept_with_predecessor_inference(excel_bytes: bytes) -> None:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(BytesIO(excel_bytes))
+    wb["Daily Schedule"].insert_rows(12)
+    buf = BytesIO()
+    wb.save(buf)
+
+    analysis = ExcelProjectLoader.analyze_excel_project(
+        file=buf.getvalue(),
+        params=_default_excel_parameters(),
+        infer_predecessors=True,
+        preview_limit=10,
+    )
+    project, _ = ExcelProjectLoader.load_excel_project(
+        file=buf.getvalue(),
+        params=_default_excel_parameters(),
+        infer_predecessors=True,
+    )
+
+    assert analysis["inferred_predecessor_count"] == 0
+    assert len(project.phase_order) == 2
+    assert [task.name for task in project.get_task_list()] == ["Task A", "Task B", "Task C"]
+
+
+def test_analyze_and_load_share_one_parse_per_upload(excel_bytes: bytes) -> None:
+    cache = get_excel_parse_cache()
+    params = _default_excel_parameters()
+    misses, hits = cache.stats.misses, cache.stats.hits
+
+    ExcelProjectLoader.analyze_excel_project(file=excel_bytes, params=params, infer_predecessors=False)
+    first, _ = ExcelProjectLoader.load_excel_project(file=BytesIO(excel_bytes), params=params, infer_predecessors=False)
+    assert (cache.stats.misses - misses, cache.stats.hits - hits) == (1, 1)
+
+    first.shift_definition.day_start_time = dt.time(6, 0)
+    first.shift_assignments[0].crew_id = "edited"
+    second, _ = ExcelProjectLoader.load_excel_project(file=excel_bytes, params=params, infer_predecessors=False)
+    assert (cache.stats.misses - misses, cache.stats.hits - hits) == (1, 2)
+
+    # Cached parses hold no minted IDs, and the project gets its own model copies.
+    assert set(first.phase_order).isdisjoint(second.phase_order)
+    assert second.shift_definition.day_start_time == dt.time(7, 0)
+    assert second.shift_assignments[0].crew_id == "crew-a"
+
+    ExcelProjectLoader.analyze_excel_project(file=excel_bytes, params=params, infer_predecessors=True)
+    ExcelProjectLoader.analyze_excel_project(file=excel_bytes, params=_default_excel_parameters(start_row=9))
+    assert cache.stats.misses - misses == 3
+
+
+def test_column_coercions_match_the_per_cell_rules() -> None:
+    durations = pd.Series([2, "1 Day", "0.5 Days", None, "8 hours", True, float("nan"), " 3 days "], dtype=object)
+    planned = pd.Series([True, None, "no", " Yes ", 0, 2.0, "", float("nan")], dtype=object)
+    predecessors = pd.Series(["a, b", None, " ,c,", 12.0, "", "d"], dtype=object)
+    names = pd.Series(["Inch mill", "Remove liners", "Install and strip", "Strip inch", "Crane lift"])
+
+    assert ExcelProjectLoader._is_phase_column(durations).tolist() == [
+        ExcelProjectLoader.is_phase_cell(cell) for cell in durations
+    ]
+    assert ExcelProjectLoader._coerce_bool_column(planned).tolist() == [
+        ExcelProjectLoader._coerce_bool(cell) for cell in planned
+    ]
+    assert ExcelProjectLoader._split_predecessor_column(predecessors).tolist() == [
+        ExcelProjectLoader._parse_predecessor_cell(cell) for cell in predecessors
+    ]
+    assert ExcelProjectLoader._infer_task_type_column(names).tolist() == [
+        ExcelProjectLoader._infer_task_type(name) for name in names
+    ]
+    with pytest.raises(ValueError):
+        ExcelProjectLoader._coerce_bool_column(pd.Series(["maybe", True], dtype=object))
+
+
+def test_datetime_column_localization_matches_per_cell_rules_across_dst() -> None:
+    timezone = ZoneInfo("America/Vancouver")
+    values = pd.to_datetime(
+        pd.Series(["2026-03-08 02:30", "2026-11-01 01:30", "2026-02-17 07:00", None])
+    )
+
+    localized = ExcelProjectLoader._localize_datetime_column(values, timezone)
+    expected = [ExcelProjectLoader._coerce_project_datetime(value, timezone) for value in values]
+
+    assert localized == expected
+    assert [value.utcoffset() if value else None for value in localized] == [
+        value.utcoffset() if value else None for value in expected
+    ]
+    assert ExcelProjectLoader._localize_datetime_column(values, None)[2] == dt.datetime(2026, 2, 17, 7)
+
+
+def test_formula_graph_resolves_relations_lags_and_skips_in_bulk() -> None:
+    df = pd.DataFrame(
+        {
+            "_excel_row": [9, 10, 11, 12, 13, 14, 15],
+            "_is_phase": [True, False, False, False, True, False, False],
+            "_predecessors": [[], [], [], ["given"], [], [], []],
+        }
+    )
+    start_formulas = {9: "=E99", 10: "=D10", 11: "=d10+1/24", 12: "=E10", 13: "=E9", 14: "=E11-0.5", 15: "=E14*2"}
+    end_formulas = {10: "=$E$14", 13: "=E10", 14: "=E11", 15: "=D14 + 3"}
+
+    edges = ExcelProjectLoader._formula_graph(
+        df,
+        _default_excel_parameters(),
+        start_formulas=start_formulas,
+        end_formulas=end_formulas,
+    )
+
+    # Self, cross-kind, non-schedule and provided-predecessor references drop out;
+    # row 14's end edge to row 11 is a duplicate of its start edge.
+    assert list(edges.itertuples(index=False, name=None)) == [
+        (1, 5, ConstraintRelation.FF, 0.0),
+        (2, 1, ConstraintRelation.SS, pytest.approx(1 / 24)),
+        (4, 0, ConstraintRelation.FS, 0.0),
+        (5, 2, ConstraintRelation.FS, -0.5),
+        (6, 5, ConstraintRelation.SF, 3.0),
+    ]
+
+
+def test_formula_reference_frame_matches_the_per_cell_parser() -> None:
+    formulas = pd.Series(
+        ["=E10", "=e10+1", "='Sheet A'!$D$9-1/24", "  =E10 + 2.5 ", "=SUM(E1:E2)", None, "=E10*2", "=E10+1/0.5"],
+        dtype=object,
+    )
+
+    frame = ExcelProjectLoader._formula_reference_frame(formulas)
+
+    assert [
+        None if pd.isna(ref_row) else (ref_col, int(ref_row), offset_days)
+        for ref_col, ref_row, offset_days in frame.itertuples(index=False, name=None)
+    ] == [ExcelProjectLoader._parse_formula_reference(formula) for formula in formulas]
+
+
+def test_parse_records_seconds_per_stage(excel_bytes: bytes) -> None:
+    parsed = ExcelProjectLoader._parse_excel_import(excel_bytes, _default_excel_parameters(), infer_predecessors=True)
+
+    assert list(parsed.stage_seconds) == [
+        "read_plan_sheet",
+        "schedule_frame",
+        "formula_graph",
+        "secondary_models",
+        "localize",
+    ]
+    assert all(seconds >= 0 for seconds in parsed.stage_seconds.values())
+    assert [assignment.crew_id for assignment in parsed.shift_assignments] == ["crew-a", "crew-b"]
+    assert parsed.stage_peak_mb == {}
+
+
+def test_parse_records_peak_memory_per_stage_while_tracing(excel_bytes: bytes) -> None:
+    tracemalloc.start()
+    try:
+        parsed = ExcelProjectLoader._parse_excel_import(excel_bytes, _default_excel_parameters(), infer_predecessors=True)
+    finally:
+        tracemalloc.stop()
+
+    assert list(parsed.stage_peak_mb) == list(parsed.stage_seconds)
+    assert all(peak > 0 for peak in parsed.stage_peak_mb.values())
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend import http_cache
+from logic.backend.http_cache import ValidationCache, conditional_get_json, validation_key
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, payload=None, headers: dict | None = None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.text = "" if payload is None else str(payload)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self._payload
+
+
+class FakeBackend:
+    def __init__(self, payload, etag: str | None = '"v1"', last_modified: str | None = None):
+        self.payload = payload
+        self.etag = etag
+        self.last_modified = last_modified
+        self.requests: list[dict] = []
+
+    def get(self, url, *, headers, params=None, timeout=30):
+        self.requests.append(dict(headers))
+        if self.etag and headers.get("If-None-Match") == self.etag:
+            return FakeResponse(304)
+        response_headers = {}
+        if self.etag:
+            response_headers["ETag"] = self.etag
+        if self.last_modified:
+            response_headers["Last-Modified"] = self.last_modified
+        return FakeResponse(200, self.payload, response_headers)
+
+
+@pytest.fixture
+def backend(monkeypatch) -> FakeBackend:
+    fake = FakeBackend({"project": {"id": "p1"}})
+    monkeypatch.setattr(http_cache, "backend_session", SimpleNamespace(get=fake.get))
+    return fake
+
+
+def test_conditional_get_reuses_body_on_not_modified(backend: FakeBackend) -> None:
+    cache = ValidationCache()
+    headers = {"Authorization": "Bearer a"}
+
+    first = conditional_get_json("https://api/snapshot", headers=headers, cache=cache)
+    second = conditional_get_json("https://api/snapshot", headers=headers, cache=cache)
+
+    assert first == second == {"project": {"id": "p1"}}
+    assert "If-None-Match" not in backend.requests[0]
+    assert backend.requests[1]["If-None-Match"] == '"v1"'
+    assert cache.stats.fresh == 1
+    assert cache.stats.revalidated == 1
+
+
+def test_conditional_get_replaces_body_when_etag_changes(backend: FakeBackend) -> None:
+    cache = ValidationCache()
+    conditional_get_json("https://api/snapshot", headers={}, cache=cache)
+
+    backend.payload = {"project": {"id": "p1", "name": "renamed"}}
+    backend.etag = '"v2"'
+    refreshed = conditional_get_json("https://api/snapshot", headers={}, cache=cache)
+
+    assert refreshed["project"]["name"] == "renamed"
+    assert cache.stats.fresh == 2
+
+
+def test_cache_key_is_scoped_to_authorization() -> None:
+    url = "https://api/projects"
+    params = {"include_closed": False}
+
+    assert validation_key(url, headers={"Authorization": "Bearer a"}, params=params) != validation_key(
+        url, headers={"Authorization": "Bearer b"}, params=params
+    )
+    assert validation_key(url, headers={"Authorization": "Bearer a", "Accept": "x"}, params=params) == validation_key(
+        url, headers={"Authorization": "Bearer a"}, params=params
+    )
+
+
+def test_disk_tier_survives_new_cache_instance(backend: FakeBackend, tmp_path: Path) -> None:
+    conditional_get_json("https://api/sites", headers={}, cache=ValidationCache(disk_dir=tmp_path))
+
+    restarted = ValidationCache(disk_dir=tmp_path)
+    body = conditional_get_json("https://api/sites", headers={}, cache=restarted)
+
+    assert body == {"project": {"id": "p1"}}
+    assert backend.requests[-1]["If-None-Match"] == '"v1"'
+    assert restarted.stats.disk_hits == 1
+    assert restarted.stats.revalidated == 1
+
+
+def test_responses_without_validators_are_not_stored(backend: FakeBackend) -> None:
+    backend.etag = None
+    cache = ValidationCache()
+
+    conditional_get_json("https://api/mills", headers={}, cache=cache)
+
+    assert len(cache) == 0
+    assert cache.stats.uncached == 1
+
+
+def test_lookups_are_recorded_once_when_the_caller_counts_them(backend: FakeBackend, monkeypatch) -> None:
+    lookups: list[bool] = []
+    monkeypatch.setattr(http_cache, "record_cache_lookup", lambda url, *, hit: lookups.append(hit))
+    cache = ValidationCache()
+
+    conditional_get_json("https://api/sites", headers={}, cache=cache)
+    conditional_get_json("https://api/sites", headers={}, cache=cache)
+    conditional_get_json("https://api/sites", headers={}, cache=cache, record_lookup=False)
+
+    assert lookups == [False, True]
+
+
+def test_disk_tier_files_are_owner_only(backend: FakeBackend, tmp_path: Path) -> None:
+    disk_dir = tmp_path / "http-cache"
+    conditional_get_json("https://api/sites", headers={}, cache=ValidationCache(disk_dir=disk_dir))
+
+    assert disk_dir.stat().st_mode & 0o777 == 0o700
+    assert [path.stat().st_mode & 0o777 for path in disk_dir.glob("*.json")] == [0o600]
+
+
+def test_reference_errors_carry_the_backend_body(monkeypatch) -> None:
+    import requests
+
+    from logic.backend import api_client
+
+    class Unavailable(FakeResponse):
+        def raise_for_status(self) -> None:
+            raise requests.HTTPError(f"{self.status_code} Server Error", response=self)
+
+    response = Unavailable(503)
+    response.text = "maintenance until 06:00"
+    monkeypatch.setattr(http_cache, "backend_session", SimpleNamespace(get=lambda *args, **kwargs: response))
+    monkeypatch.setattr(http_cache, "get_validation_cache", ValidationCache)
+
+    with pytest.raises(ValueError, match="Failed to fetch crews: 503 Server Error maintenance until 06:00"):
+        api_client.fetch_crews({"Authorization": "Bearer a"}, "site-unavailable")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend.instrumentation import BackendMetrics, InstrumentedSession, endpoint_template
+
+
+def test_endpoint_template_collapses_ids() -> None:
+    url = "https://api.example/projects/d9e16863-fbb9-4000-8d05-71a5d576f076/signals/42/observations?limit=5"
+
+    assert endpoint_template(url) == "/projects/{id}/signals/{id}/observations"
+    assert endpoint_template("https://api.example/auth/me") == "/auth/me"
+
+
+def test_metrics_aggregate_per_endpoint_and_export() -> None:
+    metrics = BackendMetrics()
+    for elapsed in (0.04, 0.2, 0.3):
+        metrics.record_request(
+            method="get",
+            template="/projects/{id}/snapshot",
+            status=200,
+            elapsed=elapsed,
+            response_bytes=1000,
+        )
+    metrics.record_request(method="GET", template="/projects/{id}/snapshot", status=503, elapsed=1.2, retries=2)
+    metrics.record_cache(method="GET", template="/projects/{id}/snapshot", hit=True)
+
+    (row,) = metrics.snapshot()
+    assert row["count"] == 4
+    assert row["errors"] == 1
+    assert row["retries"] == 2
+    assert row["response_bytes"] == 3000
+    assert row["status_codes"] == {"200": 3, "503": 1}
+    assert row["cache_hits"] == 1
+    assert row["latency_p50_s"] == 0.3
+    assert sum(row["latency_buckets"].values()) == 4
+
+    prometheus = metrics.to_prometheus()
+    assert 'ganttbuddy_backend_request_seconds_bucket{method="GET",endpoint="/projects/{id}/snapshot",le="+Inf"} 4' in prometheus
+    assert 'status="503"} 1' in prometheus
+    assert '"endpoint": "/projects/{id}/snapshot"' in metrics.to_json()
+
+
+def test_shared_session_never_replays_cookies() -> None:
+    seen_cookies: list[str | None] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            seen_cookies.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=user-a; Path=/")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        session = InstrumentedSession(metrics=BackendMetrics())
+        url = f"http://127.0.0.1:{server.server_address[1]}/auth/me"
+        session.get(url, timeout=5)
+        session.get(url, timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert seen_cookies == [None, None]
+    assert len(session.cookies) == 0
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from io import BytesIO
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.load_project import DataColumn, ExcelParameters
+from logic.load_tabular import TabularProjectLoader
+from models.constraint import ConstraintRelation
+from models.task import TaskType
+
+TZ = ZoneInfo("America/Edmonton")
+
+HEADER = "ID,Activity,Duration,Start,Finish,Skip,Actual Duration,Actual Start,Actual Finish,Notes,Predecessors,UUID,Planned"
+ROWS = [
+    "1,Phase 1,1 Day,2026-02-17 07:00,2026-02-18 07:00,,,,,,,,",
+    "2,Install liner,2,2026-02-17 07:00,2026-02-17 09:00,,,,,  start ,,task-a,yes",
+    "3,Remove bolts,1,2026-02-17 09:00,2026-02-17 10:00,,1,2026-02-17 09:00,2026-02-17 10:00,,\"task-a, \",task-b,0",
+    "4,Phase 2,0.5 Days,2026-02-18 07:00,2026-02-18 19:00,,,,,,,,",
+    "5,Inch mill,3,2026-02-18 07:00,2026-02-18 10:00,,,2026-02-18 07:30,,,task-b,,",
+]
+
+
+def _params() -> ExcelParameters:
+    return ExcelParameters(
+        start_row=1,
+        columns=[
+            DataColumn(name="ACTIVITY", column=2),
+            DataColumn(name="PLANNED DURATION (HOURS)", column=3),
+            DataColumn(name="PLANNED START", column=4),
+            DataColumn(name="PLANNED END", column=5),
+            DataColumn(name="ACTUAL DURATION", column=7),
+            DataColumn(name="ACTUAL START", column=8),
+            DataColumn(name="ACTUAL END", column=9),
+            DataColumn(name="NOTES", column=10),
+            DataColumn(name="PREDECESSOR", column=11),
+            DataColumn(name="UUID", column=12),
+            DataColumn(name="PLANNED", column=13),
+        ],
+    )
+
+
+def _csv_bytes(rows: list[str] = ROWS) -> bytes:
+    return "\n".join([HEADER, *rows]).encode()
+
+
+def _parquet_bytes() -> bytes:
+    start = dt.datetime(2026, 2, 17, 7)
+    table = pa.table(
+        {
+            "id": [1, 2, 3, 4, 5],
+            "activity": ["Phase 1", "Install liner", "Remove bolts", "Phase 2", "Inch mill"],
+            "duration": ["1 Day", "2", "1", "0.5 Days", "3"],
+            "start": [start, start, start + dt.timedelta(hours=2), start + dt.timedelta(days=1), start + dt.timedelta(days=1)],
+            "finish": [start + dt.timedelta(days=1)] * 5,
+            "skip": [None] * 5,
+            "actual_duration": pa.array([None, None, 1.0, None, None], pa.float64()),
+            "actual_start": pa.array([None, None, start + dt.timedelta(hours=2), None, None], pa.timestamp("us")),
+            "actual_finish": pa.array([None, None, start + dt.timedelta(hours=3), None, None], pa.timestamp("us")),
+            "notes": [None, "start", None, None, None],
+            "predecessors": [None, None, "task-a", None, "task-b"],
+            "uuid": [None, "task-a", "task-b", None, None],
+            "planned": [True, True, False, True, True],
+        }
+    )
+    out = BytesIO()
+    pq.write_table(table, out)
+    return out.getvalue()
+
+
+def _assert_schedule(project) -> None:
+    phases = [project.phases[uuid] for uuid in project.phase_order]
+    assert [phase.name for phase in phases] == ["Phase 1", "Phase 2"]
+    tasks = [[phase.tasks[uuid] for uuid in phase.task_order] for phase in phases]
+    assert [[task.name for task in phase_tasks] for phase_tasks in tasks] == [["Install liner", "Remove bolts"], ["Inch mill"]]
+
+    install, remove = tasks[0]
+    inch = tasks[1][0]
+    assert (install.uuid, remove.uuid) == ("task-a", "task-b")
+    assert inch.uuid not in ("", "task-a", "task-b")
+    assert [task.task_type for task in (install, remove, inch)] == [TaskType.INSTALL, TaskType.STRIP, TaskType.INCH]
+    assert install.note == "start"
+    assert (install.planned, remove.planned, inch.planned) == (True, False, True)
+    assert [(c.predecessor_id, c.predecessor_kind, c.relation_type) for c in remove.constraints] == [
+        ("task-a", "task", ConstraintRelation.FS),
+    ]
+    assert [c.predecessor_id for c in inch.constraints] == ["task-b"]
+    assert remove.status == "COMPLETE" and install.status == "NOT_STARTED"
+    assert install.start_date == dt.datetime(2026, 2, 17, 7, tzinfo=TZ)
+
+
+def test_csv_import_matches_the_excel_classification() -> None:
+    project = TabularProjectLoader.load_tabular_project(_csv_bytes(), _params(), file_format="csv", timezone=TZ)
+
+    assert project.name == "Untitled Project"
+    _assert_schedule(project)
+    inch = project.phases[project.phase_order[1]].get_task_list()[0]
+    assert inch.status == "IN_PROGRESS"
+    assert inch.actual_start == dt.datetime(2026, 2, 18, 7, 30, tzinfo=TZ)
+
+
+def test_parquet_import_is_detected_from_its_magic_bytes() -> None:
+    data = _parquet_bytes()
+    assert TabularProjectLoader.detect_format(data) == "parquet"
+    assert TabularProjectLoader.detect_format(_csv_bytes()) == "csv"
+
+    project = TabularProjectLoader.load_tabular_project(data, _params(), project_name="Reline", timezone=TZ)
+
+    assert project.name == "Reline"
+    _assert_schedule(project)
+
+
+def test_import_names_the_project_after_the_file(tmp_path: Path) -> None:
+    path = tmp_path / "p6_export.csv"
+    path.write_bytes(_csv_bytes(ROWS + [",,,,,,,,,,,,"]))
+
+    with path.open("rb") as file:
+        project = TabularProjectLoader.load_tabular_project(file, _params(), timezone=TZ)
+
+    assert project.name == "p6_export"
+    # The blank trailing row is dropped like an empty sheet row.
+    assert len(project.get_task_list()) == 3
+
+
+def test_import_rejects_columns_past_the_end_of_the_file() -> None:
+    narrow = "\n".join(",".join(line.split(",")[:10]) for line in [HEADER, *ROWS]).encode()
+
+    with pytest.raises(ValueError, match="PREDECESSOR, UUID, PLANNED"):
+        TabularProjectLoader.load_tabular_project(narrow, _params(), file_format="csv")
+
+
+def test_csv_planned_flags_follow_the_excel_tokens() -> None:
+    rows = [row.rsplit(",", 1)[0] + "," + planned for row, planned in zip(ROWS, ["", " NO ", "On", "", "n"])]
+    project = TabularProjectLoader.load_tabular_project(_csv_bytes(rows), _params(), file_format="csv", timezone=TZ)
+
+    assert [task.planned for task in project.get_task_list()] == [False, True, False]
+
+    with pytest.raises(ValueError, match="maybe"):
+        TabularProjectLoader.load_tabular_project(_csv_bytes([*ROWS[:4], ROWS[4][:-1] + "maybe"]), _params(), file_format="csv")
+
+
+def test_csv_planned_numbers_follow_the_sheet_rules() -> None:
+    rows = [row.rsplit(",", 1)[0] + "," + planned for row, planned in zip(ROWS, ["", "0.0", "2", "", " -1.5 "])]
+    project = TabularProjectLoader.load_tabular_project(_csv_bytes(rows), _params(), file_format="csv", timezone=TZ)
+
+    assert [task.planned for task in project.get_task_list()] == [False, True, True]
+
+
+def test_header_only_csv_is_rejected_clearly() -> None:
+    with pytest.raises(ValueError, match="no schedule rows"):
+        TabularProjectLoader.load_tabular_project(HEADER.encode() + b"\r\n", _params(), file_format="csv")
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend import signals
+from models.delay import Delay, DelayType
+from models.event import EventIn
+from models.parsing import list_adapter, parse_model_list, parse_model_list_json
+from models.shift_schedule import ShiftAssignment
+from models.signals import parse_observations, parse_observations_json
+
+OBSERVATIONS = [
+    {
+        "id": f"o{i}",
+        "signal_id": "s1",
+        "timestamp_utc": f"2026-02-01T00:{i:02d}:00Z",
+        "numeric_value": i,
+        "quality_code": "GOOD",
+        "created_at": None,
+        "ingested_by": "etl",
+    }
+    for i in range(5)
+]
+
+DELAY = {
+    "id": "d1",
+    "project_id": "p1",
+    "delay_type": "SAFETY",
+    "duration_minutes": 30,
+    "description": "Gas test",
+    "start_dt": "2026-02-01T10:00:00Z",
+    "end_dt": None,
+    "shift_assignment_id": None,
+    "created_by": "u1",
+    "created_at": "2026-02-01T10:05:00Z",
+    "updated_at": None,
+    "updated_by": None,
+}
+
+EVENT = {
+    "id": "e1",
+    "project_name": "Mill 3",
+    "ts": "2026-02-01T10:05:00Z",
+    "project_id": "p1",
+    "phase_id": None,
+    "task_id": None,
+    "user_id": "u1",
+    "user_name": "Sam",
+    "event_type": "PROJECT_CREATED",
+    "payload": {},
+}
+
+
+def test_json_body_parse_matches_dict_parse() -> None:
+    from_dicts = parse_observations(OBSERVATIONS)
+    from_bytes = parse_observations_json(json.dumps(OBSERVATIONS).encode("utf-8"))
+
+    assert from_bytes == from_dicts
+    assert from_bytes[1].numeric_value == 1.0
+    assert from_bytes[0].model_extra == {"ingested_by": "etl"}
+    assert parse_observations_json(b"") == [] and parse_observations(None) == []
+
+    for model, payload in ((Delay, DELAY), (EventIn, EVENT)):
+        assert parse_model_list_json(model, json.dumps([payload])) == parse_model_list(model, [payload])
+    assert parse_model_list(Delay, [DELAY])[0].delay_type is DelayType.SAFETY
+
+
+def test_adapter_is_built_once_and_still_rejects_bad_rows() -> None:
+    assert list_adapter(Delay) is list_adapter(Delay)
+    with pytest.raises(ValidationError):
+        parse_observations([{"signal_id": "s1", "timestamp_utc": "not a time"}])
+    with pytest.raises(ValidationError):
+        parse_observations_json(b'[{"signal_id": "s1"')
+
+
+def test_signal_observation_fetch_validates_the_raw_body(monkeypatch) -> None:
+    body = json.dumps(OBSERVATIONS).encode("utf-8")
+
+    class FakeSession:
+        def request(self, **kwargs):
+            return SimpleNamespace(content=body, raise_for_status=lambda: None, json=pytest.fail)
+
+    monkeypatch.setattr(signals, "backend_session", FakeSession())
+
+    observations = signals.fetch_signal_observations.__wrapped__({}, "p1", "s1")
+
+    assert [item.id for item in observations] == [f"o{i}" for i in range(5)]
+
+
+def test_shift_assignments_from_df_validate_the_frame_as_one_list() -> None:
+    frame = pd.DataFrame(
+        {
+            "shift_type": ["DAY", " night "],
+            "crew_id": ["crew-a", "crew-b"],
+            "start_date": pd.to_datetime(["2026-02-17", "2026-02-18"]),
+            "end_date": pd.to_datetime(["2026-02-18", "2026-02-19"]),
+        }
+    )
+
+    assignments = ShiftAssignment.from_df(frame, project_id=None)
+
+    assert [(a.id, a.project_id, a.crew_id, a.shift_type, a.start_date) for a in assignments] == [
+        (None, "", "crew-a", "day", dt.date(2026, 2, 17)),
+        (None, "", "crew-b", "night", dt.date(2026, 2, 18)),
+    ]
+    with pytest.raises(ValidationError):
+        ShiftAssignment.from_df(frame.assign(shift_type=["day", "swing"]), project_id="p1")
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend import signals
+from logic.backend.signals import iter_observation_chunks, observation_chunks_to_frame
+from models.signals import SignalDataType
+
+BASE = dt.datetime(2025, 3, 1, tzinfo=dt.timezone.utc)
+
+
+def _iso(value: dt.datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class FakeObservationBackend:
+    """Serves observations ordered by timestamp, honouring start/end/limit/offset."""
+
+    def __init__(self, rows: list[dict]):
+        self.rows = sorted(rows, key=lambda row: row["timestamp_utc"])
+        self.calls: list[dict] = []
+
+    def __call__(self, *, method, path, headers, params=None, json=None):
+        self.calls.append(dict(params or {}))
+        params = params or {}
+        rows = [
+            row
+            for row in self.rows
+            if ("start" not in params or row["timestamp_utc"] >= params["start"])
+            and ("end" not in params or row["timestamp_utc"] <= params["end"])
+        ]
+        offset = params.get("offset", 0)
+        return rows[offset : offset + params["limit"]]
+
+
+def _rows(timestamps: list[dt.datetime]) -> list[dict]:
+    return [
+        {"id": f"o{index}", "timestamp_utc": _iso(ts), "numeric_value": float(index), "quality_code": "ok" if index % 2 else None}
+        for index, ts in enumerate(timestamps)
+    ]
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    def install(rows: list[dict]) -> FakeObservationBackend:
+        fake = FakeObservationBackend(rows)
+        monkeypatch.setattr(signals, "_request_json", fake)
+        return fake
+
+    return install
+
+
+def test_chunks_cover_every_row_once_with_ties_across_pages(backend) -> None:
+    # Five rows share one timestamp and straddle the page boundaries.
+    timestamps = [BASE + dt.timedelta(minutes=i) for i in range(3)]
+    timestamps += [BASE + dt.timedelta(minutes=3)] * 5
+    timestamps += [BASE + dt.timedelta(minutes=4 + i) for i in range(4)]
+    fake = backend(_rows(timestamps))
+
+    chunks = list(iter_observation_chunks({}, "p1", "s1", start=BASE, page_size=3))
+
+    ids = [value for chunk in chunks for value in chunk.column("id").to_pylist()]
+    assert sorted(ids) == sorted(row["id"] for row in fake.rows)
+    assert len(ids) == len(set(ids))
+    # Offsets never exceed the run of tied timestamps.
+    assert max(call["offset"] for call in fake.calls) <= 5
+
+
+def test_max_rows_caps_requests_and_rows(backend) -> None:
+    fake = backend(_rows([BASE + dt.timedelta(seconds=i) for i in range(50)]))
+
+    chunks = list(iter_observation_chunks({}, "p1", "s1", page_size=20, max_rows=45))
+
+    assert sum(chunk.num_rows for chunk in chunks) == 45
+    assert [call["limit"] for call in fake.calls] == [20, 20, 5]
+
+
+def test_frame_matches_row_frame_columns(backend) -> None:
+    backend(_rows([BASE + dt.timedelta(minutes=i) for i in range(6)]))
+    timezone = ZoneInfo("America/Vancouver")
+
+    df = observation_chunks_to_frame(
+        iter_observation_chunks({}, "p1", "s1", page_size=4),
+        timezone=timezone,
+        data_type=SignalDataType.NUMERIC,
+    )
+
+    assert list(df["id"]) == [f"o{i}" for i in range(6)]
+    assert df["value"].dtype == "float64"
+    assert df["quality_code"].tolist() == ["", "ok", "", "ok", "", "ok"]
+    assert str(df["timestamp_local"].dt.tz) == "America/Vancouver"
+    assert df["value_label"].iloc[2] == "2.0"
+    assert {"timestamp_utc", "source_record_key", "ingestion_run_id"} <= set(df.columns)
+
+
+def test_empty_stream_gives_empty_frame(backend) -> None:
+    backend([])
+
+    df = observation_chunks_to_frame(
+        iter_observation_chunks({}, "p1", "s1"),
+        timezone=ZoneInfo("UTC"),
+        data_type=SignalDataType.BOOLEAN,
+    )
+
+    assert df.empty
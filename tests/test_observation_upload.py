@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend import observation_upload
+from logic.backend.observation_upload import iter_gzip_chunks, prepare_observations, upload_observations
+from models.signals import SignalDataType
+
+TZ = ZoneInfo("America/Vancouver")
+
+
+class FakeUploadBackend:
+    def __init__(self, fail_first: int = 0):
+        self.fail_first = fail_first
+        self.keys: list[str] = []
+        self.stored: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def post(self, url, *, headers, data, timeout):
+        with self._lock:
+            self.keys.append(headers["Idempotency-Key"])
+            if self.fail_first:
+                self.fail_first -= 1
+                return SimpleNamespace(status_code=503, text="busy", raise_for_status=lambda: None)
+            for row in json.loads(gzip.decompress(data))["observations"]:
+                self.stored[row["source_record_key"]] = row
+        return SimpleNamespace(status_code=201, text="", raise_for_status=lambda: None)
+
+
+@pytest.fixture
+def backend(monkeypatch) -> FakeUploadBackend:
+    fake = FakeUploadBackend()
+    monkeypatch.setattr(observation_upload, "backend_session", fake)
+    monkeypatch.setattr(observation_upload, "UPLOAD_BACKOFF_SECONDS", 0.0)
+    return fake
+
+
+def test_prepare_converts_local_time_and_drops_incomplete_rows() -> None:
+    df = pd.DataFrame(
+        {
+            "timestamp_local": ["2025-03-01 08:00", None, "2025-03-01 09:30", "not a date"],
+            "boolean_value": ["true", "false", "maybe", "TRUE"],
+            "quality_code": ["GOOD", "", " ", "GOOD"],
+        }
+    )
+
+    prepared = prepare_observations(df, SignalDataType.BOOLEAN, timezone=TZ)
+
+    assert prepared["timestamp_utc"].tolist() == ["2025-03-01T16:00:00.000000Z"]
+    assert prepared["boolean_value"].tolist() == [True]
+    assert prepared["quality_code"].tolist() == ["GOOD"]
+    assert prepared["source_record_key"].isna().all()
+
+
+def test_prepare_keeps_wall_times_repeated_at_the_dst_fall_back() -> None:
+    # America/Vancouver repeats 01:00-01:59 on 2025-11-02.
+    local = ["2025-11-02 00:30", "2025-11-02 01:00", "2025-11-02 01:30", "2025-11-02 01:59", "2025-11-02 02:00"]
+    df = pd.DataFrame({"timestamp_local": local, "numeric_value": [1, 2, 3, 4, 5]})
+
+    prepared = prepare_observations(df, SignalDataType.NUMERIC, timezone=ZoneInfo("America/Vancouver"))
+
+    assert prepared["numeric_value"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    # Ambiguous times take the first (PDT) occurrence, like datetime's fold=0.
+    expected = [
+        pd.Timestamp(text).to_pydatetime().replace(tzinfo=ZoneInfo("America/Vancouver")).astimezone(dt.timezone.utc)
+        for text in local
+    ]
+    assert prepared["timestamp_utc"].tolist() == [stamp.strftime("%Y-%m-%dT%H:%M:%S.%fZ") for stamp in expected]
+    assert prepared["timestamp_utc"].tolist()[2] == "2025-11-02T08:30:00.000000Z"
+
+
+def test_chunks_respect_size_bound_and_round_trip() -> None:
+    df = pd.DataFrame(
+        {
+            "timestamp_utc": pd.date_range("2025-03-01", periods=5000, freq="min", tz="UTC"),
+            "numeric_value": range(5000),
+            "source_record_key": [f"k{i}" for i in range(5000)],
+        }
+    )
+    prepared = prepare_observations(df, SignalDataType.NUMERIC, timezone=TZ)
+
+    chunks = list(iter_gzip_chunks(prepared, max_bytes=16 * 1024))
+
+    assert len(chunks) > 1
+    assert all(chunk.raw_bytes <= 16 * 1024 for chunk in chunks)
+    rows = [row for chunk in chunks for row in json.loads(gzip.decompress(chunk.body))["observations"]]
+    assert [row["source_record_key"] for row in rows] == [f"k{i}" for i in range(5000)]
+    assert rows[1]["numeric_value"] == 1.0
+
+
+def test_upload_retries_with_the_same_idempotency_key_and_reports_progress(backend: FakeUploadBackend) -> None:
+    backend.fail_first = 1
+    df = pd.DataFrame(
+        {
+            "timestamp_local": pd.date_range("2025-03-01", periods=3000, freq="min"),
+            "numeric_value": 1.5,
+        }
+    )
+    prepared = prepare_observations(df, SignalDataType.NUMERIC, timezone=TZ)
+    progress: list[tuple[int, int]] = []
+
+    report = upload_observations(
+        {}, "p1", "s1", prepared, max_bytes=32 * 1024, max_workers=3, on_progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert report.rows == 3000 and report.retries == 1
+    assert len(backend.keys) == report.chunks + 1
+    assert backend.keys.count(backend.keys[0]) == 2
+    assert len(backend.stored) == 3000
+    assert all(key.startswith("auto-") for key in backend.stored)
+    assert progress[-1] == (3000, 3000)
+
+
+def test_upload_raises_after_exhausting_retries(backend: FakeUploadBackend) -> None:
+    backend.fail_first = 100
+    prepared = prepare_observations(
+        pd.DataFrame({"timestamp_utc": ["2025-03-01T00:00:00Z"], "text_value": ["Running"]}),
+        SignalDataType.CATEGORICAL,
+        timezone=TZ,
+    )
+
+    with pytest.raises(ValueError, match="after 4 attempts"):
+        upload_observations({}, "p1", "s1", prepared)
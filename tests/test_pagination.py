@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend import pagination
+from logic.backend.pagination import fetch_all_pages_frame, iter_pages
+
+
+def _paged_source(total: int, page_size: int, *, delay: float = 0.0):
+    calls: list[int] = []
+    lock = threading.Lock()
+
+    def fetch_page(page: int) -> dict:
+        with lock:
+            calls.append(page)
+        if delay:
+            # Later pages finish first so completion order differs from page order.
+            time.sleep(delay / page)
+        start = (page - 1) * page_size
+        stop = min(start + page_size, total)
+        return {
+            "total": total,
+            "page": page,
+            "items": [{"id": index} for index in range(start, stop)],
+        }
+
+    return fetch_page, calls
+
+
+def test_fetch_all_pages_frame_merges_items_in_page_order() -> None:
+    fetch_page, calls = _paged_source(total=450, page_size=100, delay=0.02)
+    progress: list[tuple[int, int]] = []
+
+    frame = fetch_all_pages_frame(
+        fetch_page,
+        page_size=100,
+        max_workers=4,
+        on_progress=lambda loaded, total: progress.append((loaded, total)),
+    )
+
+    assert frame["id"].tolist() == list(range(450))
+    assert sorted(calls) == [1, 2, 3, 4, 5]
+    assert calls.count(1) == 1
+    assert progress[0] == (100, 450)
+    assert progress[-1] == (450, 450)
+
+
+def test_fetch_all_pages_frame_single_page_skips_pool() -> None:
+    fetch_page, calls = _paged_source(total=12, page_size=100)
+
+    frame = fetch_all_pages_frame(fetch_page, page_size=100)
+
+    assert len(frame) == 12
+    assert calls == [1]
+
+
+def test_iter_pages_reports_running_loaded_count() -> None:
+    fetch_page, _ = _paged_source(total=250, page_size=100)
+
+    results = list(iter_pages(fetch_page, page_size=100, max_workers=2))
+
+    assert results[0].page == 1
+    assert sorted(result.page for result in results) == [1, 2, 3]
+    assert [result.loaded for result in results] == [100, 200, 250]
+
+
+def test_fetch_all_pages_frame_streams_partial_frames() -> None:
+    fetch_page, _ = _paged_source(total=230, page_size=100, delay=0.01)
+    partial_sizes: list[int] = []
+
+    frame = fetch_all_pages_frame(
+        fetch_page,
+        page_size=100,
+        max_workers=3,
+        on_frame=lambda df: partial_sizes.append(len(df)),
+    )
+
+    assert frame["id"].tolist() == list(range(230))
+    assert partial_sizes[0] == 100
+    assert partial_sizes[-1] == 230
+
+
+def test_fetch_all_pages_frame_appends_pages_once_in_order(monkeypatch) -> None:
+    fetch_page, _ = _paged_source(total=450, page_size=100, delay=0.02)
+    concats: list[int] = []
+    real_concat = pagination.pd.concat
+
+    def counting_concat(frames, **kwargs):
+        concats.append(len(frames))
+        return real_concat(frames, **kwargs)
+
+    monkeypatch.setattr(pagination.pd, "concat", counting_concat)
+
+    frame = fetch_all_pages_frame(fetch_page, page_size=100, max_workers=4)
+
+    assert frame["id"].tolist() == list(range(450))
+    assert concats == [5]
+
+    # Later pages finish first: they wait for the pages before them, so each partial frame is a prefix.
+    concats.clear()
+    partial: list[list[int]] = []
+    frame = fetch_all_pages_frame(
+        fetch_page,
+        page_size=100,
+        max_workers=4,
+        on_frame=lambda df: partial.append(df["id"].tolist()),
+    )
+
+    assert frame["id"].tolist() == list(range(450))
+    assert all(ids == list(range(len(ids))) for ids in partial)
+    assert partial[0] == list(range(100)) and partial[-1] == list(range(450))
+    assert len(concats) == len(partial) - 1
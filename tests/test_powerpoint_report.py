@@ -160,6 +160,67 @@ def test_phase_delay_summary_builds_reporting_table():
     assert summary["CUMULATIVE DELAY (HRS)"].tolist() == [1.0, -0.5]
 
 
+def test_phase_and_major_delays_come_from_one_task_delay_frame():
+    project = _build_project()
+    project.phases[project.phase_order[1]].add_task(
+        Task(name="Not started", start_date=datetime(2026, 2, 2, 9, 0), end_date=datetime(2026, 2, 2, 10, 0))
+    )
+
+    per_phase = PostMortemAnalyzer.analyze_project_delays(project, n=1)
+    assert [df["Task"].tolist() for df in per_phase] == [["Task 1"], ["Task 3"]]
+    for phase_df, pid in zip(PostMortemAnalyzer.analyze_project_delays(project, n=-1), project.phase_order):
+        pd.testing.assert_frame_equal(phase_df, PostMortemAnalyzer.analyze_phase_delays(project.phases[pid], -1))
+
+    tear_out = per_phase[0].iloc[0]
+    assert (tear_out["Planned Duration"], tear_out["Actual Duration"], tear_out["Delay"]) == (2.0, 3.0, 1.0)
+    full = PostMortemAnalyzer.analyze_phase_delays(project.phases[project.phase_order[0]], -1)
+    assert full["Notes"].tolist() == ["Load level", "2026-02-01 10:00:00 -> 2026-02-01 13:00:00"]
+
+    major = PostMortemAnalyzer.major_delays(project, 2)
+    assert major[["Phase", "Task", "Delay"]].values.tolist() == [["Tear Out", "Task 1", 1.0], ["Tear Out", "Task 2", 0.0]]
+    assert PostMortemAnalyzer.major_delays(project, -1)["Task"].tolist() == ["Task 1", "Task 2", "Task 3"]
+
+
+def test_delays_use_wall_clock_durations_across_dst():
+    from zoneinfo import ZoneInfo
+
+    tz = ZoneInfo("America/Vancouver")
+    phase = Phase(name="Night shift")
+    # Clocks fall back during the actual window only.
+    task = Task(
+        name="Overnight reline",
+        start_date=datetime(2025, 10, 25, 20, 0, tzinfo=tz),
+        end_date=datetime(2025, 10, 26, 8, 0, tzinfo=tz),
+        actual_start=datetime(2025, 11, 1, 20, 0, tzinfo=tz),
+        actual_end=datetime(2025, 11, 2, 8, 0, tzinfo=tz),
+    )
+    phase.add_task(task)
+
+    row = PostMortemAnalyzer.analyze_phase_delays(phase, -1).iloc[0]
+
+    assert task.actual_duration == timedelta(hours=12)
+    assert (row["Planned Duration"], row["Actual Duration"], row["Delay"]) == (12.0, 12.0, 0.0)
+
+
+def test_write_post_mortem_streams_index_phase_and_major_delay_sheets():
+    from openpyxl import load_workbook
+
+    buffer = build_excel_report_buffer(_build_project(), n=1)
+    wb = load_workbook(buffer)
+
+    assert wb.sheetnames == ["Index", "Phase-1", "Phase-2", "Major Delays"]
+    assert [cell.value for cell in wb["Phase-1"][1]][:2] == ["Task No.", "Task"]
+    assert wb["Phase-2"]["B2"].value == "Task 3"
+    assert wb["Major Delays"].max_row == 2
+    assert [row[:2] for row in wb["Index"].iter_rows(values_only=True)] == [
+        ("Sheet Name", "Description"),
+        ("Major Delays", "Top delayed tasks across all phases"),
+        ("Phase-1", "Tear Out"),
+        ("Phase-2", "Install"),
+    ]
+    assert wb["Index"]["C3"].hyperlink.location == "'Phase-1'!A1"
+
+
 def test_build_phase_sections_matches_project_shape():
     project = _build_project()
 
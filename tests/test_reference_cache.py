@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend.reference_cache import SharedReferenceCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_identical_payloads_are_stored_once_across_scopes() -> None:
+    cache = SharedReferenceCache()
+    sites = [{"id": "s1", "name": "Site 1"}, {"id": "s2", "name": "Site 2"}]
+
+    cache.put(("sites", "scope-a", ()), sites, namespace="sites")
+    cache.put(("sites", "scope-b", ()), list(sites), namespace="sites")
+
+    stats = cache.memory_stats()
+    assert stats["entries"] == 2
+    assert stats["unique_payloads"] == 1
+    assert stats["dedup_saved_bytes"] == stats["stored_bytes"]
+
+
+def test_get_returns_independent_copies() -> None:
+    cache = SharedReferenceCache()
+    cache.put("k", [{"id": "c1"}], namespace="crews")
+
+    first = cache.get("k")
+    first[0]["id"] = "mutated"
+
+    assert cache.get("k") == [{"id": "c1"}]
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = SharedReferenceCache(ttl_seconds=10, clock=clock)
+    loads: list[int] = []
+
+    def loader():
+        loads.append(1)
+        return {"mills": len(loads)}
+
+    cache.get_or_load("mills", loader, namespace="mills")
+    clock.now = 5
+    cache.get_or_load("mills", loader, namespace="mills")
+    clock.now = 11
+    refreshed = cache.get_or_load("mills", loader, namespace="mills")
+
+    assert refreshed == {"mills": 2}
+    assert cache.stats.expirations == 1
+
+
+def test_memory_bound_evicts_least_recently_used() -> None:
+    cache = SharedReferenceCache(max_bytes=120)
+    cache.put("a", {"payload": "a" * 40}, namespace="sites")
+    cache.put("b", {"payload": "b" * 40}, namespace="sites")
+    cache.get("a")
+    cache.put("c", {"payload": "c" * 40}, namespace="sites")
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.memory_stats()["stored_bytes"] <= 120
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_by_tag_and_namespace() -> None:
+    cache = SharedReferenceCache()
+    cache.put("crews-1", [1], namespace="crews", tags=("reference", "crews:site-1"))
+    cache.put("crews-2", [2], namespace="crews", tags=("reference", "crews:site-2"))
+    cache.put("signals", [3], namespace="signal_definitions", tags=("project:p1",))
+
+    assert cache.invalidate(tags=["crews:site-1"]) == 1
+    assert cache.invalidate(namespace="signal_definitions") == 1
+    assert cache.get("crews-2") == [2]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic import gantt_builder
+from logic.cache_registry import invalidate_tags, project_tag
+from logic.gantt_builder import build_gantt_df
+from logic.signal_join import join_signal_to_tasks, task_windows
+from models.gantt_state import GanttState
+from models.phase import Phase
+from models.project import Project
+from models.signals import SignalDataType
+from models.task import Task
+
+
+def _project() -> Project:
+    phase = Phase(name="Reline")
+    phase.add_task(
+        Task(
+            name="Tear out",
+            start_date=datetime(2026, 2, 1, 7, 0),
+            end_date=datetime(2026, 2, 1, 9, 0),
+            actual_start=datetime(2026, 2, 1, 7, 0),
+            actual_end=datetime(2026, 2, 1, 10, 0),
+        )
+    )
+    phase.add_task(
+        Task(
+            name="Install",
+            start_date=datetime(2026, 2, 1, 9, 0),
+            end_date=datetime(2026, 2, 1, 12, 0),
+        )
+    )
+    project = Project(name="Join Test")
+    project.add_phase(phase)
+    return project
+
+
+def _windows(spans: list[tuple[str, str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "uuid": [f"t{i}" for i in range(len(spans))],
+            "task": "task",
+            "phase": "phase",
+            "start_utc": pd.to_datetime([start for start, _ in spans], utc=True),
+            "end_utc": pd.to_datetime([end for _, end in spans], utc=True),
+        }
+    )
+
+
+def test_task_windows_prefer_actuals_and_convert_to_utc() -> None:
+    windows = task_windows(_project())
+
+    assert windows["task"].tolist() == ["Tear out", "Install"]
+    # 07:00 and 10:00 Vancouver (PST) are 15:00 and 18:00 UTC.
+    assert windows["start_utc"].iloc[0] == pd.Timestamp("2026-02-01 15:00", tz="UTC")
+    assert windows["end_utc"].iloc[0] == pd.Timestamp("2026-02-01 18:00", tz="UTC")
+    assert windows["end_utc"].iloc[1] == pd.Timestamp("2026-02-01 20:00", tz="UTC")
+
+
+def test_numeric_join_matches_brute_force() -> None:
+    rng = np.random.default_rng(3)
+    stamps = pd.date_range("2026-02-01", periods=5000, freq="min", tz="UTC")
+    observations = pd.DataFrame({"timestamp_utc": stamps, "value": rng.normal(100, 10, size=5000)})
+    starts = rng.integers(0, 4800, size=200)
+    lengths = rng.integers(0, 600, size=200)
+    windows = _windows([(stamps[s], stamps[min(s + n, 4999)]) for s, n in zip(starts, lengths)])
+    windows.loc[0, ["start_utc", "end_utc"]] = [pd.Timestamp("2025-01-01", tz="UTC"), pd.Timestamp("2025-01-02", tz="UTC")]
+
+    joined = join_signal_to_tasks(windows, observations, SignalDataType.NUMERIC)
+
+    for window, row in zip(windows.itertuples(), joined.itertuples()):
+        inside = observations["value"][(stamps >= window.start_utc) & (stamps <= window.end_utc)]
+        assert row.samples == len(inside)
+        if len(inside):
+            assert np.isclose(row.mean, inside.mean())
+            assert row.min == inside.min() and row.max == inside.max()
+        else:
+            assert np.isnan(row.mean) and np.isnan(row.min)
+
+
+def test_state_join_counts_time_held_in_each_state() -> None:
+    observations = pd.DataFrame(
+        {
+            "timestamp_utc": pd.to_datetime(["2026-02-01 00:00", "2026-02-01 02:00", "2026-02-01 03:00"], utc=True),
+            "value_label": ["Idle", "Running", "Idle"],
+        }
+    )
+    windows = _windows([("2026-02-01 01:00", "2026-02-01 04:00"), ("2025-12-31 23:00", "2026-02-01 00:30")])
+
+    joined = join_signal_to_tasks(windows, observations, SignalDataType.CATEGORICAL)
+
+    assert joined["hours_Idle"].tolist() == [2.0, 0.5]
+    assert joined["hours_Running"].tolist() == [1.0, 0.0]
+    assert joined["samples"].tolist() == [2, 1]
+
+
+def test_gantt_df_carries_signal_summary_for_matching_tasks() -> None:
+    project = _project()
+    tear_out = project.get_task_list()[0]
+
+    df = build_gantt_df(project, GanttState(show_actual=True), ((str(tear_out.uuid), "Power: mean 812.0 kW"),))
+
+    summaries = dict(zip(df["TaskName"], df["SignalSummary"]))
+    assert summaries["Tear out"] == "Power: mean 812.0 kW"
+    assert summaries["Install"] == ""
+
+
+def test_gantt_cache_drops_only_the_invalidated_project(monkeypatch) -> None:
+    built: list[str] = []
+    real_gantt_df = gantt_builder._gantt_df
+
+    def counting_gantt_df(project, inputs, signal_stats=None):
+        built.append(project.name)
+        return real_gantt_df(project, inputs, signal_stats)
+
+    monkeypatch.setattr(gantt_builder, "_gantt_df", counting_gantt_df)
+    first, second = _project(), _project()
+    first.name, second.name = "A", "B"
+    state = GanttState(show_actual=True)
+
+    build_gantt_df(first, state)
+    build_gantt_df(second, state)
+    invalidate_tags(project_tag(first.uuid))
+    build_gantt_df(first, state)
+    build_gantt_df(second, state)
+    assert built == ["A", "B", "A"]
+
+    # An in-place edit is a new content version, so the stale frame is not served.
+    first.get_task_list()[0].name = "Strip"
+    assert "Strip" in build_gantt_df(first, state)["TaskName"].tolist()
+    assert built == ["A", "B", "A", "A"]
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend import signal_series, signals
+from logic.backend.signal_series import SignalSeriesStore, get_signal_series_store
+from logic.backend.signals import clear_signal_caches, signal_tag
+
+BASE = dt.datetime(2025, 3, 1, tzinfo=dt.timezone.utc)
+
+
+def _iso(value: dt.datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class FakeObservationBackend:
+    def __init__(self, minutes: int = 24 * 60):
+        self.rows = {
+            signal_id: [
+                {"id": f"{signal_id}-{i}", "timestamp_utc": _iso(BASE + dt.timedelta(minutes=i)), "numeric_value": float(i)}
+                for i in range(minutes)
+            ]
+            for signal_id in ("s1", "s2")
+        }
+        self.calls: list[tuple[str, dict]] = []
+
+    def __call__(self, *, method, path, headers, params=None, json=None):
+        signal_id = path.split("/")[4]
+        params = params or {}
+        self.calls.append((signal_id, dict(params)))
+        rows = [
+            row
+            for row in self.rows[signal_id]
+            if ("start" not in params or row["timestamp_utc"] >= params["start"])
+            and ("end" not in params or row["timestamp_utc"] <= params["end"])
+        ]
+        offset = params.get("offset", 0)
+        return rows[offset : offset + params["limit"]]
+
+
+@pytest.fixture
+def backend(monkeypatch) -> FakeObservationBackend:
+    fake = FakeObservationBackend()
+    monkeypatch.setattr(signals, "_request_json", fake)
+    monkeypatch.setattr(signal_series, "project_access_scope", lambda headers, project_id: "scope")
+    yield fake
+    get_signal_series_store().invalidate()
+
+
+def _ids(table) -> list[str]:
+    return table.column("id").to_pylist()
+
+
+def test_overlapping_window_only_fetches_the_gap(backend: FakeObservationBackend) -> None:
+    store = SignalSeriesStore()
+    store.get({}, "p1", "s1", start=BASE, end=BASE + dt.timedelta(hours=2))
+    backend.calls.clear()
+
+    table = store.get({}, "p1", "s1", start=BASE + dt.timedelta(hours=1), end=BASE + dt.timedelta(hours=3))
+
+    assert [params["start"] for _, params in backend.calls] == [_iso(BASE + dt.timedelta(hours=2))]
+    assert _ids(table) == [f"s1-{i}" for i in range(60, 181)]
+
+
+def test_window_inside_covered_range_needs_no_request(backend: FakeObservationBackend) -> None:
+    store = SignalSeriesStore()
+    store.get({}, "p1", "s1", start=BASE, end=BASE + dt.timedelta(hours=6))
+    backend.calls.clear()
+
+    table = store.get({}, "p1", "s1", start=BASE + dt.timedelta(hours=2), end=BASE + dt.timedelta(hours=4), max_rows=10)
+
+    assert backend.calls == []
+    assert _ids(table) == [f"s1-{i}" for i in range(120, 130)]
+
+
+def test_truncated_window_is_not_refetched(backend: FakeObservationBackend) -> None:
+    store = SignalSeriesStore()
+    window = dict(start=BASE, end=BASE + dt.timedelta(hours=12), max_rows=50)
+
+    first = store.get({}, "p1", "s1", **window)
+    requests = len(backend.calls)
+    second = store.get({}, "p1", "s1", **window)
+
+    assert _ids(first) == _ids(second) == [f"s1-{i}" for i in range(50)]
+    assert len(backend.calls) == requests
+
+
+def test_memory_budget_evicts_least_recently_used_series(backend: FakeObservationBackend) -> None:
+    store = SignalSeriesStore()
+    window = dict(start=BASE, end=BASE + dt.timedelta(hours=4))
+    store.get({}, "p1", "s1", **window)
+    store.memory_budget = store.nbytes + 1
+
+    store.get({}, "p1", "s2", **window)
+
+    assert store.invalidate(signal_id="s1") == 0
+    assert store.invalidate(signal_id="s2") == 1
+
+
+def test_clear_signal_caches_drops_only_the_tagged_signal(backend: FakeObservationBackend) -> None:
+    store = get_signal_series_store()
+    window = dict(start=BASE, end=BASE + dt.timedelta(hours=1))
+    store.get({}, "p1", "s1", **window)
+    store.get({}, "p1", "s2", **window)
+    backend.calls.clear()
+
+    clear_signal_caches(signal_tag("s1"), namespaces=())
+    store.get({}, "p1", "s1", **window)
+    store.get({}, "p1", "s2", **window)
+
+    assert [signal_id for signal_id, _ in backend.calls] == ["s1"]
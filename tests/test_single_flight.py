@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.backend.single_flight import SingleFlight
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    """Poll `condition` until it holds, failing the test instead of hanging."""
+    tick = threading.Event()
+    for _ in range(int(timeout / 0.005)):
+        if condition():
+            return
+        tick.wait(0.005)
+    raise AssertionError("condition not reached within timeout")
+
+
+def test_concurrent_identical_calls_share_one_execution() -> None:
+    flight = SingleFlight()
+    release = threading.Event()
+    executions: list[int] = []
+
+    def fetch() -> dict:
+        executions.append(1)
+        release.wait(timeout=5)
+        return {"tasks": [1, 2, 3]}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(flight.do, ("GET", "/snapshot", "scope"), fetch, label="/snapshot") for _ in range(8)]
+        _wait_for(lambda: flight.stats().get("/snapshot", {}).get("calls", 0) >= 8)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert len(executions) == 1
+    assert all(result == {"tasks": [1, 2, 3]} for result in results)
+    assert flight.stats()["/snapshot"] == {"calls": 8, "executions": 1, "coalesced": 7, "errors": 0}
+    assert flight.in_flight() == 0
+
+
+def test_followers_receive_independent_copies() -> None:
+    flight = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+
+    def fetch() -> dict:
+        started.set()
+        release.wait(timeout=5)
+        return {"items": [1]}
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "k", fetch)
+        assert started.wait(timeout=5)
+        follower = pool.submit(flight.do, "k", fetch)
+        _wait_for(lambda: flight.stats()["default"]["coalesced"] > 0)
+        release.set()
+        leader_result = leader.result(timeout=5)
+        follower_result = follower.result(timeout=5)
+
+    follower_result["items"].append(2)
+    assert leader_result == {"items": [1]}
+
+
+def test_errors_propagate_and_next_call_retries() -> None:
+    flight = SingleFlight()
+    attempts: list[int] = []
+
+    def failing() -> None:
+        attempts.append(1)
+        raise ValueError("backend unavailable")
+
+    with pytest.raises(ValueError):
+        flight.do("k", failing)
+    with pytest.raises(ValueError):
+        flight.do("k", failing)
+
+    assert len(attempts) == 2
+    assert flight.stats()["default"]["errors"] == 2
+
+
+def test_project_reads_are_shared_by_every_viewer(monkeypatch: pytest.MonkeyPatch) -> None:
+    from logic.backend import api_client
+
+    grants = {"Bearer alice": ["p1"], "Bearer bob": ["p1"], "Bearer eve": []}
+
+    def fetch_projects(headers, include_closed=False):
+        return [{"id": project_id, "can_view": True} for project_id in grants[headers["Authorization"]]]
+
+    flight = SingleFlight()
+    monkeypatch.setattr(api_client, "fetch_projects", fetch_projects)
+    monkeypatch.setattr(api_client, "get_single_flight", lambda: flight)
+    headers = {name: {"Authorization": f"Bearer {name}", "X-Organization-Id": "org-1"} for name in ("alice", "bob", "eve")}
+
+    # Different tokens with view access share a scope; anyone else keeps their own.
+    assert api_client.project_access_scope(headers["alice"], "p1") == api_client.project_access_scope(headers["bob"], "p1")
+    assert api_client.project_access_scope(headers["eve"], "p1") != api_client.project_access_scope(headers["alice"], "p1")
+    assert api_client.project_access_scope(headers["alice"], "p1") != api_client.project_access_scope(headers["alice"], "p2")
+
+    release = threading.Event()
+    started = threading.Event()
+    requests: list[str] = []
+
+    def read(name: str) -> dict:
+        def loader() -> dict:
+            requests.append(name)
+            started.set()
+            assert release.wait(5.0)
+            return {"project": "p1"}
+
+        return api_client._coalesced_project_get(
+            "/projects/{project_id}/snapshot",
+            url="http://backend/projects/p1/snapshot",
+            headers=headers[name],
+            project_id="p1",
+            params=None,
+            loader=loader,
+        )
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        alice = pool.submit(read, "alice")
+        assert started.wait(5.0)
+        bob = pool.submit(read, "bob")
+        eve = pool.submit(read, "eve")
+        _wait_for(lambda: len(requests) == 2 and flight.stats()["/projects/{project_id}/snapshot"]["coalesced"] == 1)
+        release.set()
+        results = [alice.result(5.0), bob.result(5.0), eve.result(5.0)]
+
+    assert sorted(requests) == ["alice", "eve"]
+    assert results == [{"project": "p1"}] * 3
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from logic.backend import api_client, login, signals
+from logic.backend.http_cache import ValidationCache, conditional_get_json
+from scripts.load_test import run_load
+from scripts.stub_backend import StubBackend, StubServer, build_fixtures
+
+
+def test_stub_serves_conditional_gets() -> None:
+    backend = StubBackend(build_fixtures(n_projects=1, tasks_per_project=10, events_per_project=5))
+    project_id = backend.fixtures.projects[0]["id"]
+    cache = ValidationCache()
+    headers = {"Authorization": "Bearer stub-etag"}
+
+    with StubServer(backend) as server:
+        url = f"{server.base_url}/projects/{project_id}/snapshot"
+        first = conditional_get_json(url, headers=headers, cache=cache)
+        second = conditional_get_json(url, headers=headers, cache=cache)
+
+    assert first == second
+    assert len(first["tasks"]) == 10
+    assert cache.stats.revalidated == 1
+
+
+def test_load_harness_reports_every_flow(monkeypatch) -> None:
+    backend = StubBackend(build_fixtures(n_projects=2, tasks_per_project=20, events_per_project=10))
+    for module in (api_client, login, signals):
+        monkeypatch.setattr(module, "API_BASE", module.API_BASE)
+
+    with StubServer(backend) as server:
+        report = run_load(server.base_url, users=2, iterations=2)
+
+    summaries = {summary.flow: summary for summary in report.flow_summaries}
+    assert list(summaries) == ["home", "projects", "plan", "analytics"]
+    for summary in summaries.values():
+        assert summary.errors == 0, summary.sample_errors
+        assert summary.count == 4
+        assert summary.p50_seconds <= summary.p95_seconds <= summary.p99_seconds
+    assert backend.request_counts["GET /projects/{id}/snapshot"] >= 1
+    assert any(row["endpoint"] == "/events" for row in report.endpoints)
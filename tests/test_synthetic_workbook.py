@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from logic.excel_parse_cache import get_excel_parse_cache
+from logic.load_project import ExcelProjectLoader
+from scripts.benchmark_excel_import import (
+    BenchmarkResult,
+    baseline_metrics,
+    compare_to_baseline,
+    default_excel_parameters,
+)
+from scripts.synthetic_workbook import TASKS_PER_PHASE, build_workbook, ensure_workbook, parse_size
+
+
+def test_synthetic_workbook_is_deterministic_and_loads() -> None:
+    data = build_workbook(200)
+    assert data == build_workbook(200)
+    assert data != build_workbook(200, seed=1)
+
+    get_excel_parse_cache().clear()
+    project, metadata = ExcelProjectLoader.load_excel_project(
+        file=data,
+        params=default_excel_parameters(),
+        infer_predecessors=True,
+    )
+    get_excel_parse_cache().clear()
+
+    tasks = project.get_task_list()
+    assert len(project.phase_order) + len(tasks) == 200
+    assert len(project.phases[project.phase_order[0]].task_order) == TASKS_PER_PHASE
+    assert metadata is not None and metadata.site_name == "Synthetic Site"
+    # Start cells chain onto the row above, so nearly every task gets a predecessor.
+    assert sum(bool(task.constraints) for task in tasks) >= len(tasks) - len(project.phase_order)
+    assert 0 < sum(task.completed for task in tasks) < len(tasks)
+
+
+def test_ensure_workbook_generates_once(tmp_path: Path) -> None:
+    assert parse_size("10k") == 10_000 and parse_size("250") == 250
+
+    path = ensure_workbook(tmp_path, 50)
+    modified = path.stat().st_mtime_ns
+    assert ensure_workbook(tmp_path, 50) == path
+    assert path.stat().st_mtime_ns == modified
+
+
+def _result(seconds: float, peak_mb: float, read_seconds: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        file="tests/data/synthetic_1000_rows_seed0.xlsx",
+        file_size_kb=80.0,
+        mode="load",
+        infer_predecessors=True,
+        repeats=3,
+        warmups=1,
+        runs_seconds=[seconds],
+        min_seconds=seconds,
+        median_seconds=seconds,
+        mean_seconds=seconds,
+        max_seconds=seconds,
+        peak_memory_mb=peak_mb,
+        stage_seconds={"read_plan_sheet": read_seconds, "build": 0.001},
+        stage_peak_mb={"read_plan_sheet": peak_mb},
+    )
+
+
+def test_compare_to_baseline_reports_only_regressions_past_threshold_and_floor() -> None:
+    baseline = {"synthetic_1000_rows_seed0.xlsx|load|infer=on": baseline_metrics(_result(1.0, 10.0, 0.5))}
+
+    # The build stage triples but stays under the noise floor.
+    current = _result(1.2, 10.5, 0.9)
+    current.stage_seconds["build"] = 0.003
+    regressions = compare_to_baseline(
+        [current],
+        baseline,
+        max_regression=0.25,
+        min_seconds=0.02,
+        min_mb=1.0,
+    )
+
+    assert [(r.metric, r.baseline, r.current) for r in regressions] == [("stage_seconds.read_plan_sheet", 0.5, 0.9)]
+    assert round(regressions[0].change, 2) == 0.8
+    other_case = _result(5.0, 50.0, 5.0)
+    other_case.infer_predecessors = False
+    assert compare_to_baseline([other_case], baseline, max_regression=0.25, min_seconds=0.02, min_mb=1.0) == []
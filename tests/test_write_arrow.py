@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.write_arrow import ENUM, SCHEMAS, TIMESTAMP, ArrowProject, open_dataset
+from models.constraint import Constraint, ConstraintRelation
+from models.delay import Delay, DelayType
+from models.phase import Phase
+from models.project import Project
+from models.shift_schedule import ShiftAssignment
+from models.task import Task, TaskType
+
+TZ = ZoneInfo("America/Edmonton")
+UTC = dt.timezone.utc
+
+
+def _build_project(name: str = "SAG Mill") -> Project:
+    project = Project(name=name, timezone=TZ)
+    start = dt.datetime(2026, 2, 1, 7, tzinfo=TZ)
+
+    tear_out = Phase(name="Tear Out")
+    strip = Task(
+        name="Remove liners",
+        start_date=start,
+        end_date=start + dt.timedelta(hours=4),
+        actual_start=start,
+        actual_end=start + dt.timedelta(hours=6),
+        task_type=TaskType.STRIP,
+        status="COMPLETE",
+    )
+    inch = Task(
+        name="Inch",
+        start_date=start + dt.timedelta(hours=4),
+        end_date=start + dt.timedelta(hours=5),
+        actual_start=start + dt.timedelta(hours=6),
+        task_type=TaskType.INCH,
+        status="IN_PROGRESS",
+        constraints=[Constraint(strip.uuid, "task", ConstraintRelation.SS, dt.timedelta(minutes=30))],
+    )
+    tear_out.add_task(strip)
+    tear_out.add_task(inch)
+    project.add_phase(tear_out)
+
+    install = Phase(name="Install", planned=False, constraints=[Constraint(tear_out.uuid, "phase")])
+    install.add_task(Task(name="Install liners", start_date=start + dt.timedelta(days=1), end_date=start + dt.timedelta(days=1, hours=8)))
+    project.add_phase(install)
+    project.add_phase(Phase(name="Empty"))
+
+    project.shift_assignments = [
+        ShiftAssignment(id="sa-1", project_id=project.uuid, crew_id="crew-a", shift_type="day", start_date=dt.date(2026, 2, 1)),
+    ]
+    return project
+
+
+def _delay(project: Project) -> Delay:
+    start = dt.datetime(2026, 2, 1, 9, tzinfo=TZ)
+    return Delay(
+        id="d-1",
+        project_id=project.uuid,
+        delay_type=DelayType.EQUIPMENT,
+        duration_minutes=45,
+        description="Crane down",
+        start_dt=start,
+        end_dt=start + dt.timedelta(minutes=45),
+        shift_assignment_id="sa-1",
+        created_by="user-1",
+        created_at=start,
+        updated_at=None,
+        updated_by=None,
+    )
+
+
+def test_tables_are_typed_and_derived_from_the_schedule() -> None:
+    project = _build_project()
+    tables = ArrowProject(project, delays=[_delay(project)]).tables
+
+    for name, table in tables.items():
+        assert table.schema == SCHEMAS[name]
+        assert set(table["project_id"].to_pylist()) == {project.uuid}
+
+    tasks = tables["tasks"].to_pydict()
+    assert tasks["name"] == ["Remove liners", "Inch", "Install liners"]
+    assert tasks["position"] == [1, 2, 1]
+    assert tasks["task_type"] == ["STRIP", "INCH", "GENERIC"]
+    assert tasks["status"] == ["COMPLETE", "IN_PROGRESS", "NOT_STARTED"]
+    assert tasks["planned_start"][0] == dt.datetime(2026, 2, 1, 14, tzinfo=UTC)
+    assert tasks["planned_hours"] == [4.0, 1.0, 8.0]
+    assert tasks["delay_hours"] == [2.0, None, None]
+    assert tables["tasks"]["task_type"].type == ENUM
+    # Dictionaries hold every enum value, whatever this project uses.
+    assert tables["tasks"]["task_type"].chunk(0).dictionary.to_pylist() == ["INCH", "STRIP", "INSTALL", "GENERIC"]
+
+    phases = tables["phases"].to_pydict()
+    assert phases["name"] == ["Tear Out", "Install", "Empty"]
+    assert phases["planned"] == [True, False, True]
+    assert phases["task_count"] == [2, 1, 0]
+    assert phases["completed_count"] == [1, 0, 0]
+    assert phases["planned_end"][0] == dt.datetime(2026, 2, 1, 19, tzinfo=UTC)
+    assert phases["actual_start"] == [dt.datetime(2026, 2, 1, 14, tzinfo=UTC), None, None]
+    assert phases["actual_end"] == [dt.datetime(2026, 2, 1, 20, tzinfo=UTC), None, None]
+    assert phases["planned_start"][2] is None
+
+    constraints = tables["constraints"].to_pylist()
+    assert [(c["successor_kind"], c["predecessor_kind"], c["relation_type"], c["lag"]) for c in constraints] == [
+        ("phase", "phase", "FS", dt.timedelta(0)),
+        ("task", "task", "SS", dt.timedelta(minutes=30)),
+    ]
+
+    assert tables["projects"].to_pylist()[0]["timezone"] == "America/Edmonton"
+    assert tables["projects"].to_pylist()[0]["project_type"] == "GENERIC"
+    assert tables["delays"].to_pylist()[0]["delay_type"] == "EQUIPMENT"
+    assert tables["delays"].to_pylist()[0]["start"] == dt.datetime(2026, 2, 1, 16, tzinfo=UTC)
+    assert tables["shift_assignments"].to_pylist()[0]["start_date"] == dt.date(2026, 2, 1)
+
+
+def test_parquet_and_ipc_files_round_trip(tmp_path: Path) -> None:
+    exporter = ArrowProject(_build_project())
+
+    parquet_paths = exporter.write_parquet(tmp_path / "parquet")
+    ipc_paths = exporter.write_ipc(tmp_path / "ipc")
+
+    assert [path.name for path in parquet_paths] == [f"{name}.parquet" for name in SCHEMAS]
+    assert pq.read_table(tmp_path / "parquet" / "tasks.parquet").equals(exporter.tables["tasks"])
+    with pa.ipc.open_stream(tmp_path / "ipc" / "tasks.arrows") as reader:
+        assert reader.read_all().equals(exporter.tables["tasks"])
+    assert len(ipc_paths) == len(SCHEMAS)
+    assert pq.read_table(tmp_path / "parquet" / "delays.parquet").num_rows == 0
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "ipc"])
+def test_projects_append_to_a_partitioned_dataset(tmp_path: Path, file_format: str) -> None:
+    first, second = _build_project("First"), _build_project("Second")
+    ArrowProject(first, delays=[_delay(first)]).append_to_dataset(tmp_path, file_format)
+    ArrowProject(second).append_to_dataset(tmp_path, file_format)
+
+    tasks = open_dataset(tmp_path, "tasks", file_format).to_table()
+    assert tasks.num_rows == 6
+    assert tasks.schema.field("planned_start").type == TIMESTAMP
+    assert sorted(set(tasks["project_id"].to_pylist())) == sorted([first.uuid, second.uuid])
+    assert (tmp_path / "tasks" / f"project_id={first.uuid}").is_dir()
+
+    # Exporting a project again replaces its partitions, including emptied ones.
+    first.phases[first.phase_order[1]].tasks.clear()
+    first.phases[first.phase_order[1]].task_order.clear()
+    ArrowProject(first).append_to_dataset(tmp_path, file_format)
+
+    assert open_dataset(tmp_path, "tasks", file_format).to_table().num_rows == 5
+    assert open_dataset(tmp_path, "delays", file_format).count_rows() == 0
+    assert open_dataset(tmp_path, "projects", file_format).count_rows() == 2
+
+
+def test_unknown_enum_values_are_rejected() -> None:
+    project = _build_project()
+    project.get_task_list()[0].status = "PAUSED"
+
+    with pytest.raises(ValueError, match="PAUSED"):
+        ArrowProject(project).tables
+
+
+def test_naive_task_times_are_project_wall_clock_and_hours_follow_it() -> None:
+    project = Project(name="Night shifts", timezone=TZ)
+    phase = Phase(name="Tear Out")
+    # Naive times are in the project's zone; the night of 2026-03-08 is an hour short on the clock.
+    phase.add_task(Task(name="Naive", start_date=dt.datetime(2026, 2, 1, 7), end_date=dt.datetime(2026, 2, 1, 11)))
+    phase.add_task(
+        Task(
+            name="Spring forward",
+            start_date=dt.datetime(2026, 3, 7, 19, tzinfo=TZ),
+            end_date=dt.datetime(2026, 3, 8, 7, tzinfo=TZ),
+            actual_start=dt.datetime(2026, 3, 7, 19),
+            actual_end=dt.datetime(2026, 3, 8, 9),
+        )
+    )
+    project.add_phase(phase)
+
+    tasks = ArrowProject(project).tables["tasks"].to_pydict()
+
+    assert tasks["planned_start"][0] == dt.datetime(2026, 2, 1, 14, tzinfo=UTC)
+    assert tasks["actual_end"][1] == dt.datetime(2026, 3, 8, 15, tzinfo=UTC)
+    assert tasks["planned_hours"] == [4.0, 12.0]
+    assert tasks["actual_hours"] == [None, 14.0]
+    assert tasks["delay_hours"] == [None, 2.0]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+import zipfile
+from io import BytesIO
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import pytest
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import IllegalCharacterError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.write_project import DATETIME_NUMBER_FORMAT, ExcelProject
+from logic.xlsx_stream import StreamedWorkbook
+from models.excel_format import ExcelFormat
+from models.phase import Phase
+from models.project import Project
+from models.task import Task
+
+TZ = ZoneInfo("America/Edmonton")
+
+
+def _build_project(note: str = "Load level") -> Project:
+    project = Project(name="HVC SAG Mill\nsecond line", timezone=TZ)
+    for phase_idx, phase_name in enumerate(["Tear Out", "Install"]):
+        phase = Phase(name=phase_name)
+        for task_idx in range(2):
+            start = dt.datetime(2026, 2, 1 + phase_idx, 7 + 2 * task_idx, tzinfo=TZ)
+            phase.add_task(
+                Task(
+                    name=f"{phase_name} {task_idx}",
+                    start_date=start,
+                    end_date=start + dt.timedelta(hours=2),
+                    actual_start=start.astimezone(dt.timezone.utc),
+                    actual_end=None,
+                    note=note if task_idx == 0 else "",
+                )
+            )
+        project.add_phase(phase)
+    return project
+
+
+def _export(project: Project) -> bytes:
+    return ExcelProject(project, ExcelFormat()).to_xlsx_bytes()
+
+
+def test_export_writes_phases_and_tasks_into_the_template() -> None:
+    project = _build_project()
+    data = _export(project)
+    ws = load_workbook(BytesIO(data))["Daily Schedule"]
+
+    assert ws["A5"].value == "HVC SAG Mill\n2026-02-01 to 2026-02-02 (from GanttBuddy)"
+    assert ws["A5"].font.sz == 20 and ws["A5"].alignment.wrap_text
+    assert ws["B8"].value == "HVC SAG Mill"
+    assert (ws["D8"].value, ws["E8"].value) == (dt.datetime(2026, 2, 1, 7), dt.datetime(2026, 2, 2, 11))
+
+    rows = [[ws.cell(row, col).value for col in range(1, 12)] for row in range(9, 15)]
+    assert [row[:2] for row in rows] == [
+        [1, "Tear Out"], [1, "Tear Out 0"], [2, "Tear Out 1"],
+        [2, "Install"], [3, "Install 0"], [4, "Install 1"],
+    ]
+    assert rows[0][2] == '=ROUND(E9-D9,1)&" Days ("&ROUND((E9-D9)*24,1)&" Hours)"'
+    assert rows[3][6] == '=ROUND(I12-H12,1)&" Days ("&ROUND((I12-H12)*24,1)&" Hours)"'
+    # Timezone-aware values are written as the project's wall-clock time.
+    assert rows[1][2:5] == [2.0, dt.datetime(2026, 2, 1, 7), dt.datetime(2026, 2, 1, 9)]
+    assert rows[1][7] == dt.datetime(2026, 2, 1, 7)
+    assert rows[1][9] == "Load level"
+    first_phase = project.phases[project.phase_order[0]]
+    assert ws["L10"].value == first_phase.tasks[first_phase.task_order[0]].uuid
+
+    assert ws["B9"].font.b and ws["B9"].fill.fgColor.rgb == "00E7E6E6"
+    assert not ws["B10"].font.b and ws["B10"].fill.fgColor.rgb == "00FFFFFF"
+    assert ws["D10"].number_format == DATETIME_NUMBER_FORMAT and ws["D10"].alignment.horizontal == "center"
+    assert ws.row_dimensions[9].height == pytest.approx(32.1)
+    assert ws.row_dimensions[10].height == pytest.approx(15.6)
+    # Template cells around the schedule are kept.
+    assert ws["N9"].value.startswith("=IF(")
+
+
+def test_export_drops_the_calc_chain_and_recalculates_on_load() -> None:
+    data = _export(_build_project())
+
+    with zipfile.ZipFile(BytesIO(data)) as archive:
+        names = archive.namelist()
+        workbook_xml = archive.read("xl/workbook.xml").decode()
+    assert not any("calcChain" in name for name in names)
+    assert 'fullCalcOnLoad="1"' in workbook_xml
+    assert "Daily Schedule" in StreamedWorkbook(data)
+
+
+def test_repeated_exports_share_cell_formats() -> None:
+    first = _export(_build_project())
+    second = _export(_build_project())
+
+    def styles(data: bytes) -> bytes:
+        with zipfile.ZipFile(BytesIO(data)) as archive:
+            return archive.read("xl/styles.xml")
+
+    assert styles(first) == styles(second)
+
+
+def test_export_rejects_illegal_characters() -> None:
+    with pytest.raises(IllegalCharacterError):
+        _export(_build_project(note="bad\x01note"))
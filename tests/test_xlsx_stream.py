@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import datetime as dt
+import sys
+import zipfile
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from logic.xlsx_stream import SheetBounds, StreamedWorkbook
+
+_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+SHEET_ROWS = """
+<row r="1">
+  <c r="A1" t="s"><v>0</v></c>
+  <c r="B1" t="s"><v>1</v></c>
+  <c r="C1" t="inlineStr"><is><t>inline</t></is></c>
+</row>
+<row r="2">
+  <c r="A2"><v>3</v></c>
+  <c r="B2"><v>2.5</v></c>
+  <c r="C2" s="1"><v>46070.5</v></c>
+  <c r="D2" t="b"><v>1</v></c>
+  <c r="E2" t="e"><v>#REF!</v></c>
+</row>
+<row r="3">
+  <c r="A3"><v>10</v></c>
+  <c r="B3"><f t="shared" ref="B3:B5" si="0">A3+1</f><v>11</v></c>
+  <c r="C3"><f>SUM(A3:B3)</f><v>21</v></c>
+</row>
+<row r="4"><c r="A4"><v>20</v></c><c r="B4"><f t="shared" si="0"/><v>21</v></c></row>
+<row r="5"><c r="A5"><v>30</v></c><c r="B5"><f t="shared" si="0"/><v>31</v></c></row>
+<row r="7"><c r="A7"><v>99</v></c></row>
+"""
+
+
+def _build_package(rows: str = SHEET_ROWS) -> bytes:
+    parts = {
+        "_rels/.rels": (
+            f'<Relationships xmlns="{_PKG}">'
+            f'<Relationship Id="rId1" Type="{_REL}/officeDocument" Target="xl/workbook.xml"/>'
+            "</Relationships>"
+        ),
+        "xl/workbook.xml": (
+            f'<workbook xmlns="{_MAIN}" xmlns:r="{_REL}"><sheets>'
+            '<sheet name="Plan" sheetId="1" r:id="rId1"/>'
+            "</sheets></workbook>"
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            f'<Relationships xmlns="{_PKG}">'
+            f'<Relationship Id="rId1" Type="{_REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Type="{_REL}/sharedStrings" Target="sharedStrings.xml"/>'
+            f'<Relationship Id="rId3" Type="{_REL}/styles" Target="styles.xml"/>'
+            "</Relationships>"
+        ),
+        "xl/sharedStrings.xml": (
+            f'<sst xmlns="{_MAIN}"><si><t>ACTIVITY</t></si>'
+            "<si><r><t>Rich </t></r><r><t>text</t></r><rPh><t>skip</t></rPh></si></sst>"
+        ),
+        "xl/styles.xml": (
+            f'<styleSheet xmlns="{_MAIN}"><cellXfs count="2">'
+            '<xf numFmtId="0"/><xf numFmtId="22"/>'
+            "</cellXfs></styleSheet>"
+        ),
+        "xl/worksheets/sheet1.xml": f'<worksheet xmlns="{_MAIN}"><sheetData>{rows}</sheetData></worksheet>',
+    }
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        for name, xml in parts.items():
+            archive.writestr(name, xml)
+    return buf.getvalue()
+
+
+def test_cached_values_are_converted_like_openpyxl() -> None:
+    sheet = StreamedWorkbook(_build_package())["Plan"]
+
+    assert [sheet.cell(1, column).value for column in (1, 2, 3)] == ["ACTIVITY", "Rich text", "inline"]
+    assert sheet["A2"].value == 3 and isinstance(sheet["A2"].value, int)
+    assert sheet["B2"].value == 2.5
+    assert sheet["C2"].value == dt.datetime(2026, 2, 17, 12)
+    assert sheet["D2"].value is True
+    assert sheet["E2"].value is None
+    assert sheet.max_row == 7
+    assert list(sheet.iter_rows([1, 2], min_row=5)) == [[30, 31], [None, None], [99, None]]
+
+
+def test_formulas_are_read_alongside_values_and_shared_ones_translated() -> None:
+    workbook = StreamedWorkbook(
+        _build_package(),
+        bounds={"Plan": SheetBounds(columns=frozenset({2}), formula_columns=frozenset({2}))},
+    )
+    sheet = workbook["Plan"]
+
+    assert [sheet.formula(row, 2) for row in (3, 4, 5)] == ["=A3+1", "=A4+1", "=A5+1"]
+    assert [sheet.cell(row, 2).value for row in (3, 4, 5)] == [11, 21, 31]
+    # Column C is outside the bounds: neither its value nor its formula is kept.
+    assert sheet.formula(3, 3) is None and sheet["C3"].value is None
+
+
+def test_bounds_limit_columns_rows_and_single_cells() -> None:
+    bounds = SheetBounds(columns=frozenset({1}), max_row=3, cells=frozenset({(2, 4)}))
+    workbook = StreamedWorkbook(_build_package(), bounds={"Plan": bounds})
+    sheet = workbook["Plan"]
+
+    assert sheet["A3"].value == 10 and sheet["A7"].value is None
+    assert sheet["D2"].value is True
+    assert sheet["B2"].value is None
+    assert sheet.formulas == {}
+    assert "Plan" in workbook and "Missing" not in workbook
+    with pytest.raises(KeyError):
+        workbook["Missing"]
+
+
+def test_shared_formulas_keep_anchored_references_fixed() -> None:
+    rows = """
+<row r="3">
+  <c r="C3"><f t="shared" ref="C3:D4" si="1">$A$1+A3*B$2+SUM(Plan!$A3:A4)</f></c>
+  <c r="D3"><f t="shared" si="1"/></c>
+</row>
+<row r="4"><c r="C4"><f t="shared" si="1"/></c><c r="D4"><f t="shared" si="1"/></c></row>
+"""
+    columns = frozenset({3, 4})
+    workbook = StreamedWorkbook(
+        _build_package(rows),
+        bounds={"Plan": SheetBounds(columns=columns, formula_columns=columns)},
+    )
+    sheet = workbook["Plan"]
+
+    assert sheet.formula(3, 4) == "=$A$1+B3*C$2+SUM(Plan!$A3:B4)"
+    assert sheet.formula(4, 3) == "=$A$1+A4*B$2+SUM(Plan!$A4:A5)"
+    assert sheet.formula(4, 4) == "=$A$1+B4*C$2+SUM(Plan!$A4:B5)"